@@ -2,7 +2,7 @@
  * 登記事項証明書インポートページ
  *
  * 機能:
- * - PDFアップロード
+ * - PDFアップロード（抽出はバックグラウンド、完了まで進捗をポーリング）
  * - PDFパース
  * - 登記レコード一覧表示
  * - 物件登録
@@ -45,8 +45,15 @@ interface ToukiImport {
   status: string;
   parsed_at?: string;
   created_at: string;
+  page_count?: number | null;
+  pages_extracted?: number;
 }
 
+// バックグラウンド抽出中のステータス（POST /touki/upload は queued で返る）
+const PENDING_STATUSES = ['queued', 'extracting'];
+// 抽出中のインポートがある間の再取得間隔
+const POLL_INTERVAL_MS = 2000;
+
 export default function ToukiImportPage() {
   // 状態
   const [records, setRecords] = useState<ToukiRecord[]>([]);
@@ -69,6 +76,28 @@ export default function ToukiImportPage() {
     loadData();
   }, []);
 
+  // 抽出中のインポートがある間はインポート一覧だけ再取得
+  const pendingImports = imports.filter(i => PENDING_STATUSES.includes(i.status));
+  const hasPending = pendingImports.length > 0;
+  useEffect(() => {
+    if (!hasPending) return;
+    const timer = setInterval(async () => {
+      try {
+        const importsRes = await api.get(API_PATHS.TOUKI.LIST);
+        const latest: ToukiImport[] = importsRes.data.items || [];
+        setImports(latest);
+        // 抽出が終わったら登記レコードも更新（auto_parse で作成される場合がある）
+        if (!latest.some(i => PENDING_STATUSES.includes(i.status))) {
+          const recordsRes = await api.get(API_PATHS.TOUKI.RECORDS_LIST);
+          setRecords(recordsRes.data.items || []);
+        }
+      } catch {
+        // 一時的なエラーは次回のポーリングで再試行
+      }
+    }, POLL_INTERVAL_MS);
+    return () => clearInterval(timer);
+  }, [hasPending]);
+
   // データ読み込み
   const loadData = async () => {
     setLoading(true);
@@ -80,7 +109,7 @@ export default function ToukiImportPage() {
 
       // インポート一覧を取得
       const importsRes = await api.get(API_PATHS.TOUKI.LIST);
-      setImports(importsRes.data.imports || []);
+      setImports(importsRes.data.items || []);
     } catch (e: any) {
       setError(e.response?.data?.detail || e.message);
     } finally {
@@ -107,7 +136,7 @@ export default function ToukiImportPage() {
 
         await api.post(API_PATHS.TOUKI.UPLOAD, formData);
       }
-      setSuccess(`${pdfFiles.length}件のPDFをアップロードしました`);
+      setSuccess(`${pdfFiles.length}件のPDFをアップロードしました（テキスト抽出中）`);
       await loadData();
     } catch (e: any) {
       setError(e.response?.data?.detail || e.message);
@@ -376,6 +405,31 @@ export default function ToukiImportPage() {
         </div>
       </div>
 
+      {/* 抽出中のインポート */}
+      {hasPending && (
+        <div className="mb-6">
+          <h2 className="text-lg font-medium mb-3">抽出中のPDF</h2>
+          <div className="border rounded-lg divide-y">
+            {pendingImports.map(imp => (
+              <div key={imp.id} className="p-3 flex items-center justify-between">
+                <div>
+                  <span className="font-medium">{imp.file_name}</span>
+                  <span className="ml-2 text-xs text-gray-500">
+                    {new Date(imp.created_at).toLocaleString('ja-JP')}
+                  </span>
+                </div>
+                <div className="flex items-center gap-2 text-sm text-gray-600">
+                  <div className="animate-spin h-4 w-4 border-2 border-blue-500 border-t-transparent rounded-full"></div>
+                  {imp.status === 'queued'
+                    ? '待機中'
+                    : `抽出中 ${imp.pages_extracted ?? 0}${imp.page_count ? `/${imp.page_count}` : ''}ページ`}
+                </div>
+              </div>
+            ))}
+          </div>
+        </div>
+      )}
+
       {/* 未パースのインポート */}
       {imports.filter(i => i.status === 'uploaded').length > 0 && (
         <div className="mb-6">
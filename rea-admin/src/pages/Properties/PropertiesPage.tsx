@@ -265,6 +265,7 @@ const PropertiesPage = () => {
         limit: pageSize,
         sort_by: sortBy,
         sort_order: sortOrder,
+        fields: 'list',  // 一覧表示列のみ取得（column_labels.field_presets）
       };
       if (debouncedSearch) params.search = debouncedSearch;
       if (filters.property_type) params.property_type = filters.property_type;
@@ -35,6 +35,7 @@ export const propertyService = {
     if (params?.limit !== undefined) queryParams.append('limit', params.limit.toString());
     if (params?.sale_price_min !== undefined) queryParams.append('sale_price_min', params.sale_price_min.toString());
     if (params?.sale_price_max !== undefined) queryParams.append('sale_price_max', params.sale_price_max.toString());
+    if (params?.fields) queryParams.append('fields', params.fields);
 
     const response = await api.get(`/properties/?${queryParams.toString()}`);
 
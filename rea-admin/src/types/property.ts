@@ -43,6 +43,7 @@ export interface PropertySearchParams {
   sort_order?: 'asc' | 'desc';
   skip?: number;
   limit?: number;
+  fields?: string;  // 取得カラム（カンマ区切り、またはプリセット名 list/map/export）
 }
 
 /**
@@ -18,7 +18,12 @@ from sqlalchemy.orm import Session
 
 from app.api import dependencies
 from app.core.exceptions import DatabaseError
+from app.services.publication_validator import publication_rules
+from shared.async_database import AsyncREADatabase
 from shared.auth.middleware import get_current_user
+from shared.database import READatabase
+from shared.query_stats import endpoint_query_stats
+from shared.schema_registry import schema_registry
 
 router = APIRouter()
 
@@ -189,6 +194,7 @@ def update_field_visibility(
 
         _execute_field_settings_update(db, update, field_type, updated_by)
         db.commit()
+        schema_registry.invalidate()
 
         result_value = (
             update.required_for_publication if field_type == "required"
@@ -225,6 +231,7 @@ def update_field_visibility_bulk(
             _execute_field_settings_update(db, update, field_type, updated_by)
 
         db.commit()
+        schema_registry.invalidate()
 
         return {
             "success": True,
@@ -235,3 +242,63 @@ def update_field_visibility_bulk(
     except Exception as e:
         db.rollback()
         raise DatabaseError(str(e))
+
+
+@router.get("/schema-registry")
+def get_schema_registry_stats(request: Request) -> Dict[str, Any]:
+    """スキーマレジストリの状態を取得"""
+    user = get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="認証が必要です")
+    return schema_registry.stats()
+
+
+@router.post("/schema-registry/refresh")
+def refresh_schema_registry(
+    request: Request,
+    db: Session = Depends(dependencies.get_db),
+) -> Dict[str, Any]:
+    """スキーマレジストリを再ロード（マイグレーション適用後など、公開ルールも再コンパイル）"""
+    user = get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="認証が必要です")
+    try:
+        schema_registry.refresh(db)
+        publication_rules.invalidate()
+        return schema_registry.stats()
+    except Exception as e:
+        raise DatabaseError(str(e))
+
+
+@router.get("/db-pool")
+def get_db_pool_stats(request: Request) -> Dict[str, Any]:
+    """DBコネクションプールの状態を取得（sync: READatabase / async: AsyncREADatabase）"""
+    user = get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="認証が必要です")
+    return {
+        "sync": READatabase.pool_stats(),
+        "async": AsyncREADatabase.stats(),
+    }
+
+
+@router.get("/query-stats")
+def get_query_stats(request: Request) -> Dict[str, Any]:
+    """エンドポイント別のSQL統計（直近リクエスト、SQL合計時間の多い順）"""
+    user = get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="認証が必要です")
+    return {
+        "window": endpoint_query_stats.WINDOW,
+        "endpoints": endpoint_query_stats.summary(),
+    }
+
+
+@router.delete("/query-stats")
+def reset_query_stats(request: Request) -> Dict[str, Any]:
+    """SQL統計をリセット"""
+    user = get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="認証が必要です")
+    endpoint_query_stats.reset()
+    return {"reset": True}
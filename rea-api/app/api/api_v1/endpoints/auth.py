@@ -42,7 +42,7 @@ class UserResponse(BaseModel):
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(request: LoginRequest):
+def login(request: LoginRequest):
     """ログイン"""
     db = READatabase()
     conn = db.get_connection()
@@ -142,7 +142,7 @@ async def logout():
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(request: Request):
+def get_current_user_info(request: Request):
     """現在のユーザー情報を取得"""
     user = get_current_user(request)
 
@@ -209,7 +209,7 @@ class PasswordResetResponse(BaseModel):
 
 
 @router.post("/password-reset/request", response_model=PasswordResetResponse)
-async def request_password_reset(request: PasswordResetRequest):
+def request_password_reset(request: PasswordResetRequest):
     """パスワードリセットをリクエスト（メール送信）"""
     db = READatabase()
     conn = db.get_connection()
@@ -259,7 +259,7 @@ async def request_password_reset(request: PasswordResetRequest):
 
 
 @router.post("/password-reset/confirm", response_model=PasswordResetResponse)
-async def confirm_password_reset(request: PasswordResetConfirm):
+def confirm_password_reset(request: PasswordResetConfirm):
     """パスワードリセットを実行"""
     db = READatabase()
     conn = db.get_connection()
@@ -309,7 +309,7 @@ async def confirm_password_reset(request: PasswordResetConfirm):
 
 
 @router.get("/password-reset/verify/{token}")
-async def verify_reset_token(token: str):
+def verify_reset_token(token: str):
     """トークンの有効性を確認"""
     db = READatabase()
     conn = db.get_connection()
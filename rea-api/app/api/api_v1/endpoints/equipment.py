@@ -35,7 +35,7 @@ def _fetch_all_equipment() -> List[Dict[str, Any]]:
 
 
 @router.get("/", response_model=List[Dict[str, Any]])
-async def get_all_equipment():
+def get_all_equipment():
     """全設備マスターを取得"""
     try:
         return _fetch_all_equipment()
@@ -44,7 +44,7 @@ async def get_all_equipment():
 
 
 @router.get("/grouped", response_model=Dict[str, List[Dict[str, Any]]])
-async def get_equipment_grouped():
+def get_equipment_grouped():
     """設備マスターをカテゴリごとにグループ化して取得"""
     try:
         all_equipment = _fetch_all_equipment()
@@ -67,7 +67,7 @@ async def get_equipment_grouped():
 
 
 @router.get("/categories", response_model=List[str])
-async def get_equipment_categories():
+def get_equipment_categories():
     """設備カテゴリ一覧を取得"""
     try:
         all_equipment = _fetch_all_equipment()
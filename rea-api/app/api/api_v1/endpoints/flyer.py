@@ -9,9 +9,13 @@ GET /api/v1/flyer/preview/{property_id} - プレビュー画像生成
 
 import logging
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import Response
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.crud.generic import GenericCRUD
 
 # rea-flyerモジュールをインポート
 import sys
@@ -80,7 +84,7 @@ async def generate_maisoku(
 
 
 @router.post("/chirashi")
-async def generate_chirashi(request: ChirashiRequest):
+def generate_chirashi(request: ChirashiRequest, db: Session = Depends(get_db)):
     """
     チラシSVGを生成（複数物件対応）
 
@@ -91,15 +95,8 @@ async def generate_chirashi(request: ChirashiRequest):
         SVGファイル
     """
     try:
-        # 物件データ取得
-        from app.services.property_service import PropertyService
-        service = PropertyService()
-
-        properties = []
-        for pid in request.property_ids:
-            property_data = await service.get_property_full(pid)
-            if property_data:
-                properties.append(property_data)
+        # 物件データ一括取得（物件数に関わらず1クエリ）
+        properties = GenericCRUD(db).get_full_many(request.property_ids)
 
         if not properties:
             raise HTTPException(status_code=404, detail="物件が見つかりません")
@@ -3,31 +3,72 @@
 
 画像のアップロード・削除・更新を行う。
 メタデータはproperty_imagesテーブルで管理。
+アップロード時に表示サイズごとの派生画像（+ WebP）を生成し、variants に記録する。
+
+画像ファイルは内容のハッシュ（SHA-256）で保存する（properties/objects/ab/cd/{hash}.{ext}）。
+同じ画像は1ファイルだけ保存して複数の property_images 行から参照し、
+内容が変わらないため /uploads から長期キャッシュ（immutable）で配信する。
 """
+import hashlib
+import json
 import os
 import uuid
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, UploadFile
+from fastapi.responses import RedirectResponse
+from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
 from app.core.database import get_db
+from app.utils.image_processor import SIZE_ORIGINAL, VARIANT_SIZES, image_processor, variant_url
 from shared.auth.middleware import get_current_user
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# アップロード先ディレクトリ
-UPLOAD_DIR = os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'uploads', 'properties')
+# アップロード先ディレクトリ（UPLOAD_ROOT が /uploads に対応）
+UPLOAD_ROOT = os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'uploads')
+UPLOAD_DIR = os.path.join(UPLOAD_ROOT, 'properties')
+
+# 内容アドレスで保存する画像の相対パス（UPLOAD_ROOT 基準）
+OBJECT_PREFIX = 'properties/objects'
 
 # 許可する画像形式
 ALLOWED_EXTENSIONS = {'jpg', 'jpeg', 'png', 'gif', 'webp'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
+# ファイル保存時の読み込み単位
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# multipartのヘッダ等を含めたリクエストサイズの上限（超える場合は受信前に拒否）
+MAX_REQUEST_SIZE = MAX_FILE_SIZE + 1024 * 1024
+
+# 取得できる画像サイズ
+IMAGE_SIZES = (*VARIANT_SIZES, SIZE_ORIGINAL)
+
+# メタデータ更新で変更できるフィールドと許可する値の型
+UPDATABLE_FIELDS: Dict[str, tuple] = {
+    'image_type': (str, int),
+    'display_order': (int,),
+    'caption': (str, type(None)),
+    'is_public': (bool,),
+}
+
+IMAGE_COLUMNS = """
+    id, property_id, image_type, file_path, file_url,
+    display_order, caption, is_public, variants
+"""
+
+
+class ImageReorderRequest(BaseModel):
+    """画像並び替えリクエスト（表示順に並べた画像ID）"""
+    ids: List[int] = Field(..., min_length=1)
+
 
 def require_auth(request: Request) -> dict:
     """認証を要求（ログイン必須）"""
@@ -54,20 +95,129 @@ def validate_image_file(file: UploadFile) -> None:
         )
 
 
+def object_path(content_hash: str, ext: str) -> str:
+    """内容アドレスの相対パス（UPLOAD_ROOT 基準）"""
+    return f"{OBJECT_PREFIX}/{content_hash[:2]}/{content_hash[2:4]}/{content_hash}.{ext}"
+
+
+def store_upload(file: UploadFile) -> Tuple[str, str, bool]:
+    """
+    アップロードファイルをチャンク単位で保存し、内容アドレスに配置
+
+    サイズ上限を読み込みながら確認し、同時にSHA-256を計算する。
+    同じ内容のファイルが既にあれば新しく保存しない。
+
+    Returns:
+        (相対パス, content_hash, 新規に保存したか)
+    """
+    ext = get_file_extension(file.filename or 'jpg')
+    if ext == 'jpeg':
+        ext = 'jpg'
+
+    tmp_dir = os.path.join(UPLOAD_ROOT, OBJECT_PREFIX, 'tmp')
+    os.makedirs(tmp_dir, exist_ok=True)
+    tmp_path = os.path.join(tmp_dir, f"{uuid.uuid4().hex}.part")
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(tmp_path, 'wb') as f:
+            while chunk := file.file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_FILE_SIZE:
+                    raise HTTPException(status_code=400, detail="ファイルサイズが10MBを超えています")
+                digest.update(chunk)
+                f.write(chunk)
+
+        content_hash = digest.hexdigest()
+        relative_path = object_path(content_hash, ext)
+        full_path = os.path.join(UPLOAD_ROOT, relative_path)
+        if os.path.exists(full_path):
+            os.remove(tmp_path)
+            return relative_path, content_hash, False
+
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        os.replace(tmp_path, full_path)
+        return relative_path, content_hash, True
+    except HTTPException:
+        os.remove(tmp_path)
+        raise
+    except IOError as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        logger.error(f"Failed to save image: {e}")
+        raise HTTPException(status_code=500, detail="画像の保存に失敗しました")
+
+
+def find_existing_variants(db: Session, content_hash: str) -> Optional[Dict[str, Any]]:
+    """同じ内容の画像で生成済みの派生画像（論理削除済みの行も含む、ファイルは残っているため）"""
+    row = db.execute(
+        text("""
+            SELECT variants
+            FROM property_images
+            WHERE content_hash = :content_hash AND variants IS NOT NULL
+            LIMIT 1
+        """),
+        {"content_hash": content_hash}
+    ).fetchone()
+    return row.variants if row else None
+
+
+def validate_image_fields(update_data: Dict[str, Any]) -> Optional[str]:
+    """メタデータ更新値の型チェック（エラーメッセージ、問題なければ None）"""
+    for field, value in update_data.items():
+        allowed = UPDATABLE_FIELDS[field]
+        if isinstance(value, bool) and bool not in allowed:
+            return f"{field} の値が不正です"
+        if not isinstance(value, allowed):
+            return f"{field} の値が不正です"
+    return None
+
+
+def validate_image_size(size: Optional[str]) -> None:
+    """画像サイズ指定のバリデーション"""
+    if size is not None and size not in IMAGE_SIZES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"不正な画像サイズです。指定可能: {', '.join(IMAGE_SIZES)}"
+        )
+
+
+def format_image(row: Any, size: Optional[str] = None, webp: bool = False) -> Dict[str, Any]:
+    """
+    property_imagesの行をレスポンス形式に変換
+
+    size を指定した場合は file_url をそのサイズの派生画像に置き換える（未生成なら原本）。
+    """
+    image = dict(row._mapping)
+    return {
+        "id": image["id"],
+        "property_id": image["property_id"],
+        "image_type": image["image_type"],
+        "file_path": image["file_path"],
+        "file_url": variant_url(image, size, webp) if size else image["file_url"],
+        "display_order": image["display_order"],
+        "caption": image["caption"],
+        "is_public": image["is_public"],
+        "variants": image["variants"],
+    }
+
+
 @router.get("/{property_id}/images")
 def get_property_images(
     request: Request,
     property_id: int,
+    size: Optional[str] = Query(None, description="file_url のサイズ（thumbnail/medium/large/original）"),
+    webp: bool = Query(False, description="file_url を WebP にする"),
     db: Session = Depends(get_db),
 ):
     """物件の画像一覧を取得"""
     require_auth(request)
+    validate_image_size(size)
 
     result = db.execute(
-        text("""
-            SELECT id, property_id, image_type, file_path, file_url,
-                   display_order, caption, is_public,
-                   created_at, updated_at
+        text(f"""
+            SELECT {IMAGE_COLUMNS}
             FROM property_images
             WHERE property_id = :property_id
               AND deleted_at IS NULL
@@ -76,24 +226,48 @@ def get_property_images(
         {"property_id": property_id}
     )
 
-    images = []
-    for row in result:
-        images.append({
-            "id": row.id,
-            "property_id": row.property_id,
-            "image_type": row.image_type,
-            "file_path": row.file_path,
-            "file_url": row.file_url,
-            "display_order": row.display_order,
-            "caption": row.caption,
-            "is_public": row.is_public,
-        })
+    return [format_image(row, size, webp) for row in result]
+
+
+@router.get("/{property_id}/images/{image_id}/file")
+def get_property_image_file(
+    request: Request,
+    property_id: int,
+    image_id: int,
+    size: str = Query(SIZE_ORIGINAL, description="thumbnail/medium/large/original"),
+    db: Session = Depends(get_db),
+):
+    """
+    指定サイズの画像にリダイレクト
+
+    Acceptに image/webp が含まれる場合はWebP版を返す。
+    非公開画像はログインが必要。
+    """
+    validate_image_size(size)
+
+    row = db.execute(
+        text(f"""
+            SELECT {IMAGE_COLUMNS}
+            FROM property_images
+            WHERE id = :image_id AND property_id = :property_id AND deleted_at IS NULL
+        """),
+        {"image_id": image_id, "property_id": property_id}
+    ).fetchone()
+
+    if not row:
+        raise HTTPException(status_code=404, detail="画像が見つかりません")
+    if not row.is_public:
+        require_auth(request)
 
-    return images
+    webp = "image/webp" in request.headers.get("accept", "")
+    url = variant_url(dict(row._mapping), size, webp)
+    if not url:
+        raise HTTPException(status_code=404, detail="画像が見つかりません")
+    return RedirectResponse(url, status_code=307, headers={"Vary": "Accept"})
 
 
 @router.post("/{property_id}/images")
-async def upload_property_image(
+def upload_property_image(
     request: Request,
     property_id: int,
     file: UploadFile = File(...),
@@ -108,41 +282,29 @@ async def upload_property_image(
 
     # バリデーション
     validate_image_file(file)
-
-    # ファイルサイズチェック
-    contents = await file.read()
-    if len(contents) > MAX_FILE_SIZE:
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_REQUEST_SIZE:
         raise HTTPException(status_code=400, detail="ファイルサイズが10MBを超えています")
 
-    # アップロードディレクトリ作成
-    property_dir = os.path.join(UPLOAD_DIR, str(property_id))
-    os.makedirs(property_dir, exist_ok=True)
-
-    # ユニークなファイル名を生成
-    ext = get_file_extension(file.filename or 'jpg')
-    unique_filename = f"{uuid.uuid4().hex}.{ext}"
-    file_path = os.path.join(property_dir, unique_filename)
-
-    # ファイル保存
-    try:
-        with open(file_path, 'wb') as f:
-            f.write(contents)
-    except IOError as e:
-        logger.error(f"Failed to save image: {e}")
-        raise HTTPException(status_code=500, detail="画像の保存に失敗しました")
-
-    # 相対パス（DB保存用）
-    relative_path = f"properties/{property_id}/{unique_filename}"
+    # ファイル保存（内容アドレス、同じ画像は既存ファイルを参照）
+    relative_path, content_hash, created = store_upload(file)
     file_url = f"/uploads/{relative_path}"
 
+    # 派生画像を生成（同じ画像で生成済みなら再利用、失敗しても原本で登録し後でバックフィルする）
+    variants = None if created else find_existing_variants(db, content_hash)
+    if variants is None:
+        variants = image_processor.process(UPLOAD_ROOT, relative_path)
+
     # DBに保存
     try:
         result = db.execute(
-            text("""
+            text(f"""
                 INSERT INTO property_images
-                (property_id, image_type, file_path, file_url, display_order, caption, is_public)
-                VALUES (:property_id, :image_type, :file_path, :file_url, :display_order, :caption, :is_public)
-                RETURNING id, property_id, image_type, file_path, file_url, display_order, caption, is_public
+                (property_id, image_type, file_path, file_url, display_order, caption, is_public,
+                 variants, content_hash)
+                VALUES (:property_id, :image_type, :file_path, :file_url, :display_order, :caption, :is_public,
+                        CAST(:variants AS jsonb), :content_hash)
+                RETURNING {IMAGE_COLUMNS}
             """),
             {
                 "property_id": property_id,
@@ -152,26 +314,16 @@ async def upload_property_image(
                 "display_order": display_order,
                 "caption": caption,
                 "is_public": is_public,
+                "variants": json.dumps(variants) if variants else None,
+                "content_hash": content_hash,
             }
         )
         db.commit()
 
-        row = result.fetchone()
-        return {
-            "id": row.id,
-            "property_id": row.property_id,
-            "image_type": row.image_type,
-            "file_path": row.file_path,
-            "file_url": row.file_url,
-            "display_order": row.display_order,
-            "caption": row.caption,
-            "is_public": row.is_public,
-        }
+        return format_image(result.fetchone())
     except Exception as e:
         db.rollback()
-        # ファイルも削除
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        # ファイルは削除しない（同じ内容のアップロードから参照される可能性があるため）
         logger.error(f"Failed to save image record: {e}")
         raise HTTPException(status_code=500, detail=f"画像の登録に失敗しました: {str(e)}")
 
@@ -200,8 +352,7 @@ def update_property_image(
         raise HTTPException(status_code=404, detail="画像が見つかりません")
 
     # 更新可能なフィールドのみ抽出
-    allowed_fields = {'image_type', 'display_order', 'caption', 'is_public'}
-    update_data = {k: v for k, v in data.items() if k in allowed_fields}
+    update_data = {k: v for k, v in data.items() if k in UPDATABLE_FIELDS}
 
     if not update_data:
         return {"message": "更新するデータがありません"}
@@ -224,25 +375,15 @@ def update_property_image(
 
         # 更新後のデータを返す
         result = db.execute(
-            text("""
-                SELECT id, property_id, image_type, file_path, file_url,
-                       display_order, caption, is_public
+            text(f"""
+                SELECT {IMAGE_COLUMNS}
                 FROM property_images
                 WHERE id = :image_id AND deleted_at IS NULL
             """),
             {"image_id": image_id}
         ).fetchone()
 
-        return {
-            "id": result.id,
-            "property_id": result.property_id,
-            "image_type": result.image_type,
-            "file_path": result.file_path,
-            "file_url": result.file_url,
-            "display_order": result.display_order,
-            "caption": result.caption,
-            "is_public": result.is_public,
-        }
+        return format_image(result)
     except Exception as e:
         db.rollback()
         logger.error(f"Failed to update image: {e}")
@@ -291,7 +432,7 @@ def delete_property_image(
 
 
 @router.post("/{property_id}/images/bulk")
-async def bulk_update_images(
+def bulk_update_images(
     request: Request,
     property_id: int,
     images: List[Dict[str, Any]],
@@ -301,42 +442,161 @@ async def bulk_update_images(
     物件画像の一括更新（メタデータのみ）
     新規画像はPOST /{property_id}/imagesで個別にアップロード後、
     このエンドポイントでメタデータを一括更新する。
+
+    入力は事前に検証し、有効な画像をまとめて1回の UPDATE ... FROM (VALUES ...) で更新する。
+    同じidが複数回ある場合は後の指定で上書きする。
     """
     require_auth(request)
 
-    results = []
+    # 結果は入力順（id単位）、更新対象は検証を通ったもののみ
+    results: Dict[Any, Dict[str, Any]] = {}
+    updates: Dict[int, Dict[str, Any]] = {}
 
     for img_data in images:
         image_id = img_data.get('id')
         if not image_id:
             continue
 
-        # 更新可能フィールドのみ
-        allowed_fields = {'image_type', 'display_order', 'caption', 'is_public'}
-        update_data = {k: v for k, v in img_data.items() if k in allowed_fields}
-
+        update_data = {k: v for k, v in img_data.items() if k in UPDATABLE_FIELDS}
         if not update_data:
             continue
 
-        set_parts = [f"{k} = :{k}" for k in update_data.keys()]
-        set_clause = ", ".join(set_parts)
-        update_data["image_id"] = image_id
-        update_data["property_id"] = property_id
+        valid_id = isinstance(image_id, int) and not isinstance(image_id, bool)
+        key = image_id if valid_id else str(image_id)
+        result = results.setdefault(key, {"id": image_id})
+        error = validate_image_fields(update_data) if valid_id else "idが不正です"
+        if error:
+            result.update(status="error", message=error)
+            updates.pop(key, None)
+            continue
 
+        if 'image_type' in update_data:
+            update_data['image_type'] = str(update_data['image_type'])
+        result.pop("message", None)
+        result["status"] = "pending"
+        updates.setdefault(key, {}).update(update_data)
+
+    if updates:
+        existing = {
+            row.id for row in db.execute(
+                text("""
+                    SELECT id FROM property_images
+                    WHERE id = ANY(:ids) AND property_id = :property_id AND deleted_at IS NULL
+                """),
+                {"ids": list(updates), "property_id": property_id}
+            )
+        }
+        for image_id in [i for i in updates if i not in existing]:
+            del updates[image_id]
+
+    if updates:
+        values = []
+        params: Dict[str, Any] = {"property_id": property_id}
+        for i, (image_id, update_data) in enumerate(updates.items()):
+            values.append(f"(CAST(:id_{i} AS integer), CAST(:data_{i} AS jsonb))")
+            params[f"id_{i}"] = image_id
+            params[f"data_{i}"] = json.dumps(update_data, ensure_ascii=False)
+
+        # 指定されたフィールドのみ更新（値の型変換は jsonb_populate_record に任せる）
+        set_clause = ",\n".join(
+            f"{field} = CASE WHEN v.data ? '{field}' THEN r.{field} ELSE pi.{field} END"
+            for field in UPDATABLE_FIELDS
+        )
         try:
-            db.execute(
+            updated = db.execute(
                 text(f"""
-                    UPDATE property_images
-                    SET {set_clause}, updated_at = NOW()
-                    WHERE id = :image_id AND property_id = :property_id AND deleted_at IS NULL
+                    UPDATE property_images pi
+                    SET {set_clause},
+                        updated_at = NOW()
+                    FROM (VALUES {", ".join(values)}) AS v(id, data),
+                         LATERAL jsonb_populate_record(NULL::property_images, v.data) AS r
+                    WHERE pi.id = v.id AND pi.property_id = :property_id AND pi.deleted_at IS NULL
+                    RETURNING pi.id
                 """),
-                update_data
-            )
-            results.append({"id": image_id, "status": "updated"})
+                params
+            ).fetchall()
+            db.commit()
         except Exception as e:
-            logger.warning(f"Failed to update image {image_id}: {e}")
-            results.append({"id": image_id, "status": "error", "message": str(e)})
+            db.rollback()
+            logger.error(f"Failed to bulk update images: {e}")
+            raise HTTPException(status_code=500, detail=f"画像の一括更新に失敗しました: {str(e)}")
+
+        for row in updated:
+            results[row.id]["status"] = "updated"
+
+    for result in results.values():
+        if result["status"] == "pending":
+            result.update(status="error", message="画像が見つかりません")
+
+    return {
+        "updated": len([r for r in results.values() if r["status"] == "updated"]),
+        "results": list(results.values()),
+    }
 
-    db.commit()
 
-    return {"updated": len([r for r in results if r["status"] == "updated"]), "results": results}
+@router.post("/{property_id}/images/reorder")
+def reorder_images(
+    request: Request,
+    property_id: int,
+    data: ImageReorderRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    物件画像の並び替え
+
+    ids の順に display_order を 1, 2, 3... に振り直す（1回のUPDATE）。
+    ids に含まれない画像は現在の順序のまま後ろに続ける。
+    """
+    require_auth(request)
+
+    if len(set(data.ids)) != len(data.ids):
+        raise HTTPException(status_code=400, detail="idが重複しています")
+
+    existing = {
+        row.id for row in db.execute(
+            text("""
+                SELECT id FROM property_images
+                WHERE property_id = :property_id AND deleted_at IS NULL
+            """),
+            {"property_id": property_id}
+        )
+    }
+    missing = [image_id for image_id in data.ids if image_id not in existing]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"画像が見つかりません: {missing}")
+
+    try:
+        rows = db.execute(
+            text("""
+                WITH ordered AS (
+                    SELECT pi.id,
+                           ROW_NUMBER() OVER (
+                               ORDER BY COALESCE(o.position, :unlisted), pi.display_order, pi.id
+                           ) AS new_order
+                    FROM property_images pi
+                    LEFT JOIN unnest(CAST(:ids AS integer[])) WITH ORDINALITY AS o(id, position)
+                        ON o.id = pi.id
+                    WHERE pi.property_id = :property_id AND pi.deleted_at IS NULL
+                )
+                UPDATE property_images pi
+                SET display_order = ordered.new_order,
+                    updated_at = NOW()
+                FROM ordered
+                WHERE pi.id = ordered.id
+                  AND pi.display_order IS DISTINCT FROM ordered.new_order
+                RETURNING pi.id, pi.display_order
+            """),
+            {"ids": data.ids, "unlisted": len(data.ids) + 1, "property_id": property_id}
+        ).fetchall()
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to reorder images: {e}")
+        raise HTTPException(status_code=500, detail=f"画像の並び替えに失敗しました: {str(e)}")
+
+    changed = {row.id for row in rows}
+    results = [
+        {"id": image_id, "display_order": position, "status": "updated" if image_id in changed else "unchanged"}
+        for position, image_id in enumerate(data.ids, start=1)
+    ]
+    return {"updated": len(changed), "results": results}
@@ -58,7 +58,7 @@ class BulkSyncResult(BaseModel):
 # ========================================
 
 @router.get("/", response_model=List[Integration])
-async def get_integrations():
+def get_integrations():
     """連携先一覧を取得"""
     with READatabase.cursor() as (cur, conn):
         cur.execute("""
@@ -82,7 +82,7 @@ async def get_integrations():
 
 
 @router.patch("/{code}", response_model=Integration)
-async def update_integration(code: str, data: IntegrationUpdate):
+def update_integration(code: str, data: IntegrationUpdate):
     """連携先の有効/無効を切り替え"""
     with READatabase.cursor() as (cur, conn):
         cur.execute("""
@@ -113,7 +113,7 @@ async def update_integration(code: str, data: IntegrationUpdate):
 # ========================================
 
 @router.get("/sync-status")
-async def get_sync_status(limit: int = 100, offset: int = 0):
+def get_sync_status(limit: int = 100, offset: int = 0):
     """物件の同期状態一覧を取得"""
     with READatabase.cursor() as (cur, conn):
         # アクティブな連携先を取得
@@ -167,7 +167,7 @@ async def get_sync_status(limit: int = 100, offset: int = 0):
 
 
 @router.get("/sync-summary")
-async def get_sync_summary():
+def get_sync_summary():
     """同期状態サマリーを取得"""
     with READatabase.cursor() as (cur, conn):
         # 総物件数
@@ -205,7 +205,7 @@ async def get_sync_summary():
 # ========================================
 
 @router.post("/bulk-sync", response_model=BulkSyncResult)
-async def bulk_sync(request: BulkSyncRequest):
+def bulk_sync(request: BulkSyncRequest):
     """物件を一括同期"""
     # 連携先のエンドポイントを取得
     with READatabase.cursor() as (cur, conn):
@@ -13,6 +13,7 @@ from pathlib import Path
 project_root = Path(__file__).resolve().parent.parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Set
 
 # ロガー設定
@@ -26,6 +27,7 @@ from sqlalchemy import MetaData, Table, text
 from sqlalchemy.orm import Session
 
 from shared.config.tables import ALL_ALLOWED_TABLES
+from shared.schema_registry import schema_registry
 
 router = APIRouter()
 
@@ -241,63 +243,30 @@ def get_table_columns_with_labels(
         # master_optionsキャッシュを先に取得
         master_options_cache = _get_master_options_cache(db)
 
-        # 1. DBカラム + column_labels（column_labelsに登録されているカラムのみ表示）
-        query = text(
-            """
-            SELECT
-                c.column_name,
-                c.data_type,
-                c.character_maximum_length,
-                c.numeric_precision,
-                c.is_nullable,
-                c.column_default,
-                c.ordinal_position,
-                -- column_labelsからの情報
-                cl.japanese_label,
-                cl.description,
-                cl.input_type,
-                cl.display_order,
-                cl.is_required,
-                cl.group_name,
-                cl.max_length,
-                cl.visible_for,
-                cl.master_category_code,
-                cl.group_order,
-                cl.placeholder,
-                -- 主キー判定
-                CASE
-                    WHEN pk.column_name IS NOT NULL THEN true
-                    ELSE false
-                END as is_primary_key
-            FROM information_schema.columns c
-            INNER JOIN column_labels cl
-                ON cl.table_name = c.table_name
-                AND cl.column_name = c.column_name
-            LEFT JOIN (
-                SELECT kcu.column_name
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu
-                    ON tc.constraint_name = kcu.constraint_name
-                WHERE tc.table_name = :table_name
-                AND tc.constraint_type = 'PRIMARY KEY'
-            ) pk ON pk.column_name = c.column_name
-            WHERE c.table_schema = 'public'
-            AND c.table_name = :table_name
-            ORDER BY
-                COALESCE(cl.group_order, 999),
-                COALESCE(cl.display_order, c.ordinal_position),
-                c.ordinal_position
-        """
-        )
+        # スキーマレジストリから取得（information_schema / column_labels を都度参照しない）
+        db_columns = schema_registry.get_column_info(table_name, db)
+        labels = schema_registry.get_column_labels(table_name, db)
 
-        result = db.execute(query, {"table_name": table_name})
+        # 1. DBカラム + column_labels（column_labelsに登録されているカラムのみ表示）
+        real_rows = []
+        for c in db_columns:
+            label = labels.get(c["column_name"])
+            if label is None:
+                continue
+            # data_type等の重複キーはinformation_schemaの値を優先
+            real_rows.append(SimpleNamespace(**{**label, **c}))
+        real_rows.sort(key=lambda r: (
+            r.group_order if r.group_order is not None else DEFAULT_ORDER,
+            r.display_order if r.display_order is not None else r.ordinal_position,
+            r.ordinal_position,
+        ))
         columns = []
         existing_column_names = set()
 
         # property_typesから動的に選択肢を取得
         property_type_options = _get_property_type_options(db)
 
-        for row in result:
+        for row in real_rows:
             existing_column_names.add(row.column_name)
 
             # 選択肢の取得:
@@ -344,34 +313,12 @@ def get_table_columns_with_labels(
             columns.append(column_info)
 
         # 2. 仮想カラム（column_labelsにのみ存在するカラム）を追加
-        virtual_query = text(
-            """
-            SELECT
-                cl.column_name,
-                cl.japanese_label,
-                cl.description,
-                cl.input_type,
-                cl.display_order,
-                cl.is_required,
-                cl.group_name,
-                cl.max_length,
-                cl.data_type,
-                cl.visible_for,
-                cl.master_category_code,
-                cl.group_order,
-                cl.placeholder
-            FROM column_labels cl
-            WHERE cl.table_name = :table_name
-            AND cl.column_name NOT IN (
-                SELECT c.column_name
-                FROM information_schema.columns c
-                WHERE c.table_schema = 'public' AND c.table_name = :table_name
-            )
-            ORDER BY cl.group_order, cl.display_order
-        """
-        )
-
-        virtual_result = db.execute(virtual_query, {"table_name": table_name})
+        db_column_names = {c["column_name"] for c in db_columns}
+        virtual_result = [
+            SimpleNamespace(**label)
+            for column_name, label in labels.items()
+            if column_name not in db_column_names
+        ]
         for row in virtual_result:
             # 仮想カラムのoptions取得（master_optionsから）
             if row.master_category_code and row.master_category_code in master_options_cache:
@@ -418,6 +365,20 @@ def get_table_columns_with_labels(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/field-presets/{table_name}", response_model=Dict[str, List[str]])
+def get_field_presets(
+    table_name: str, db: Session = Depends(dependencies.get_db)
+) -> Dict[str, List[str]]:
+    """
+    カラムプリセット（fields= に指定可能な名前と対象カラム）を取得
+    column_labels.field_presets から組み立てる
+    """
+    if table_name not in ALLOWED_TABLES:
+        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
+
+    return schema_registry.get_field_presets(table_name, db)
+
+
 @router.get("/enums/{enum_name}", response_model=List[str])
 def get_enum_values(
     enum_name: str, db: Session = Depends(dependencies.get_db)
@@ -462,19 +423,13 @@ def get_filter_options(db: Session = Depends(dependencies.get_db)) -> Dict[str,
     try:
         filter_options: Dict[str, List[Dict[str, Any]]] = {}
 
-        # column_labelsからフィルター用フィールドのmaster_category_codeを取得
-        query = text("""
-            SELECT column_name, master_category_code
-            FROM column_labels
-            WHERE table_name = 'properties'
-            AND column_name IN ('sales_status', 'publication_status')
-            AND master_category_code IS NOT NULL
-        """)
-        result = db.execute(query)
+        # column_labelsからフィルター用フィールドのmaster_category_codeを取得（スキーマレジストリ経由）
+        property_labels = schema_registry.get_column_labels("properties", db)
 
-        for row in result:
-            column_name = row.column_name
-            master_category_code = row.master_category_code
+        for column_name in ("sales_status", "publication_status"):
+            master_category_code = property_labels.get(column_name, {}).get("master_category_code")
+            if not master_category_code:
+                continue
 
             # master_optionsから選択肢を取得（metadataも含む）
             options_query = text("""
@@ -36,7 +36,7 @@ class ValidationResult(BaseModel):
 
 
 @router.post("/homes/export")
-async def export_homes_csv(request: ExportRequest):
+def export_homes_csv(request: ExportRequest):
     """HOMES CSV出力
 
     Args:
@@ -73,7 +73,7 @@ async def export_homes_csv(request: ExportRequest):
 
 
 @router.post("/homes/validate", response_model=ValidationResult)
-async def validate_homes_export(request: ExportRequest):
+def validate_homes_export(request: ExportRequest):
     """HOMES出力前バリデーション
 
     Args:
@@ -103,7 +103,7 @@ async def validate_homes_export(request: ExportRequest):
 
 
 @router.get("/homes/field-mapping")
-async def get_homes_field_mapping():
+def get_homes_field_mapping():
     """HOMESフィールドマッピング定義を取得
 
     Returns:
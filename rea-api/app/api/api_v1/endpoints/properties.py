@@ -5,17 +5,26 @@
 column_labelsテーブルをベースに動的に処理する。
 ハードコードなし。
 """
+import csv
+import io
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from app.core.database import get_db
-from app.crud.generic import GenericCRUD
+from app.crud.generic import GenericCRUD, encode_cursor
+from app.services.property_search import SEARCH_RANK_COLUMN
 from app.services.publication_validator import (
     validate_for_publication,
     format_validation_error,
     format_validation_error_grouped,
 )
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
@@ -33,6 +42,45 @@ PUB_STATUS_MEMBER = "会員公開"
 PUB_STATUS_PRE_CHECK = "公開前確認"
 VALID_PUBLICATION_STATUSES = [PUB_STATUS_PUBLIC, PUB_STATUS_PRIVATE, PUB_STATUS_MEMBER, PUB_STATUS_PRE_CHECK]
 
+# 一括取得の上限件数
+MAX_FULL_BATCH_SIZE = 500
+
+# 汎用検索の対象カラム（search_textがない環境のILIKE検索用）
+SEARCH_COLUMNS = ["property_name", "company_property_number"]
+
+# エクスポート時に1チャンクへまとめる行数
+EXPORT_CHUNK_ROWS = 500
+
+# 一括更新の上限件数
+MAX_BULK_UPDATE_SIZE = 1000
+
+# 公開可否一括チェックの上限件数
+MAX_READINESS_BATCH_SIZE = 1000
+
+
+class PropertyListFilter(BaseModel):
+    """一括処理の対象条件（GET /properties と同じフィルタ）"""
+    search: Optional[str] = None
+    property_type: Optional[str] = None
+    sales_status: Optional[str] = None
+    publication_status: Optional[str] = None
+    sale_price_min: Optional[int] = None
+    sale_price_max: Optional[int] = None
+
+
+class BulkUpdateRequest(BaseModel):
+    """一括更新リクエスト（idsまたはfilterのどちらかを指定）"""
+    ids: Optional[List[int]] = None
+    filter: Optional[PropertyListFilter] = None
+    patch: Dict[str, Any]
+
+
+class PublicationReadinessRequest(BaseModel):
+    """公開可否一括チェックリクエスト（idsまたはfilterのどちらかを指定）"""
+    ids: Optional[List[int]] = None
+    filter: Optional[PropertyListFilter] = None
+    target_status: str = PUB_STATUS_PUBLIC
+
 
 # =============================================================================
 # DB設定読み込み関数（ステータス連動）
@@ -79,6 +127,115 @@ def get_status_trigger_codes(db: Session, trigger_type: str) -> List[int]:
         return []  # フォールバック: 空リスト（連動しない）
 
 
+def normalize_update_data(property_data: Dict[str, Any]) -> None:
+    """
+    更新データの正規化・検証（単体更新・一括更新共通）
+
+    文字列はトリムし、null不可カラム・公開ステータスの値を検証する。
+
+    Raises:
+        HTTPException: 検証エラー（400）
+    """
+    # 文字列フィールドのトリム処理
+    for key, value in property_data.items():
+        if isinstance(value, str):
+            property_data[key] = value.strip()
+
+    # property_nameがnullの場合は400エラー
+    if "property_name" in property_data and property_data["property_name"] is None:
+        raise HTTPException(status_code=400, detail="property_nameをnullにすることはできません")
+
+    # publication_statusがnullの場合は400エラー
+    if "publication_status" in property_data and property_data["publication_status"] is None:
+        raise HTTPException(status_code=400, detail="publication_statusをnullにすることはできません")
+
+    # publication_statusの値バリデーション
+    if "publication_status" in property_data and property_data["publication_status"] is not None:
+        if property_data["publication_status"] not in VALID_PUBLICATION_STATUSES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"publication_statusの値が不正です。有効な値: {', '.join(VALID_PUBLICATION_STATUSES)}"
+            )
+
+
+def apply_status_linkage(
+    property_data: Dict[str, Any],
+    existing_full: Dict[str, Any],
+    trigger_codes: Callable[[str], List[int]],
+) -> None:
+    """
+    販売ステータス → 公開ステータス連動（完全DB駆動）
+
+    sales_statusが変わる場合、master_optionsの設定に応じて
+    publication_statusを「公開前確認」または「非公開」に変更する。
+
+    trigger_codes: trigger_type → option_code一覧（get_status_trigger_codes）
+    """
+    new_sales_status = property_data.get("sales_status")
+    current_sales_status = existing_full.get("sales_status")
+
+    if new_sales_status and new_sales_status != current_sales_status:
+        # 数値に変換（フロントからは数値で来る）
+        sales_code = int(new_sales_status) if str(new_sales_status).isdigit() else None
+
+        if sales_code is not None:
+            # 公開前確認連動（DB駆動）
+            if sales_code in trigger_codes('triggers_pre_check'):
+                property_data["publication_status"] = PUB_STATUS_PRE_CHECK
+            # 非公開連動（DB駆動）
+            elif sales_code in trigger_codes('triggers_unpublish'):
+                property_data["publication_status"] = PUB_STATUS_PRIVATE
+
+
+def apply_auto_calculations(property_data: Dict[str, Any], existing_full: Dict[str, Any]) -> None:
+    """自動計算: 坪単価・仲介手数料（マージしたデータから計算、更新データ優先）"""
+    merged_for_calc = {**existing_full, **property_data}
+    sale_price = merged_for_calc.get("sale_price")
+    land_area = merged_for_calc.get("land_area")  # land_infoテーブル
+
+    # 坪単価: 常に再計算（price_per_tsuboは自動計算フィールド）
+    if sale_price and land_area:
+        calculated_price_per_tsubo = calculate_price_per_tsubo(sale_price, land_area)
+        if calculated_price_per_tsubo is not None:
+            property_data["price_per_tsubo"] = calculated_price_per_tsubo
+
+    # 仲介手数料: 既存値がない場合のみ自動計算（編集可能）
+    current_brokerage_fee = merged_for_calc.get("brokerage_fee")
+    if not current_brokerage_fee and sale_price:
+        calculated_fee = calculate_brokerage_fee(sale_price)
+        if calculated_fee is not None:
+            property_data["brokerage_fee"] = calculated_fee
+
+
+def check_publication(
+    db: Session,
+    property_data: Dict[str, Any],
+    existing_full: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    """
+    公開時バリデーション
+
+    publication_statusが「公開」「会員公開」に変更される場合、
+    現在データと更新データをマージしてrequired_for_publicationの必須項目をチェック。
+
+    Returns:
+        エラー詳細（グループ別）、問題なければNone
+    """
+    new_publication_status = property_data.get("publication_status")
+    if not new_publication_status:
+        return None
+
+    merged_data = {**existing_full, **property_data}
+    current_status = existing_full.get("publication_status")
+
+    is_valid, missing_fields = validate_for_publication(
+        db, merged_data, new_publication_status, current_status
+    )
+    if is_valid:
+        return None
+    return format_validation_error_grouped(missing_fields, new_publication_status)
+
+
 def require_auth(request: Request) -> dict:
     """認証を要求（ログイン必須）"""
     user = get_current_user(request)
@@ -87,6 +244,172 @@ def require_auth(request: Request) -> dict:
     return user
 
 
+def parse_id_list(ids: str, max_count: int) -> List[int]:
+    """
+    カンマ区切りのIDリストを解析（重複除去・順序維持）
+
+    Raises:
+        HTTPException: 形式不正・件数超過
+    """
+    try:
+        parsed = [int(x) for x in ids.split(",") if x.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="idsは整数のカンマ区切りで指定してください")
+
+    unique_ids = list(dict.fromkeys(parsed))
+    if not unique_ids:
+        raise HTTPException(status_code=400, detail="idsを指定してください")
+    if len(unique_ids) > max_count:
+        raise HTTPException(status_code=400, detail=f"idsは最大{max_count}件までです")
+    return unique_ids
+
+
+def build_list_filters(
+    property_type: Optional[str],
+    sales_status: Optional[str],
+    publication_status: Optional[str],
+    sale_price_min: Optional[int],
+    sale_price_max: Optional[int],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    一覧・エクスポート共通のフィルタ条件を構築
+
+    Returns:
+        (filters, range_filters)
+    """
+    filters: Dict[str, Any] = {}
+    if property_type:
+        filters["property_type"] = f"%{property_type}%"
+    if sales_status:
+        filters["sales_status"] = sales_status
+    if publication_status:
+        filters["publication_status"] = publication_status
+
+    # 価格範囲フィルタ
+    range_filters: Dict[str, Any] = {}
+    if sale_price_min is not None:
+        range_filters["sale_price__gte"] = sale_price_min
+    if sale_price_max is not None:
+        range_filters["sale_price__lte"] = sale_price_max
+
+    return filters, range_filters
+
+
+def build_list_query(
+    search: Optional[str],
+    property_type: Optional[str],
+    sales_status: Optional[str],
+    publication_status: Optional[str],
+    sale_price_min: Optional[int],
+    sale_price_max: Optional[int],
+) -> Dict[str, Any]:
+    """
+    一覧・エクスポート・一括処理共通の検索条件（GenericCRUD の一覧系メソッドの引数）
+
+    検索語がある場合、完全一致フィルタは使わない（範囲フィルタのみ併用）。
+    """
+    filters, range_filters = build_list_filters(
+        property_type, sales_status, publication_status, sale_price_min, sale_price_max
+    )
+    return {
+        "filters": filters if filters and not search else None,
+        "range_filters": range_filters or None,
+        "search_term": search,
+        "search_columns": SEARCH_COLUMNS if search else None,
+    }
+
+
+def resolve_target_ids(
+    crud: GenericCRUD,
+    ids: Optional[List[int]],
+    list_filter: Optional[PropertyListFilter],
+    max_count: int,
+    label: str,
+) -> List[int]:
+    """
+    一括処理の対象IDを決定（ids優先、なければfilterに一致する物件をID順）
+
+    Raises:
+        HTTPException: 未指定・件数超過
+    """
+    if ids:
+        property_ids = list(dict.fromkeys(ids))
+    elif list_filter:
+        rows = crud.iter_list(
+            "properties",
+            sort_by="id",
+            sort_order="asc",
+            fields=["id"],
+            **build_list_query(**list_filter.model_dump()),
+        )
+        # 上限+1件で打ち切り（超過判定用）
+        property_ids = [row["id"] for row in islice(rows, max_count + 1)]
+        rows.close()
+    else:
+        raise HTTPException(status_code=400, detail="idsまたはfilterを指定してください")
+
+    if len(property_ids) > max_count:
+        raise HTTPException(status_code=400, detail=f"{label}は最大{max_count}件までです")
+    return property_ids
+
+
+def stream_ndjson(items: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    """辞書のイテレータをNDJSON（1行1JSON）として逐次出力"""
+    lines = []
+    for item in items:
+        lines.append(json.dumps(jsonable_encoder(item), ensure_ascii=False))
+        if len(lines) >= EXPORT_CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def _csv_value(value: Any) -> Any:
+    """CSVセル値に変換（JSONB等の構造はJSON文字列、NULLは空文字）"""
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(jsonable_encoder(value), ensure_ascii=False)
+    return value
+
+
+def stream_csv(items: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    """
+    辞書のイテレータをCSVとして逐次出力（UTF-8 BOM付き、Excel互換）
+
+    ヘッダーは先頭行のキーから作成する。
+    """
+    buffer = io.StringIO()
+    writer = None
+    rows = 0
+
+    buffer.write("\ufeff")
+    for item in items:
+        if writer is None:
+            writer = csv.writer(buffer)
+            writer.writerow(item.keys())
+        writer.writerow(_csv_value(v) for v in item.values())
+        rows += 1
+        if rows % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def stream_json_array(items: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    """辞書のイテレータをJSON配列として逐次出力"""
+    yield "["
+    for i, item in enumerate(items):
+        if i:
+            yield ","
+        yield json.dumps(jsonable_encoder(item), ensure_ascii=False)
+    yield "]"
+
+
 @router.get("/", response_model=Dict[str, Any])
 def read_properties(
     request: Request,
@@ -100,85 +423,195 @@ def read_properties(
     sale_price_max: Optional[int] = Query(None, description="最高価格（円）"),
     sort_by: Optional[str] = Query("id", description="ソート対象カラム"),
     sort_order: Optional[str] = Query("desc", description="ソート順序（asc/desc）"),
+    cursor: Optional[str] = Query(None, description="次ページカーソル（前回レスポンスのnext_cursor、指定時はskipを無視）"),
+    count: str = Query("exact", pattern="^(exact|estimate)$", description="総件数の取得方法（exact/estimate、estimateはフィルタなし時のみ有効）"),
+    fields: Optional[str] = Query(None, description="取得カラム（カンマ区切り、またはプリセット名 list/map/export）"),
     db: Session = Depends(get_db),
 ):
     """
     物件一覧取得（検索条件付き・ページネーション対応）
 
+    ページネーション:
+    - skip/limit: オフセット方式（従来互換）
+    - cursor/limit: キーセット方式（深いページでも一定コスト）
+
+    件数:
+    - count=exact: 一覧と同じクエリで正確な件数を取得
+    - count=estimate: フィルタなしの場合はプランナー推定値（テーブルスキャンなし）
+
+    カラム:
+    - fields未指定: 全カラム
+    - fields=list 等: column_labels.field_presets で定義されたプリセット
+    - fields=id,property_name,...: column_labelsに登録されたカラムのみ指定可能
+
     レスポンス形式:
     {
         "items": [...],
-        "total": 件数
+        "total": 件数,
+        "total_is_estimate": totalが推定値か,
+        "next_cursor": 次ページカーソル（最終ページはnull）
     }
     """
     require_auth(request)
     crud = GenericCRUD(db)
 
-    # フィルタ条件を構築
-    filters: Dict[str, Any] = {}
-    if property_type:
-        filters["property_type"] = f"%{property_type}%"
-    if sales_status:
-        filters["sales_status"] = sales_status
-    if publication_status:
-        filters["publication_status"] = publication_status
+    sort_by = sort_by or "id"
+    sort_order = sort_order if sort_order in ("asc", "desc") else "desc"
 
-    # 価格範囲フィルタ
-    range_filters: Dict[str, Any] = {}
-    if sale_price_min is not None:
-        range_filters["sale_price__gte"] = sale_price_min
-    if sale_price_max is not None:
-        range_filters["sale_price__lte"] = sale_price_max
+    query = build_list_query(
+        search, property_type, sales_status, publication_status, sale_price_min, sale_price_max
+    )
+
+    try:
+        columns = crud.resolve_fields("properties", fields)
+
+        if count == "estimate" and not (search or query["filters"] or query["range_filters"]):
+            # フィルタなし: 一覧のみ取得し、件数はプランナー推定値
+            results = crud.get_list(
+                "properties",
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                cursor=cursor,
+                fields=columns,
+            )
+            total = crud.get_count_estimate("properties")
+            total_is_estimate = True
+        else:
+            if search:
+                # 検索時は類似度順（search_textがない環境ではid降順）
+                sort_by, sort_order = SEARCH_RANK_COLUMN, "desc"
+            # 一覧と総件数を1クエリで取得
+            results, total = crud.get_list_with_total(
+                "properties",
+                skip=skip,
+                limit=limit,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                cursor=cursor,
+                fields=columns,
+                **query,
+            )
+            total_is_estimate = False
+    except ValueError as e:
+        # 不正なカーソル・未登録のカラム
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # 次ページカーソル（limit件取得できた場合のみ）
+    next_cursor = None
+    if len(results) == limit:
+        next_cursor = encode_cursor(sort_by, sort_order, results[-1])
+
+    # 検索ランキング（search_rank）は並び順・カーソル用の値でレスポンスには含めない
+    for item in results:
+        item.pop(SEARCH_RANK_COLUMN, None)
+
+    return {
+        "items": results,
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+        "next_cursor": next_cursor,
+    }
 
-    # 検索カラム定義
-    search_columns = ["property_name", "company_property_number"]
 
-    # 汎用検索
+@router.get("/export")
+def export_properties(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="出力形式（ndjson/csv）"),
+    search: Optional[str] = Query(None, description="汎用検索（物件名・物件番号）"),
+    property_type: Optional[str] = Query(None, description="物件種別"),
+    sales_status: Optional[str] = Query(None, description="販売状況"),
+    publication_status: Optional[str] = Query(None, description="公開状態"),
+    sale_price_min: Optional[int] = Query(None, description="最低価格（円）"),
+    sale_price_max: Optional[int] = Query(None, description="最高価格（円）"),
+    sort_by: Optional[str] = Query("id", description="ソート対象カラム"),
+    sort_order: Optional[str] = Query("desc", description="ソート順序（asc/desc）"),
+    fields: Optional[str] = Query(None, description="取得カラム（カンマ区切り、またはプリセット名 list/map/export）"),
+    db: Session = Depends(get_db),
+):
+    """
+    物件一覧エクスポート（全件ストリーミング）
+
+    条件は GET /properties と同じ（ページネーションなし）。
+    サーバーサイドカーソルで少しずつ読み出して逐次出力するため、
+    件数に関わらずメモリ使用量は一定。
+
+    - format=ndjson: 1行1物件のJSON（application/x-ndjson）
+    - format=csv: ヘッダー付きCSV（UTF-8 BOM付き）
+    """
+    require_auth(request)
+    crud = GenericCRUD(db)
+
+    sort_by = sort_by or "id"
+    sort_order = sort_order if sort_order in ("asc", "desc") else "desc"
     if search:
-        # 検索は別メソッドで処理
-        results = crud.search(
-            "properties",
-            search,
-            search_columns=search_columns,
-            skip=skip,
-            limit=limit,
-            range_filters=range_filters if range_filters else None,
-        )
-        # 総件数取得（検索条件付き）
-        total = crud.get_count(
-            "properties",
-            range_filters=range_filters if range_filters else None,
-            search_term=search,
-            search_columns=search_columns,
-        )
-    else:
-        results = crud.get_list(
-            "properties",
-            skip=skip,
-            limit=limit,
-            filters=filters if filters else None,
-            range_filters=range_filters if range_filters else None,
-            sort_by=sort_by or "id",
-            sort_order=sort_order or "desc",
-        )
-        # 総件数取得（フィルタ条件付き）
-        total = crud.get_count(
-            "properties",
-            filters=filters if filters else None,
-            range_filters=range_filters if range_filters else None,
-        )
+        sort_by, sort_order = SEARCH_RANK_COLUMN, "desc"
+
+    query = build_list_query(
+        search, property_type, sales_status, publication_status, sale_price_min, sale_price_max
+    )
+
+    try:
+        columns = crud.resolve_fields("properties", fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    items = crud.iter_list(
+        "properties",
+        sort_by=sort_by,
+        sort_order=sort_order,
+        fields=columns,
+        **query,
+    )
+
+    filename = f"properties_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{format}"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if format == "csv":
+        return StreamingResponse(stream_csv(items), media_type="text/csv; charset=utf-8", headers=headers)
+    return StreamingResponse(stream_ndjson(items), media_type="application/x-ndjson", headers=headers)
+
+
+@router.get("/full")
+def read_properties_full(
+    request: Request,
+    ids: str = Query(..., description=f"物件ID（カンマ区切り、最大{MAX_FULL_BATCH_SIZE}件）"),
+    db: Session = Depends(get_db),
+):
+    """
+    複数物件の詳細を一括取得（関連テーブル・画像含む）
+
+    各要素は GET /properties/{id}/full と同じ形式。
+    ID数に関わらず1クエリで取得し、JSON配列をストリーミングで返す。
+    存在しない・削除済みのIDは結果に含まれない（指定順を維持）。
+    """
+    require_auth(request)
+    property_ids = parse_id_list(ids, MAX_FULL_BATCH_SIZE)
+    crud = GenericCRUD(db)
 
-    return {"items": results, "total": total}
+    return StreamingResponse(
+        stream_json_array(crud.iter_full_many(property_ids)),
+        media_type="application/json",
+    )
 
 
 @router.get("/{property_id}", response_model=Dict[str, Any])
-def read_property(request: Request, property_id: int, db: Session = Depends(get_db)):
+def read_property(
+    request: Request,
+    property_id: int,
+    fields: Optional[str] = Query(None, description="取得カラム（カンマ区切り、またはプリセット名 list/map/export）"),
+    db: Session = Depends(get_db),
+):
     """
     物件詳細取得（propertiesテーブルのみ）
     """
     require_auth(request)
     crud = GenericCRUD(db)
-    result = crud.get("properties", property_id)
+    try:
+        columns = crud.resolve_fields("properties", fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    result = crud.get("properties", property_id, fields=columns)
 
     if result is None:
         raise HTTPException(status_code=404, detail="Property not found")
@@ -248,6 +681,145 @@ def create_property(request: Request, property_data: Dict[str, Any], db: Session
         )
 
 
+@router.post("/bulk-update", response_model=Dict[str, Any])
+def bulk_update_properties(
+    request: Request,
+    body: BulkUpdateRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    物件一括更新（販売状況・公開状態の一括変更等）
+
+    対象は ids または filter で指定し、全件に同じ patch を適用する。
+    PUT /properties/{id} と同じ処理（ステータス連動・自動計算・公開時バリデーション）を
+    全件まとめて行い、検証を通過した物件のみ1トランザクションで更新する。
+
+    レスポンス形式:
+    {
+        "updated": 更新件数,
+        "failed": 失敗件数,
+        "results": [{"id": 物件ID, "status": "updated" | "not_found" | "invalid", "detail": ...}]
+    }
+    """
+    require_auth(request)
+    crud = GenericCRUD(db)
+
+    patch = dict(body.patch)
+    normalize_update_data(patch)
+    if not patch:
+        raise HTTPException(status_code=400, detail="patchを指定してください")
+
+    # 対象IDを決定（条件なしのfilterで全件を更新しないようにする）
+    if not body.ids and body.filter and not any(build_list_query(**body.filter.model_dump()).values()):
+        raise HTTPException(status_code=400, detail="filterの条件を1つ以上指定してください")
+    property_ids = resolve_target_ids(crud, body.ids, body.filter, MAX_BULK_UPDATE_SIZE, "一括更新")
+
+    # 現在データを1クエリで取得
+    existing_by_id = {item["id"]: item for item in crud.iter_full_many(property_ids)}
+
+    # ステータス連動コードはリクエスト内で1回だけ読み込む
+    trigger_cache: Dict[str, List[int]] = {}
+
+    def trigger_codes(trigger_type: str) -> List[int]:
+        if trigger_type not in trigger_cache:
+            trigger_cache[trigger_type] = get_status_trigger_codes(db, trigger_type)
+        return trigger_cache[trigger_type]
+
+    # 全件を検証してから更新データを組み立てる
+    results: List[Dict[str, Any]] = []
+    updates: Dict[int, Dict[str, Any]] = {}
+    for property_id in property_ids:
+        existing_full = existing_by_id.get(property_id)
+        if existing_full is None:
+            results.append({"id": property_id, "status": "not_found"})
+            continue
+
+        property_data = dict(patch)
+        apply_status_linkage(property_data, existing_full, trigger_codes)
+        apply_auto_calculations(property_data, existing_full)
+
+        error_detail = check_publication(db, property_data, existing_full)
+        if error_detail:
+            results.append({"id": property_id, "status": "invalid", "detail": error_detail})
+            continue
+
+        updates[property_id] = property_data
+        results.append({"id": property_id, "status": "updated"})
+
+    try:
+        crud.bulk_update_full(updates)
+        db.commit()
+    except ValueError as e:
+        logger.error(f"Validation error in bulk update: {e}")
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except SQLAlchemyError as e:
+        logger.error(f"Database error in bulk update: {e}")
+        db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"データベースエラー: {str(e)}"
+        )
+
+    return {
+        "updated": len(updates),
+        "failed": len(results) - len(updates),
+        "results": results,
+    }
+
+
+@router.post("/publication-readiness", response_model=Dict[str, Any])
+def check_publication_readiness(
+    request: Request,
+    body: PublicationReadinessRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    公開可否の一括チェック（一覧の「公開可 / 未入力N件」バッジ用）
+
+    対象は ids または filter（一覧と同じ条件、未指定の条件は全件）で最大1000件。
+    物件データは1クエリで取得し、コンパイル済みの公開ルールで全件を検証する。
+
+    レスポンス形式:
+    {
+        "target_status": "公開",
+        "ready_count": 公開可能件数,
+        "results": [{"id": 物件ID, "ready": true/false, "missing_count": N, "missing": ["物件名", ...]}],
+        "not_found": [存在しない・削除済みのID]
+    }
+    """
+    require_auth(request)
+    crud = GenericCRUD(db)
+
+    if body.target_status not in VALID_PUBLICATION_STATUSES:
+        raise HTTPException(status_code=400, detail=f"target_statusが不正です: {body.target_status}")
+
+    property_ids = resolve_target_ids(
+        crud, body.ids, body.filter or PropertyListFilter(), MAX_READINESS_BATCH_SIZE, "公開可否チェック"
+    )
+
+    results: List[Dict[str, Any]] = []
+    found = set()
+    for item in crud.iter_full_many(property_ids):
+        found.add(item["id"])
+        is_valid, missing_fields = validate_for_publication(
+            db, item, body.target_status, item.get("publication_status")
+        )
+        results.append({
+            "id": item["id"],
+            "ready": is_valid,
+            "missing_count": len(missing_fields),
+            "missing": [field["label"] for field in missing_fields],
+        })
+
+    return {
+        "target_status": body.target_status,
+        "ready_count": sum(1 for r in results if r["ready"]),
+        "results": results,
+        "not_found": [pid for pid in property_ids if pid not in found],
+    }
+
+
 @router.put("/{property_id}", response_model=Dict[str, Any])
 def update_property(
     request: Request,
@@ -266,26 +838,7 @@ def update_property(
     require_auth(request)
     crud = GenericCRUD(db)
 
-    # 文字列フィールドのトリム処理
-    for key, value in property_data.items():
-        if isinstance(value, str):
-            property_data[key] = value.strip()
-
-    # property_nameがnullの場合は400エラー
-    if "property_name" in property_data and property_data["property_name"] is None:
-        raise HTTPException(status_code=400, detail="property_nameをnullにすることはできません")
-
-    # publication_statusがnullの場合は400エラー
-    if "publication_status" in property_data and property_data["publication_status"] is None:
-        raise HTTPException(status_code=400, detail="publication_statusをnullにすることはできません")
-
-    # publication_statusの値バリデーション
-    if "publication_status" in property_data and property_data["publication_status"] is not None:
-        if property_data["publication_status"] not in VALID_PUBLICATION_STATUSES:
-            raise HTTPException(
-                status_code=400,
-                detail=f"publication_statusの値が不正です。有効な値: {', '.join(VALID_PUBLICATION_STATUSES)}"
-            )
+    normalize_update_data(property_data)
 
     # 存在確認 & 現在データ取得（全テーブル）
     existing_full = crud.get_full(property_id)
@@ -293,57 +846,15 @@ def update_property(
         raise HTTPException(status_code=404, detail="Property not found")
 
     # 販売ステータス → 公開ステータス連動（完全DB駆動）
-    new_sales_status = property_data.get("sales_status")
-    current_sales_status = existing_full.get("sales_status")
-
-    if new_sales_status and new_sales_status != current_sales_status:
-        # 数値に変換（フロントからは数値で来る）
-        sales_code = int(new_sales_status) if str(new_sales_status).isdigit() else None
-
-        if sales_code is not None:
-            # 公開前確認連動（DB駆動）
-            pre_check_codes = get_status_trigger_codes(db, 'triggers_pre_check')
-            if sales_code in pre_check_codes:
-                property_data["publication_status"] = PUB_STATUS_PRE_CHECK
-            else:
-                # 非公開連動（DB駆動）
-                unpublish_codes = get_status_trigger_codes(db, 'triggers_unpublish')
-                if sales_code in unpublish_codes:
-                    property_data["publication_status"] = PUB_STATUS_PRIVATE
+    apply_status_linkage(property_data, existing_full, lambda t: get_status_trigger_codes(db, t))
 
     # 自動計算: 坪単価・仲介手数料
-    # マージしたデータから計算（更新データ優先）
-    merged_for_calc = {**existing_full, **property_data}
-    sale_price = merged_for_calc.get("sale_price")
-    land_area = merged_for_calc.get("land_area")  # land_infoテーブル
-
-    # 坪単価: 常に再計算（price_per_tsuboは自動計算フィールド）
-    if sale_price and land_area:
-        calculated_price_per_tsubo = calculate_price_per_tsubo(sale_price, land_area)
-        if calculated_price_per_tsubo is not None:
-            property_data["price_per_tsubo"] = calculated_price_per_tsubo
-
-    # 仲介手数料: 既存値がない場合のみ自動計算（編集可能）
-    current_brokerage_fee = merged_for_calc.get("brokerage_fee")
-    if not current_brokerage_fee and sale_price:
-        calculated_fee = calculate_brokerage_fee(sale_price)
-        if calculated_fee is not None:
-            property_data["brokerage_fee"] = calculated_fee
+    apply_auto_calculations(property_data, existing_full)
 
     # 公開時バリデーション
-    new_publication_status = property_data.get("publication_status")
-    if new_publication_status:
-        # 現在データと更新データをマージ
-        merged_data = {**existing_full, **property_data}
-        current_status = existing_full.get("publication_status")
-
-        is_valid, missing_fields = validate_for_publication(
-            db, merged_data, new_publication_status, current_status
-        )
-        if not is_valid:
-            # 詳細なエラー情報を返す（グループ別）
-            error_detail = format_validation_error_grouped(missing_fields, new_publication_status)
-            raise HTTPException(status_code=400, detail=error_detail)
+    error_detail = check_publication(db, property_data, existing_full)
+    if error_detail:
+        raise HTTPException(status_code=400, detail=error_detail)
 
     try:
         result = crud.update_full(property_id, property_data)
@@ -8,6 +8,8 @@ from datetime import datetime, date
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from psycopg2.extensions import AsIs
+from psycopg2.extras import execute_values
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -224,6 +226,18 @@ class RegistryUpdate(BaseModel):
     notes: Optional[str] = None
 
 
+class RegistryEntriesReplace(BaseModel):
+    """甲区・乙区の一括置き換え（None の区は変更しない、[] は全削除）"""
+    kou_entries: Optional[List[KouEntryCreate]] = None
+    otsu_entries: Optional[List[OtsuEntryCreate]] = None
+
+
+class RegistryFullCreate(RegistryCreate):
+    """表題部 + 甲区 + 乙区 の一括作成"""
+    kou_entries: List[KouEntryCreate] = []
+    otsu_entries: List[OtsuEntryCreate] = []
+
+
 def row_to_dict(row, columns) -> dict:
     """DBの行を辞書に変換"""
     return {col: row[i] for i, col in enumerate(columns)}
@@ -246,7 +260,7 @@ REGISTRY_COLUMNS = [
 # 静的パス（{registry_id}より先に定義）
 # ====================
 @router.get("/registries/purposes")
-async def get_registry_purposes():
+def get_registry_purposes():
     """登記目的マスター取得"""
     with READatabase.cursor() as (cur, conn):
         cur.execute("""
@@ -271,7 +285,7 @@ async def get_registry_purposes():
 
 
 @router.get("/registries/metadata")
-async def get_registry_metadata():
+def get_registry_metadata():
     """登記情報のメタデータ（column_labelsから取得）"""
     with READatabase.cursor() as (cur, conn):
         cur.execute("""
@@ -311,7 +325,7 @@ async def get_registry_metadata():
 
 
 @router.get("/properties/{property_id}/registries", response_model=RegistryListResponse)
-async def get_property_registries(property_id: int):
+def get_property_registries(property_id: int):
     """物件の登記情報一覧を取得"""
     with READatabase.cursor() as (cur, conn):
         # 物件存在確認
@@ -341,7 +355,7 @@ async def get_property_registries(property_id: int):
 
 
 @router.post("/properties/{property_id}/registries", response_model=RegistryResponse)
-async def create_registry(property_id: int, data: RegistryCreate):
+def create_registry(property_id: int, data: RegistryCreate):
     """登記情報を追加"""
     with READatabase.cursor(commit=True) as (cur, conn):
         # 物件存在確認
@@ -375,7 +389,7 @@ async def create_registry(property_id: int, data: RegistryCreate):
 
 
 @router.get("/registries/{registry_id}", response_model=RegistryResponse)
-async def get_registry(registry_id: int):
+def get_registry(registry_id: int):
     """登記情報詳細を取得"""
     with READatabase.cursor() as (cur, conn):
         cur.execute(f"""
@@ -399,7 +413,7 @@ async def get_registry(registry_id: int):
 
 
 @router.put("/registries/{registry_id}", response_model=RegistryResponse)
-async def update_registry(registry_id: int, data: RegistryUpdate):
+def update_registry(registry_id: int, data: RegistryUpdate):
     """登記情報を更新"""
     with READatabase.cursor(commit=True) as (cur, conn):
         # 存在確認
@@ -435,7 +449,7 @@ async def update_registry(registry_id: int, data: RegistryUpdate):
 
 
 @router.delete("/registries/{registry_id}")
-async def delete_registry(registry_id: int):
+def delete_registry(registry_id: int):
     """登記情報を論理削除"""
     with READatabase.cursor(commit=True) as (cur, conn):
         cur.execute(
@@ -459,7 +473,7 @@ KOU_COLUMNS = [
 
 
 @router.get("/registries/{registry_id}/kou", response_model=List[KouEntryResponse])
-async def get_kou_entries(registry_id: int):
+def get_kou_entries(registry_id: int):
     """甲区エントリ一覧取得"""
     with READatabase.cursor() as (cur, conn):
         cur.execute(f"""
@@ -482,7 +496,7 @@ async def get_kou_entries(registry_id: int):
 
 
 @router.post("/registries/{registry_id}/kou", response_model=KouEntryResponse)
-async def create_kou_entry(registry_id: int, data: KouEntryCreate):
+def create_kou_entry(registry_id: int, data: KouEntryCreate):
     """甲区エントリ追加"""
     with READatabase.cursor(commit=True) as (cur, conn):
         # 表題部存在確認
@@ -513,7 +527,7 @@ async def create_kou_entry(registry_id: int, data: KouEntryCreate):
 
 
 @router.put("/registries/kou/{entry_id}", response_model=KouEntryResponse)
-async def update_kou_entry(entry_id: int, data: KouEntryCreate):
+def update_kou_entry(entry_id: int, data: KouEntryCreate):
     """甲区エントリ更新"""
     with READatabase.cursor(commit=True) as (cur, conn):
         update_data = data.model_dump(exclude_none=True)
@@ -544,7 +558,7 @@ async def update_kou_entry(entry_id: int, data: KouEntryCreate):
 
 
 @router.delete("/registries/kou/{entry_id}")
-async def delete_kou_entry(entry_id: int):
+def delete_kou_entry(entry_id: int):
     """甲区エントリ論理削除"""
     with READatabase.cursor(commit=True) as (cur, conn):
         cur.execute("UPDATE registry_kou_entries SET deleted_at = NOW() WHERE id = %s AND deleted_at IS NULL RETURNING id", (entry_id,))
@@ -567,7 +581,7 @@ OTSU_COLUMNS = [
 
 
 @router.get("/registries/{registry_id}/otsu", response_model=List[OtsuEntryResponse])
-async def get_otsu_entries(registry_id: int):
+def get_otsu_entries(registry_id: int):
     """乙区エントリ一覧取得"""
     with READatabase.cursor() as (cur, conn):
         cur.execute(f"""
@@ -590,7 +604,7 @@ async def get_otsu_entries(registry_id: int):
 
 
 @router.post("/registries/{registry_id}/otsu", response_model=OtsuEntryResponse)
-async def create_otsu_entry(registry_id: int, data: OtsuEntryCreate):
+def create_otsu_entry(registry_id: int, data: OtsuEntryCreate):
     """乙区エントリ追加"""
     with READatabase.cursor(commit=True) as (cur, conn):
         # 表題部存在確認
@@ -621,7 +635,7 @@ async def create_otsu_entry(registry_id: int, data: OtsuEntryCreate):
 
 
 @router.put("/registries/otsu/{entry_id}", response_model=OtsuEntryResponse)
-async def update_otsu_entry(entry_id: int, data: OtsuEntryCreate):
+def update_otsu_entry(entry_id: int, data: OtsuEntryCreate):
     """乙区エントリ更新"""
     with READatabase.cursor(commit=True) as (cur, conn):
         update_data = data.model_dump(exclude_none=True)
@@ -652,7 +666,7 @@ async def update_otsu_entry(entry_id: int, data: OtsuEntryCreate):
 
 
 @router.delete("/registries/otsu/{entry_id}")
-async def delete_otsu_entry(entry_id: int):
+def delete_otsu_entry(entry_id: int):
     """乙区エントリ論理削除"""
     with READatabase.cursor(commit=True) as (cur, conn):
         cur.execute("UPDATE registry_otsu_entries SET deleted_at = NOW() WHERE id = %s AND deleted_at IS NULL RETURNING id", (entry_id,))
@@ -662,61 +676,149 @@ async def delete_otsu_entry(entry_id: int):
 
 
 # ====================
-# 全情報取得（表題部 + 甲区 + 乙区）
+# 全情報取得・一括書き込み（表題部 + 甲区 + 乙区）
 # ====================
+# 列値に DEFAULT を指定する（複数行INSERTで一部の行だけ項目が無い場合）
+_DEFAULT = AsIs('DEFAULT')
+
+REGISTRY_DATE_KEYS = ['built_date', 'ownership_date', 'mortgage_date', 'certified_date', 'title_cause_date']
+
+
+def _registry_document_query(where: str) -> str:
+    """表題部と甲区・乙区（JSON配列）を1文で取得するSQL"""
+    def entries(table: str, columns: List[str]) -> str:
+        return f"""COALESCE((
+                   SELECT json_agg(e ORDER BY e.rank_number, e.id)
+                   FROM (
+                       SELECT {', '.join(columns)}
+                       FROM {table}
+                       WHERE registry_id = r.id AND deleted_at IS NULL
+                   ) e
+               ), '[]'::json)"""
+
+    return f"""
+        SELECT {', '.join('r.' + col for col in REGISTRY_COLUMNS)},
+               {entries('registry_kou_entries', KOU_COLUMNS)} AS kou_entries,
+               {entries('registry_otsu_entries', OTSU_COLUMNS)} AS otsu_entries
+        FROM property_registries r
+        WHERE {where} AND r.deleted_at IS NULL
+        ORDER BY r.registry_type, r.id
+    """
+
+
+def _fetch_registry_documents(cur, where: str, params: tuple) -> List[Dict[str, Any]]:
+    """{registry, kou_entries, otsu_entries} のリスト（日付はjson_aggで文字列になる）"""
+    cur.execute(_registry_document_query(where), params)
+    documents = []
+    for row in cur.fetchall():
+        registry = row_to_dict(row, REGISTRY_COLUMNS)
+        for key in REGISTRY_DATE_KEYS:
+            if registry.get(key):
+                registry[key] = str(registry[key])
+        documents.append({
+            "registry": registry,
+            "kou_entries": row[len(REGISTRY_COLUMNS)],
+            "otsu_entries": row[len(REGISTRY_COLUMNS) + 1],
+        })
+    return documents
+
+
+def _insert_entries(cur, table: str, registry_id: int, entries: List[BaseModel]) -> None:
+    """甲区・乙区エントリを複数行INSERTで追加（未指定の項目はDBの既定値）"""
+    if not entries:
+        return
+    rows = [entry.model_dump(exclude_none=True) for entry in entries]
+    used = {col for row in rows for col in row}
+    columns = [col for col in type(entries[0]).model_fields if col in used]
+
+    execute_values(
+        cur,
+        f"INSERT INTO {table} (registry_id, {', '.join(columns)}) VALUES %s",
+        [(registry_id, *[row.get(col, _DEFAULT) for col in columns]) for row in rows],
+        page_size=len(rows),
+    )
+
+
+def _replace_entries(cur, table: str, registry_id: int, entries: List[BaseModel]) -> None:
+    """既存エントリを論理削除して置き換え"""
+    cur.execute(
+        f"UPDATE {table} SET deleted_at = NOW() WHERE registry_id = %s AND deleted_at IS NULL",
+        (registry_id,)
+    )
+    _insert_entries(cur, table, registry_id, entries)
+
+
 @router.get("/registries/{registry_id}/full")
-async def get_registry_full(registry_id: int):
-    """登記情報の全情報取得（表題部 + 甲区 + 乙区）"""
+def get_registry_full(registry_id: int):
+    """登記情報の全情報取得（表題部 + 甲区 + 乙区、1クエリ）"""
     with READatabase.cursor() as (cur, conn):
-        # 表題部
-        cur.execute(f"""
-            SELECT {', '.join(REGISTRY_COLUMNS)}
-            FROM property_registries
-            WHERE id = %s AND deleted_at IS NULL
-        """, (registry_id,))
-        row = cur.fetchone()
-        if not row:
+        documents = _fetch_registry_documents(cur, "r.id = %s", (registry_id,))
+        if not documents:
             raise HTTPException(status_code=404, detail="登記情報が見つかりません")
+        return documents[0]
 
-        registry = row_to_dict(row, REGISTRY_COLUMNS)
-        for key in ['built_date', 'ownership_date', 'mortgage_date', 'certified_date', 'title_cause_date']:
-            if registry.get(key):
-                registry[key] = str(registry[key])
 
-        # 甲区
-        cur.execute(f"""
-            SELECT {', '.join(KOU_COLUMNS)}
-            FROM registry_kou_entries
-            WHERE registry_id = %s AND deleted_at IS NULL
-            ORDER BY rank_number
-        """, (registry_id,))
-        kou_rows = cur.fetchall()
-        kou_entries = []
-        for r in kou_rows:
-            data = row_to_dict(r, KOU_COLUMNS)
-            for key in ['reception_date', 'cause_date', 'deletion_date']:
-                if data.get(key):
-                    data[key] = str(data[key])
-            kou_entries.append(data)
+@router.get("/properties/{property_id}/registries/full")
+def get_property_registries_full(property_id: int):
+    """物件の登記情報を甲区・乙区を含めて全件取得（1クエリ）"""
+    with READatabase.cursor() as (cur, conn):
+        documents = _fetch_registry_documents(cur, "r.property_id = %s", (property_id,))
+        if not documents:
+            # 登記が無い場合のみ物件の存在を確認
+            cur.execute("SELECT id FROM properties WHERE id = %s AND deleted_at IS NULL", (property_id,))
+            if not cur.fetchone():
+                raise HTTPException(status_code=404, detail="物件が見つかりません")
+        return {"items": documents, "total": len(documents)}
+
+
+@router.post("/properties/{property_id}/registries/full")
+def create_registry_full(property_id: int, data: RegistryFullCreate):
+    """表題部と甲区・乙区エントリを1トランザクションで作成"""
+    with READatabase.cursor(commit=True) as (cur, conn):
+        cur.execute("SELECT id FROM properties WHERE id = %s AND deleted_at IS NULL", (property_id,))
+        if not cur.fetchone():
+            raise HTTPException(status_code=404, detail="物件が見つかりません")
+
+        insert_data = data.model_dump(exclude_none=True, exclude={'kou_entries', 'otsu_entries'})
+        insert_data['property_id'] = property_id
+
+        columns = list(insert_data.keys())
+        values = [insert_data[col] for col in columns]
+        placeholders = ', '.join(['%s'] * len(columns))
 
-        # 乙区
         cur.execute(f"""
-            SELECT {', '.join(OTSU_COLUMNS)}
-            FROM registry_otsu_entries
-            WHERE registry_id = %s AND deleted_at IS NULL
-            ORDER BY rank_number
-        """, (registry_id,))
-        otsu_rows = cur.fetchall()
-        otsu_entries = []
-        for r in otsu_rows:
-            data = row_to_dict(r, OTSU_COLUMNS)
-            for key in ['reception_date', 'cause_date', 'deletion_date']:
-                if data.get(key):
-                    data[key] = str(data[key])
-            otsu_entries.append(data)
+            INSERT INTO property_registries ({', '.join(columns)})
+            VALUES ({placeholders})
+            RETURNING id
+        """, values)
+        registry_id = cur.fetchone()[0]
 
-        return {
-            "registry": registry,
-            "kou_entries": kou_entries,
-            "otsu_entries": otsu_entries
-        }
+        _insert_entries(cur, 'registry_kou_entries', registry_id, data.kou_entries)
+        _insert_entries(cur, 'registry_otsu_entries', registry_id, data.otsu_entries)
+
+        return _fetch_registry_documents(cur, "r.id = %s", (registry_id,))[0]
+
+
+@router.put("/registries/{registry_id}/entries")
+def replace_registry_entries(registry_id: int, data: RegistryEntriesReplace):
+    """甲区・乙区エントリをまとめて置き換え（既存は論理削除、1トランザクション）"""
+    if data.kou_entries is None and data.otsu_entries is None:
+        raise HTTPException(status_code=400, detail="更新データがありません")
+
+    with READatabase.cursor(commit=True) as (cur, conn):
+        # 同じ登記への同時置き換えを直列化
+        cur.execute(
+            "SELECT id FROM property_registries WHERE id = %s AND deleted_at IS NULL FOR UPDATE",
+            (registry_id,)
+        )
+        if not cur.fetchone():
+            raise HTTPException(status_code=404, detail="表題部が見つかりません")
+
+        if data.kou_entries is not None:
+            _replace_entries(cur, 'registry_kou_entries', registry_id, data.kou_entries)
+        if data.otsu_entries is not None:
+            _replace_entries(cur, 'registry_otsu_entries', registry_id, data.otsu_entries)
+
+        cur.execute("UPDATE property_registries SET updated_at = NOW() WHERE id = %s", (registry_id,))
+
+        return _fetch_registry_documents(cur, "r.id = %s", (registry_id,))[0]
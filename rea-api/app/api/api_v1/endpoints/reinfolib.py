@@ -134,7 +134,7 @@ def _convert_to_codes(regulations: Dict[str, Any]) -> tuple:
 
 
 @router.get("/regulations")
-async def get_regulations(
+def get_regulations(
     lat: float = Query(..., description="緯度"),
     lng: float = Query(..., description="経度")
 ):
@@ -175,7 +175,7 @@ async def get_regulations(
 
 
 @router.get("/use-area")
-async def get_use_area(
+def get_use_area(
     lat: float = Query(..., description="緯度"),
     lng: float = Query(..., description="経度")
 ):
@@ -195,7 +195,7 @@ async def get_use_area(
 
 
 @router.get("/hazard")
-async def get_hazard_info(
+def get_hazard_info(
     lat: float = Query(..., description="緯度"),
     lng: float = Query(..., description="経度")
 ):
@@ -241,7 +241,7 @@ async def get_hazard_info(
 
 
 @router.get("/tile/{api_code}")
-async def get_tile_geojson(
+def get_tile_geojson(
     api_code: str,
     lat: float = Query(..., description="緯度"),
     lng: float = Query(..., description="経度"),
@@ -274,7 +274,7 @@ async def get_tile_geojson(
 
 
 @router.get("/price")
-async def get_price_info(
+def get_price_info(
     year: int = Query(..., description="年"),
     area: str = Query(..., description="都道府県コード（01=北海道）"),
     city: Optional[str] = Query(None, description="市区町村コード")
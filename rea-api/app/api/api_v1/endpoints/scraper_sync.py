@@ -5,19 +5,36 @@ ContaboのMI scraperから送信されたデータを
 rea_scraperのproperties / land_info / building_info にUPSERTする。
 """
 import logging
-from typing import Any, Dict, List
+import os
+import uuid
+from typing import Any, Dict, List, Optional
 
 from app.core.database import get_db
-from app.crud.generic import GenericCRUD
-from fastapi import APIRouter, Depends, HTTPException, Request
+from app.services.ingest_jobs import (
+    FORMAT_JSON,
+    FORMAT_NDJSON,
+    PAYLOAD_DIR,
+    STATUS_QUEUED,
+    ingest_job_worker,
+    payload_path_for,
+)
+from app.services.scraper_ingest import bulk_upsert_items
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from shared.async_database import AsyncREADatabase
 from shared.auth.middleware import get_current_user
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# ジョブ方式で受け付ける送信データの最大サイズ（圧縮後）
+MAX_JOB_PAYLOAD_SIZE = int(os.getenv("INGEST_JOB_MAX_PAYLOAD_SIZE", str(500 * 1024 * 1024)))
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
 
 def _require_auth(request: Request) -> dict:
     """認証を要求"""
@@ -27,18 +44,6 @@ def _require_auth(request: Request) -> dict:
     return user
 
 
-# フィールド振り分け定数
-_LAND_INFO_KEYS = frozenset({
-    "land_area", "land_category", "use_district", "city_planning",
-    "building_coverage_ratio", "floor_area_ratio",
-})
-_BUILDING_INFO_KEYS = frozenset({
-    "building_structure", "construction_date", "building_area",
-    "total_floor_area", "room_count", "room_type", "total_units",
-})
-_SKIP_KEYS = frozenset({"property_url"})
-
-
 @router.post("/bulk-upsert", response_model=Dict[str, Any])
 def bulk_upsert_properties(
     request: Request,
@@ -50,116 +55,154 @@ def bulk_upsert_properties(
 
     property_urlをユニークキーとしてUPSERT。
     各itemは properties / land_info / building_info のフィールドを含む。
-    1物件ずつトランザクション（部分成功許容）。
+    ステージングテーブル経由で集合演算によりまとめて反映する（app/services/scraper_ingest.py）。
+    前回取り込み時と内容が同じitemは書き込まない（unchanged）。
+    失敗したitemのみ errors に返す（部分成功許容）。
+
+    レスポンス形式:
+    {"created": N, "updated": N, "unchanged": N, "errors": [{"index": N, "detail": "..."}]}
     """
     user = _require_auth(request)
     organization_id = user["organization_id"]
 
-    stats = {"created": 0, "updated": 0, "errors": []}
+    try:
+        return bulk_upsert_items(db, items, organization_id)
+    except SQLAlchemyError as e:
+        logger.error(f"bulk-upsert failed: {e}")
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"データベースエラー: {str(e)}")
 
-    for idx, item in enumerate(items):
-        try:
-            result = _upsert_one_property(db, item, organization_id)
-            stats[result] += 1
-        except Exception as e:
-            logger.error(f"bulk-upsert item[{idx}] failed: {e}")
-            db.rollback()
-            stats["errors"].append({"index": idx, "detail": str(e)})
 
-    return stats
+def _write_chunk(f, chunk: bytes) -> None:
+    f.write(chunk)
 
 
-def _upsert_one_property(
-    db: Session, item: Dict[str, Any], organization_id: int
-) -> str:
-    """1物件をUPSERT。'created' or 'updated' を返す。"""
-    property_url = item.get("property_url")
-    if not property_url:
-        raise ValueError("property_url is required")
+@router.post("/bulk-upsert/jobs", status_code=202, response_model=Dict[str, Any])
+async def create_bulk_upsert_job(
+    request: Request,
+    format: Optional[str] = Query(None, description="json（配列） / ndjson（1行1item）、未指定時はContent-Typeで判定"),
+):
+    """
+    物件一括UPSERTジョブを登録（大量データ用）
+
+    リクエストボディ（JSON配列 または NDJSON、gzip圧縮可）を保存してすぐにジョブIDを返す。
+    取り込みはバックグラウンドでチャンク単位に行い、進捗は GET /bulk-upsert/jobs/{job_id} で確認する。
+    gzipは先頭バイトで判定する（Content-Encoding不要）。
+    """
+    user = _require_auth(request)
 
-    # 既存チェック
-    result = db.execute(
-        text("SELECT id FROM properties WHERE property_url = :url AND deleted_at IS NULL"),
-        {"url": property_url},
+    payload_format = format or (
+        FORMAT_NDJSON if "ndjson" in request.headers.get("content-type", "") else FORMAT_JSON
     )
-    existing = result.fetchone()
-
-    crud = GenericCRUD(db)
-
-    props_data = {}
-    land_data = {}
-    building_data = {}
-
-    for key, val in item.items():
-        if val is None or key in _SKIP_KEYS:
-            continue
-        if key in _LAND_INFO_KEYS:
-            land_data[key] = val
-        elif key in _BUILDING_INFO_KEYS:
-            building_data[key] = val
-        else:
-            props_data[key] = val
-
-    if existing:
-        property_id = existing[0]
-        if props_data:
-            crud.update("properties", property_id, props_data, commit=False)
-        if land_data:
-            _upsert_related_table(db, "land_info", property_id, land_data)
-        if building_data:
-            _upsert_related_table(db, "building_info", property_id, building_data)
-        db.commit()
-        return "updated"
-    else:
-        if not props_data.get("property_name"):
-            props_data["property_name"] = "（スクレイピング物件）"
-        new_prop = crud.create("properties", props_data, extra_fields={
-            "organization_id": organization_id,
-            "property_url": property_url,
-        }, commit=False)
-        property_id = new_prop["id"]
-        if land_data:
-            _upsert_related_table(db, "land_info", property_id, land_data)
-        if building_data:
-            _upsert_related_table(db, "building_info", property_id, building_data)
-        db.commit()
-        return "created"
-
-
-def _upsert_related_table(
-    db: Session, table_name: str, property_id: int, data: Dict[str, Any]
+    if payload_format not in (FORMAT_JSON, FORMAT_NDJSON):
+        raise HTTPException(status_code=400, detail=f"formatが不正です: {payload_format}")
+
+    job_key = uuid.uuid4().hex
+    os.makedirs(PAYLOAD_DIR, exist_ok=True)
+    tmp_path = os.path.join(PAYLOAD_DIR, f"{job_key}.part")
+
+    # ボディをメモリに溜めずにファイルへ書き出す
+    size = 0
+    head = b""
+    try:
+        with open(tmp_path, "wb") as f:
+            async for chunk in request.stream():
+                size += len(chunk)
+                if size > MAX_JOB_PAYLOAD_SIZE:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"送信データが大きすぎます（最大{MAX_JOB_PAYLOAD_SIZE // (1024 * 1024)}MB）",
+                    )
+                if len(head) < 2:
+                    head += chunk[:2]
+                await run_in_threadpool(_write_chunk, f, chunk)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    if size == 0:
+        os.remove(tmp_path)
+        raise HTTPException(status_code=400, detail="送信データが空です")
+
+    is_gzip = head[:2] == _GZIP_MAGIC
+    payload_path = payload_path_for(job_key, payload_format, is_gzip)
+    os.replace(tmp_path, payload_path)
+
+    try:
+        job_id = await AsyncREADatabase.fetchval(
+            """
+            INSERT INTO scraper_ingest_jobs
+                (organization_id, status, payload_path, payload_format, is_gzip, payload_size, created_by)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            RETURNING id
+            """,
+            user["organization_id"],
+            STATUS_QUEUED,
+            os.path.basename(payload_path),
+            payload_format,
+            is_gzip,
+            size,
+            user.get("email"),
+        )
+    except Exception:
+        os.remove(payload_path)
+        raise
+
+    ingest_job_worker.notify()
+    return {"job_id": job_id, "status": STATUS_QUEUED}
+
+
+@router.get("/bulk-upsert/jobs/{job_id}", response_model=Dict[str, Any])
+async def get_bulk_upsert_job(
+    request: Request,
+    job_id: int,
+    error_offset: int = Query(0, ge=0, description="errorsの取得開始位置"),
+    error_limit: int = Query(100, ge=0, le=1000, description="errorsの取得件数"),
 ):
-    """関連テーブル（land_info / building_info）にUPSERT"""
-    if table_name not in ("land_info", "building_info"):
-        raise ValueError(f"Invalid table: {table_name}")
+    """
+    物件一括UPSERTジョブの状態
+
+    レスポンス形式:
+    {
+        "job_id": N, "status": "queued" | "running" | "completed" | "failed",
+        "total_items": N（件数の確認前はnull）, "processed_items": N, "progress": 0.0〜1.0,
+        "created": N, "updated": N, "unchanged": N, "error_count": N,
+        "errors": [{"index": N, "detail": "..."}]（保存は先頭1000件まで）,
+        "error_message": ジョブ自体の失敗理由, "created_at", "started_at", "finished_at"
+    }
+    """
+    user = _require_auth(request)
 
-    result = db.execute(
-        text(f"SELECT id FROM {table_name} WHERE property_id = :pid AND deleted_at IS NULL"),
-        {"pid": property_id},
+    row = await AsyncREADatabase.fetchrow(
+        """
+        SELECT id, status, total_items, processed_items,
+               created_count, updated_count, unchanged_count, error_count,
+               (SELECT COALESCE(jsonb_agg(e ORDER BY n), '[]'::jsonb)
+                FROM jsonb_array_elements(errors) WITH ORDINALITY AS t(e, n)
+                WHERE n > %s AND n <= %s) AS errors,
+               error_message, created_at, started_at, finished_at
+        FROM scraper_ingest_jobs
+        WHERE id = %s AND organization_id = %s
+        """,
+        error_offset, error_offset + error_limit, job_id, user["organization_id"],
     )
-    existing = result.fetchone()
-
-    if existing:
-        set_parts = ["updated_at = NOW()"]
-        params = {"rid": existing[0]}
-        for i, (col, val) in enumerate(data.items()):
-            param_key = f"v{i}"
-            set_parts.append(f"{col} = :{param_key}")
-            params[param_key] = val
-        db.execute(
-            text(f"UPDATE {table_name} SET {', '.join(set_parts)} WHERE id = :rid AND deleted_at IS NULL"),
-            params,
-        )
-    else:
-        columns = ["property_id", "created_at", "updated_at"]
-        params = {"pid": property_id}
-        for i, (col, val) in enumerate(data.items()):
-            param_key = f"v{i}"
-            columns.append(col)
-            params[param_key] = val
-        col_names = ", ".join(columns)
-        placeholders = ":pid, NOW(), NOW(), " + ", ".join(f":v{i}" for i in range(len(data)))
-        db.execute(
-            text(f"INSERT INTO {table_name} ({col_names}) VALUES ({placeholders})"),
-            params,
-        )
+    if row is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    total = row["total_items"]
+    return {
+        "job_id": row["id"],
+        "status": row["status"],
+        "total_items": total,
+        "processed_items": row["processed_items"],
+        "progress": round(row["processed_items"] / total, 4) if total else (1.0 if total == 0 else 0.0),
+        "created": row["created_count"],
+        "updated": row["updated_count"],
+        "unchanged": row["unchanged_count"],
+        "error_count": row["error_count"],
+        "errors": row["errors"],
+        "error_message": row["error_message"],
+        "created_at": row["created_at"],
+        "started_at": row["started_at"],
+        "finished_at": row["finished_at"],
+    }
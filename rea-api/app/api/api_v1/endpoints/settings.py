@@ -53,7 +53,7 @@ def mask_value(value: Optional[str]) -> Optional[str]:
 
 
 @router.get("/")
-async def get_settings(request: Request):
+def get_settings(request: Request):
     """
     全設定一覧を取得
 
@@ -93,7 +93,7 @@ async def get_settings(request: Request):
 
 
 @router.get("/{key}")
-async def get_setting(key: str, request: Request):
+def get_setting(key: str, request: Request):
     """
     特定の設定を取得
 
@@ -134,7 +134,7 @@ async def get_setting(key: str, request: Request):
 
 
 @router.put("/{key}")
-async def update_setting(key: str, request_body: SettingUpdateRequest, request: Request):
+def update_setting(key: str, request_body: SettingUpdateRequest, request: Request):
     """
     設定を更新
 
@@ -5,25 +5,28 @@
 - コンテキストマネージャー使用
 - カスタム例外使用
 """
+import hashlib
 import json
 import logging
 import os
 import re
-import sys
+import uuid
+import zipfile
 from datetime import date, datetime, timezone
-from typing import List, Optional
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 from fastapi import APIRouter, File, Query, UploadFile
+from psycopg2.extras import execute_values
 from pydantic import BaseModel
 
 from app.core.exceptions import DatabaseError, ResourceNotFound, ValidationError
+from app.services.touki_extraction import STATUS_EXTRACTING, STATUS_QUEUED, touki_extraction_worker
+from app.services.touki_import import parse_import
+from app.services.touki_search import property_location, search_records, suggest_records
 from shared.database import READatabase
 
-# パーサーのパスを追加
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', '..', 'rea-scraper'))
-
 # pdfplumber
 try:
     import pdfplumber
@@ -36,6 +39,15 @@ router = APIRouter()
 UPLOAD_DIR = os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'uploads', 'touki')
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# ファイル保存時の読み込み単位
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# PDF1ファイルのサイズ上限（ZIP内のファイルも同じ）
+MAX_PDF_SIZE = 50 * 1024 * 1024
+
+# 一括アップロード1回あたりのPDF数の上限（ZIP内のファイルを含む）
+MAX_BATCH_FILES = 200
+
 
 # ========== Pydantic Models ==========
 
@@ -46,6 +58,8 @@ class ToukiImportResponse(BaseModel):
     raw_text: Optional[str] = None
     parsed_data: Optional[dict] = None
     error_message: Optional[str] = None
+    page_count: Optional[int] = None
+    pages_extracted: int = 0
     created_at: datetime
 
 
@@ -82,6 +96,26 @@ class ToukiRecordListResponse(BaseModel):
     total: int
 
 
+class ToukiRecordSearchItem(ToukiRecordResponse):
+    score: Optional[float] = None
+
+
+class ToukiRecordSearchResponse(BaseModel):
+    items: List[ToukiRecordSearchItem]
+
+
+class ToukiRecordSuggestItem(ToukiRecordSearchItem):
+    lot_match: bool
+    location_score: float
+    linked: bool = False
+
+
+class ToukiRecordSuggestResponse(BaseModel):
+    address: str
+    chiban: List[str]
+    items: List[ToukiRecordSuggestItem]
+
+
 class CreatePropertyFromToukiRequest(BaseModel):
     land_touki_record_id: Optional[int] = None
     building_touki_record_id: Optional[int] = None
@@ -116,285 +150,284 @@ def map_structure_to_enum(structure: str) -> str:
     return '9:その他'
 
 
-def simple_parse(raw_text: str) -> dict:
-    """改良版パース（登記情報提供サービスPDF対応）"""
-    # 全角→半角変換
-    zenkaku_to_hankaku = str.maketrans('０１２３４５６７８９：．，', '0123456789:.,')
-
-    def normalize(text):
-        return text.translate(zenkaku_to_hankaku)
-
-    result = {
-        'document_type': 'unknown',
-        'real_estate_number': None,
-        'land_info': {},
-        'building_info': {},
-        'owner_info': {},
-        'mortgage_info': [],
-        'parsed_at': datetime.now(timezone.utc).isoformat()
-    }
-
-    # 土地/建物判定
-    has_land = '土地の表示' in raw_text
-    has_building = '建物の表示' in raw_text or '主である建物の表示' in raw_text
-    if has_land and has_building:
-        result['document_type'] = 'both'
-    elif has_building:
-        result['document_type'] = 'building'
-    elif has_land:
-        result['document_type'] = 'land'
-
-    # 不動産番号
-    match = re.search(r'不動産番号[│\|]?\s*([０-９\d]+)', raw_text)
-    if match:
-        result['real_estate_number'] = normalize(match.group(1))
-
-    # 土地情報
-    if result['document_type'] in ['land', 'both']:
-        matches = re.findall(r'所\s*在[│\|]([^│┃\n]+)', raw_text)
-        for loc in reversed(matches):
-            loc = loc.strip()
-            if loc and not re.search(r'年|月|日|変更|登記', loc):
-                result['land_info']['location'] = loc
-                break
-
-        match = re.search(r'([０-９\d]+番[０-９\d]*)\s*│', raw_text)
-        if match:
-            result['land_info']['lot_number'] = normalize(match.group(1))
-
-        for cat in ['宅地', '畑', '田', '山林', '原野', '雑種地']:
-            if f'│{cat}' in raw_text or f'│ {cat}' in raw_text:
-                result['land_info']['land_category'] = cat
-
-        area_matches = re.findall(r'│\s*([０-９\d]+)[：:]([０-９\d]+)\s*│', raw_text)
-        if area_matches:
-            whole, decimal = area_matches[-1]
-            area = float(normalize(whole)) + float(normalize(decimal)) / 100
-            result['land_info']['land_area_m2'] = round(area, 2)
-
-    # 建物情報
-    if result['document_type'] in ['building', 'both']:
-        matches = re.findall(r'所\s*在[│\|]([^│┃\n]+)', raw_text)
-        for loc in reversed(matches):
-            loc = loc.strip()
-            if loc and not re.search(r'年|月|日|変更|登記', loc):
-                result['building_info']['location'] = loc
-                break
-
-        match = re.search(r'家屋番号[│\|]\s*([^│┃\n]+)', raw_text)
-        if match:
-            result['building_info']['building_number'] = normalize(match.group(1).strip())
-
-        if '居宅' in raw_text:
-            result['building_info']['building_type'] = '居宅'
-
-        match = re.search(r'│(木造[^│\n]+階)', raw_text)
-        if match:
-            result['building_info']['structure'] = match.group(1) + '建'
-
-        floor_matches = re.findall(r'([１２３４５６７８９\d]+)階\s*([０-９\d]+)[：:]([０-９\d]+)', raw_text)
-        if floor_matches:
-            floor_areas = {}
-            total = 0.0
-            for floor, whole, decimal in floor_matches:
-                floor_num = int(normalize(floor))
-                area = float(normalize(whole)) + float(normalize(decimal)) / 100
-                floor_areas[f'floor_{floor_num}'] = round(area, 2)
-                total += area
-            result['building_info']['floor_areas'] = floor_areas
-            result['building_info']['total_floor_area_m2'] = round(total, 2)
-
-        match = re.search(r'(昭和|平成|令和)([０-９\d]+)年([０-９\d]+)月([０-９\d]+)日新築', raw_text)
-        if match:
-            era, y, m, d = match.groups()
-            era_start = {'昭和': 1926, '平成': 1989, '令和': 2019}
-            year = era_start.get(era, 1926) + int(normalize(y)) - 1
-            result['building_info']['construction_date'] = f"{year}-{int(normalize(m)):02d}-{int(normalize(d)):02d}"
-
-    # 所有者
-    owner_blocks = []
-    lines = raw_text.split('\n')
-    for i, line in enumerate(lines):
-        if '所有者' in line and '登記名義人' not in line:
-            addr_match = re.search(r'所有者\s+([^┃\n]+)', line)
-            if addr_match:
-                address = addr_match.group(1).strip().rstrip('│')
-                for offset in range(1, 4):
-                    if i + offset >= len(lines):
-                        break
-                    check_line = lines[i + offset]
-                    name_match = re.search(r'[│┃]\s*([^│┃\d０-９\n]{2,})\s*┃', check_line)
-                    if not name_match:
-                        name_match = re.search(r'^\s*([^\d０-９│┃\n]{2,})\s*┃$', check_line)
-                    if name_match:
-                        name = re.sub(r'\s+', '', name_match.group(1).strip())
-                        skip_words = ['移記', '登記', '原因', '売買', '相続', '平成', '昭和', '令和', '順位']
-                        if name and len(name) >= 2 and not any(w in name for w in skip_words):
-                            owner_blocks.append({'address': address, 'name': name})
-                            break
-
-    if owner_blocks:
-        latest = owner_blocks[-1]
-        result['owner_info']['owner_address'] = latest['address']
-        result['owner_info']['owner_name'] = latest['name']
-
-    # 抵当権
-    if '抵当権設定' in raw_text:
-        amount_matches = re.findall(r'債権額\s*金([０-９\d,，]+)万?円', raw_text)
-        for amount_str in amount_matches:
-            amount = int(normalize(amount_str).replace(',', ''))
-            result['mortgage_info'].append({'type': '抵当権', 'amount': amount})
-
-    return result
-
-
-def save_to_touki_records(cur, import_id: int, parsed_data: dict) -> List[int]:
-    """パース結果をtouki_recordsに保存"""
-    record_ids = []
-    doc_type = parsed_data.get('document_type', 'unknown')
-
-    owner_info = parsed_data.get('owner_info', {})
-    owners = []
-    if owner_info.get('owner_name'):
-        owners.append({
-            'name': owner_info.get('owner_name'),
-            'address': owner_info.get('owner_address')
-        })
-
-    mortgages = parsed_data.get('mortgage_info', [])
-
-    # 土地レコード
-    if doc_type in ['land', 'both']:
-        land = parsed_data.get('land_info', {})
-        location = land.get('location', '')
-        if location:
-            cur.execute("""
-                INSERT INTO touki_records (
-                    real_estate_number, document_type, location,
-                    lot_number, land_category, land_area_m2,
-                    owners, mortgages, touki_import_id, raw_parsed
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """, (
-                parsed_data.get('real_estate_number'),
-                'land',
-                location,
-                land.get('lot_number'),
-                land.get('land_category'),
-                land.get('land_area_m2'),
-                json.dumps(owners, ensure_ascii=False),
-                json.dumps(mortgages, ensure_ascii=False),
-                import_id,
-                json.dumps(parsed_data, ensure_ascii=False)
-            ))
-            record_ids.append(cur.fetchone()[0])
-
-    # 建物レコード
-    if doc_type in ['building', 'both']:
-        building = parsed_data.get('building_info', {})
-        location = building.get('location', '')
-        if location:
-            floor_areas = building.get('floor_areas', {})
-            construction_date = None
-            if building.get('construction_date'):
-                try:
-                    construction_date = datetime.strptime(
-                        building['construction_date'], '%Y-%m-%d'
-                    ).date()
-                except ValueError as e:
-                    logger.warning(f"Invalid construction_date format: {building.get('construction_date')} - {e}")
+def save_pdf_stream(src: BinaryIO, file_name: str) -> Tuple[str, str]:
+    """
+    PDFをチャンク単位で保存し、同時にSHA-256を計算
 
-            cur.execute("""
-                INSERT INTO touki_records (
-                    real_estate_number, document_type, location,
-                    building_number, building_type, structure,
-                    floor_area_m2, floor_areas, construction_date,
-                    owners, mortgages, touki_import_id, raw_parsed
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                RETURNING id
-            """, (
-                parsed_data.get('real_estate_number'),
-                'building',
-                location,
-                building.get('building_number'),
-                building.get('building_type'),
-                building.get('structure'),
-                building.get('total_floor_area_m2'),
-                json.dumps(floor_areas, ensure_ascii=False) if floor_areas else None,
-                construction_date,
-                json.dumps(owners, ensure_ascii=False),
-                json.dumps(mortgages, ensure_ascii=False),
-                import_id,
-                json.dumps(parsed_data, ensure_ascii=False)
-            ))
-            record_ids.append(cur.fetchone()[0])
+    保存先のファイル名はアップロードごとに一意（同じ内容・同じファイル名でも別ファイル）。
+    重複として破棄するファイルを消しても、他のインポートが参照するPDFは消えない。
 
-    return record_ids
+    Returns:
+        (保存先パス, content_hash)
+    """
+    token = uuid.uuid4().hex
+    tmp_path = os.path.join(UPLOAD_DIR, f".{token}.part")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(tmp_path, 'wb') as f:
+            while chunk := src.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_PDF_SIZE:
+                    raise ValidationError("file", f"{file_name}: ファイルサイズが上限（50MB）を超えています")
+                digest.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    content_hash = digest.hexdigest()
+    timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+    file_path = os.path.join(UPLOAD_DIR, f"{timestamp}_{token}_{os.path.basename(file_name)}")
+    os.replace(tmp_path, file_path)
+    return file_path, content_hash
+
+
+def iter_batch_pdfs(files: List[UploadFile]):
+    """
+    一括アップロードのPDFを1件ずつ返す（ZIPは中のPDFを展開せずに1件ずつ読む）
+
+    Yields:
+        (ファイル名, 読み込み用ファイル or None, スキップ理由 or None)
+    """
+    for upload in files:
+        name = upload.filename or ''
+        lower = name.lower()
+        if lower.endswith('.pdf'):
+            yield name, upload.file, None
+        elif lower.endswith('.zip'):
+            try:
+                archive = zipfile.ZipFile(upload.file)
+            except zipfile.BadZipFile:
+                yield name, None, "ZIPファイルを読み込めません"
+                continue
+            with archive:
+                for member in archive.infolist():
+                    member_name = member.filename
+                    if member.is_dir() or os.path.basename(member_name).startswith('.') \
+                            or member_name.startswith('__MACOSX/'):
+                        continue
+                    if not member_name.lower().endswith('.pdf'):
+                        yield f"{name}/{member_name}", None, "PDFファイルではありません"
+                    elif member.file_size > MAX_PDF_SIZE:
+                        yield f"{name}/{member_name}", None, "ファイルサイズが上限（50MB）を超えています"
+                    else:
+                        with archive.open(member) as src:
+                            yield os.path.basename(member_name), src, None
+        else:
+            yield name, None, "PDFまたはZIPファイルのみ対応しています"
 
 
 # ========== エンドポイント ==========
 
-@router.post("/upload", response_model=ToukiImportResponse)
-async def upload_touki_pdf(file: UploadFile = File(...)):
-    """登記事項証明書PDFをアップロードしてテキスト抽出"""
+@router.post("/upload", response_model=ToukiImportResponse, status_code=202)
+def upload_touki_pdf(
+    file: UploadFile = File(...),
+    auto_parse: bool = Query(False, description="抽出完了後にそのままパースする"),
+):
+    """
+    登記事項証明書PDFをアップロード（テキスト抽出はバックグラウンド）
+
+    status=queued で登録してすぐに返す。抽出の進捗は GET /touki/{import_id} の
+    status（queued → extracting → uploaded、auto_parse なら parsed）で確認する。
+    """
     if not file.filename.lower().endswith('.pdf'):
         raise ValidationError("file", "PDFファイルのみ対応しています")
 
     if pdfplumber is None:
         raise DatabaseError("pdfplumber not installed")
 
-    # ファイル保存
-    timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
-    safe_filename = f"{timestamp}_{file.filename}"
-    file_path = os.path.join(UPLOAD_DIR, safe_filename)
-
-    content = await file.read()
-    with open(file_path, 'wb') as f:
-        f.write(content)
-
-    # テキスト抽出
-    raw_text = None
-    error_message = None
+    # ファイル保存（チャンク単位でコピー）
+    file_path, content_hash = save_pdf_stream(file.file, file.filename)
 
-    try:
-        all_text = []
-        with pdfplumber.open(file_path) as pdf:
-            for i, page in enumerate(pdf.pages):
-                text = page.extract_text()
-                if text:
-                    all_text.append(f"--- Page {i + 1} ---\n{text}")
-        raw_text = "\n\n".join(all_text)
-    except Exception as e:
-        error_message = str(e)
-
-    # DB保存
+    # DB保存（抽出待ち）
     with READatabase.cursor(commit=True) as (cur, conn):
         cur.execute("""
-            INSERT INTO touki_imports (file_name, file_path, raw_text, status, error_message)
+            INSERT INTO touki_imports (file_name, file_path, status, auto_parse, content_hash)
             VALUES (%s, %s, %s, %s, %s)
             RETURNING id, created_at
         """, (
             file.filename,
             file_path,
-            raw_text,
-            'uploaded' if raw_text else 'error',
-            error_message
+            STATUS_QUEUED,
+            auto_parse,
+            content_hash
         ))
+        row = cur.fetchone()
+
+    touki_extraction_worker.notify()
+
+    return ToukiImportResponse(
+        id=row[0],
+        file_name=file.filename,
+        status=STATUS_QUEUED,
+        created_at=row[1]
+    )
+
+
+@router.post("/upload/batch", status_code=202)
+def upload_touki_batch(
+    files: List[UploadFile] = File(...),
+    auto_parse: bool = Query(True, description="抽出完了後にそのままパースする"),
+):
+    """
+    登記事項証明書PDFの一括アップロード（複数PDF または ZIP）
+
+    各PDFをチャンク単位で保存してハッシュを計算し、取り込み済み（エラー以外）の
+    証明書と同じ内容のものは抽出せず既存インポートを返す。
+    新しいPDFは1つのバッチとして queued で登録し、抽出・パースはワーカーで行う。
+    進捗は GET /touki/batches/{batch_id} で確認する。
+    """
+    if pdfplumber is None:
+        raise DatabaseError("pdfplumber not installed")
+
+    saved: List[Dict] = []
+    skipped: List[Dict] = []
+    try:
+        for file_name, src, reason in iter_batch_pdfs(files):
+            if reason:
+                skipped.append({"file_name": file_name, "reason": reason})
+                continue
+            if len(saved) >= MAX_BATCH_FILES:
+                raise ValidationError("files", f"PDFは1回あたり{MAX_BATCH_FILES}件までです")
+            file_path, content_hash = save_pdf_stream(src, file_name)
+            saved.append({"file_name": file_name, "file_path": file_path, "content_hash": content_hash})
+    except BaseException:
+        for item in saved:
+            os.remove(item["file_path"])
+        raise
+
+    if not saved and not skipped:
+        raise ValidationError("files", "PDFファイルがありません")
+
+    try:
+        with READatabase.cursor(commit=True) as (cur, conn):
+            # 取り込み済みの証明書（同じ内容）
+            cur.execute("""
+                SELECT DISTINCT ON (content_hash) content_hash, id
+                FROM touki_imports
+                WHERE content_hash = ANY(%s) AND deleted_at IS NULL AND status <> 'error'
+                ORDER BY content_hash, id
+            """, ([item["content_hash"] for item in saved],))
+            import_ids: Dict[str, int] = dict(cur.fetchall())
+
+            new_items: List[Dict] = []
+            duplicate_items: List[Dict] = []
+            new_hashes = set()
+            for item in saved:
+                if item["content_hash"] in import_ids or item["content_hash"] in new_hashes:
+                    duplicate_items.append(item)
+                else:
+                    new_hashes.add(item["content_hash"])
+                    new_items.append(item)
+
+            cur.execute("""
+                INSERT INTO touki_import_batches (file_count, auto_parse, skipped)
+                VALUES (%s, %s, %s)
+                RETURNING id
+            """, (len(saved), auto_parse, json.dumps(skipped, ensure_ascii=False)))
+            batch_id = cur.fetchone()[0]
+
+            queued = []
+            if new_items:
+                rows = execute_values(cur, """
+                    INSERT INTO touki_imports (file_name, file_path, status, auto_parse, content_hash, batch_id)
+                    VALUES %s
+                    RETURNING id, file_name, content_hash
+                """, [
+                    (item["file_name"], item["file_path"], STATUS_QUEUED, auto_parse, item["content_hash"], batch_id)
+                    for item in new_items
+                ], fetch=True)
+                queued = [{"id": row[0], "file_name": row[1]} for row in rows]
+                import_ids.update({row[2]: row[0] for row in rows})
+
+            # 重複は取り込み済み（または同じバッチで先に登録した）インポートを指す
+            duplicates = [
+                {"file_name": item["file_name"], "import_id": import_ids[item["content_hash"]]}
+                for item in duplicate_items
+            ]
+            cur.execute(
+                "UPDATE touki_import_batches SET duplicates = %s WHERE id = %s",
+                (json.dumps(duplicates, ensure_ascii=False), batch_id)
+            )
+    except BaseException:
+        for item in saved:
+            if os.path.exists(item["file_path"]):
+                os.remove(item["file_path"])
+        raise
+
+    # 重複分のPDFはこのアップロードで保存した（どのインポートも参照しない）ファイルなので削除する
+    for item in duplicate_items:
+        os.remove(item["file_path"])
+
+    touki_extraction_worker.notify()
+
+    return {
+        "batch_id": batch_id,
+        "queued": queued,
+        "duplicates": duplicates,
+        "skipped": skipped,
+    }
+
 
+@router.get("/batches/{batch_id}")
+def get_touki_batch(batch_id: int):
+    """
+    一括アップロードの進捗
+
+    バッチ内のインポートごとの状態と、状態別の件数・作成された登記レコード数を返す。
+    status は queued / extracting が残っていれば processing、なければ completed。
+    """
+    with READatabase.cursor() as (cur, conn):
+        cur.execute("""
+            SELECT b.id, b.file_count, b.auto_parse, b.duplicates, b.skipped, b.created_at,
+                   COALESCE(i.items, '[]'::json)
+            FROM touki_import_batches b
+            LEFT JOIN LATERAL (
+                SELECT json_agg(json_build_object(
+                    'id', ti.id,
+                    'file_name', ti.file_name,
+                    'status', ti.status,
+                    'page_count', ti.page_count,
+                    'pages_extracted', ti.pages_extracted,
+                    'error_message', ti.error_message,
+                    'record_count', (
+                        SELECT COUNT(*) FROM touki_records tr
+                        WHERE tr.touki_import_id = ti.id AND tr.deleted_at IS NULL
+                    )
+                ) ORDER BY ti.id) AS items
+                FROM touki_imports ti
+                WHERE ti.batch_id = b.id AND ti.deleted_at IS NULL
+            ) i ON TRUE
+            WHERE b.id = %s
+        """, (batch_id,))
         row = cur.fetchone()
-        return ToukiImportResponse(
-            id=row[0],
-            file_name=file.filename,
-            status='uploaded' if raw_text else 'error',
-            raw_text=raw_text,
-            error_message=error_message,
-            created_at=row[1]
-        )
+        if not row:
+            raise ResourceNotFound("登記一括インポート", batch_id)
+
+    items = row[6]
+    counts: Dict[str, int] = {}
+    for item in items:
+        counts[item["status"]] = counts.get(item["status"], 0) + 1
+    pending = counts.get(STATUS_QUEUED, 0) + counts.get(STATUS_EXTRACTING, 0)
+
+    return {
+        "batch_id": row[0],
+        "status": "processing" if pending else "completed",
+        "file_count": row[1],
+        "auto_parse": row[2],
+        "status_counts": counts,
+        "record_count": sum(item["record_count"] for item in items),
+        "items": items,
+        "duplicates": row[3],
+        "skipped": row[4],
+        "created_at": row[5],
+    }
 
 
 @router.get("/list", response_model=ToukiListResponse)
-async def list_touki_imports(
-    status: Optional[str] = Query(None, description="フィルタ: uploaded/parsed/imported/error"),
+def list_touki_imports(
+    status: Optional[str] = Query(None, description="フィルタ: queued/extracting/uploaded/parsed/imported/error"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0)
 ):
@@ -411,7 +444,8 @@ async def list_touki_imports(
 
         # データ取得
         sql = """
-            SELECT id, file_name, status, raw_text, parsed_data, error_message, created_at
+            SELECT id, file_name, status, raw_text, parsed_data, error_message, created_at,
+                   page_count, pages_extracted
             FROM touki_imports
             WHERE deleted_at IS NULL
         """
@@ -433,7 +467,9 @@ async def list_touki_imports(
                 raw_text=row[3][:500] if row[3] else None,
                 parsed_data=row[4],
                 error_message=row[5],
-                created_at=row[6]
+                created_at=row[6],
+                page_count=row[7],
+                pages_extracted=row[8] or 0
             )
             for row in rows
         ]
@@ -442,11 +478,12 @@ async def list_touki_imports(
 
 
 @router.get("/{import_id}", response_model=ToukiImportResponse)
-async def get_touki_import(import_id: int):
+def get_touki_import(import_id: int):
     """インポート詳細を取得"""
     with READatabase.cursor() as (cur, conn):
         cur.execute("""
-            SELECT id, file_name, status, raw_text, parsed_data, error_message, created_at
+            SELECT id, file_name, status, raw_text, parsed_data, error_message, created_at,
+                   page_count, pages_extracted
             FROM touki_imports
             WHERE id = %s AND deleted_at IS NULL
         """, (import_id,))
@@ -462,12 +499,14 @@ async def get_touki_import(import_id: int):
             raw_text=row[3],
             parsed_data=row[4],
             error_message=row[5],
-            created_at=row[6]
+            created_at=row[6],
+            page_count=row[7],
+            pages_extracted=row[8] or 0
         )
 
 
 @router.post("/{import_id}/parse")
-async def parse_touki_import(import_id: int):
+def parse_touki_import(import_id: int):
     """アップロード済みのテキストをパースして構造化し、touki_recordsに保存"""
     with READatabase.cursor(commit=True) as (cur, conn):
         cur.execute("SELECT raw_text FROM touki_imports WHERE id = %s AND deleted_at IS NULL", (import_id,))
@@ -479,26 +518,8 @@ async def parse_touki_import(import_id: int):
         if not raw_text:
             raise ValidationError("raw_text", "パース対象のテキストがありません")
 
-        # パーサーをインポート
-        try:
-            from src.parsers.touki.touki_parser import ToukiParser
-            parser = ToukiParser()
-            parsed_data = parser.parse(raw_text)
-        except ImportError:
-            parsed_data = simple_parse(raw_text)
-
-        # touki_importsを更新
-        cur.execute("""
-            UPDATE touki_imports
-            SET parsed_data = %s, status = 'parsed', updated_at = NOW()
-            WHERE id = %s
-        """, (
-            json.dumps(parsed_data, ensure_ascii=False),
-            import_id
-        ))
-
-        # touki_recordsに保存
-        touki_record_ids = save_to_touki_records(cur, import_id, parsed_data)
+        # パースして touki_imports を更新、touki_recordsに保存
+        parsed_data, touki_record_ids = parse_import(cur, import_id, raw_text)
 
         return {
             "status": "success",
@@ -510,7 +531,7 @@ async def parse_touki_import(import_id: int):
 # ========== touki_records エンドポイント ==========
 
 @router.get("/records/list", response_model=ToukiRecordListResponse)
-async def list_touki_records(
+def list_touki_records(
     document_type: Optional[str] = Query(None, description="land/building/unit"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0)
@@ -570,8 +591,74 @@ async def list_touki_records(
         return ToukiRecordListResponse(items=items, total=total)
 
 
+def _search_item_fields(row: dict) -> dict:
+    """touki_search の結果行をレスポンス用に変換（数値・JSONの既定値）"""
+    return {
+        **row,
+        'land_area_m2': float(row['land_area_m2']) if row['land_area_m2'] else None,
+        'floor_area_m2': float(row['floor_area_m2']) if row['floor_area_m2'] else None,
+        'owners': row['owners'] or [],
+        'mortgages': row['mortgages'] or [],
+    }
+
+
+@router.get("/records/search", response_model=ToukiRecordSearchResponse)
+def search_touki_records(
+    real_estate_number: Optional[str] = Query(None, description="不動産番号（完全一致）"),
+    lot_number: Optional[str] = Query(None, description="地番（91番44 / 91-44 どちらでも可）"),
+    location: Optional[str] = Query(None, description="所在（部分一致）"),
+    owner: Optional[str] = Query(None, description="所有者名（部分一致）"),
+    document_type: Optional[str] = Query(None, description="land/building/unit"),
+    limit: int = Query(20, ge=1, le=100)
+):
+    """登記レコード検索（正規化キー + インデックス、所在・所有者の類似度順）"""
+    if not any([real_estate_number, lot_number, location, owner]):
+        raise ValidationError(message="不動産番号・地番・所在・所有者のいずれかを指定してください")
+
+    with READatabase.cursor() as (cur, conn):
+        rows = search_records(
+            cur,
+            real_estate_number=real_estate_number,
+            lot_number=lot_number,
+            location=location,
+            owner=owner,
+            document_type=document_type,
+            limit=limit,
+        )
+    return ToukiRecordSearchResponse(items=[ToukiRecordSearchItem(**_search_item_fields(r)) for r in rows])
+
+
+@router.get("/records/suggest", response_model=ToukiRecordSuggestResponse)
+def suggest_touki_records(
+    property_id: Optional[int] = Query(None, description="物件ID（住所・地番を物件から取得）"),
+    address: Optional[str] = Query(None, description="住所（property_id より優先）"),
+    chiban: Optional[List[str]] = Query(None, description="地番（複数指定可、property_id より優先）"),
+    limit: int = Query(10, ge=1, le=50)
+):
+    """住所・地番から物件に紐付ける登記レコードの候補を提案"""
+    with READatabase.cursor() as (cur, conn):
+        property_address, property_chiban = '', []
+        if property_id is not None:
+            found = property_location(cur, property_id)
+            if found is None:
+                raise ResourceNotFound("物件", property_id)
+            property_address, property_chiban = found
+
+        address = address or property_address
+        chiban = chiban or property_chiban
+        if not address and not chiban:
+            raise ValidationError(message="property_id または住所・地番を指定してください")
+
+        rows = suggest_records(cur, address, chiban, property_id=property_id, limit=limit)
+    return ToukiRecordSuggestResponse(
+        address=address,
+        chiban=chiban,
+        items=[ToukiRecordSuggestItem(**_search_item_fields(r)) for r in rows],
+    )
+
+
 @router.get("/records/{record_id}", response_model=ToukiRecordResponse)
-async def get_touki_record(record_id: int):
+def get_touki_record(record_id: int):
     """登記レコード詳細"""
     with READatabase.cursor() as (cur, conn):
         cur.execute("""
@@ -609,7 +696,7 @@ async def get_touki_record(record_id: int):
 
 
 @router.post("/records/create-property")
-async def create_property_from_touki(request: CreatePropertyFromToukiRequest):
+def create_property_from_touki(request: CreatePropertyFromToukiRequest):
     """登記レコードから物件を作成"""
     record_ids = request.touki_record_ids or []
     if request.land_touki_record_id:
@@ -770,7 +857,7 @@ class ApplyToukiRequest(BaseModel):
 
 
 @router.post("/records/apply-to-property")
-async def apply_touki_to_property(request: ApplyToukiRequest):
+def apply_touki_to_property(request: ApplyToukiRequest):
     """登記情報を既存物件に反映（土地・建物情報を上書き更新）"""
     if not request.touki_record_ids:
         raise ValidationError("touki_record_ids", "登記レコードIDが必要です")
@@ -925,7 +1012,7 @@ async def apply_touki_to_property(request: ApplyToukiRequest):
 
 
 @router.post("/records/link")
-async def link_touki_to_property(request: LinkToukiRequest):
+def link_touki_to_property(request: LinkToukiRequest):
     """既存物件に登記レコードを紐付け（リンクのみ、データ更新なし）"""
     with READatabase.cursor(commit=True) as (cur, conn):
         cur.execute("SELECT id FROM properties WHERE id = %s AND deleted_at IS NULL", (request.property_id,))
@@ -946,7 +1033,7 @@ async def link_touki_to_property(request: LinkToukiRequest):
 
 
 @router.delete("/records/{record_id}")
-async def delete_touki_record(record_id: int):
+def delete_touki_record(record_id: int):
     """登記レコードを論理削除"""
     with READatabase.cursor(commit=True) as (cur, conn):
         cur.execute("UPDATE touki_records SET deleted_at = NOW() WHERE id = %s AND deleted_at IS NULL RETURNING id", (record_id,))
@@ -956,7 +1043,7 @@ async def delete_touki_record(record_id: int):
 
 
 @router.delete("/{import_id}")
-async def delete_touki_import(import_id: int):
+def delete_touki_import(import_id: int):
     """インポートを論理削除（ファイルは保持）"""
     with READatabase.cursor(commit=True) as (cur, conn):
         cur.execute("SELECT id FROM touki_imports WHERE id = %s AND deleted_at IS NULL", (import_id,))
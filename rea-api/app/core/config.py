@@ -23,6 +23,9 @@ class Settings(BaseSettings):
     # ログ設定
     LOG_LEVEL: str = "INFO"
 
+    # SQL計測: X-Debug-SQL: 1 ヘッダー付きリクエストのJSONレスポンスに _debug を付与するか
+    SQL_DEBUG_ENABLED: bool = os.getenv("SQL_DEBUG_ENABLED", "false").lower() == "true"
+
     # 外部API URL設定（ハードコード回避）
     REINFOLIB_BASE_URL: str = "https://www.reinfolib.mlit.go.jp/ex-api/external"
     GSI_GEOCODE_URL: str = "https://msearch.gsi.go.jp/address-search/AddressSearch"
@@ -15,6 +15,8 @@ from sqlalchemy.orm import Session, sessionmaker
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from shared.query_stats import instrument_engine
+
 # プロジェクトルートの.envを読み込む（shared/database.pyと同じ）
 env_path = project_root / ".env"
 if env_path.exists():
@@ -32,6 +34,7 @@ db_url = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 # SQLAlchemy設定
 engine = create_engine(db_url)
+instrument_engine(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -9,12 +9,25 @@ from pathlib import Path
 project_root = Path(__file__).resolve().parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+import base64
+import binascii
 import json
-from typing import Any, Dict, List, Optional, Set
+import re
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.services.property_search import (
+    SEARCH_ADDRESS_COLUMNS,
+    SEARCH_DOCUMENT_COLUMNS,
+    SEARCH_RANK_COLUMN,
+    SEARCH_TEXT_COLUMN,
+    build_search_document,
+    refresh_search_documents,
+)
 from shared.config.tables import CRUD_ALLOWED_TABLES
+from shared.formatters import split_search_keywords
+from shared.schema_registry import STANDARD_FIELD_PRESETS, schema_registry
 
 
 def _serialize_data(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -28,6 +41,71 @@ def _serialize_data(data: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def _sql_type(column: Dict[str, Any]) -> str:
+    """information_schema.columns の行からCAST先の型名を返す"""
+    if column["data_type"] == "ARRAY":
+        return f"{column['udt_name'][1:]}[]"
+    if column["data_type"] == "USER-DEFINED":
+        return column["udt_name"]
+    return column["data_type"]
+
+
+# get_full複合クエリで関連テーブルのカラムに付ける別名（r0__column_name）
+_RELATED_ALIAS = re.compile(r"^r(\d+)__(.+)$")
+
+
+def _format_image(image: Any) -> Dict[str, Any]:
+    """property_imagesの1行をget_fullのレスポンス形式に変換"""
+    return {
+        "id": image["id"],
+        "property_id": image["property_id"],
+        "image_type": str(image["image_type"]) if image["image_type"] else "0",
+        "file_path": image["file_path"],
+        "file_url": image["file_url"],
+        "display_order": image["display_order"],
+        "caption": image["caption"] or "",
+        "is_public": image["is_public"] if image["is_public"] is not None else True,
+        "variants": image.get("variants"),
+    }
+
+
+def encode_cursor(sort_by: str, sort_order: str, row: Dict[str, Any]) -> str:
+    """
+    キーセットページネーション用カーソルを生成
+
+    最終行の (sort_by, id) をエンコードした不透明トークンを返す。
+    ソートカラムが行に含まれない場合はidソートとして扱う（get_listのフォールバックと同じ）
+    """
+    if sort_by not in row:
+        sort_by = "id"
+    payload = {
+        "s": sort_by,
+        "o": sort_order,
+        "v": row.get(sort_by),
+        "id": row["id"],
+    }
+    raw = json.dumps(payload, ensure_ascii=False, default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    カーソルトークンをデコード
+
+    Raises:
+        ValueError: 不正なトークン
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+    if not isinstance(payload, dict) or not {"s", "o", "v", "id"} <= payload.keys():
+        raise ValueError("Invalid cursor: missing keys")
+    return payload
+
+
 class GenericCRUD:
     """
     メタデータ駆動の汎用CRUD
@@ -62,97 +140,152 @@ class GenericCRUD:
         "updated_at",
     }
 
+    # get_fullでマージする関連テーブル（マージ優先順）
+    FULL_RELATED_TABLES: List[str] = ["building_info", "land_info"]
+
     def __init__(self, db: Session):
         self.db = db
-        self._column_cache: Dict[str, List[str]] = {}
 
     def _get_valid_columns(self, table_name: str) -> List[str]:
         """
-        column_labelsから有効なカラム一覧を取得（キャッシュ付き）
+        column_labelsから有効なカラム一覧を取得（スキーマレジストリ経由）
         """
-        if table_name in self._column_cache:
-            return self._column_cache[table_name]
-
-        result = self.db.execute(
-            text("""
-                SELECT column_name
-                FROM column_labels
-                WHERE table_name = :table_name
-                ORDER BY display_order, column_name
-            """),
-            {"table_name": table_name}
-        )
-        columns = [row[0] for row in result]
-        self._column_cache[table_name] = columns
-        return columns
+        return schema_registry.get_label_columns(table_name, self.db)
 
     def _get_updatable_columns(self, table_name: str) -> Set[str]:
         """
         column_labelsから更新可能なカラム一覧を取得
         is_updatable = true のカラムのみ返す
         """
-        cache_key = f"{table_name}_updatable"
-        if cache_key in self._column_cache:
-            return set(self._column_cache[cache_key])
-
-        result = self.db.execute(
-            text("""
-                SELECT column_name
-                FROM column_labels
-                WHERE table_name = :table_name
-                AND is_updatable = true
-            """),
-            {"table_name": table_name}
-        )
-        columns = [row[0] for row in result]
-        self._column_cache[cache_key] = columns
-        return set(columns)
+        return schema_registry.get_updatable_columns(table_name, self.db)
 
     def _get_db_columns(self, table_name: str) -> List[str]:
         """
-        実際のDBカラム一覧を取得
+        実際のDBカラム一覧を取得（スキーマレジストリ経由）
         """
-        result = self.db.execute(
-            text("""
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_schema = 'public'
-                AND table_name = :table_name
-                ORDER BY ordinal_position
-            """),
-            {"table_name": table_name}
-        )
-        return [row[0] for row in result]
+        return schema_registry.get_db_columns(table_name, self.db)
 
     def _validate_table(self, table_name: str) -> None:
         """テーブル名のバリデーション（SQLインジェクション対策）"""
         if table_name not in self.ALLOWED_TABLES:
             raise ValueError(f"Table '{table_name}' is not allowed")
 
-    def _filter_data(self, table_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def resolve_fields(self, table_name: str, fields: Optional[str]) -> Optional[List[str]]:
+        """
+        fields パラメータを取得カラム一覧に変換
+
+        - 未指定: None（全カラム）
+        - プリセット名（column_labels.field_presets、例: list / map / export）
+          標準プリセットが未登録（マイグレーション未適用）の場合は None（全カラム）
+        - カンマ区切りのカラム名（column_labelsに登録済みかつDBに存在するもののみ）
+
+        idは常に含める。
+
+        Raises:
+            ValueError: 未登録のカラム名・プリセット名
         """
-        有効なカラムのみをフィルタリング（メタデータ駆動）
+        if not fields or not fields.strip():
+            return None
+
+        self._validate_table(table_name)
+        db_columns = self._get_db_columns(table_name)
+
+        presets = schema_registry.get_field_presets(table_name, self.db)
+        name = fields.strip()
+        if name in presets:
+            requested = presets[name]
+        elif name in STANDARD_FIELD_PRESETS:
+            return None
+        else:
+            requested = [f.strip() for f in fields.split(",") if f.strip()]
+            labeled = set(self._get_valid_columns(table_name)) & set(db_columns)
+            unknown = [f for f in requested if f not in labeled]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+        columns = ["id"]
+        for column in requested:
+            if column in db_columns and column not in columns:
+                columns.append(column)
+        return columns
+
+    def _keyset_condition(
+        self,
+        cursor: str,
+        sort_by: str,
+        sort_order: str,
+        sort_expr: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        キーセットページネーションのWHERE条件を生成
+
+        ORDER BY {sort_by} {sort_order}, id {sort_order} の並びで、
+        カーソル位置より後ろの行を返す条件。
+        PostgreSQLの既定（ASCはNULLS LAST、DESCはNULLS FIRST）に合わせてNULLを扱う。
+
+        sort_expr: ソートキーがカラムでなく式の場合（検索ランキング等）のSQL式
+
+        Raises:
+            ValueError: カーソルが不正、またはソート条件と一致しない
+        """
+        data = decode_cursor(cursor)
+        if data["s"] != sort_by or data["o"] != sort_order:
+            raise ValueError("Cursor does not match sort_by/sort_order")
+        sort_by = sort_expr or sort_by
+
+        op = "<" if sort_order == "desc" else ">"
+        params: Dict[str, Any] = {"cursor_id": data["id"]}
+
+        if sort_by == "id":
+            return f"id {op} :cursor_id", params
+
+        if data["v"] is None:
+            if sort_order == "desc":
+                # NULL行の途中: 残りのNULL行 + 全ての非NULL行
+                condition = f"(({sort_by} IS NULL AND id < :cursor_id) OR {sort_by} IS NOT NULL)"
+            else:
+                # NULL行は末尾: 残りのNULL行のみ
+                condition = f"({sort_by} IS NULL AND id > :cursor_id)"
+        else:
+            params["cursor_value"] = data["v"]
+            condition = f"({sort_by}, id) {op} (:cursor_value, :cursor_id)"
+            if sort_order == "asc":
+                # NULL行は末尾に続く
+                condition = f"({condition} OR {sort_by} IS NULL)"
+
+        return condition, params
 
-        フィルタ条件:
+    def get_writable_columns(self, table_name: str) -> Set[str]:
+        """
+        作成・更新で書き込めるカラム（メタデータ駆動）
+
+        条件:
         1. column_labelsに登録されている
         2. 実際にDBに存在する
         3. is_updatable = true である
-        """
-        updatable_columns = self._get_updatable_columns(table_name)
-        db_columns = set(self._get_db_columns(table_name))
 
-        # 有効 = column_labelsでis_updatable=true AND 実際にDBに存在
-        allowed = updatable_columns & db_columns
+        スキーマレジストリから取得する（未ロード時のみDBを参照）。
+        """
+        return self._get_updatable_columns(table_name) & set(self._get_db_columns(table_name))
 
+    def filter_writable(self, table_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """書き込めるカラム（get_writable_columns）のみにフィルタリング"""
+        allowed = self.get_writable_columns(table_name)
         return {k: v for k, v in data.items() if k in allowed}
 
-    def get(self, table_name: str, id: int) -> Optional[Dict[str, Any]]:
+    def _filter_data(self, table_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """有効なカラムのみをフィルタリング（filter_writable と同じ）"""
+        return self.filter_writable(table_name, data)
+
+    def get(self, table_name: str, id: int, fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """
         単一レコード取得
+
+        fields: 取得カラム（resolve_fieldsの結果、Noneの場合は全カラム）
         """
         self._validate_table(table_name)
 
-        columns = self._get_db_columns(table_name)
+        columns = fields or self._get_db_columns(table_name)
         columns_str = ", ".join(columns)
         result = self.db.execute(
             text(f"SELECT {columns_str} FROM {table_name} WHERE id = :id AND deleted_at IS NULL"),
@@ -164,20 +297,30 @@ class GenericCRUD:
 
         return dict(result._mapping)
 
-    def get_full(self, property_id: int) -> Optional[Dict[str, Any]]:
+    def get_full(self, property_id: int, composite: bool = True) -> Optional[Dict[str, Any]]:
         """
         物件の全データを取得（properties + 関連テーブル）
         メタデータ駆動: propertiesを優先、関連テーブルで補完
+
+        composite: Trueの場合は1クエリ（LATERAL JOIN + json_agg）で取得、
+                   Falseの場合はテーブルごとに個別クエリで取得（比較・検証用）
         """
+        if composite:
+            row = self.db.execute(
+                text(self._build_full_query("p.id = :pid")),
+                {"pid": property_id}
+            ).fetchone()
+            if row is None:
+                return None
+            return self._merge_full_row(row._mapping)
+
         # properties 取得
         result = self.get("properties", property_id)
         if result is None:
             return None
 
         # 関連テーブルを取得してマージ
-        related_tables = ["building_info", "land_info"]
-
-        for table_name in related_tables:
+        for table_name in self.FULL_RELATED_TABLES:
             rel_columns = self._get_db_columns(table_name)
             rel_columns_str = ", ".join(rel_columns)
             related = self.db.execute(
@@ -186,15 +329,7 @@ class GenericCRUD:
             ).fetchone()
 
             if related:
-                related_dict = dict(related._mapping)
-                for key, value in related_dict.items():
-                    # システムカラムはスキップ
-                    if key in ['id', 'property_id', 'created_at', 'updated_at']:
-                        continue
-                    # 既に値がある場合は上書きしない（propertiesを優先）
-                    # ただし、propertiesに該当カラムがない場合は追加
-                    if key not in result or result[key] is None:
-                        result[key] = value
+                self._merge_related(result, dict(related._mapping))
 
         # datetime型を文字列に変換
         for key in ['created_at', 'updated_at']:
@@ -205,61 +340,170 @@ class GenericCRUD:
         images_result = self.db.execute(
             text("""
                 SELECT id, property_id, image_type, file_path, file_url,
-                       display_order, caption, is_public
+                       display_order, caption, is_public, variants
                 FROM property_images
                 WHERE property_id = :pid AND deleted_at IS NULL
                 ORDER BY display_order, id
             """),
             {"pid": property_id}
         )
-        images = []
-        for row in images_result:
-            images.append({
-                "id": row.id,
-                "property_id": row.property_id,
-                "image_type": str(row.image_type) if row.image_type else "0",
-                "file_path": row.file_path,
-                "file_url": row.file_url,
-                "display_order": row.display_order,
-                "caption": row.caption or "",
-                "is_public": row.is_public if row.is_public is not None else True,
-            })
-        result["property_images"] = images
+        result["property_images"] = [_format_image(row._mapping) for row in images_result]
 
         return result
 
-    def get_list(
+    def get_full_many(self, property_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        複数物件の全データを一括取得（get_fullと同じ形式）
+
+        ID数に関わらず1クエリで取得する。
+        結果は指定順（存在しない・削除済みのIDは含まない）。
+        """
+        return list(self.iter_full_many(property_ids))
+
+    def iter_full_many(self, property_ids: List[int]) -> Iterator[Dict[str, Any]]:
+        """
+        複数物件の全データを指定順に1件ずつ返す（ストリーミング出力用）
+        """
+        if not property_ids:
+            return
+
+        query = self._build_full_query("p.id = ANY(:pids)") + " ORDER BY array_position(:pids, p.id)"
+        result = self.db.execute(text(query), {"pids": list(property_ids)})
+        for row in result:
+            yield self._merge_full_row(row._mapping)
+
+    def _build_full_query(self, where_clause: str) -> str:
+        """
+        get_full用の複合クエリを構築
+
+        properties と関連テーブル（LATERAL JOIN）、画像（json_agg）を1文で取得する。
+        関連テーブルのカラムは "r{n}__{column}" の別名で返す。
+        カラム一覧はスキーマレジストリから取得するため、カタログ問い合わせは発生しない。
+        """
+        select_parts = [f"p.{col}" for col in self._get_db_columns("properties")]
+        joins = []
+
+        for i, table_name in enumerate(self.FULL_RELATED_TABLES):
+            alias = f"r{i}"
+            rel_columns = self._get_db_columns(table_name)
+            select_parts.extend(f'{alias}.{col} AS "{alias}__{col}"' for col in rel_columns)
+            joins.append(f"""
+                LEFT JOIN LATERAL (
+                    SELECT {", ".join(rel_columns)}
+                    FROM {table_name}
+                    WHERE property_id = p.id AND deleted_at IS NULL
+                    ORDER BY id
+                    LIMIT 1
+                ) {alias} ON TRUE""")
+
+        select_parts.append('img.images AS "__property_images"')
+        joins.append("""
+                LEFT JOIN LATERAL (
+                    SELECT COALESCE(
+                        json_agg(json_build_object(
+                            'id', pi.id,
+                            'property_id', pi.property_id,
+                            'image_type', pi.image_type,
+                            'file_path', pi.file_path,
+                            'file_url', pi.file_url,
+                            'display_order', pi.display_order,
+                            'caption', pi.caption,
+                            'is_public', pi.is_public,
+                            'variants', pi.variants
+                        ) ORDER BY pi.display_order, pi.id),
+                        '[]'::json
+                    ) AS images
+                    FROM property_images pi
+                    WHERE pi.property_id = p.id AND pi.deleted_at IS NULL
+                ) img ON TRUE""")
+
+        return f"""
+            SELECT {", ".join(select_parts)}
+            FROM properties p{"".join(joins)}
+            WHERE {where_clause} AND p.deleted_at IS NULL
+        """
+
+    def _merge_full_row(self, mapping: Any) -> Dict[str, Any]:
+        """
+        複合クエリの1行を get_full と同じ形式の辞書に変換
+        """
+        result: Dict[str, Any] = {}
+        related: List[Dict[str, Any]] = [{} for _ in self.FULL_RELATED_TABLES]
+        images: List[Dict[str, Any]] = []
+
+        for key, value in mapping.items():
+            alias = _RELATED_ALIAS.match(key)
+            if key == "__property_images":
+                images = value or []
+            elif alias:
+                index, column = alias.groups()
+                related[int(index)][column] = value
+            else:
+                result[key] = value
+
+        for related_dict in related:
+            # LEFT JOINで行が無い場合は id が NULL
+            if related_dict.get("id") is not None:
+                self._merge_related(result, related_dict)
+
+        # datetime型を文字列に変換
+        for key in ['created_at', 'updated_at']:
+            if key in result and result[key] is not None:
+                result[key] = str(result[key])
+
+        result["property_images"] = [_format_image(image) for image in images]
+        return result
+
+    @staticmethod
+    def _merge_related(result: Dict[str, Any], related_dict: Dict[str, Any]) -> None:
+        """関連テーブルの値をマージ（propertiesの値を優先）"""
+        for key, value in related_dict.items():
+            # システムカラムはスキップ
+            if key in ['id', 'property_id', 'created_at', 'updated_at']:
+                continue
+            # 既に値がある場合は上書きしない（propertiesを優先）
+            # ただし、propertiesに該当カラムがない場合は追加
+            if key not in result or result[key] is None:
+                result[key] = value
+
+    def _build_conditions(
         self,
-        table_name: str,
-        skip: int = 0,
-        limit: int = 100,
+        valid_columns: Set[str],
         filters: Optional[Dict[str, Any]] = None,
         range_filters: Optional[Dict[str, Any]] = None,
-        sort_by: str = "id",
-        sort_order: str = "desc",
-    ) -> List[Dict[str, Any]]:
+        search_term: Optional[str] = None,
+        search_columns: Optional[List[str]] = None,
+    ) -> Tuple[List[str], Dict[str, Any]]:
         """
-        一覧取得（フィルタリング・ソート対応）
+        一覧・件数・検索で共通のWHERE条件を構築
 
+        filters: 完全一致（'%'を含む文字列はILIKE）
         range_filters: 範囲フィルタ（例: {"sale_price__gte": 1000, "sale_price__lte": 5000}）
-        """
-        self._validate_table(table_name)
-
-        # 有効なカラムを確認
-        valid_columns = set(self._get_db_columns(table_name))
-
-        # ソートカラムの検証
-        if sort_by not in valid_columns:
-            sort_by = "id"
-        if sort_order not in ("asc", "desc"):
-            sort_order = "desc"
+        search_term / search_columns: 検索語
+            - search_textカラムがあるテーブル: 正規化した検索ドキュメントへのキーワードAND検索
+            - それ以外: 指定カラムのOR部分一致検索
 
-        # クエリ構築
-        columns_str = ", ".join(valid_columns)
-        query = f"SELECT {columns_str} FROM {table_name}"
+        Returns:
+            (conditions, params): AND結合する条件リストとバインドパラメータ
+        """
         params: Dict[str, Any] = {}
         conditions = ["deleted_at IS NULL"]  # 論理削除されていないレコードのみ
 
+        # 検索条件（検索ドキュメントがあればトライグラムインデックスで検索）
+        if search_term and SEARCH_TEXT_COLUMN in valid_columns:
+            keywords = split_search_keywords(search_term)
+            for i, keyword in enumerate(keywords):
+                conditions.append(f"{SEARCH_TEXT_COLUMN} LIKE :search_{i}")
+                params[f"search_{i}"] = f"%{keyword}%"
+            if keywords:
+                params["search_query"] = "".join(keywords)
+        elif search_term and search_columns:
+            target_columns = [c for c in search_columns if c in valid_columns]
+            if target_columns:
+                search_conditions = [f"{col} ILIKE :search" for col in target_columns]
+                conditions.append(f"({' OR '.join(search_conditions)})")
+                params["search"] = f"%{search_term}%"
+
         # フィルタリング
         if filters:
             for i, (key, value) in enumerate(filters.items()):
@@ -288,19 +532,249 @@ class GenericCRUD:
                             conditions.append(f"{col_name} <= :{param_name}")
                             params[param_name] = value
 
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
+        return conditions, params
+
+    @staticmethod
+    def _normalize_sort(valid_columns: Set[str], sort_by: str, sort_order: str) -> Tuple[str, str]:
+        """ソート条件の検証（不正値はid降順にフォールバック）"""
+        if sort_by not in valid_columns:
+            sort_by = "id"
+        if sort_order not in ("asc", "desc"):
+            sort_order = "desc"
+        return sort_by, sort_order
+
+    @staticmethod
+    def _order_clause(sort_by: str, sort_order: str) -> str:
+        """ORDER BY句（idを第2キーにして並びを一意にする）"""
+        clause = f" ORDER BY {sort_by} {sort_order}"
+        if sort_by != "id":
+            clause += f", id {sort_order}"
+        return clause
+
+    def get_list(
+        self,
+        table_name: str,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        range_filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "id",
+        sort_order: str = "desc",
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        一覧取得（フィルタリング・ソート対応）
+
+        range_filters: 範囲フィルタ（例: {"sale_price__gte": 1000, "sale_price__lte": 5000}）
+        cursor: キーセットページネーション用カーソル（指定時はskipを無視）
+        fields: 取得カラム（resolve_fieldsの結果、Noneの場合は全カラム）
+        """
+        items, _ = self._select_page(
+            table_name,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            range_filters=range_filters,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            cursor=cursor,
+            with_total=False,
+            fields=fields,
+        )
+        return items
+
+    def get_list_with_total(
+        self,
+        table_name: str,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        range_filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "id",
+        sort_order: str = "desc",
+        cursor: Optional[str] = None,
+        search_term: Optional[str] = None,
+        search_columns: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        一覧と総件数を1クエリで取得（get_list + get_count の代替）
+
+        - オフセット方式: COUNT(*) OVER() で一覧と同じスキャンから件数を得る
+        - カーソル方式: カーソル条件を除いた件数をスカラーサブクエリで同時に取得
+
+        fields: 取得カラム（resolve_fieldsの結果、Noneの場合は全カラム）
+
+        Returns:
+            (items, total)
+        """
+        return self._select_page(
+            table_name,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            range_filters=range_filters,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            cursor=cursor,
+            search_term=search_term,
+            search_columns=search_columns,
+            with_total=True,
+            fields=fields,
+        )
+
+    def _prepare_select(
+        self,
+        table_name: str,
+        filters: Optional[Dict[str, Any]],
+        range_filters: Optional[Dict[str, Any]],
+        sort_by: str,
+        sort_order: str,
+        search_term: Optional[str],
+        search_columns: Optional[List[str]],
+        fields: Optional[List[str]],
+    ) -> Tuple[List[str], str, Dict[str, Any], str, str, Optional[str]]:
+        """
+        一覧系SELECTの共通部分を構築
+
+        Returns:
+            (select_parts, base_where, params, sort_by, sort_order, sort_expr)
+            sort_by / sort_order は検証済みの値、sort_expr は式でソートする場合のSQL式
+        """
+        self._validate_table(table_name)
+
+        # 有効なカラムを確認
+        valid_columns = set(self._get_db_columns(table_name))
+
+        conditions, params = self._build_conditions(
+            valid_columns, filters, range_filters, search_term, search_columns
+        )
+        base_where = " AND ".join(conditions)
+
+        # 検索ランキング（検索ドキュメントとの類似度）
+        rank_expr = None
+        if "search_query" in params:
+            rank_expr = f"similarity({SEARCH_TEXT_COLUMN}, :search_query)::float8"
+
+        sortable_columns = valid_columns | {SEARCH_RANK_COLUMN} if rank_expr else valid_columns
+        sort_by, sort_order = self._normalize_sort(sortable_columns, sort_by, sort_order)
+        sort_expr = rank_expr if sort_by == SEARCH_RANK_COLUMN else None
+
+        # 取得カラム（射影指定時もカーソル生成のためソートカラムは含める）
+        columns = list(fields) if fields else self._get_db_columns(table_name)
+        if sort_by in valid_columns and sort_by not in columns:
+            columns.append(sort_by)
+        select_parts = [", ".join(columns)]
+        if rank_expr:
+            select_parts.append(f"{rank_expr} AS {SEARCH_RANK_COLUMN}")
+
+        return select_parts, base_where, params, sort_by, sort_order, sort_expr
+
+    def _select_page(
+        self,
+        table_name: str,
+        skip: int,
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        range_filters: Optional[Dict[str, Any]],
+        sort_by: str,
+        sort_order: str,
+        cursor: Optional[str],
+        with_total: bool,
+        search_term: Optional[str] = None,
+        search_columns: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """get_list / get_list_with_total の共通実装"""
+        select_parts, base_where, params, sort_by, sort_order, sort_expr = self._prepare_select(
+            table_name, filters, range_filters, sort_by, sort_order, search_term, search_columns, fields
+        )
+
+        if with_total:
+            if cursor:
+                select_parts.append(f"(SELECT COUNT(*) FROM {table_name} WHERE {base_where}) AS __total")
+            else:
+                select_parts.append("COUNT(*) OVER() AS __total")
+
+        # キーセットページネーション
+        where_clause = base_where
+        if cursor:
+            keyset_condition, keyset_params = self._keyset_condition(cursor, sort_by, sort_order, sort_expr)
+            where_clause += f" AND {keyset_condition}"
+            params.update(keyset_params)
 
-        # ソート
-        query += f" ORDER BY {sort_by} {sort_order}"
+        query = f"SELECT {', '.join(select_parts)} FROM {table_name} WHERE {where_clause}"
+        query += self._order_clause(sort_expr or sort_by, sort_order)
 
         # ページネーション
-        query += " OFFSET :skip LIMIT :limit"
-        params["skip"] = skip
+        if cursor:
+            query += " LIMIT :limit"
+        else:
+            query += " OFFSET :skip LIMIT :limit"
+            params["skip"] = skip
         params["limit"] = limit
 
         result = self.db.execute(text(query), params)
-        return [dict(row._mapping) for row in result]
+        items = [dict(row._mapping) for row in result]
+
+        if not with_total:
+            return items, None
+
+        if items:
+            total = items[0]["__total"]
+            for item in items:
+                del item["__total"]
+        else:
+            # 範囲外のページでは行が返らないため件数を別途取得
+            total = self.get_count(
+                table_name,
+                filters=filters,
+                range_filters=range_filters,
+                search_term=search_term,
+                search_columns=search_columns,
+            )
+        return items, total
+
+    def iter_list(
+        self,
+        table_name: str,
+        filters: Optional[Dict[str, Any]] = None,
+        range_filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "id",
+        sort_order: str = "desc",
+        search_term: Optional[str] = None,
+        search_columns: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        条件に一致する全件を1件ずつ返す（エクスポート用）
+
+        サーバーサイドカーソル（名前付きカーソル）で batch_size 件ずつ取得するため、
+        件数に関わらずメモリ使用量は一定。条件・並び順は get_list と同じ。
+        """
+        select_parts, base_where, params, sort_by, sort_order, sort_expr = self._prepare_select(
+            table_name, filters, range_filters, sort_by, sort_order, search_term, search_columns, fields
+        )
+
+        query = f"SELECT {', '.join(select_parts)} FROM {table_name} WHERE {base_where}"
+        query += self._order_clause(sort_expr or sort_by, sort_order)
+
+        result = self.db.execute(
+            text(query),
+            params,
+            execution_options={"stream_results": True, "yield_per": batch_size},
+        )
+        try:
+            for row in result:
+                item = dict(row._mapping)
+                # 検索ランキングは並び順用（出力しない）
+                item.pop(SEARCH_RANK_COLUMN, None)
+                yield item
+        finally:
+            # クライアント切断時もカーソルを閉じる
+            result.close()
 
     def get_count(
         self,
@@ -318,49 +792,29 @@ class GenericCRUD:
         self._validate_table(table_name)
 
         valid_columns = set(self._get_db_columns(table_name))
-        params: Dict[str, Any] = {}
-        conditions = ["deleted_at IS NULL"]
-
-        # 検索条件（searchメソッドと同じロジック）
-        if search_term and search_columns:
-            target_columns = [c for c in search_columns if c in valid_columns]
-            if target_columns:
-                search_conditions = [f"{col} ILIKE :search" for col in target_columns]
-                conditions.append(f"({' OR '.join(search_conditions)})")
-                params["search"] = f"%{search_term}%"
-
-        # フィルタリング（get_listと同じロジック）
-        if filters:
-            for i, (key, value) in enumerate(filters.items()):
-                if key in valid_columns and value is not None:
-                    param_name = f"filter_{i}"
-                    if isinstance(value, str) and '%' in value:
-                        conditions.append(f"{key} ILIKE :{param_name}")
-                    else:
-                        conditions.append(f"{key} = :{param_name}")
-                    params[param_name] = value
-
-        # 範囲フィルタリング
-        if range_filters:
-            for i, (key, value) in enumerate(range_filters.items()):
-                if value is not None:
-                    if "__gte" in key:
-                        col_name = key.replace("__gte", "")
-                        if col_name in valid_columns:
-                            param_name = f"range_{i}"
-                            conditions.append(f"{col_name} >= :{param_name}")
-                            params[param_name] = value
-                    elif "__lte" in key:
-                        col_name = key.replace("__lte", "")
-                        if col_name in valid_columns:
-                            param_name = f"range_{i}"
-                            conditions.append(f"{col_name} <= :{param_name}")
-                            params[param_name] = value
+        conditions, params = self._build_conditions(
+            valid_columns, filters, range_filters, search_term, search_columns
+        )
 
         query = f"SELECT COUNT(*) FROM {table_name} WHERE " + " AND ".join(conditions)
         result = self.db.execute(text(query), params).scalar()
         return result or 0
 
+    def get_count_estimate(self, table_name: str) -> int:
+        """
+        論理削除を除いたレコード件数のプランナー推定値を取得
+
+        フィルタなしの一覧で正確な件数が不要な場合に使用（テーブルスキャンなし）。
+        """
+        self._validate_table(table_name)
+
+        plan = self.db.execute(
+            text(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table_name} WHERE deleted_at IS NULL")
+        ).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     def create(self, table_name: str, data: Dict[str, Any], extra_fields: Optional[Dict[str, Any]] = None, commit: bool = True) -> Dict[str, Any]:
         """
         レコード作成
@@ -389,10 +843,11 @@ class GenericCRUD:
         """
 
         result = self.db.execute(text(query), serialized_data).fetchone()
+        row = self._sync_search_text(table_name, dict(result._mapping))
         if commit:
             self.db.commit()
 
-        return dict(result._mapping)
+        return row
 
     def update(self, table_name: str, id: int, data: Dict[str, Any], commit: bool = True) -> Optional[Dict[str, Any]]:
         """
@@ -418,13 +873,29 @@ class GenericCRUD:
         """
 
         result = self.db.execute(text(query), serialized_data).fetchone()
+        row = self._sync_search_text(table_name, dict(result._mapping)) if result is not None else None
         if commit:
             self.db.commit()
 
-        if result is None:
-            return None
+        return row
 
-        return dict(result._mapping)
+    def _sync_search_text(self, table_name: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        検索ドキュメント（search_text）を再計算し、変わった場合のみ保存
+
+        create / update の RETURNING 行から計算するため追加のSELECTは不要。
+        """
+        if SEARCH_TEXT_COLUMN not in row:
+            return row
+
+        document = build_search_document(row)
+        if document != row[SEARCH_TEXT_COLUMN]:
+            self.db.execute(
+                text(f"UPDATE {table_name} SET {SEARCH_TEXT_COLUMN} = :document WHERE id = :id"),
+                {"document": document, "id": row["id"]},
+            )
+            row[SEARCH_TEXT_COLUMN] = document
+        return row
 
     def update_full(self, property_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -482,6 +953,116 @@ class GenericCRUD:
         self.db.commit()
         return self.get_full(property_id)
 
+    def bulk_update_full(self, updates: Dict[int, Dict[str, Any]]) -> None:
+        """
+        複数物件の全データを一括更新（update_fullの一括版、commitは呼び出し元）
+
+        データの振り分け・カラムのフィルタリングは update_full と同じ。
+        テーブルごと・更新カラムの組み合わせごとに UPDATE ... FROM (VALUES ...) を
+        1文で実行するため、物件数に比例してSQLが増えない。
+
+        updates: {property_id: 更新データ}
+        """
+        if not updates:
+            return
+
+        tables = ["properties"] + self.FULL_RELATED_TABLES
+        table_columns = {table_name: set(self._get_db_columns(table_name)) for table_name in tables}
+
+        # データを各テーブルに振り分け（propertiesを優先）
+        table_data: Dict[str, Dict[int, Dict[str, Any]]] = {table_name: {} for table_name in tables}
+        for property_id, data in updates.items():
+            for key, value in data.items():
+                if key in {'id', 'created_at', 'updated_at'}:
+                    continue
+                for table_name in tables:
+                    if key in table_columns[table_name]:
+                        table_data[table_name].setdefault(property_id, {})[key] = value
+                        break
+
+        # properties を更新
+        properties_rows = {
+            property_id: self._filter_data("properties", data)
+            for property_id, data in table_data["properties"].items()
+        }
+        self._bulk_update_rows("properties", properties_rows)
+
+        # 検索ドキュメントの元カラムが変わった物件のみ再計算
+        if SEARCH_TEXT_COLUMN in table_columns["properties"]:
+            source = set(SEARCH_DOCUMENT_COLUMNS + SEARCH_ADDRESS_COLUMNS)
+            changed_ids = [pid for pid, data in properties_rows.items() if source & data.keys()]
+            if changed_ids:
+                refresh_search_documents(self.db, changed_ids)
+
+        # 関連テーブルを更新（存在しなければ作成）
+        for table_name in self.FULL_RELATED_TABLES:
+            rows = table_data[table_name]
+            if not rows:
+                continue
+
+            # 既存レコード（get_fullと同じく物件ごとに最小idの行）
+            existing = {
+                row.property_id: row.id
+                for row in self.db.execute(
+                    text(f"""
+                        SELECT DISTINCT ON (property_id) property_id, id
+                        FROM {table_name}
+                        WHERE property_id = ANY(:pids) AND deleted_at IS NULL
+                        ORDER BY property_id, id
+                    """),
+                    {"pids": list(rows)},
+                )
+            }
+
+            self._bulk_update_rows(table_name, {
+                existing[property_id]: self._filter_data(table_name, data)
+                for property_id, data in rows.items()
+                if property_id in existing
+            })
+            for property_id, data in rows.items():
+                if property_id not in existing:
+                    self._create_related(table_name, {**data, "property_id": property_id})
+
+    def _bulk_update_rows(self, table_name: str, rows: Dict[int, Dict[str, Any]]) -> None:
+        """
+        複数行を UPDATE ... FROM (VALUES ...) で一括更新（内部用）
+
+        rows: {id: 更新データ}（フィルタ済み）
+        更新カラムの組み合わせが同じ行を1文にまとめる。
+        VALUES内の値はカラム型にCASTする（型推論でtextになるのを防ぐ）。
+        """
+        column_types = {
+            c["column_name"]: _sql_type(c)
+            for c in schema_registry.get_column_info(table_name, self.db)
+        }
+
+        groups: Dict[Tuple[str, ...], List[Tuple[int, Dict[str, Any]]]] = {}
+        for row_id, data in rows.items():
+            if data:
+                groups.setdefault(tuple(sorted(data)), []).append((row_id, _serialize_data(data)))
+
+        for columns, group in groups.items():
+            params: Dict[str, Any] = {}
+            values = []
+            for i, (row_id, data) in enumerate(group):
+                params[f"id_{i}"] = row_id
+                placeholders = [f":id_{i}"]
+                for j, col in enumerate(columns):
+                    params[f"v{i}_{j}"] = data[col]
+                    placeholders.append(f"CAST(:v{i}_{j} AS {column_types[col]})")
+                values.append(f"({', '.join(placeholders)})")
+
+            set_clause = ", ".join(f"{col} = v.{col}" for col in columns)
+            self.db.execute(
+                text(f"""
+                    UPDATE {table_name} AS t
+                    SET {set_clause}, updated_at = NOW()
+                    FROM (VALUES {", ".join(values)}) AS v(id, {", ".join(columns)})
+                    WHERE t.id = v.id
+                """),
+                params,
+            )
+
     def _update_related(self, table_name: str, id: int, data: Dict[str, Any]) -> None:
         """
         関連テーブルの更新（内部用）
@@ -546,71 +1127,48 @@ class GenericCRUD:
         skip: int = 0,
         limit: int = 100,
         range_filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
-        全文検索（指定カラムまたはテキストカラム全てを対象）
+        全文検索
+
+        - search_textカラムがあるテーブル: 検索ドキュメント（トライグラム）を類似度順で検索
+        - それ以外: 指定カラムまたはテキストカラム全てをOR部分一致、id降順
 
         range_filters: 範囲フィルタ（例: {"sale_price__gte": 1000, "sale_price__lte": 5000}）
+        cursor: キーセットページネーション用カーソル（指定時はskipを無視）
+        fields: 取得カラム（resolve_fieldsの結果、Noneの場合は全カラム）
         """
         self._validate_table(table_name)
 
         valid_columns = set(self._get_db_columns(table_name))
 
-        # 検索対象カラムを決定
-        if search_columns:
-            target_columns = [c for c in search_columns if c in valid_columns]
-        else:
-            # テキスト型カラムを自動検出
-            result = self.db.execute(
-                text("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_schema = 'public'
-                    AND table_name = :table_name
-                    AND data_type IN ('character varying', 'text', 'character')
-                """),
-                {"table_name": table_name}
-            )
-            target_columns = [row[0] for row in result]
-
-        if not target_columns:
-            return []
-
-        # OR検索クエリ構築
-        search_conditions = [f"{col} ILIKE :search" for col in target_columns]
-        params = {"search": f"%{search_term}%", "skip": skip, "limit": limit}
-
-        # 範囲フィルタリング
-        range_conditions = []
-        if range_filters:
-            for i, (key, value) in enumerate(range_filters.items()):
-                if value is not None:
-                    if "__gte" in key:
-                        col_name = key.replace("__gte", "")
-                        if col_name in valid_columns:
-                            param_name = f"range_{i}"
-                            range_conditions.append(f"{col_name} >= :{param_name}")
-                            params[param_name] = value
-                    elif "__lte" in key:
-                        col_name = key.replace("__lte", "")
-                        if col_name in valid_columns:
-                            param_name = f"range_{i}"
-                            range_conditions.append(f"{col_name} <= :{param_name}")
-                            params[param_name] = value
-
-        # クエリ構築（論理削除されていないレコードのみ）
-        where_clause = f"deleted_at IS NULL AND ({' OR '.join(search_conditions)})"
-        if range_conditions:
-            where_clause += f" AND {' AND '.join(range_conditions)}"
-
-        columns_str = ", ".join(valid_columns)
-        query = f"""
-            SELECT {columns_str} FROM {table_name}
-            WHERE {where_clause}
-            ORDER BY id DESC
-            OFFSET :skip LIMIT :limit
-        """
-
-        result = self.db.execute(text(query), params)
-
-        return [dict(row._mapping) for row in result]
+        # 検索対象カラムを決定（検索ドキュメントがないテーブルのみ）
+        target_columns = None
+        if SEARCH_TEXT_COLUMN not in valid_columns:
+            if search_columns:
+                target_columns = [c for c in search_columns if c in valid_columns]
+            else:
+                # テキスト型カラムを自動検出
+                target_columns = schema_registry.get_text_columns(table_name, self.db)
+
+            if not target_columns:
+                return []
+
+        # 検索ドキュメントがあれば類似度順、なければid降順
+        items, _ = self._select_page(
+            table_name,
+            skip=skip,
+            limit=limit,
+            filters=None,
+            range_filters=range_filters,
+            sort_by=SEARCH_RANK_COLUMN,
+            sort_order="desc",
+            cursor=cursor,
+            with_total=False,
+            search_term=search_term,
+            search_columns=target_columns,
+            fields=fields,
+        )
+        return items
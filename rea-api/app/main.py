@@ -1,23 +1,54 @@
 import os
+import json
 import traceback
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 
 from .api.api_v1.api import api_router
+from .api.api_v1.endpoints.images import OBJECT_PREFIX
 from .core.config import settings
 from .core.exceptions import REAException
+from .services.ingest_jobs import ingest_job_worker
+from .services.touki_extraction import touki_extraction_worker
+from .utils.image_processor import image_processor
+from shared.async_database import AsyncREADatabase
+from shared.database import READatabase
+from shared.query_stats import RequestQueryStats, begin_request, end_request, endpoint_query_stats
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    起動・終了処理
+    - DBコネクションプールの作成・破棄（async: asyncpg / sync: READatabase）
+    - 取り込みジョブ・登記PDF抽出ワーカーの起動・停止
+    - 画像処理プロセスの終了
+    """
+    await AsyncREADatabase.init_pool()
+    ingest_job_worker.start()
+    touki_extraction_worker.start()
+    yield
+    await run_in_threadpool(ingest_job_worker.stop)
+    await run_in_threadpool(touki_extraction_worker.stop)
+    await run_in_threadpool(image_processor.shutdown)
+    await AsyncREADatabase.close_pool()
+    READatabase.close_pool()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version="1.0.0",
     description="REA - Real Estate Automation API",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS設定
@@ -29,12 +60,85 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+
+def _add_endpoint_stats(request: Request, stats: RequestQueryStats) -> None:
+    stats.finish()
+    route = request.scope.get("route")
+    if route is not None:
+        endpoint_query_stats.add(request.method, getattr(route, "path", request.url.path), stats)
+
+
+async def _finish_after_body(body_iterator, request: Request, stats: RequestQueryStats):
+    """本文の送信が終わってからエンドポイント別の集計に追加（StreamingResponse の本文生成中のSQLを含める）"""
+    try:
+        async for chunk in body_iterator:
+            yield chunk
+    finally:
+        _add_endpoint_stats(request, stats)
+
+
+@app.middleware("http")
+async def sql_instrumentation(request: Request, call_next):
+    """リクエスト単位のSQL計測
+
+    - Server-Timing ヘッダー（db: SQL合計時間と件数 / app: 全体）を付与
+      ヘッダーはレスポンス開始時点の値のため、StreamingResponse（/properties/export 等）の
+      本文生成中に実行したSQLは含まない
+    - エンドポイント別の集計に追加（GET /admin/query-stats）
+      本文の送信完了後に追加するため、ストリーミング中のSQLも含む
+    - SQL_DEBUG_ENABLED=true かつ X-Debug-SQL: 1 の場合、JSONレスポンスに _debug.sql を付与
+    """
+    stats = begin_request()
+    try:
+        response = await call_next(request)
+    except BaseException:
+        end_request()
+        raise
+    # 本文はこの後に生成されるため、終了時刻は本文の送信後に確定する
+    end_request(finish=False)
+
+    if (
+        settings.SQL_DEBUG_ENABLED
+        and request.headers.get("x-debug-sql") == "1"
+        and response.headers.get("content-type", "").startswith("application/json")
+    ):
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        try:
+            content = json.loads(body)
+        except ValueError:
+            content = None
+        if isinstance(content, dict):
+            content["_debug"] = {"sql": stats.to_dict()}
+            body = json.dumps(content, ensure_ascii=False, default=str).encode("utf-8")
+        raw_headers = [(k, v) for k, v in response.raw_headers if k != b"content-length"]
+        response = Response(body, status_code=response.status_code)
+        response.raw_headers = raw_headers + [(b"content-length", str(len(body)).encode())]
+
+    response.headers["Server-Timing"] = stats.server_timing()
+    if hasattr(response, "body_iterator"):
+        response.body_iterator = _finish_after_body(response.body_iterator, request, stats)
+    else:
+        _add_endpoint_stats(request, stats)
+    return response
+
+
+class UploadStaticFiles(StaticFiles):
+    """アップロード画像の配信（内容アドレスの画像は内容が変わらないため長期キャッシュ）"""
+
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code == 200 and path.replace(os.sep, "/").startswith(f"{OBJECT_PREFIX}/"):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 # 静的ファイル（画像アップロード用）
 if not os.path.exists("uploads"):
     os.makedirs("uploads")
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+app.mount("/uploads", UploadStaticFiles(directory="uploads"), name="uploads")
 
 # API ルーター
 app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -0,0 +1,120 @@
+"""
+DBキューのバックグラウンドワーカー
+
+ingest_jobs（スクレイパー取り込み）と touki_extraction（登記PDF抽出）で使う。
+CPU処理のプロセスプールは app.utils.process_pool.spawn_process_pool。
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PollingWorker:
+    """
+    DBのキューからジョブを取得して処理するワーカー（アプリ起動時に start()、終了時に stop()）
+
+    - claim: 次のジョブを取得して返す（無ければ None）。複数プロセスで同じジョブを
+             取得しないよう FOR UPDATE SKIP LOCKED 等で確保すること
+    - run:   1ジョブを処理する（例外はログに出して次のジョブへ）
+    - 同時に処理するのは workers 件まで、空きがあるときだけ claim を呼ぶ
+    - notify() ですぐに取得、それ以外は poll_interval 秒ごと（他プロセスで登録されたジョブ用）
+    """
+
+    def __init__(
+        self,
+        name: str,
+        claim: Callable[[], Optional[Any]],
+        run: Callable[[Any], None],
+        workers_env: str,
+        default_workers: int = 2,
+        poll_interval: float = 5.0,
+    ):
+        self.name = name
+        self.poll_interval = poll_interval
+        self._claim = claim
+        self._run = run
+        self._workers_env = workers_env
+        self._default_workers = default_workers
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._poller: Optional[threading.Thread] = None
+        self._slots: Optional[threading.Semaphore] = None
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    def is_stopping(self) -> bool:
+        """stop() が呼ばれたか（長いジョブは区切りで確認して中断する）"""
+        return self._stopping.is_set()
+
+    def start(self, workers: Optional[int] = None) -> bool:
+        """
+        ワーカーを起動
+
+        Args:
+            workers: 同時に処理するジョブ数（未指定時は環境変数 workers_env、0でこのプロセスでは処理しない）
+
+        Returns:
+            起動した場合 True（起動済み・0件指定の場合は False）
+        """
+        if self._executor is not None:
+            return False
+        workers = workers if workers is not None else int(os.getenv(self._workers_env, str(self._default_workers)))
+        if workers <= 0:
+            # このプロセスではジョブを処理しない（他プロセス・専用ワーカーに任せる）
+            return False
+        self._stopping.clear()
+        self._slots = threading.Semaphore(workers)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.name)
+        self._poller = threading.Thread(target=self._poll, name=f"{self.name}-poller", daemon=True)
+        self._poller.start()
+        return True
+
+    def stop(self) -> None:
+        """ワーカーを停止（処理中のジョブの完了を待つ）"""
+        if self._executor is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._poller.join(timeout=self.poll_interval * 2)
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        self._poller = None
+
+    def notify(self) -> None:
+        """新しいジョブの登録を通知（すぐに取得させる）"""
+        self._wakeup.set()
+
+    def _execute(self, job: Any) -> None:
+        try:
+            self._run(job)
+        except Exception as e:
+            logger.error(f"{self.name} failed: {e}")
+        finally:
+            self._slots.release()
+            self._wakeup.set()
+
+    def _poll(self) -> None:
+        while not self._stopping.is_set():
+            # 空きワーカーがあるときだけ取得する
+            if not self._slots.acquire(timeout=self.poll_interval):
+                continue
+            try:
+                job = None if self._stopping.is_set() else self._claim()
+            except Exception as e:
+                logger.error(f"{self.name} claim failed: {e}")
+                job = None
+
+            if job is None:
+                self._slots.release()
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+            self._executor.submit(self._execute, job)
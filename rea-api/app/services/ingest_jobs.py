@@ -0,0 +1,318 @@
+"""
+スクレイパー同期の非同期取り込みジョブ
+
+大きな送信データを POST /properties/bulk-upsert で同期処理すると、
+HTTPワーカーとDBセッションを処理完了まで占有し、プロキシのタイムアウトで全体が失敗する。
+ジョブ方式では受信データをファイルに保存してすぐにジョブIDを返し、
+バックグラウンドのワーカーがチャンク単位で scraper_ingest.bulk_upsert_items を実行する。
+
+- ジョブ: scraper_ingest_jobs テーブル（進捗・件数・itemごとのエラー）
+- 受信データ: data/ingest_jobs/ に保存（JSON配列 または NDJSON、gzip圧縮可）
+              全体を読み込まず1件ずつ解析する（件数は初回に1回だけ数えて total_items に保存）
+- ワーカー: プロセスごとに INGEST_JOB_WORKERS スレッド（background_workers.PollingWorker、0で無効）
+- 取得: FOR UPDATE SKIP LOCKED（複数プロセスで同じジョブを処理しない）
+- 再開: チャンクごとに進捗をコミットし、停止したジョブ（heartbeat切れ）は続きから再処理
+        アプリ終了時は処理中のチャンクの完了を待ち、残りは queued に戻して次回起動時に再開
+"""
+import gzip
+import json
+import logging
+import os
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+from app.services.background_workers import PollingWorker
+from app.services.scraper_ingest import bulk_upsert_items
+
+logger = logging.getLogger(__name__)
+
+# 受信データの保存先（/uploads の静的配信の対象外に置く）
+PAYLOAD_DIR = os.getenv(
+    "INGEST_JOB_PAYLOAD_DIR",
+    os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'ingest_jobs'),
+)
+
+FORMAT_JSON = "json"
+FORMAT_NDJSON = "ndjson"
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+# 1チャンク（1トランザクション）で取り込む件数
+CHUNK_SIZE = int(os.getenv("INGEST_JOB_CHUNK_SIZE", "500"))
+
+# JSON配列を読み進める単位（文字数）
+_READ_SIZE = 1024 * 1024
+
+# JSON配列の1件の上限（これを超えても解析できない場合は不正なデータとみなす）
+MAX_ITEM_SIZE = 64 * 1024 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'\s*')
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+# ジョブに保存するエラーの上限（件数は error_count に全件）
+MAX_STORED_ERRORS = 1000
+
+# この時間 heartbeat が更新されない running ジョブは停止したとみなして再取得
+STALE_AFTER_SECONDS = 600
+
+_CLAIM_QUERY = """
+    UPDATE scraper_ingest_jobs
+    SET status = :running,
+        started_at = COALESCE(started_at, NOW()),
+        heartbeat_at = NOW(),
+        attempts = attempts + 1
+    WHERE id = (
+        SELECT id
+        FROM scraper_ingest_jobs
+        WHERE status = :queued
+           OR (status = :running AND heartbeat_at < NOW() - make_interval(secs => :stale_after))
+        ORDER BY id
+        FOR UPDATE SKIP LOCKED
+        LIMIT 1
+    )
+    RETURNING id, organization_id, payload_path, payload_format, is_gzip, total_items, processed_items
+"""
+
+
+def payload_path_for(job_key: str, payload_format: str, is_gzip: bool) -> str:
+    """受信データの保存パス"""
+    extension = "ndjson" if payload_format == FORMAT_NDJSON else "json"
+    return os.path.join(PAYLOAD_DIR, f"{job_key}.{extension}{'.gz' if is_gzip else ''}")
+
+
+def _iter_json_array(f) -> Iterator[Any]:
+    """JSON配列の要素を1件ずつ返す（_READ_SIZE ずつ読み進め、保持するのは解析中の1件分まで）"""
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill() -> None:
+        nonlocal buf, pos, eof
+        if len(buf) - pos > MAX_ITEM_SIZE:
+            raise ValueError(f"JSON item exceeds {MAX_ITEM_SIZE} characters or is invalid")
+        data = f.read(_READ_SIZE)
+        eof = not data
+        buf = buf[pos:] + data
+        pos = 0
+
+    def peek() -> str:
+        nonlocal pos
+        while True:
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos < len(buf):
+                return buf[pos]
+            if eof:
+                return ""
+            fill()
+
+    if peek() != "[":
+        raise ValueError("JSON payload must be an array of items")
+    pos += 1
+    if peek() == "]":
+        return
+
+    while True:
+        peek()
+        try:
+            item, end = _DECODER.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            fill()
+            continue
+        # 数値が読み込み単位の境界で切れている場合（"12" + "34"、"-1." + "5"）は続きを読んでから解析し直す
+        if not eof and (end == len(buf) or buf[end] in _NUMBER_CHARS):
+            fill()
+            continue
+        pos = end
+        yield item
+
+        separator = peek()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"invalid JSON array: expected ',' or ']' but got {separator!r}")
+        pos += 1
+
+
+def iter_payload_items(
+    path: str, payload_format: str, is_gzip: bool, skip: int = 0
+) -> Iterator[Tuple[Any, Optional[str]]]:
+    """
+    受信データを1件ずつ返す（全体はメモリに読み込まない）
+
+    Args:
+        skip: 先頭から読み飛ばす件数（再開時の processed_items、NDJSONは解析せずに飛ばす）
+
+    Yields:
+        (item, エラー内容) NDJSONの解析できない行は (None, エラー内容)
+    """
+    opener = gzip.open if is_gzip else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        if payload_format == FORMAT_NDJSON:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                if skip:
+                    skip -= 1
+                    continue
+                try:
+                    yield json.loads(line), None
+                except ValueError as e:
+                    yield None, f"invalid JSON line: {e}"
+            return
+
+        for item in _iter_json_array(f):
+            if skip:
+                skip -= 1
+                continue
+            yield item, None
+
+
+def count_payload_items(path: str, payload_format: str, is_gzip: bool) -> int:
+    """件数（進捗表示用、ジョブごとに1回だけ数える）"""
+    if payload_format == FORMAT_NDJSON:
+        opener = gzip.open if is_gzip else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            return sum(1 for line in f if line.strip())
+    return sum(1 for _ in iter_payload_items(path, payload_format, is_gzip))
+
+
+def _iter_chunks(items: Iterator[Tuple[Any, Optional[str]]], size: int) -> Iterator[List[Tuple[Any, Optional[str]]]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _process_chunk(organization_id: int, offset: int, chunk: List[Tuple[Any, Optional[str]]]) -> Dict[str, Any]:
+    """1チャンクを取り込み（エラーのindexはジョブ全体での位置）"""
+    errors = [
+        {"index": offset + i, "detail": error}
+        for i, (_, error) in enumerate(chunk)
+        if error is not None
+    ]
+    valid = [(offset + i, item) for i, (item, error) in enumerate(chunk) if error is None]
+
+    db = SessionLocal()
+    try:
+        stats = bulk_upsert_items(db, [item for _, item in valid], organization_id)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    errors.extend({"index": valid[e["index"]][0], "detail": e["detail"]} for e in stats["errors"])
+    errors.sort(key=lambda e: e["index"])
+    return {
+        "created": stats["created"],
+        "updated": stats["updated"],
+        "unchanged": stats.get("unchanged", 0),
+        "errors": errors,
+    }
+
+
+def _update_job(job_id: int, query: str, params: Dict[str, Any]) -> None:
+    db = SessionLocal()
+    try:
+        db.execute(text(query), {"id": job_id, **params})
+        db.commit()
+    finally:
+        db.close()
+
+
+def run_job(job: Any, should_stop: Callable[[], bool] = lambda: False) -> None:
+    """
+    1ジョブを最後まで処理（中断された場合は processed_items の続きから）
+
+    should_stop が True を返した場合はチャンクの区切りで中断し、ジョブを queued に戻す。
+    """
+    path = os.path.join(PAYLOAD_DIR, job.payload_path)
+    try:
+        if job.total_items is None:
+            total = count_payload_items(path, job.payload_format, job.is_gzip)
+            _update_job(job.id, "UPDATE scraper_ingest_jobs SET total_items = :total WHERE id = :id",
+                        {"total": total})
+
+        offset = job.processed_items
+        items = iter_payload_items(path, job.payload_format, job.is_gzip, skip=offset)
+        for chunk in _iter_chunks(items, CHUNK_SIZE):
+            if should_stop():
+                _update_job(job.id, "UPDATE scraper_ingest_jobs SET status = :status WHERE id = :id",
+                            {"status": STATUS_QUEUED})
+                return
+
+            result = _process_chunk(job.organization_id, offset, chunk)
+            offset += len(chunk)
+            _update_job(job.id, """
+                UPDATE scraper_ingest_jobs
+                SET processed_items = :processed,
+                    created_count = created_count + :created,
+                    updated_count = updated_count + :updated,
+                    unchanged_count = unchanged_count + :unchanged,
+                    error_count = error_count + :error_count,
+                    errors = CASE
+                        WHEN jsonb_array_length(errors) >= :max_errors THEN errors
+                        ELSE errors || CAST(:errors AS jsonb)
+                    END,
+                    heartbeat_at = NOW()
+                WHERE id = :id
+            """, {
+                "processed": offset,
+                "created": result["created"],
+                "updated": result["updated"],
+                "unchanged": result["unchanged"],
+                "error_count": len(result["errors"]),
+                "errors": json.dumps(result["errors"][:MAX_STORED_ERRORS], ensure_ascii=False),
+                "max_errors": MAX_STORED_ERRORS,
+            })
+
+        _update_job(job.id, """
+            UPDATE scraper_ingest_jobs
+            SET status = :status, finished_at = NOW(), heartbeat_at = NOW()
+            WHERE id = :id
+        """, {"status": STATUS_COMPLETED})
+        os.remove(path)
+    except Exception as e:
+        logger.error(f"ingest job {job.id} failed: {e}")
+        _update_job(job.id, """
+            UPDATE scraper_ingest_jobs
+            SET status = :status, error_message = :message, finished_at = NOW()
+            WHERE id = :id
+        """, {"status": STATUS_FAILED, "message": str(e)})
+
+
+def claim_job() -> Optional[Any]:
+    """次のジョブを取得（queued、または heartbeat が切れた running）"""
+    db = SessionLocal()
+    try:
+        job = db.execute(text(_CLAIM_QUERY), {
+            "running": STATUS_RUNNING,
+            "queued": STATUS_QUEUED,
+            "stale_after": STALE_AFTER_SECONDS,
+        }).fetchone()
+        db.commit()
+        return job
+    finally:
+        db.close()
+
+
+def _run_claimed_job(job: Any) -> None:
+    run_job(job, ingest_job_worker.is_stopping)
+
+
+# シングルトンインスタンス
+ingest_job_worker = PollingWorker("ingest-job", claim_job, _run_claimed_job, workers_env="INGEST_JOB_WORKERS")
@@ -0,0 +1,93 @@
+"""
+物件検索ドキュメント
+
+properties.search_text に正規化済みの検索ドキュメントを保持し、
+pg_trgm の GIN インデックスで部分一致検索・類似度ランキングを行う。
+
+- ドキュメント: 物件名・物件名カナ・物件番号・住所を正規化して連結
+- 正規化: shared.formatters.normalize_search_text（全角半角・かな統一）
+          住所は normalize_address を通してから正規化
+- 更新: GenericCRUD が properties の作成・更新時に再計算する
+- 既存データ: scripts/backfill_property_search_text.py で一括作成
+"""
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from shared.formatters import normalize_address, normalize_search_text
+from shared.schema_registry import schema_registry
+
+# 検索ドキュメントを保持するカラム
+SEARCH_TEXT_COLUMN = "search_text"
+
+# 検索ランキング用の疑似カラム名（sort_byに指定可能）
+SEARCH_RANK_COLUMN = "search_rank"
+
+# ドキュメントに含めるカラム（それぞれ独立した語として扱う）
+SEARCH_DOCUMENT_COLUMNS: List[str] = [
+    "property_name",
+    "property_name_kana",
+    "company_property_number",
+]
+
+# 住所カラム（連結してから1語として扱う）
+SEARCH_ADDRESS_COLUMNS: List[str] = [
+    "prefecture",
+    "city",
+    "address",
+    "address_detail",
+]
+
+
+def build_search_document(row: Dict[str, Any]) -> str:
+    """
+    物件データから検索ドキュメントを生成
+
+    フィールド境界をまたいで一致しないよう、各語は空白で区切る。
+    """
+    parts = [normalize_search_text(str(row[col])) for col in SEARCH_DOCUMENT_COLUMNS if row.get(col)]
+
+    address = "".join(str(row[col]) for col in SEARCH_ADDRESS_COLUMNS if row.get(col))
+    if address:
+        parts.append(normalize_search_text(normalize_address(address)))
+
+    return " ".join(part for part in parts if part)
+
+
+def source_columns(db: Session) -> List[str]:
+    """ドキュメント生成に必要な実在カラム（スキーマレジストリで確認）"""
+    db_columns = set(schema_registry.get_db_columns("properties", db))
+    return [col for col in SEARCH_DOCUMENT_COLUMNS + SEARCH_ADDRESS_COLUMNS if col in db_columns]
+
+
+def refresh_search_documents(db: Session, property_ids: Optional[List[int]] = None) -> int:
+    """
+    検索ドキュメントを再計算して保存（commitは呼び出し元）
+
+    Args:
+        property_ids: 対象物件ID（Noneの場合は全件）
+
+    Returns:
+        更新件数（内容が変わらない行は更新しない）
+    """
+    columns = source_columns(db)
+    query = f"SELECT id, {SEARCH_TEXT_COLUMN}, {', '.join(columns)} FROM properties"
+    params: Dict[str, Any] = {}
+    if property_ids is not None:
+        query += " WHERE id = ANY(:ids)"
+        params["ids"] = list(property_ids)
+
+    changed = []
+    for row in db.execute(text(query), params):
+        mapping = row._mapping
+        document = build_search_document(mapping)
+        if document != mapping[SEARCH_TEXT_COLUMN]:
+            changed.append({"id": mapping["id"], "document": document})
+
+    if changed:
+        db.execute(
+            text(f"UPDATE properties SET {SEARCH_TEXT_COLUMN} = :document WHERE id = :id"),
+            changed,
+        )
+    return len(changed)
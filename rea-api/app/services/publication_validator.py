@@ -11,11 +11,27 @@ required_for_publication で設定された必須項目が入力されている
 - 条件付き除外: column_labels.conditional_exclusion
 - 特殊フラグ: column_labels.special_flag_key
 - 最小選択数: column_labels.min_selections
+
+【ルールのコンパイル】
+========================
+設定は物件種別ごとに PublicationRules（不変オブジェクト）へコンパイルし、プロセス内でキャッシュする。
+バリデーション自体（evaluate_publication_rules）はDBにアクセスしない。
+
+- column_labels はスキーマレジストリから読み込み、レジストリ再ロード時（version変化）に再コンパイル
+- master_options（公開ステータス・条件付き除外の選択肢）は1クエリで読み込み、MAX_AGE で再読み込み
+- 即時反映が必要な場合は publication_rules.invalidate()（管理APIの schema-registry/refresh でも実行）
 """
-from typing import Any, Dict, List, Optional, Set, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import text
 import logging
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from shared.schema_registry import schema_registry
 
 logger = logging.getLogger(__name__)
 
@@ -33,302 +49,339 @@ _DEFAULT_SPECIAL_FLAG_KEYS = {
     "bus_stops": "no_bus",
     "nearby_facilities": "no_facilities",
 }
+_DEFAULT_CONDITIONAL_EXCLUSIONS = {
+    "building_coverage_ratio": {"depends_on": "use_district", "exclude_when_option_value": ["無指定"]},
+    "floor_area_ratio": {"depends_on": "use_district", "exclude_when_option_value": ["無指定"]},
+    "room_floor": {"depends_on": "property_type", "exclude_when": ["detached"]},
+    "total_units": {"depends_on": "property_type", "exclude_when": ["detached"]},
+    "setback": {"depends_on": "road_info", "exclude_when_flag": "no_road_access"},
+}
+
+# 公開ステータスと条件付き除外で参照するマスタ選択肢（1クエリで取得）
+_MASTER_OPTIONS_QUERY = """
+    SELECT mc.category_code, mo.option_code, mo.option_value, mo.requires_validation
+    FROM master_options mo
+    JOIN master_categories mc ON mo.category_id = mc.id
+    WHERE mo.is_active = TRUE
+      AND (mc.category_code = 'publication_status' OR mc.category_code = ANY(:category_codes))
+"""
 
 
 # =============================================================================
-# DB設定読み込み関数
+# コンパイル済みルール
 # =============================================================================
 
-def get_validation_required_statuses(db: Session) -> List[str]:
-    """
-    バリデーションが必要な公開ステータス一覧を取得
+@dataclass(frozen=True)
+class ExclusionRule:
+    """条件付き除外ルール（column_labels.conditional_exclusion をコンパイルしたもの）
 
-    Returns:
-        ["公開", "会員公開"] 等
+    - flag_key: depends_on の値に特殊フラグが立っていれば除外（exclude_when_flag）
+    - option_codes: depends_on の選択肢コードがこの集合に含まれれば除外（exclude_when_option_value）
+    - values: depends_on の値がいずれかに一致すれば除外（exclude_when）
     """
-    try:
-        query = text("""
-            SELECT mo.option_value
-            FROM master_options mo
-            JOIN master_categories mc ON mo.category_id = mc.id
-            WHERE mc.category_code = 'publication_status'
-              AND mo.requires_validation = TRUE
-              AND mo.is_active = TRUE
-        """)
-        result = db.execute(query)
-        statuses = [row.option_value for row in result]
-        if statuses:
-            return statuses
-    except Exception as e:
-        logger.warning(f"Failed to load validation_required_statuses from DB: {e}")
 
-    return _DEFAULT_PUBLICATION_STATUSES
+    depends_on: str
+    flag_key: Optional[str] = None
+    option_codes: Optional[FrozenSet[str]] = None
+    values: Tuple[Any, ...] = ()
 
+    def excludes(self, property_data: Dict[str, Any]) -> bool:
+        depends_value = property_data.get(self.depends_on)
 
-def get_zero_valid_columns(db: Session) -> Set[str]:
-    """
-    0が有効値となるカラム一覧を取得
+        if self.flag_key is not None:
+            return has_special_flag(depends_value, self.flag_key)
 
-    Returns:
-        zero_is_valid=TRUEのカラム名セット
-    """
-    try:
-        query = text("""
-            SELECT column_name
-            FROM column_labels
-            WHERE zero_is_valid = TRUE
-        """)
-        result = db.execute(query)
-        columns = {row.column_name for row in result}
-        if columns:
-            return columns
-    except Exception as e:
-        logger.warning(f"Failed to load zero_valid_columns from DB: {e}")
+        if self.option_codes is not None:
+            # JSONB配列対応: ["rea_4"] のような形式
+            if isinstance(depends_value, list):
+                return any(str(code) in self.option_codes for code in depends_value)
+            # 後方互換: 整数または文字列
+            if isinstance(depends_value, (int, str)):
+                return str(depends_value) in self.option_codes
+            return False
 
-    return _DEFAULT_ZERO_VALID_COLUMNS
+        # 値ベースの判定（exclude_when）- 後方互換性のため残す
+        if depends_value in self.values:
+            return True
+        # マスタオプションの値チェック（code or valueどちらでもマッチ）
+        if isinstance(depends_value, (int, str)):
+            str_value = str(depends_value)
+            return any(str_value == str(value) for value in self.values)
+        return False
 
 
-def get_special_flag_keys(db: Session) -> Dict[str, str]:
-    """
-    特殊フラグのキー名マッピングを取得
+@dataclass(frozen=True)
+class RequiredField:
+    """公開時必須フィールド"""
 
-    Returns:
-        {"road_info": "no_road_access", "transportation": "no_station", ...}
-    """
-    try:
-        query = text("""
-            SELECT column_name, special_flag_key
-            FROM column_labels
-            WHERE special_flag_key IS NOT NULL
-        """)
-        result = db.execute(query)
-        mapping = {row.column_name: row.special_flag_key for row in result}
-        if mapping:
-            return mapping
-    except Exception as e:
-        logger.warning(f"Failed to load special_flag_keys from DB: {e}")
+    column_name: str
+    label: str
+    group: str
+    valid_none_values: Tuple[str, ...]
+    min_selections: Optional[int]
+    exclusion: Optional[ExclusionRule]
 
-    return _DEFAULT_SPECIAL_FLAG_KEYS
 
+@dataclass(frozen=True)
+class ValidationGroup:
+    """validation_group（グループ内のいずれか1つが true であること）"""
 
-def get_min_selections(db: Session, column_name: str) -> Optional[int]:
-    """
-    カラムの最小選択数を取得
+    columns: Tuple[str, ...]
+    labels: Tuple[str, ...]
+    group: str
 
-    Args:
-        db: DBセッション
-        column_name: カラム名
 
-    Returns:
-        最小選択数（設定なしの場合はNone）
-    """
-    try:
-        query = text("""
-            SELECT min_selections
-            FROM column_labels
-            WHERE column_name = :column_name
-              AND min_selections IS NOT NULL
-            LIMIT 1
-        """)
-        result = db.execute(query, {"column_name": column_name}).fetchone()
-        if result and result.min_selections is not None:
-            return result.min_selections
-    except Exception as e:
-        logger.warning(f"Failed to get min_selections for {column_name}: {e}")
-    return None
+@dataclass(frozen=True)
+class PublicationRules:
+    """物件種別ごとのコンパイル済み公開ルール"""
 
+    property_type: str
+    required_fields: Tuple[RequiredField, ...]
+    validation_groups: Tuple[ValidationGroup, ...]
+    zero_valid_columns: FrozenSet[str]
+    special_flag_keys: Mapping[str, str]
 
-def get_column_labels_batch(db: Session, column_names: List[str]) -> Dict[str, Dict[str, Any]]:
-    """
-    複数カラムのvalid_none_text・min_selectionsを一括取得（N+1解消用）
 
-    Args:
-        db: DBセッション
-        column_names: カラム名リスト
+# =============================================================================
+# ルールのコンパイル
+# =============================================================================
 
-    Returns:
-        {column_name: {"valid_none_text": [...], "min_selections": int|None}}
-    """
-    if not column_names:
-        return {}
+def _iter_labels(all_labels: Dict[str, Dict[str, Dict[str, Any]]]):
+    """全テーブルのcolumn_labels行"""
+    for labels in all_labels.values():
+        yield from labels.values()
 
-    try:
-        query = text("""
-            SELECT column_name, valid_none_text, min_selections
-            FROM column_labels
-            WHERE column_name = ANY(:column_names)
-        """)
-        result = db.execute(query, {"column_names": column_names})
-        labels = {}
-        for row in result:
-            labels[row.column_name] = {
-                "valid_none_text": row.valid_none_text if row.valid_none_text else None,
-                "min_selections": row.min_selections,
-            }
-        return labels
-    except Exception as e:
-        logger.warning(f"Failed to batch load column_labels: {e}")
-        return {}
 
+def _is_visible(label: Dict[str, Any], property_type: str) -> bool:
+    visible_for = label.get("visible_for")
+    return visible_for is None or property_type in visible_for
 
-def get_validation_groups(db: Session, property_type: str) -> Dict[str, List[Dict[str, Any]]]:
-    """
-    validation_groupでグループ化されたフィールドを取得
-    同じグループのフィールドは「いずれか1つtrue」を要求
 
-    Args:
-        db: DBセッション
-        property_type: 物件種別
+def _load_conditional_exclusions(all_labels) -> Dict[str, Dict[str, Any]]:
+    exclusions = {
+        label["column_name"]: label["conditional_exclusion"]
+        for label in _iter_labels(all_labels)
+        if label.get("conditional_exclusion")
+    }
+    return exclusions or _DEFAULT_CONDITIONAL_EXCLUSIONS
 
-    Returns:
-        {
-            "property_purpose": [
-                {"column_name": "is_residential", "japanese_label": "居住用"},
-                {"column_name": "is_commercial", "japanese_label": "事業用"},
-                {"column_name": "is_investment", "japanese_label": "投資用"},
-            ],
-            ...
-        }
-    """
-    try:
-        query = text("""
-            SELECT column_name, japanese_label, validation_group, group_name
-            FROM column_labels
-            WHERE validation_group IS NOT NULL
-              AND (visible_for IS NULL OR :property_type = ANY(visible_for))
-            ORDER BY validation_group, display_order
-        """)
-        result = db.execute(query, {"property_type": property_type})
-
-        groups: Dict[str, List[Dict[str, Any]]] = {}
-        for row in result:
-            group_key = row.validation_group
-            if group_key not in groups:
-                groups[group_key] = []
-            groups[group_key].append({
-                "column_name": row.column_name,
-                "japanese_label": row.japanese_label or row.column_name,
-                "group_name": row.group_name or "その他",
-            })
-        return groups
-    except Exception as e:
-        logger.warning(f"Failed to get validation_groups: {e}")
-        return {}
 
+def _load_master_category_codes(all_labels) -> Dict[str, str]:
+    """カラム名 → master_category_code（最初に見つかったもの）"""
+    codes: Dict[str, str] = {}
+    for label in _iter_labels(all_labels):
+        if label.get("master_category_code"):
+            codes.setdefault(label["column_name"], label["master_category_code"])
+    return codes
 
-def get_conditional_exclusions(db: Session) -> Dict[str, Dict[str, Any]]:
+
+def _load_master_options(db: Session, category_codes: List[str]) -> Tuple[List[str], Dict[str, Dict[str, str]]]:
     """
-    条件付き除外ルールを取得
+    公開ステータスと条件付き除外用の選択肢を一括取得
 
     Returns:
-        {
-            "building_coverage_ratio": {"depends_on": "use_district", "exclude_when_option_value": ["無指定"]},
-            "setback": {"depends_on": "road_info", "exclude_when_flag": "no_road_access"},
-            ...
-        }
+        (バリデーション必要ステータス, {category_code: {option_code: option_value}})
     """
+    statuses: List[str] = []
+    options: Dict[str, Dict[str, str]] = {}
     try:
-        query = text("""
-            SELECT column_name, conditional_exclusion
-            FROM column_labels
-            WHERE conditional_exclusion IS NOT NULL
-        """)
-        result = db.execute(query)
-        exclusions = {}
+        result = db.execute(text(_MASTER_OPTIONS_QUERY), {"category_codes": category_codes})
         for row in result:
-            if row.conditional_exclusion:
-                exclusions[row.column_name] = row.conditional_exclusion
-        if exclusions:
-            return exclusions
+            if row.category_code == "publication_status" and row.requires_validation:
+                statuses.append(row.option_value)
+            options.setdefault(row.category_code, {})[str(row.option_code)] = row.option_value
     except Exception as e:
-        logger.warning(f"Failed to load conditional_exclusions from DB: {e}")
+        logger.warning(f"Failed to load master_options for publication rules: {e}")
+    return statuses or _DEFAULT_PUBLICATION_STATUSES, options
 
-    # フォールバック
-    return {
-        "building_coverage_ratio": {"depends_on": "use_district", "exclude_when_option_value": ["無指定"]},
-        "floor_area_ratio": {"depends_on": "use_district", "exclude_when_option_value": ["無指定"]},
-        "room_floor": {"depends_on": "property_type", "exclude_when": ["detached"]},
-        "total_units": {"depends_on": "property_type", "exclude_when": ["detached"]},
-        "setback": {"depends_on": "road_info", "exclude_when_flag": "no_road_access"},
-    }
 
+def _compile_exclusion(
+    rule: Dict[str, Any],
+    category_codes: Dict[str, str],
+    master_options: Dict[str, Dict[str, str]],
+) -> Optional[ExclusionRule]:
+    depends_on = rule.get("depends_on")
 
-def get_option_value_by_id(db: Session, option_id: int, category_code: str) -> Optional[str]:
-    """
-    マスタオプションIDから表示名を取得
-
-    Args:
-        db: DBセッション
-        option_id: マスタオプションのoption_code（整数）
-        category_code: カテゴリコード（column_labels.master_category_codeから取得）
+    if "exclude_when_flag" in rule:
+        return ExclusionRule(depends_on=depends_on, flag_key=rule["exclude_when_flag"])
 
-    Returns:
-        option_value（表示名）またはNone
-    """
-    try:
-        query = text("""
-            SELECT mo.option_value
-            FROM master_options mo
-            JOIN master_categories mc ON mo.category_id = mc.id
-            WHERE mc.category_code = :category_code
-              AND mo.option_code = :option_code
-              AND mo.is_active = TRUE
-        """)
-        result = db.execute(query, {
-            "category_code": category_code,
-            "option_code": str(option_id)
-        }).fetchone()
-        if result:
-            return result.option_value
-    except Exception as e:
-        logger.warning(f"Failed to get option_value for {category_code}/{option_id}: {e}")
-    return None
+    if "exclude_when_option_value" in rule:
+        category_code = category_codes.get(depends_on)
+        if not category_code:
+            return None
+        exclude_values = set(rule.get("exclude_when_option_value") or [])
+        option_codes = frozenset(
+            code
+            for code, value in master_options.get(category_code, {}).items()
+            if value in exclude_values
+        )
+        return ExclusionRule(depends_on=depends_on, option_codes=option_codes)
 
+    return ExclusionRule(depends_on=depends_on, values=tuple(rule.get("exclude_when") or []))
 
-def get_master_category_code(db: Session, column_name: str) -> Optional[str]:
-    """
-    カラム名からマスタカテゴリコードを取得
 
-    Returns:
-        master_category_code またはNone
+def compile_publication_rules(
+    property_type: str,
+    all_labels: Dict[str, Dict[str, Dict[str, Any]]],
+    master_options: Dict[str, Dict[str, str]],
+) -> PublicationRules:
     """
-    try:
-        query = text("""
-            SELECT master_category_code
-            FROM column_labels
-            WHERE column_name = :column_name
-              AND master_category_code IS NOT NULL
-            LIMIT 1
-        """)
-        result = db.execute(query, {"column_name": column_name}).fetchone()
-        if result:
-            return result.master_category_code
-    except Exception as e:
-        logger.warning(f"Failed to get master_category_code for {column_name}: {e}")
-    return None
-
+    column_labels と master_options から物件種別の公開ルールを組み立てる（DBアクセスなし）
 
-def get_valid_none_text(db: Session, column_name: str) -> List[str]:
-    """
-    カラム別の「なし」有効値を取得
+    Args:
+        property_type: 物件種別
+        all_labels: schema_registry.get_all_column_labels() の結果
+        master_options: {category_code: {option_code: option_value}}
+    """
+    labels = list(_iter_labels(all_labels))
+
+    zero_valid_columns = frozenset(
+        label["column_name"] for label in labels if label.get("zero_is_valid") is True
+    ) or frozenset(_DEFAULT_ZERO_VALID_COLUMNS)
+    special_flag_keys = {
+        label["column_name"]: label["special_flag_key"]
+        for label in labels
+        if label.get("special_flag_key") is not None
+    } or _DEFAULT_SPECIAL_FLAG_KEYS
+    exclusions = _load_conditional_exclusions(all_labels)
+    category_codes = _load_master_category_codes(all_labels)
+
+    # 必須フィールド（非表示カラムは対象外）
+    required_labels = sorted(
+        (
+            label for label in labels
+            if property_type in (label.get("required_for_publication") or [])
+            and _is_visible(label, property_type)
+        ),
+        key=lambda label: (
+            label.get("group_order") if label.get("group_order") is not None else 999,
+            label.get("display_order") if label.get("display_order") is not None else 999,
+        ),
+    )
+    required_fields = []
+    for label in required_labels:
+        column_name = label["column_name"]
+        rule = exclusions.get(column_name)
+        required_fields.append(RequiredField(
+            column_name=column_name,
+            label=label.get("japanese_label") or column_name,
+            group=label.get("group_name") or "その他",
+            valid_none_values=tuple(label.get("valid_none_text") or _DEFAULT_VALID_NONE_VALUES),
+            min_selections=label.get("min_selections"),
+            exclusion=_compile_exclusion(rule, category_codes, master_options) if rule else None,
+        ))
+
+    # validation_group（validation_group, display_order順）
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for label in sorted(
+        (l for l in labels if l.get("validation_group") is not None and _is_visible(l, property_type)),
+        key=lambda l: (l["validation_group"], l.get("display_order") if l.get("display_order") is not None else 999),
+    ):
+        grouped.setdefault(label["validation_group"], []).append(label)
+    validation_groups = tuple(
+        ValidationGroup(
+            columns=tuple(l["column_name"] for l in group_labels),
+            labels=tuple(l.get("japanese_label") or l["column_name"] for l in group_labels),
+            group=group_labels[0].get("group_name") or "その他",
+        )
+        for group_labels in grouped.values()
+    )
+
+    return PublicationRules(
+        property_type=property_type,
+        required_fields=tuple(required_fields),
+        validation_groups=validation_groups,
+        zero_valid_columns=zero_valid_columns,
+        special_flag_keys=MappingProxyType(dict(special_flag_keys)),
+    )
+
+
+class PublicationRuleCache:
+    """物件種別ごとのコンパイル済みルール（プロセス共有）"""
+
+    _instance: Optional['PublicationRuleCache'] = None
+
+    MAX_AGE = 300  # 5分（master_options の変更を取り込む上限）
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._lock = threading.RLock()
+            cls._instance._rules = {}
+            cls._instance._statuses = frozenset()
+            cls._instance._master_options = {}
+            cls._instance._registry_version = None
+            cls._instance._loaded_at = None
+            cls._instance._compiled_count = 0
+        return cls._instance
+
+    def _is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or self._registry_version != schema_registry.version
+            or time.time() - self._loaded_at > self.MAX_AGE
+        )
+
+    def _ensure_loaded(self, db: Session) -> None:
+        # レジストリの期限切れ再ロードを先に済ませる（versionが変わる）
+        all_labels = schema_registry.get_all_column_labels(db)
+        if not self._is_stale():
+            return
+        with self._lock:
+            if not self._is_stale():
+                return
+            category_codes = _load_master_category_codes(all_labels)
+            depends_on_columns = {
+                rule.get("depends_on")
+                for rule in _load_conditional_exclusions(all_labels).values()
+                if "exclude_when_option_value" in rule
+            }
+            statuses, master_options = _load_master_options(
+                db, sorted({category_codes[c] for c in depends_on_columns if c in category_codes})
+            )
+            self._statuses = frozenset(statuses)
+            self._master_options = master_options
+            self._rules = {}
+            self._registry_version = schema_registry.version
+            self._loaded_at = time.time()
+
+    def get_validation_statuses(self, db: Session) -> FrozenSet[str]:
+        """バリデーションが必要な公開ステータス（"公開", "会員公開" 等）"""
+        self._ensure_loaded(db)
+        return self._statuses
+
+    def get(self, db: Session, property_type: str) -> PublicationRules:
+        """物件種別のルール（初回のみコンパイル）"""
+        self._ensure_loaded(db)
+        rules = self._rules.get(property_type)
+        if rules is None:
+            with self._lock:
+                rules = self._rules.get(property_type)
+                if rules is None:
+                    rules = compile_publication_rules(
+                        property_type, schema_registry.get_all_column_labels(db), self._master_options
+                    )
+                    self._rules[property_type] = rules
+                    self._compiled_count += 1
+        return rules
+
+    def invalidate(self) -> None:
+        """次回アクセス時に master_options を再読み込みし、ルールを再コンパイルさせる"""
+        with self._lock:
+            self._loaded_at = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded_at": self._loaded_at,
+            "registry_version": self._registry_version,
+            "property_types": sorted(self._rules.keys()),
+            "compiled_count": self._compiled_count,
+            "max_age_seconds": self.MAX_AGE,
+        }
 
-    Returns:
-        ["なし", "該当なし"] 等
-    """
-    try:
-        query = text("""
-            SELECT valid_none_text
-            FROM column_labels
-            WHERE column_name = :column_name
-              AND valid_none_text IS NOT NULL
-        """)
-        result = db.execute(query, {"column_name": column_name}).fetchone()
-        if result and result.valid_none_text:
-            return result.valid_none_text
-    except Exception as e:
-        logger.warning(f"Failed to load valid_none_text for {column_name}: {e}")
 
-    return _DEFAULT_VALID_NONE_VALUES
+# シングルトンインスタンス
+publication_rules = PublicationRuleCache()
 
 
 # =============================================================================
@@ -416,105 +469,43 @@ def is_valid_value(
     return True
 
 
-def should_exclude_field(
-    db: Session,
-    column_name: str,
-    property_data: Dict[str, Any],
-    conditional_exclusions: Dict[str, Dict[str, Any]],
-    special_flag_keys: Dict[str, str],
-) -> bool:
-    """
-    条件付き除外の判定
+# =============================================================================
+# バリデーション
+# =============================================================================
 
-    Args:
-        db: DBセッション
-        column_name: 判定対象カラム名
-        property_data: 物件データ
-        conditional_exclusions: 条件付き除外ルール
-        special_flag_keys: 特殊フラグキーマッピング
+def evaluate_publication_rules(rules: PublicationRules, property_data: Dict[str, Any]) -> List[Dict[str, str]]:
+    """
+    コンパイル済みルールで物件データをチェック（DBアクセスなし）
 
     Returns:
-        True: このフィールドはチェック対象外
-        False: チェック対象
+        未入力フィールド [{"label": "物件名", "group": "基本情報"}, ...]（問題なければ空）
     """
-    rule = conditional_exclusions.get(column_name)
-    if not rule:
-        return False
-
-    depends_on = rule.get("depends_on")
-    depends_value = property_data.get(depends_on)
-
-    # フラグベースの判定（exclude_when_flag）
-    if "exclude_when_flag" in rule:
-        flag_key = rule["exclude_when_flag"]
-        if has_special_flag(depends_value, flag_key):
-            return True
-        return False
-
-    # マスタオプション表示名での判定（exclude_when_option_value）
-    if "exclude_when_option_value" in rule:
-        exclude_values = rule.get("exclude_when_option_value", [])
-        category_code = get_master_category_code(db, depends_on)
-        if not category_code:
-            return False
-
-        # JSONB配列対応: ["rea_4"] のような形式
-        if isinstance(depends_value, list):
-            for code in depends_value:
-                option_value = get_option_value_by_id(db, code, category_code)
-                if option_value and option_value in exclude_values:
-                    return True
-            return False
-
-        # 後方互換: 整数または文字列
-        if isinstance(depends_value, (int, str)):
-            option_value = get_option_value_by_id(db, depends_value, category_code)
-            if option_value and option_value in exclude_values:
-                return True
-        return False
-
-    # 値ベースの判定（exclude_when）- 後方互換性のため残す
-    exclude_when = rule.get("exclude_when", [])
-    if depends_value in exclude_when:
-        return True
-
-    # マスタオプションの値チェック（code or valueどちらでもマッチ）
-    if isinstance(depends_value, (int, str)):
-        str_value = str(depends_value)
-        for exclude_val in exclude_when:
-            if str_value == str(exclude_val):
-                return True
-
-    return False
+    # 未入力フィールドをチェック
+    missing_fields = []
+    for field in rules.required_fields:
+        # 条件付き除外チェック
+        if field.exclusion is not None and field.exclusion.excludes(property_data):
+            continue
 
+        value = property_data.get(field.column_name)
+        if not is_valid_value(
+            value, field.column_name, rules.zero_valid_columns, rules.special_flag_keys,
+            field.valid_none_values, field.min_selections,
+        ):
+            missing_fields.append({"label": field.label, "group": field.group})
 
-def get_required_fields(db: Session, property_type: str) -> List[Dict[str, Any]]:
-    """
-    指定された物件種別で必須となるフィールド一覧を取得
+    if missing_fields:
+        return missing_fields
 
-    非表示カラム（visible_forに含まれない）はバリデーション対象外
+    # validation_groupチェック（同じグループで「いずれか1つtrue」を要求）
+    for group in rules.validation_groups:
+        if not any(property_data.get(column) is True for column in group.columns):
+            missing_fields.append({
+                "label": f"「{'」「'.join(group.labels)}」のいずれか",
+                "group": group.group,
+            })
 
-    Returns:
-        [{"table_name": "properties", "column_name": "property_name", "japanese_label": "物件名", "group_name": "基本情報"}, ...]
-    """
-    query = text("""
-        SELECT table_name, column_name, japanese_label, group_name
-        FROM column_labels
-        WHERE required_for_publication IS NOT NULL
-          AND :property_type = ANY(required_for_publication)
-          AND (visible_for IS NULL OR :property_type = ANY(visible_for))
-        ORDER BY COALESCE(group_order, 999), COALESCE(display_order, 999)
-    """)
-    result = db.execute(query, {"property_type": property_type})
-    return [
-        {
-            "table_name": row.table_name,
-            "column_name": row.column_name,
-            "japanese_label": row.japanese_label or row.column_name,
-            "group_name": row.group_name or "その他",
-        }
-        for row in result
-    ]
+    return missing_fields
 
 
 def validate_for_publication(
@@ -527,7 +518,7 @@ def validate_for_publication(
     公開時バリデーションを実行
 
     Args:
-        db: DBセッション
+        db: DBセッション（ルール未ロード時のみ使用）
         property_data: 物件データ（現在 + 更新データのマージ済み）
         new_publication_status: 更新後の公開ステータス
         current_publication_status: 現在の公開ステータス（既に公開中なら再チェック不要の判断用）
@@ -536,11 +527,8 @@ def validate_for_publication(
         (is_valid, missing_fields): バリデーション結果と未入力フィールド情報のリスト
         missing_fields: [{"label": "物件名", "group": "基本情報"}, ...]
     """
-    # DBから設定を読み込み
-    validation_statuses = get_validation_required_statuses(db)
-
     # 公開/会員公開への変更でない場合はスキップ
-    if new_publication_status not in validation_statuses:
+    if new_publication_status not in publication_rules.get_validation_statuses(db):
         return True, []
 
     # 物件種別を取得
@@ -548,71 +536,8 @@ def validate_for_publication(
     if not property_type:
         return False, [{"label": "物件種別が未設定です", "group": "基本情報"}]
 
-    # 必須フィールド一覧を取得
-    required_fields = get_required_fields(db, property_type)
-
-    if not required_fields:
-        # 必須設定がない場合はOK
-        return True, []
-
-    # DBから各種設定を読み込み
-    zero_valid_columns = get_zero_valid_columns(db)
-    special_flag_keys = get_special_flag_keys(db)
-    conditional_exclusions = get_conditional_exclusions(db)
-
-    # valid_none_text・min_selectionsを一括取得（N+1解消）
-    required_column_names = [f["column_name"] for f in required_fields]
-    column_labels_map = get_column_labels_batch(db, required_column_names)
-
-    # 未入力フィールドをチェック
-    missing_fields = []
-    for field in required_fields:
-        column_name = field["column_name"]
-
-        # 条件付き除外チェック
-        if should_exclude_field(db, column_name, property_data, conditional_exclusions, special_flag_keys):
-            continue
-
-        value = property_data.get(column_name)
-
-        # バッチ取得結果から読み出し（フォールバック付き）
-        col_info = column_labels_map.get(column_name, {})
-        valid_none_values = col_info.get("valid_none_text") or _DEFAULT_VALID_NONE_VALUES
-        min_selections = col_info.get("min_selections")
-
-        # 有効値判定
-        if not is_valid_value(value, column_name, zero_valid_columns, special_flag_keys, valid_none_values, min_selections):
-            missing_fields.append({
-                "label": field["japanese_label"],
-                "group": field["group_name"],
-            })
-
-    if missing_fields:
-        return False, missing_fields
-
-    # validation_groupチェック（同じグループで「いずれか1つtrue」を要求）
-    validation_groups = get_validation_groups(db, property_type)
-    for group_name, group_fields in validation_groups.items():
-        # グループ内のフィールドで1つでもtrueがあればOK
-        has_true_value = False
-        for field in group_fields:
-            value = property_data.get(field["column_name"])
-            if value is True:
-                has_true_value = True
-                break
-
-        if not has_true_value:
-            # グループ内で1つもtrueがない場合はエラー
-            labels = [f["japanese_label"] for f in group_fields]
-            missing_fields.append({
-                "label": f"「{'」「'.join(labels)}」のいずれか",
-                "group": group_fields[0]["group_name"] if group_fields else "その他",
-            })
-
-    if missing_fields:
-        return False, missing_fields
-
-    return True, []
+    missing_fields = evaluate_publication_rules(publication_rules.get(db, property_type), property_data)
+    return not missing_fields, missing_fields
 
 
 def format_validation_error(missing_fields: List[Dict[str, str]], publication_status: str) -> str:
@@ -0,0 +1,425 @@
+"""
+スクレイパー同期の一括取り込み
+
+MI scraper から送信された物件（数千件/回）を properties / land_info / building_info に
+集合演算で UPSERT する。件数に比例してSQLが増えない。
+
+1. 送信データを一時テーブル（ステージング）に execute_values で一括投入
+2. properties: INSERT ... SELECT ... ON CONFLICT (property_url) DO UPDATE
+   （送信カラムの組み合わせごとに1文、RETURNING で新規/更新を判定）
+3. land_info / building_info: 既存行を UPDATE ... FROM で一括更新、無い物件は INSERT ... SELECT
+4. 検索ドキュメント（search_text）を対象物件分まとめて再計算
+
+【変更検知】
+送信データを正規化したハッシュを properties.scraper_content_hash に保存する。
+前回と同じハッシュの item は書き込みを一切行わず unchanged として数える
+（updated_at・WAL・インデックス更新が発生しない）。
+
+一括処理が失敗した場合（型変換エラー等）は、1件ずつセーブポイントで再実行し
+失敗した item のみエラーとして返す（部分成功）。
+
+前提: scripts/migrations/2026-10-18_properties_property_url_unique.sql
+      （properties.property_url の部分ユニークインデックス）
+      scripts/migrations/2026-10-18_properties_scraper_content_hash.sql
+"""
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from psycopg2.extras import execute_values
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.crud.generic import GenericCRUD
+from app.services.property_search import (
+    SEARCH_ADDRESS_COLUMNS,
+    SEARCH_DOCUMENT_COLUMNS,
+    SEARCH_TEXT_COLUMN,
+    refresh_search_documents,
+)
+from shared.schema_registry import schema_registry
+
+logger = logging.getLogger(__name__)
+
+# フィールド振り分け定数
+LAND_INFO_KEYS = frozenset({
+    "land_area", "land_category", "use_district", "city_planning",
+    "building_coverage_ratio", "floor_area_ratio",
+})
+BUILDING_INFO_KEYS = frozenset({
+    "building_structure", "construction_date", "building_area",
+    "total_floor_area", "room_count", "room_type", "total_units",
+})
+SKIP_KEYS = frozenset({"property_url"})
+
+RELATED_TABLE_KEYS: Dict[str, frozenset] = {
+    "land_info": LAND_INFO_KEYS,
+    "building_info": BUILDING_INFO_KEYS,
+}
+
+# 新規作成時に物件名が無い場合の仮名
+PLACEHOLDER_PROPERTY_NAME = "（スクレイピング物件）"
+
+STAGING_TABLE = "scraper_sync_staging"
+
+# 送信データのハッシュを保持するカラム
+CONTENT_HASH_COLUMN = "scraper_content_hash"
+
+# ステージングに1文で投入する行数
+STAGING_PAGE_SIZE = 1000
+
+
+class _StagedItem:
+    """ステージング1行（同じproperty_urlのitemは送信順にマージ）"""
+
+    def __init__(self, idx: int, property_url: str):
+        self.idx = idx
+        self.property_url = property_url
+        self.indices: List[int] = []
+        self.props: Dict[str, Any] = {}
+        self.related: Dict[str, Dict[str, Any]] = {table: {} for table in RELATED_TABLE_KEYS}
+
+
+def _group_ids(groups: Dict[Tuple[str, ...], int], data: Dict[str, Any]) -> int:
+    """カラムの組み合わせごとの番号（データなしは -1）"""
+    if not data:
+        return -1
+    return groups.setdefault(tuple(sorted(data)), len(groups))
+
+
+def _json(data: Dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def content_hash(entry: "_StagedItem") -> str:
+    """
+    取り込み対象データの正規化ハッシュ（SHA-256）
+
+    フィルタ後の properties / 関連テーブルのデータをキー順に並べたJSONから計算するため、
+    キーの順序や取り込み対象外のキー・NULL値の違いは変更とみなさない。
+    """
+    normalized = json.dumps(
+        {"properties": entry.props, **entry.related},
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def stage_items(
+    db: Session, items: List[Dict[str, Any]]
+) -> Tuple[List[_StagedItem], List[Dict[str, Any]]]:
+    """
+    itemを振り分け・検証してステージング行にまとめる
+
+    カラム情報はスキーマレジストリから取得する（未ロード時・期限切れ時のみDBを参照）。
+
+    Returns:
+        (ステージング行, 検証エラー [{"index", "detail"}])
+    """
+    # properties は GenericCRUD.create / update と同じ条件（is_updatable かつ実在カラム）
+    property_columns = GenericCRUD(db).get_writable_columns("properties")
+    related_columns = {
+        table_name: keys & set(schema_registry.get_db_columns(table_name, db))
+        for table_name, keys in RELATED_TABLE_KEYS.items()
+    }
+
+    staged: Dict[str, _StagedItem] = {}
+    errors: List[Dict[str, Any]] = []
+    for idx, item in enumerate(items):
+        property_url = item.get("property_url") if isinstance(item, dict) else None
+        if not property_url:
+            errors.append({"index": idx, "detail": "property_url is required"})
+            continue
+
+        props: Dict[str, Any] = {}
+        related: Dict[str, Dict[str, Any]] = {table: {} for table in RELATED_TABLE_KEYS}
+        for key, val in item.items():
+            if val is None or key in SKIP_KEYS:
+                continue
+            for table_name, keys in RELATED_TABLE_KEYS.items():
+                if key in keys:
+                    if key in related_columns[table_name]:
+                        related[table_name][key] = val
+                    break
+            else:
+                props[key] = val
+
+        entry = staged.get(property_url)
+        if entry is None:
+            entry = staged[property_url] = _StagedItem(len(staged), property_url)
+        entry.indices.append(idx)
+        entry.props.update({key: val for key, val in props.items() if key in property_columns})
+        for table_name, data in related.items():
+            entry.related[table_name].update(data)
+
+    return list(staged.values()), errors
+
+
+def _load_staging(db: Session, staged: List[_StagedItem]) -> Dict[str, Dict[Tuple[str, ...], int]]:
+    """
+    ステージングテーブルを作成して一括投入
+
+    Returns:
+        {"props" | テーブル名: {カラムの組み合わせ: グループ番号}}
+    """
+    groups: Dict[str, Dict[Tuple[str, ...], int]] = {"props": {}}
+    groups.update({table_name: {} for table_name in RELATED_TABLE_KEYS})
+
+    rows = []
+    for entry in staged:
+        rows.append((
+            entry.idx,
+            entry.property_url,
+            content_hash(entry),
+            _json(entry.props),
+            _group_ids(groups["props"], entry.props),
+            _json(entry.related["land_info"]),
+            _group_ids(groups["land_info"], entry.related["land_info"]),
+            _json(entry.related["building_info"]),
+            _group_ids(groups["building_info"], entry.related["building_info"]),
+        ))
+
+    db.execute(text(f"DROP TABLE IF EXISTS {STAGING_TABLE}"))
+    db.execute(text(f"""
+        CREATE TEMP TABLE {STAGING_TABLE} (
+            idx INTEGER PRIMARY KEY,
+            property_url TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            unchanged BOOLEAN NOT NULL DEFAULT FALSE,
+            props JSONB NOT NULL,
+            props_group INTEGER NOT NULL,
+            land_info JSONB NOT NULL,
+            land_info_group INTEGER NOT NULL,
+            building_info JSONB NOT NULL,
+            building_info_group INTEGER NOT NULL
+        ) ON COMMIT DROP
+    """))
+
+    # セッションと同じ接続・トランザクションで投入
+    cursor = db.connection().connection.cursor()
+    try:
+        execute_values(
+            cursor,
+            f"""
+                INSERT INTO {STAGING_TABLE} (
+                    idx, property_url, content_hash,
+                    props, props_group, land_info, land_info_group, building_info, building_info_group
+                ) VALUES %s
+            """,
+            rows,
+            template="(%s, %s, %s, %s::jsonb, %s, %s::jsonb, %s, %s::jsonb, %s)",
+            page_size=STAGING_PAGE_SIZE,
+        )
+    finally:
+        cursor.close()
+
+    return groups
+
+
+def _upsert_properties(
+    db: Session,
+    organization_id: int,
+    groups: Dict[Tuple[str, ...], int],
+    only_idx: Optional[int],
+) -> List[Any]:
+    """
+    properties を INSERT ... ON CONFLICT (property_url) でUPSERT
+
+    Returns:
+        RETURNING行（id, property_url, inserted）
+    """
+    only = " AND NOT s.unchanged" + (" AND s.idx = :only_idx" if only_idx is not None else "")
+    # properties のデータが無い item も対象（新規なら仮名で作成、既存なら updated_at のみ更新）
+    all_groups = list(groups.items()) + [((), -1)]
+
+    returned = []
+    for columns, group_id in all_groups:
+        insert_columns = ["organization_id", "property_url", CONTENT_HASH_COLUMN] + list(columns)
+        select_exprs = [":organization_id", "s.property_url", "s.content_hash"] + [f"r.{col}" for col in columns]
+        if "property_name" in columns:
+            index = insert_columns.index("property_name")
+            select_exprs[index] = "COALESCE(NULLIF(r.property_name, ''), :placeholder_name)"
+        else:
+            insert_columns.append("property_name")
+            select_exprs.append(":placeholder_name")
+
+        set_parts = [f"{col} = EXCLUDED.{col}" for col in columns + (CONTENT_HASH_COLUMN,)]
+        set_parts.append("updated_at = NOW()")
+        result = db.execute(
+            text(f"""
+                INSERT INTO properties AS p ({", ".join(insert_columns)})
+                SELECT {", ".join(select_exprs)}
+                FROM {STAGING_TABLE} s
+                CROSS JOIN LATERAL jsonb_populate_record(NULL::properties, s.props) r
+                WHERE s.props_group = :group_id{only}
+                ON CONFLICT (property_url) WHERE deleted_at IS NULL
+                DO UPDATE SET {", ".join(set_parts)}
+                RETURNING p.id, p.property_url, (p.xmax = 0) AS inserted
+            """),
+            {
+                "organization_id": organization_id,
+                "placeholder_name": PLACEHOLDER_PROPERTY_NAME,
+                "group_id": group_id,
+                "only_idx": only_idx,
+            },
+        )
+        returned.extend(result.fetchall())
+    return returned
+
+
+def _upsert_related(
+    db: Session,
+    table_name: str,
+    groups: Dict[Tuple[str, ...], int],
+    only_idx: Optional[int],
+) -> None:
+    """
+    関連テーブルを一括UPSERT（既存行は送信カラムのみ更新、無い物件は作成）
+
+    既存行は get_full と同じく物件ごとに最小idの行を対象とする。
+    """
+    if not groups:
+        return
+
+    only = " AND NOT s.unchanged" + (" AND s.idx = :only_idx" if only_idx is not None else "")
+    params = {"only_idx": only_idx}
+    columns = sorted({col for group_columns in groups for col in group_columns})
+
+    set_parts = [
+        f"{col} = CASE WHEN s.{table_name} ? '{col}' THEN r.{col} ELSE t.{col} END"
+        for col in columns
+    ]
+    db.execute(
+        text(f"""
+            UPDATE {table_name} AS t
+            SET {", ".join(set_parts)}, updated_at = NOW()
+            FROM {STAGING_TABLE} s
+            JOIN properties p ON p.property_url = s.property_url AND p.deleted_at IS NULL
+            CROSS JOIN LATERAL jsonb_populate_record(NULL::{table_name}, s.{table_name}) r
+            CROSS JOIN LATERAL (
+                SELECT x.id
+                FROM {table_name} x
+                WHERE x.property_id = p.id AND x.deleted_at IS NULL
+                ORDER BY x.id
+                LIMIT 1
+            ) e
+            WHERE t.id = e.id AND s.{table_name}_group >= 0{only}
+        """),
+        params,
+    )
+
+    for group_columns, group_id in groups.items():
+        db.execute(
+            text(f"""
+                INSERT INTO {table_name} (property_id, created_at, updated_at, {", ".join(group_columns)})
+                SELECT p.id, NOW(), NOW(), {", ".join(f"r.{col}" for col in group_columns)}
+                FROM {STAGING_TABLE} s
+                JOIN properties p ON p.property_url = s.property_url AND p.deleted_at IS NULL
+                CROSS JOIN LATERAL jsonb_populate_record(NULL::{table_name}, s.{table_name}) r
+                WHERE s.{table_name}_group = :group_id{only}
+                  AND NOT EXISTS (
+                      SELECT 1 FROM {table_name} x
+                      WHERE x.property_id = p.id AND x.deleted_at IS NULL
+                  )
+            """),
+            {**params, "group_id": group_id},
+        )
+
+
+def _mark_unchanged(db: Session) -> Set[int]:
+    """
+    前回取り込み時とハッシュが同じ行に unchanged を立てる
+
+    Returns:
+        unchanged のステージング行番号
+    """
+    result = db.execute(text(f"""
+        UPDATE {STAGING_TABLE} s
+        SET unchanged = TRUE
+        FROM properties p
+        WHERE p.property_url = s.property_url
+          AND p.deleted_at IS NULL
+          AND p.{CONTENT_HASH_COLUMN} = s.content_hash
+        RETURNING s.idx
+    """))
+    return {row.idx for row in result}
+
+
+def _apply(
+    db: Session,
+    organization_id: int,
+    groups: Dict[str, Dict[Tuple[str, ...], int]],
+    only_idx: Optional[int] = None,
+) -> List[Any]:
+    """ステージング（only_idx指定時はその1行）を本テーブルへ反映"""
+    returned = _upsert_properties(db, organization_id, groups["props"], only_idx)
+    for table_name in RELATED_TABLE_KEYS:
+        _upsert_related(db, table_name, groups[table_name], only_idx)
+    return returned
+
+
+def bulk_upsert_items(db: Session, items: List[Dict[str, Any]], organization_id: int) -> Dict[str, Any]:
+    """
+    物件を一括UPSERTしてコミット
+
+    Returns:
+        {"created": 件数, "updated": 件数, "unchanged": 件数,
+         "errors": [{"index": itemの位置, "detail": エラー内容}]}
+        同じproperty_urlのitemはマージし、2件目以降は updated（変更なしの場合は unchanged）として数える
+    """
+    stats: Dict[str, Any] = {"created": 0, "updated": 0, "unchanged": 0, "errors": []}
+
+    staged, errors = stage_items(db, items)
+    stats["errors"].extend(errors)
+    if not staged:
+        return stats
+
+    groups = _load_staging(db, staged)
+    unchanged = _mark_unchanged(db)
+    for entry in staged:
+        if entry.idx in unchanged:
+            stats["unchanged"] += len(entry.indices)
+
+    if len(unchanged) == len(staged):
+        # 全件変更なし: 書き込みなし
+        db.rollback()
+        return stats
+
+    # 一括反映（失敗時は1件ずつ再実行して失敗itemを特定）
+    returned: List[Any] = []
+    try:
+        with db.begin_nested():
+            returned = _apply(db, organization_id, groups)
+    except SQLAlchemyError as e:
+        logger.warning(f"bulk-upsert batch failed, retrying per item: {e}")
+        for entry in staged:
+            try:
+                with db.begin_nested():
+                    returned.extend(_apply(db, organization_id, groups, entry.idx))
+            except SQLAlchemyError as item_error:
+                detail = str(getattr(item_error, "orig", item_error)).strip()
+                logger.error(f"bulk-upsert item{entry.indices} failed: {detail}")
+                stats["errors"].extend({"index": idx, "detail": detail} for idx in entry.indices)
+
+    by_url = {entry.property_url: entry for entry in staged}
+    search_sources = set(SEARCH_DOCUMENT_COLUMNS + SEARCH_ADDRESS_COLUMNS)
+    search_ids: Set[int] = set()
+    for row in returned:
+        entry = by_url[row.property_url]
+        stats["created" if row.inserted else "updated"] += 1
+        stats["updated"] += len(entry.indices) - 1
+        if row.inserted or search_sources & entry.props.keys():
+            search_ids.add(row.id)
+
+    # 検索ドキュメントを再計算（GenericCRUD.create / update と同じ）
+    if search_ids and SEARCH_TEXT_COLUMN in schema_registry.get_db_columns("properties", db):
+        refresh_search_documents(db, sorted(search_ids))
+
+    db.commit()
+    stats["errors"].sort(key=lambda error: error["index"])
+    return stats
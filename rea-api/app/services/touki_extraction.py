@@ -0,0 +1,220 @@
+"""
+登記事項証明書PDFのバックグラウンド抽出
+
+pdfplumber のテキスト抽出は1ページ数百msかかり、複数ページの証明書では
+アップロードAPIのワーカーを数秒占有していた。
+アップロード時は touki_imports に queued で登録してすぐに返し、
+ワーカーがページ単位でプロセスプールに分散して抽出する。
+
+- 進捗: touki_imports.status（queued → extracting → uploaded → parsed / error）
+        と page_count / pages_extracted
+- 取得: FOR UPDATE SKIP LOCKED（複数プロセスで同じPDFを処理しない）
+- 停止したジョブ（extracting のまま updated_at が古い）は再取得して最初から抽出
+- auto_parse=TRUE のインポートは抽出後にそのままパースして touki_records を作成
+
+前提: scripts/migrations/2026-10-18_touki_imports_extraction.sql
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.background_workers import PollingWorker
+from app.services.touki_import import parse_import
+from app.utils.process_pool import spawn_process_pool
+from shared.database import READatabase
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_EXTRACTING = "extracting"
+STATUS_UPLOADED = "uploaded"
+STATUS_PARSED = "parsed"
+STATUS_ERROR = "error"
+
+# 1タスクで抽出するページ数（PDFを開くコストとの兼ね合い）
+PAGES_PER_TASK = 2
+
+# この時間 updated_at が更新されない extracting は停止したとみなして再取得
+STALE_AFTER_SECONDS = 600
+
+_CLAIM_QUERY = """
+    UPDATE touki_imports
+    SET status = %s, pages_extracted = 0, error_message = NULL, updated_at = NOW()
+    WHERE id = (
+        SELECT id
+        FROM touki_imports
+        WHERE deleted_at IS NULL
+          AND (status = %s
+               OR (status = %s AND updated_at < NOW() - make_interval(secs => %s)))
+        ORDER BY id
+        FOR UPDATE SKIP LOCKED
+        LIMIT 1
+    )
+    RETURNING id, file_path, auto_parse
+"""
+
+
+def count_pages(file_path: str) -> int:
+    """PDFのページ数（プロセスプールで実行される）"""
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def extract_pages(file_path: str, page_indexes: List[int]) -> List[Tuple[int, Optional[str]]]:
+    """指定ページのテキストを抽出（プロセスプールで実行される）"""
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return [(i, pdf.pages[i].extract_text()) for i in page_indexes]
+
+
+def format_raw_text(page_texts: Dict[int, Optional[str]]) -> str:
+    """ページごとのテキストを raw_text の形式（--- Page n --- 区切り）に結合"""
+    return "\n\n".join(
+        f"--- Page {i + 1} ---\n{text}"
+        for i, text in sorted(page_texts.items())
+        if text
+    )
+
+
+def extract_pdf_text(executor: ProcessPoolExecutor, file_path: str, on_progress=None) -> Tuple[str, int]:
+    """
+    PDFのテキストをページ並列で抽出
+
+    Args:
+        on_progress: ページのまとまりが終わるごとに (抽出済みページ数, 総ページ数) で呼ばれる
+
+    Returns:
+        (raw_text, 総ページ数)
+    """
+    page_count = executor.submit(count_pages, file_path).result()
+    if on_progress:
+        on_progress(0, page_count)
+
+    futures = [
+        executor.submit(extract_pages, file_path, list(range(start, min(start + PAGES_PER_TASK, page_count))))
+        for start in range(0, page_count, PAGES_PER_TASK)
+    ]
+    page_texts: Dict[int, Optional[str]] = {}
+    for future in as_completed(futures):
+        page_texts.update(future.result())
+        if on_progress:
+            on_progress(len(page_texts), page_count)
+
+    return format_raw_text(page_texts), page_count
+
+
+def _update_import(import_id: int, query: str, params: tuple) -> None:
+    with READatabase.cursor(commit=True) as (cur, conn):
+        cur.execute(query, (*params, import_id))
+
+
+def run_extraction(executor: ProcessPoolExecutor, job: Any) -> None:
+    """1件のPDFを抽出して touki_imports を更新（auto_parse ならパースまで）"""
+    import_id, file_path, auto_parse = job
+
+    def on_progress(done: int, total: int) -> None:
+        _update_import(import_id, """
+            UPDATE touki_imports
+            SET page_count = %s, pages_extracted = %s, updated_at = NOW()
+            WHERE id = %s
+        """, (total, done))
+
+    try:
+        raw_text, _ = extract_pdf_text(executor, file_path, on_progress)
+    except Exception as e:
+        logger.error(f"touki import {import_id} extraction failed: {e}")
+        _update_import(import_id, """
+            UPDATE touki_imports
+            SET status = %s, error_message = %s, updated_at = NOW()
+            WHERE id = %s
+        """, (STATUS_ERROR, str(e)))
+        if isinstance(e, BrokenProcessPool):
+            raise
+        return
+
+    _update_import(import_id, """
+        UPDATE touki_imports
+        SET raw_text = %s, status = %s, error_message = %s, updated_at = NOW()
+        WHERE id = %s
+    """, (
+        raw_text or None,
+        STATUS_UPLOADED if raw_text else STATUS_ERROR,
+        None if raw_text else "テキストを抽出できませんでした",
+    ))
+    if not raw_text or not auto_parse:
+        return
+
+    try:
+        with READatabase.cursor(commit=True) as (cur, conn):
+            parse_import(cur, import_id, raw_text)
+    except Exception as e:
+        # 抽出結果は残し、手動で再パースできるようにする
+        logger.error(f"touki import {import_id} auto parse failed: {e}")
+        _update_import(import_id, """
+            UPDATE touki_imports SET error_message = %s, updated_at = NOW() WHERE id = %s
+        """, (f"パースに失敗しました: {e}",))
+
+
+class ToukiExtractionWorker(PollingWorker):
+    """登記PDF抽出のワーカー（PDF単位のスレッド + ページ抽出のプロセスプール）"""
+
+    def __init__(self):
+        super().__init__("touki-extraction", self._claim_import, self._extract, workers_env="TOUKI_EXTRACTION_JOBS")
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._process_count = 1
+        self._pool_lock = threading.Lock()
+
+    def start(self, jobs: Optional[int] = None, processes: Optional[int] = None) -> bool:
+        """
+        ワーカーを起動（アプリ起動時）
+
+        Args:
+            jobs: 同時に処理するPDF数（TOUKI_EXTRACTION_JOBS、0でこのプロセスでは処理しない）
+            processes: ページ抽出のプロセス数（TOUKI_EXTRACTION_PROCESSES）
+        """
+        if self.running:
+            return False
+        self._process_count = processes or int(
+            os.getenv("TOUKI_EXTRACTION_PROCESSES", str(min(4, os.cpu_count() or 1)))
+        )
+        self._processes = spawn_process_pool(self._process_count)
+        if not super().start(jobs):
+            self._processes.shutdown(wait=False)
+            self._processes = None
+            return False
+        return True
+
+    def stop(self) -> None:
+        """ワーカーを停止（処理中のPDFは完了を待つ、未処理は queued のまま次回起動時に処理）"""
+        if not self.running:
+            return
+        super().stop()
+        self._processes.shutdown(wait=True)
+        self._processes = None
+
+    @staticmethod
+    def _claim_import() -> Optional[Any]:
+        with READatabase.cursor(commit=True) as (cur, conn):
+            cur.execute(_CLAIM_QUERY, (STATUS_EXTRACTING, STATUS_QUEUED, STATUS_EXTRACTING, STALE_AFTER_SECONDS))
+            return cur.fetchone()
+
+    def _extract(self, job: Any) -> None:
+        processes = self._processes
+        try:
+            run_extraction(processes, job)
+        except BrokenProcessPool:
+            # 抽出プロセスが異常終了した場合（壊れたPDF等）はプールを作り直す
+            logger.error(f"touki extraction process pool broken (import {job[0]})")
+            with self._pool_lock:
+                if self._processes is processes:
+                    self._processes = spawn_process_pool(self._process_count)
+
+
+# シングルトンインスタンス
+touki_extraction_worker = ToukiExtractionWorker()
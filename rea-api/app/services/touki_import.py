@@ -0,0 +1,138 @@
+"""
+登記事項証明書のパース・touki_records保存
+
+アップロードAPI（endpoints/touki.py）とバックグラウンドのPDF抽出（services/touki_extraction.py）で共用する。
+"""
+import json
+import logging
+from datetime import datetime
+from typing import List, Tuple
+
+from app.services.touki_search import build_search_keys
+from shared.touki_parser import parse_touki
+
+logger = logging.getLogger(__name__)
+
+
+def save_to_touki_records(cur, import_id: int, parsed_data: dict) -> List[int]:
+    """パース結果をtouki_recordsに保存"""
+    record_ids = []
+    doc_type = parsed_data.get('document_type', 'unknown')
+
+    owner_info = parsed_data.get('owner_info', {})
+    owners = []
+    if owner_info.get('owner_name'):
+        owners.append({
+            'name': owner_info.get('owner_name'),
+            'address': owner_info.get('owner_address')
+        })
+
+    mortgages = parsed_data.get('mortgage_info', [])
+
+    # 土地レコード
+    if doc_type in ['land', 'both']:
+        land = parsed_data.get('land_info', {})
+        location = land.get('location', '')
+        if location:
+            keys = build_search_keys({
+                'real_estate_number': parsed_data.get('real_estate_number'),
+                'location': location,
+                'lot_number': land.get('lot_number'),
+                'owners': owners,
+            })
+            cur.execute("""
+                INSERT INTO touki_records (
+                    real_estate_number, document_type, location,
+                    lot_number, land_category, land_area_m2,
+                    owners, mortgages, touki_import_id, raw_parsed,
+                    lot_number_key, location_key, owner_names
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                RETURNING id
+            """, (
+                keys['real_estate_number'],
+                'land',
+                location,
+                land.get('lot_number'),
+                land.get('land_category'),
+                land.get('land_area_m2'),
+                json.dumps(owners, ensure_ascii=False),
+                json.dumps(mortgages, ensure_ascii=False),
+                import_id,
+                json.dumps(parsed_data, ensure_ascii=False),
+                keys['lot_number_key'],
+                keys['location_key'],
+                keys['owner_names'],
+            ))
+            record_ids.append(cur.fetchone()[0])
+
+    # 建物レコード
+    if doc_type in ['building', 'both']:
+        building = parsed_data.get('building_info', {})
+        location = building.get('location', '')
+        if location:
+            floor_areas = building.get('floor_areas', {})
+            construction_date = None
+            if building.get('construction_date'):
+                try:
+                    construction_date = datetime.strptime(
+                        building['construction_date'], '%Y-%m-%d'
+                    ).date()
+                except ValueError as e:
+                    logger.warning(f"Invalid construction_date format: {building.get('construction_date')} - {e}")
+
+            keys = build_search_keys({
+                'real_estate_number': parsed_data.get('real_estate_number'),
+                'location': location,
+                'owners': owners,
+            })
+            cur.execute("""
+                INSERT INTO touki_records (
+                    real_estate_number, document_type, location,
+                    building_number, building_type, structure,
+                    floor_area_m2, floor_areas, construction_date,
+                    owners, mortgages, touki_import_id, raw_parsed,
+                    lot_number_key, location_key, owner_names
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                RETURNING id
+            """, (
+                keys['real_estate_number'],
+                'building',
+                location,
+                building.get('building_number'),
+                building.get('building_type'),
+                building.get('structure'),
+                building.get('total_floor_area_m2'),
+                json.dumps(floor_areas, ensure_ascii=False) if floor_areas else None,
+                construction_date,
+                json.dumps(owners, ensure_ascii=False),
+                json.dumps(mortgages, ensure_ascii=False),
+                import_id,
+                json.dumps(parsed_data, ensure_ascii=False),
+                keys['lot_number_key'],
+                keys['location_key'],
+                keys['owner_names'],
+            ))
+            record_ids.append(cur.fetchone()[0])
+
+    return record_ids
+
+
+def parse_import(cur, import_id: int, raw_text: str) -> Tuple[dict, List[int]]:
+    """
+    インポートのテキストをパースして touki_imports を更新し、touki_records に保存
+
+    Returns:
+        (パース結果, 作成した touki_records のID)
+    """
+    parsed_data = parse_touki(raw_text)
+
+    cur.execute("""
+        UPDATE touki_imports
+        SET parsed_data = %s, status = 'parsed', updated_at = NOW()
+        WHERE id = %s
+    """, (
+        json.dumps(parsed_data, ensure_ascii=False),
+        import_id
+    ))
+
+    return parsed_data, save_to_touki_records(cur, import_id, parsed_data)
@@ -0,0 +1,297 @@
+"""
+登記レコード（touki_records）の検索・物件への紐付け候補
+
+登記レコードを物件に紐付けるとき、一覧（OFFSETページング）を目で探していたのを
+正規化済みのキーとインデックスで検索できるようにする。
+
+- real_estate_number: 不動産番号（数字のみ、B-treeインデックス）
+- lot_number_key:     地番（shared.formatters.normalize_lot_number、B-treeインデックス）
+                      建物は所在の「○番地○」から作成
+- location_key:       所在（番地を除いた町域まで、トライグラムGINインデックス）
+- owner_names:        所有者名（正規化して空白区切り、トライグラムGINインデックス）
+- 更新: touki_import.save_to_touki_records が作成時に設定する
+- 既存データ: scripts/backfill_touki_search_keys.py で一括作成
+
+前提: scripts/migrations/2026-10-18_touki_records_search.sql
+"""
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from shared.formatters import normalize_address, normalize_lot_number, normalize_search_text
+
+# 所在末尾の番地（建物の所在「春光町三丁目 33番地2」→ 33番地2）
+_TRAILING_LOT = re.compile(r'(\d[\d\-番地の]*)$')
+
+# 漢数字の丁目（登記は「三丁目」、物件住所は「3丁目」が多い）
+_KANJI_CHOME = re.compile(r'([一二三四五六七八九十]+)丁目')
+_KANJI_DIGITS = {c: i for i, c in enumerate('一二三四五六七八九', start=1)}
+
+# 複数の地番の区切り（land_info.chiban は「91-44, 91-45」のように入る）
+_CHIBAN_SEPARATOR = re.compile(r'[,、，\s]+')
+
+# 検索・候補で返すカラム
+SEARCH_RESULT_COLUMNS = [
+    'id', 'real_estate_number', 'document_type', 'location',
+    'lot_number', 'land_category', 'land_area_m2',
+    'building_number', 'building_type', 'structure',
+    'floor_area_m2', 'floor_areas', 'construction_date',
+    'owners', 'mortgages', 'touki_import_id', 'created_at',
+]
+
+# 候補として返す所在の類似度の下限（地番が一致しない場合）
+MIN_LOCATION_SIMILARITY = 0.3
+
+# 地番一致の加点（同じ町域で地番一致 > 同じ町域で地番違い > 別の町域で地番一致 の順になる値）
+LOT_MATCH_WEIGHT = 0.5
+
+
+def _kanji_to_int(kanji: str) -> int:
+    """漢数字（一〜九十九）を数値に変換"""
+    if '十' not in kanji:
+        return _KANJI_DIGITS.get(kanji, 0)
+    tens, _, ones = kanji.partition('十')
+    return (_KANJI_DIGITS.get(tens, 1) if tens else 1) * 10 + _KANJI_DIGITS.get(ones, 0)
+
+
+def normalize_location(location: str) -> str:
+    """所在・住所を比較用に正規化（全角半角・空白・丁目の漢数字・ヶを統一）"""
+    if not location:
+        return ""
+    text = normalize_search_text(normalize_address(location))
+    text = _KANJI_CHOME.sub(lambda m: f"{_kanji_to_int(m.group(1))}丁目", text)
+    return text.replace('ヶ', 'ケ')
+
+
+def split_location(location: str) -> Tuple[str, str]:
+    """
+    所在・住所を町域と末尾の番地に分割
+
+    Returns:
+        (正規化した町域, 正規化した番地)  番地が無い場合は空文字
+
+    Examples:
+        >>> split_location("北見市春光町三丁目 ３３番地２")
+        ("北見市春光町3丁目", "33-2")
+    """
+    key = normalize_location(location)
+    match = _TRAILING_LOT.search(key)
+    if not match:
+        return key, ""
+    return key[:match.start()], normalize_lot_number(match.group(1))
+
+
+def build_search_keys(record: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """
+    登記レコードから検索キーを作成
+
+    Args:
+        record: touki_records の行（location, lot_number, owners, real_estate_number）
+    """
+    location_key, trailing_lot = split_location(record.get('location') or '')
+    lot_number_key = normalize_lot_number(record.get('lot_number') or '') or trailing_lot
+
+    names = [normalize_search_text(o.get('name') or '') for o in (record.get('owners') or [])]
+    owner_names = ' '.join(name for name in names if name)
+
+    real_estate_number = re.sub(r'\D', '', normalize_search_text(record.get('real_estate_number') or ''))
+
+    return {
+        'real_estate_number': real_estate_number or None,
+        'lot_number_key': lot_number_key or None,
+        'location_key': location_key or None,
+        'owner_names': owner_names or None,
+    }
+
+
+def refresh_search_keys(cur, record_ids: Optional[Sequence[int]] = None) -> int:
+    """
+    検索キーを再計算して保存（commitは呼び出し元）
+
+    Args:
+        record_ids: 対象レコードID（Noneの場合は全件）
+
+    Returns:
+        更新件数（内容が変わらない行は更新しない）
+    """
+    query = """
+        SELECT id, real_estate_number, location, lot_number, owners,
+               lot_number_key, location_key, owner_names
+        FROM touki_records
+    """
+    params: Tuple[Any, ...] = ()
+    if record_ids is not None:
+        query += " WHERE id = ANY(%s)"
+        params = (list(record_ids),)
+    cur.execute(query, params)
+
+    changed = []
+    for row in cur.fetchall():
+        record_id, real_estate_number, location, lot_number, owners = row[:5]
+        keys = build_search_keys({
+            'real_estate_number': real_estate_number,
+            'location': location,
+            'lot_number': lot_number,
+            'owners': owners,
+        })
+        current = {
+            'real_estate_number': real_estate_number,
+            'lot_number_key': row[5],
+            'location_key': row[6],
+            'owner_names': row[7],
+        }
+        if keys != current:
+            changed.append((
+                keys['real_estate_number'], keys['lot_number_key'],
+                keys['location_key'], keys['owner_names'], record_id,
+            ))
+
+    if changed:
+        cur.executemany("""
+            UPDATE touki_records
+            SET real_estate_number = %s, lot_number_key = %s, location_key = %s, owner_names = %s
+            WHERE id = %s
+        """, changed)
+    return len(changed)
+
+
+def search_records(
+    cur,
+    real_estate_number: Optional[str] = None,
+    lot_number: Optional[str] = None,
+    location: Optional[str] = None,
+    owner: Optional[str] = None,
+    document_type: Optional[str] = None,
+    limit: int = 20,
+) -> List[Dict[str, Any]]:
+    """
+    登記レコードを検索（条件はAND、いずれもインデックスで絞り込む）
+
+    Args:
+        real_estate_number: 不動産番号（完全一致、ハイフン・空白は無視）
+        lot_number: 地番（正規化して完全一致）
+        location: 所在（正規化して部分一致、類似度順）
+        owner: 所有者名（正規化して部分一致、類似度順）
+
+    Returns:
+        SEARCH_RESULT_COLUMNS + score（所在・所有者の類似度、指定が無ければ NULL）
+    """
+    conditions = ["deleted_at IS NULL"]
+    params: List[Any] = []
+    rank_terms: List[str] = []
+    rank_params: List[Any] = []
+
+    if real_estate_number:
+        conditions.append("real_estate_number = %s")
+        params.append(re.sub(r'\D', '', normalize_search_text(real_estate_number)))
+    if lot_number:
+        conditions.append("lot_number_key = %s")
+        params.append(normalize_lot_number(lot_number))
+    if location:
+        location_key = normalize_location(location)
+        conditions.append("location_key LIKE %s")
+        params.append(f"%{location_key}%")
+        rank_terms.append("similarity(location_key, %s)")
+        rank_params.append(location_key)
+    if owner:
+        owner_key = normalize_search_text(owner)
+        conditions.append("owner_names LIKE %s")
+        params.append(f"%{owner_key}%")
+        rank_terms.append("similarity(owner_names, %s)")
+        rank_params.append(owner_key)
+    if document_type:
+        conditions.append("document_type = %s")
+        params.append(document_type)
+
+    score_expr = f"({' + '.join(rank_terms)})::float8" if rank_terms else "NULL::float8"
+    cur.execute(f"""
+        SELECT {', '.join(SEARCH_RESULT_COLUMNS)}, {score_expr} AS score
+        FROM touki_records
+        WHERE {' AND '.join(conditions)}
+        ORDER BY score DESC NULLS LAST, id DESC
+        LIMIT %s
+    """, (*rank_params, *params, limit))
+    columns = SEARCH_RESULT_COLUMNS + ['score']
+    return [dict(zip(columns, row)) for row in cur.fetchall()]
+
+
+def property_location(cur, property_id: int) -> Optional[Tuple[str, List[str]]]:
+    """
+    物件の住所と地番を取得
+
+    地番は land_info.chiban（登記反映時に「,」区切りで複数入る）と property_registries.chiban から。
+
+    Returns:
+        (住所, [地番, ...])  物件が無い場合は None
+    """
+    cur.execute("""
+        SELECT CONCAT_WS('', p.city, p.address),
+               ARRAY(
+                   SELECT l.chiban FROM land_info l
+                   WHERE l.property_id = p.id AND l.deleted_at IS NULL AND l.chiban <> ''
+                   UNION ALL
+                   SELECT r.chiban FROM property_registries r
+                   WHERE r.property_id = p.id AND r.deleted_at IS NULL AND r.chiban <> ''
+               )
+        FROM properties p
+        WHERE p.id = %s AND p.deleted_at IS NULL
+    """, (property_id,))
+    row = cur.fetchone()
+    if not row:
+        return None
+    chiban = [c for value in row[1] for c in _CHIBAN_SEPARATOR.split(value) if c.strip()]
+    return row[0] or '', chiban
+
+
+def suggest_records(
+    cur,
+    address: str,
+    chiban: Sequence[str] = (),
+    property_id: Optional[int] = None,
+    limit: int = 10,
+) -> List[Dict[str, Any]]:
+    """
+    住所・地番から紐付け候補の登記レコードを提案
+
+    地番が一致するもの（lot_number_key）と所在が似ているもの（location_key のトライグラム）を
+    1回のクエリで取得し、所在の類似度 + 地番一致の加点（LOT_MATCH_WEIGHT）の順に並べる。
+    地番の指定が無い場合は住所末尾の番地を地番として使う（地番と住居表示が同じ地域向け）。
+
+    Returns:
+        SEARCH_RESULT_COLUMNS + lot_match, location_score, score, linked（property_id 指定時、紐付け済みか）
+    """
+    location_key, trailing_lot = split_location(address)
+    lot_keys = [key for key in (normalize_lot_number(c) for c in chiban) if key]
+    if not lot_keys and trailing_lot:
+        lot_keys = [trailing_lot]
+    if not location_key and not lot_keys:
+        return []
+
+    cur.execute(f"""
+        SELECT {', '.join('r.' + c for c in SEARCH_RESULT_COLUMNS)},
+               m.lot_match, m.location_score,
+               (m.location_score + CASE WHEN m.lot_match THEN %(lot_weight)s ELSE 0 END)::float8 AS score,
+               EXISTS (
+                   SELECT 1 FROM property_touki_links l
+                   WHERE l.property_id = %(property_id)s AND l.touki_record_id = r.id
+               ) AS linked
+        FROM touki_records r
+        CROSS JOIN LATERAL (
+            SELECT COALESCE(r.lot_number_key = ANY(%(lot_keys)s::text[]), FALSE) AS lot_match,
+                   COALESCE(similarity(r.location_key, %(location_key)s), 0)::float8 AS location_score
+        ) m
+        WHERE r.deleted_at IS NULL
+          AND (r.lot_number_key = ANY(%(lot_keys)s::text[])
+               OR (%(location_key)s <> '' AND r.location_key %% %(location_key)s))
+          AND (m.lot_match OR m.location_score >= %(min_similarity)s)
+        ORDER BY score DESC, r.id DESC
+        LIMIT %(limit)s
+    """, {
+        'property_id': property_id,
+        'lot_keys': lot_keys,
+        'location_key': location_key,
+        'min_similarity': MIN_LOCATION_SIMILARITY,
+        'lot_weight': LOT_MATCH_WEIGHT,
+        'limit': limit,
+    })
+    columns = SEARCH_RESULT_COLUMNS + ['lot_match', 'location_score', 'score', 'linked']
+    return [dict(zip(columns, row)) for row in cur.fetchall()]
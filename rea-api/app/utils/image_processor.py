@@ -1 +1,186 @@
-# TODO: 実装予定
+"""
+物件画像の派生画像（サムネイル・中・大 + WebP）生成
+
+アップロードされた原本から表示サイズごとの縮小画像を作り、
+管理画面の一覧・チラシ・WordPressが原本（最大10MB）を取得しなくて済むようにする。
+
+- サイズ: thumbnail / medium / large（長辺のpx、原本より大きくはしない）
+- 形式: JPEG（透過ありはPNG）+ WebP
+- 保存先: 原本と同じディレクトリに {原本名}_{サイズ}_{長辺}_q{画質}.{jpg|png|webp}
+          内容アドレスの画像は長期キャッシュ（immutable）されるため、同じ名前のファイルは上書きしない。
+          サイズ・画質を変えた場合はファイル名が変わる
+- 縮小はCPU負荷が高いためプロセスプールで実行（APIワーカーのGILを占有しない）
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from app.utils.process_pool import spawn_process_pool
+
+logger = logging.getLogger(__name__)
+
+# サイズ名 → 長辺(px)
+VARIANT_SIZES: Dict[str, int] = {
+    "thumbnail": 320,
+    "medium": 800,
+    "large": 1600,
+}
+
+SIZE_ORIGINAL = "original"
+
+JPEG_QUALITY = 85
+WEBP_QUALITY = 80
+
+# 1枚あたりの処理待ちの上限（秒）
+PROCESS_TIMEOUT_SECONDS = 60
+
+# 派生画像の生成に使うプロセス数
+WORKERS = int(os.getenv("IMAGE_PROCESS_WORKERS", "2"))
+
+
+def _has_alpha(image: Image.Image) -> bool:
+    return image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+
+
+def _save_new(image: Image.Image, upload_root: str, relative_path: str, format: str, **options) -> None:
+    """派生画像を保存（同じ名前 = 同じ原本・パラメータのファイルがあれば上書きしない）"""
+    path = os.path.join(upload_root, relative_path)
+    if os.path.exists(path):
+        return
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    image.save(tmp_path, format, **options)
+    os.replace(tmp_path, path)
+
+
+def generate_variants(upload_root: str, relative_path: str) -> Dict[str, Any]:
+    """
+    原本から派生画像を生成（プロセスプールで実行される）
+
+    Args:
+        upload_root: アップロードのルートディレクトリ（/uploads に対応）
+        relative_path: 原本の相対パス（property_images.file_path）
+
+    Returns:
+        {"width", "height", "sizes": {サイズ名: {"file_url", "webp_url", "width", "height"}}}
+    """
+    source = os.path.join(upload_root, relative_path)
+    stem, _ = os.path.splitext(relative_path)
+
+    with Image.open(source) as opened:
+        # 向き（EXIF）を反映し、GIFアニメーション等は先頭フレームを使う
+        image = ImageOps.exif_transpose(opened)
+        image.load()
+
+    alpha = _has_alpha(image)
+    image = image.convert("RGBA" if alpha else "RGB")
+
+    sizes = {}
+    for name, long_edge in VARIANT_SIZES.items():
+        resized = image.copy()
+        resized.thumbnail((long_edge, long_edge), Image.Resampling.LANCZOS)
+
+        if alpha:
+            variant_path = f"{stem}_{name}_{long_edge}.png"
+            _save_new(resized, upload_root, variant_path, "PNG", optimize=True)
+        else:
+            variant_path = f"{stem}_{name}_{long_edge}_q{JPEG_QUALITY}.jpg"
+            _save_new(resized, upload_root, variant_path, "JPEG",
+                      quality=JPEG_QUALITY, optimize=True, progressive=True)
+        webp_path = f"{stem}_{name}_{long_edge}_q{WEBP_QUALITY}.webp"
+        _save_new(resized, upload_root, webp_path, "WEBP", quality=WEBP_QUALITY, method=4)
+
+        sizes[name] = {
+            "file_url": f"/uploads/{variant_path}",
+            "webp_url": f"/uploads/{webp_path}",
+            "width": resized.width,
+            "height": resized.height,
+        }
+
+    return {"width": image.width, "height": image.height, "sizes": sizes}
+
+
+def variant_url(image: Dict[str, Any], size: Optional[str], webp: bool = False) -> Optional[str]:
+    """
+    指定サイズの画像URL（派生画像が無ければ原本）
+
+    Args:
+        image: property_imagesの行（file_url, variants）
+        size: thumbnail / medium / large / original（None は原本）
+        webp: WebPを優先するか
+    """
+    variant = ((image.get("variants") or {}).get("sizes") or {}).get(size or SIZE_ORIGINAL)
+    if not variant:
+        return image.get("file_url")
+    return variant["webp_url"] if webp else variant["file_url"]
+
+
+class ImageProcessorPool:
+    """派生画像生成のプロセスプール（プロセス共有、初回使用時に作成）"""
+
+    _instance: Optional['ImageProcessorPool'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._executor = None
+            cls._instance._lock = threading.Lock()
+        return cls._instance
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = spawn_process_pool(WORKERS)
+            return self._executor
+
+    def process(self, upload_root: str, relative_path: str) -> Optional[Dict[str, Any]]:
+        """
+        派生画像を生成して結果を返す（失敗時は None、原本はそのまま使える）
+        """
+        try:
+            future = self._get_executor().submit(generate_variants, upload_root, relative_path)
+            return future.result(timeout=PROCESS_TIMEOUT_SECONDS)
+        except BrokenProcessPool as e:
+            # ワーカープロセスが異常終了した場合は次回作り直す
+            logger.error(f"Image process pool broken: {e}")
+            self._executor = None
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to generate image variants for {relative_path}: {e}")
+            return None
+
+    def process_many(
+        self, upload_root: str, relative_paths: Iterable[str]
+    ) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        複数の原本を並列に処理（バックフィル用、完了順に返す）
+
+        Yields:
+            (相対パス, 結果, エラー内容)
+        """
+        executor = self._get_executor()
+        futures = {executor.submit(generate_variants, upload_root, path): path for path in relative_paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                yield path, future.result(), None
+            except BrokenProcessPool:
+                self._executor = None
+                raise
+            except Exception as e:
+                yield path, None, str(e)
+
+    def shutdown(self) -> None:
+        """プロセスプールを終了（アプリ終了時）"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+# シングルトンインスタンス
+image_processor = ImageProcessorPool()
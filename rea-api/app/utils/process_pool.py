@@ -0,0 +1,12 @@
+"""
+CPU処理用のプロセスプール
+
+touki_extraction（PDFのページ抽出）と image_processor（派生画像生成）で使う。
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def spawn_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """プロセスプールを作成（DBコネクション・スレッドを持つAPIプロセスをforkしないよう spawn で起動）"""
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
@@ -10,6 +10,7 @@
 
 import logging
 from fastapi import APIRouter, Query, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional
 import urllib.request
@@ -20,7 +21,7 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-from shared.database import READatabase
+from shared.async_database import AsyncREADatabase
 from shared.constants import calc_walk_minutes, SCHOOL_TYPE_CODES, DEFAULT_SEARCH_RADIUS
 
 router = APIRouter()
@@ -130,22 +131,15 @@ class UrbanPlanningResponse(BaseModel):
 # ヘルパー関数
 # =============================================================================
 
-def get_facility_categories():
+async def get_facility_categories():
     """DBからカテゴリ一覧を取得（display_order >= 0 のみ）"""
-    db = READatabase()
-    conn = db.get_connection()
-    cur = conn.cursor()
-    try:
-        cur.execute("""
-            SELECT category_code, category_name, icon
-            FROM m_facility_categories
-            WHERE display_order >= 0
-            ORDER BY display_order, id
-        """)
-        return {row[0]: {'name': row[1], 'icon': row[2]} for row in cur.fetchall()}
-    finally:
-        cur.close()
-        conn.close()
+    rows = await AsyncREADatabase.fetch("""
+        SELECT category_code, category_name, icon
+        FROM m_facility_categories
+        WHERE display_order >= 0
+        ORDER BY display_order, id
+    """)
+    return {row[0]: {'name': row[1], 'icon': row[2]} for row in rows}
 
 
 def geocode_gsi(address: str) -> Optional[dict]:
@@ -198,29 +192,22 @@ def geocode_nominatim(address: str) -> Optional[dict]:
     return None
 
 
-def get_google_api_key() -> Optional[str]:
+async def get_google_api_key() -> Optional[str]:
     """Google Maps APIキーを取得（DB設定 > 環境変数）"""
     try:
-        db = READatabase()
-        conn = db.get_connection()
-        cur = conn.cursor()
-        try:
-            cur.execute("SELECT value FROM system_settings WHERE key = 'GOOGLE_MAPS_API_KEY'")
-            row = cur.fetchone()
-            if row and row[0]:
-                return row[0]
-        finally:
-            cur.close()
-            conn.close()
+        value = await AsyncREADatabase.fetchval(
+            "SELECT value FROM system_settings WHERE key = 'GOOGLE_MAPS_API_KEY'"
+        )
+        if value:
+            return value
     except Exception as e:
         logger.debug(f"DB設定取得エラー（フォールバック使用）: {e}")
 
     return settings.GOOGLE_MAPS_API_KEY
 
 
-def geocode_google(address: str) -> Optional[dict]:
+def geocode_google(address: str, api_key: Optional[str]) -> Optional[dict]:
     """Google Maps Geocoding API（有料・高精度）"""
-    api_key = get_google_api_key()
     if not api_key:
         logger.debug("GOOGLE_MAPS_API_KEY not set, skipping Google Geocoding")
         return None
@@ -266,45 +253,36 @@ async def get_nearest_stations(
     limit: int = Query(5, description="取得件数", ge=1, le=20)
 ):
     """指定座標から最寄りの駅を検索"""
-    db = READatabase()
-    conn = db.get_connection()
-    cur = conn.cursor()
-
-    try:
-        cur.execute("""
-            SELECT
-                id, station_name, line_name, company_name,
-                ST_Distance(
-                    geom::geography,
-                    ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography
-                ) as distance_m
-            FROM m_stations
-            WHERE ST_DWithin(
+    rows = await AsyncREADatabase.fetch("""
+        SELECT
+            id, station_name, line_name, company_name,
+            ST_Distance(
                 geom::geography,
-                ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography,
-                %s
-            )
-            ORDER BY distance_m
-            LIMIT %s
-        """, (lng, lat, lng, lat, radius, limit))
-
-        stations = []
-        for row in cur.fetchall():
-            distance_m = int(row[4])
-            stations.append(NearestStationResponse(
-                station_id=row[0],
-                station_name=row[1],
-                line_name=row[2],
-                company_name=row[3],
-                distance_meters=distance_m,
-                walk_minutes=calc_walk_minutes(distance_m)
-            ))
+                ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography
+            ) as distance_m
+        FROM m_stations
+        WHERE ST_DWithin(
+            geom::geography,
+            ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography,
+            %s
+        )
+        ORDER BY distance_m
+        LIMIT %s
+    """, lng, lat, lng, lat, radius, limit)
 
-        return NearestStationsResponse(stations=stations, latitude=lat, longitude=lng)
+    stations = []
+    for row in rows:
+        distance_m = int(row[4])
+        stations.append(NearestStationResponse(
+            station_id=row[0],
+            station_name=row[1],
+            line_name=row[2],
+            company_name=row[3],
+            distance_meters=distance_m,
+            walk_minutes=calc_walk_minutes(distance_m)
+        ))
 
-    finally:
-        cur.close()
-        conn.close()
+    return NearestStationsResponse(stations=stations, latitude=lat, longitude=lng)
 
 
 # =============================================================================
@@ -315,16 +293,20 @@ async def get_nearest_stations(
 async def geocode_address(
     address: str = Query(..., description="住所", min_length=3)
 ):
-    """住所から緯度経度を取得（Google > GSI > Nominatim）"""
-    result = geocode_google(address)
+    """住所から緯度経度を取得（Google > GSI > Nominatim）
+
+    外部APIは同期HTTPのためスレッドプールで実行する（イベントループをブロックしない）
+    """
+    api_key = await get_google_api_key()
+    result = await run_in_threadpool(geocode_google, address, api_key)
     if result:
         return GeocodeResponse(**result)
 
-    result = geocode_gsi(address)
+    result = await run_in_threadpool(geocode_gsi, address)
     if result:
         return GeocodeResponse(**result)
 
-    result = geocode_nominatim(address)
+    result = await run_in_threadpool(geocode_nominatim, address)
     if result:
         return GeocodeResponse(**result)
 
@@ -345,83 +327,59 @@ async def get_school_districts(
     limit: int = Query(10, description="最大取得件数", ge=1, le=20)
 ):
     """指定座標から小学校・中学校の候補を取得"""
-    db = READatabase()
-    conn = db.get_connection()
-    cur = conn.cursor()
-
-    try:
-        cur.execute("""
-            SELECT school_name FROM m_school_districts
-            WHERE school_type = '小学校'
-            AND ST_Contains(area, ST_SetSRID(ST_MakePoint(%s, %s), 4326))
-        """, (lng, lat))
-        elementary_district_names = set(row[0] for row in cur.fetchall())
-
-        cur.execute("""
-            SELECT school_name FROM m_school_districts
-            WHERE school_type = '中学校'
-            AND ST_Contains(area, ST_SetSRID(ST_MakePoint(%s, %s), 4326))
-        """, (lng, lat))
-        junior_high_district_names = set(row[0] for row in cur.fetchall())
-
-        cur.execute("""
+    async with AsyncREADatabase.connection() as conn:
+        rows = await conn.fetch("""
+            SELECT school_type, school_name FROM m_school_districts
+            WHERE school_type IN ('小学校', '中学校')
+            AND ST_Contains(area, ST_SetSRID(ST_MakePoint($1, $2), 4326))
+        """, lng, lat)
+        elementary_district_names = set(row[1] for row in rows if row[0] == '小学校')
+        junior_high_district_names = set(row[1] for row in rows if row[0] == '中学校')
+
+        school_query = """
             SELECT name, address, admin_type_name,
                 ST_Distance(
                     location::geography,
-                    ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography
+                    ST_SetSRID(ST_MakePoint($1, $2), 4326)::geography
                 ) as distance_m
             FROM m_schools
-            WHERE school_type = %s
+            WHERE school_type = $3
             ORDER BY distance_m
-            LIMIT %s
-        """, (lng, lat, SCHOOL_TYPE_CODES['elementary'], limit))
-
-        elementary_candidates = []
-        for row in cur.fetchall():
-            name, address, admin_type, distance_m = row
-            distance_m = int(distance_m)
-            elementary_candidates.append(SchoolCandidate(
-                school_name=name, address=address, admin_type=admin_type,
-                distance_meters=distance_m,
-                walk_minutes=calc_walk_minutes(distance_m),
-                is_in_district=name in elementary_district_names
-            ))
-
-        cur.execute("""
-            SELECT name, address, admin_type_name,
-                ST_Distance(
-                    location::geography,
-                    ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography
-                ) as distance_m
-            FROM m_schools
-            WHERE school_type = %s
-            ORDER BY distance_m
-            LIMIT %s
-        """, (lng, lat, SCHOOL_TYPE_CODES['junior_high'], limit))
-
-        junior_high_candidates = []
-        for row in cur.fetchall():
-            name, address, admin_type, distance_m = row
-            distance_m = int(distance_m)
-            junior_high_candidates.append(SchoolCandidate(
-                school_name=name, address=address, admin_type=admin_type,
-                distance_meters=distance_m,
-                walk_minutes=calc_walk_minutes(distance_m),
-                is_in_district=name in junior_high_district_names
-            ))
-
-        elementary_candidates.sort(key=lambda x: (not x.is_in_district, x.distance_meters))
-        junior_high_candidates.sort(key=lambda x: (not x.is_in_district, x.distance_meters))
-
-        return SchoolDistrictsResponse(
-            elementary=elementary_candidates,
-            junior_high=junior_high_candidates,
-            latitude=lat, longitude=lng
-        )
-
-    finally:
-        cur.close()
-        conn.close()
+            LIMIT $4
+        """
+        elementary_rows = await conn.fetch(school_query, lng, lat, SCHOOL_TYPE_CODES['elementary'], limit)
+        junior_high_rows = await conn.fetch(school_query, lng, lat, SCHOOL_TYPE_CODES['junior_high'], limit)
+
+    elementary_candidates = []
+    for row in elementary_rows:
+        name, address, admin_type, distance_m = row
+        distance_m = int(distance_m)
+        elementary_candidates.append(SchoolCandidate(
+            school_name=name, address=address, admin_type=admin_type,
+            distance_meters=distance_m,
+            walk_minutes=calc_walk_minutes(distance_m),
+            is_in_district=name in elementary_district_names
+        ))
+
+    junior_high_candidates = []
+    for row in junior_high_rows:
+        name, address, admin_type, distance_m = row
+        distance_m = int(distance_m)
+        junior_high_candidates.append(SchoolCandidate(
+            school_name=name, address=address, admin_type=admin_type,
+            distance_meters=distance_m,
+            walk_minutes=calc_walk_minutes(distance_m),
+            is_in_district=name in junior_high_district_names
+        ))
+
+    elementary_candidates.sort(key=lambda x: (not x.is_in_district, x.distance_meters))
+    junior_high_candidates.sort(key=lambda x: (not x.is_in_district, x.distance_meters))
+
+    return SchoolDistrictsResponse(
+        elementary=elementary_candidates,
+        junior_high=junior_high_candidates,
+        latitude=lat, longitude=lng
+    )
 
 
 # =============================================================================
@@ -435,39 +393,30 @@ async def get_nearest_bus_stops(
     limit: int = Query(10, description="最大取得件数", ge=1, le=20)
 ):
     """指定座標から最寄りのバス停を検索"""
-    db = READatabase()
-    conn = db.get_connection()
-    cur = conn.cursor()
-
-    try:
-        cur.execute("""
-            SELECT
-                name, bus_type_name, operators, bus_routes,
-                ST_Distance(
-                    location::geography,
-                    ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography
-                ) as distance_m
-            FROM m_bus_stops
-            ORDER BY distance_m
-            LIMIT %s
-        """, (lng, lat, limit))
-
-        bus_stops = []
-        for row in cur.fetchall():
-            name, bus_type, operators, routes, distance_m = row
-            distance_m = int(distance_m)
-            bus_stops.append(BusStopCandidate(
-                name=name, bus_type=bus_type,
-                operators=operators or [], routes=routes or [],
-                distance_meters=distance_m,
-                walk_minutes=calc_walk_minutes(distance_m)
-            ))
-
-        return NearestBusStopsResponse(bus_stops=bus_stops, latitude=lat, longitude=lng)
-
-    finally:
-        cur.close()
-        conn.close()
+    rows = await AsyncREADatabase.fetch("""
+        SELECT
+            name, bus_type_name, operators, bus_routes,
+            ST_Distance(
+                location::geography,
+                ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography
+            ) as distance_m
+        FROM m_bus_stops
+        ORDER BY distance_m
+        LIMIT %s
+    """, lng, lat, limit)
+
+    bus_stops = []
+    for row in rows:
+        name, bus_type, operators, routes, distance_m = row
+        distance_m = int(distance_m)
+        bus_stops.append(BusStopCandidate(
+            name=name, bus_type=bus_type,
+            operators=operators or [], routes=routes or [],
+            distance_meters=distance_m,
+            walk_minutes=calc_walk_minutes(distance_m)
+        ))
+
+    return NearestBusStopsResponse(bus_stops=bus_stops, latitude=lat, longitude=lng)
 
 
 # =============================================================================
@@ -482,51 +431,42 @@ async def get_nearest_facilities(
     limit: int = Query(10, description="最大取得件数", ge=1, le=50)
 ):
     """指定座標から最寄りの施設を検索"""
-    db = READatabase()
-    conn = db.get_connection()
-    cur = conn.cursor()
-
-    try:
-        category_filter = ""
-        params = [lng, lat]
-        if category:
-            category_filter = "AND category_code = %s"
-            params.append(category)
-        params.append(limit)
-
-        cur.execute("""
-            SELECT
-                id, name, category_code, address,
-                ST_Distance(
-                    location::geography,
-                    ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography
-                ) as distance_m
-            FROM m_facilities
-            WHERE location IS NOT NULL
-            {}
-            ORDER BY distance_m
-            LIMIT %s
-        """.format(category_filter), params)
-
-        categories = get_facility_categories()
-        facilities = []
-        for row in cur.fetchall():
-            fac_id, name, cat_code, address, distance_m = row
-            distance_m = int(distance_m)
-            facilities.append(FacilityCandidate(
-                id=fac_id, name=name,
-                category_code=cat_code,
-                category_name=categories.get(cat_code, {}).get('name', cat_code),
-                address=address,
-                distance_meters=distance_m,
-                walk_minutes=calc_walk_minutes(distance_m)
-            ))
-
-        return NearestFacilitiesResponse(facilities=facilities, latitude=lat, longitude=lng)
-
-    finally:
-        cur.close()
-        conn.close()
+    category_filter = ""
+    params = [lng, lat]
+    if category:
+        category_filter = "AND category_code = %s"
+        params.append(category)
+    params.append(limit)
+
+    rows = await AsyncREADatabase.fetch("""
+        SELECT
+            id, name, category_code, address,
+            ST_Distance(
+                location::geography,
+                ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography
+            ) as distance_m
+        FROM m_facilities
+        WHERE location IS NOT NULL
+        {}
+        ORDER BY distance_m
+        LIMIT %s
+    """.format(category_filter), *params)
+
+    categories = await get_facility_categories()
+    facilities = []
+    for row in rows:
+        fac_id, name, cat_code, address, distance_m = row
+        distance_m = int(distance_m)
+        facilities.append(FacilityCandidate(
+            id=fac_id, name=name,
+            category_code=cat_code,
+            category_name=categories.get(cat_code, {}).get('name', cat_code),
+            address=address,
+            distance_meters=distance_m,
+            walk_minutes=calc_walk_minutes(distance_m)
+        ))
+
+    return NearestFacilitiesResponse(facilities=facilities, latitude=lat, longitude=lng)
 
 
 @router.get("/nearest-facilities-by-category")
@@ -536,31 +476,27 @@ async def get_nearest_facilities_by_category(
     limit_per_category: int = Query(3, description="カテゴリごとの取得件数", ge=1, le=10)
 ):
     """指定座標から各カテゴリごとに最寄りの施設を検索"""
-    db = READatabase()
-    conn = db.get_connection()
-    cur = conn.cursor()
-
-    try:
-        categories = get_facility_categories()
-        result = {}
+    categories = await get_facility_categories()
+    result = {}
 
+    async with AsyncREADatabase.connection() as conn:
         for cat_code, cat_info in categories.items():
-            cur.execute("""
+            rows = await conn.fetch("""
                 SELECT
                     id, name, address,
                     ST_Distance(
                         location::geography,
-                        ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography
+                        ST_SetSRID(ST_MakePoint($1, $2), 4326)::geography
                     ) as distance_m
                 FROM m_facilities
                 WHERE location IS NOT NULL
-                AND category_code = %s
+                AND category_code = $3
                 ORDER BY distance_m
-                LIMIT %s
-            """, (lng, lat, cat_code, limit_per_category))
+                LIMIT $4
+            """, lng, lat, cat_code, limit_per_category)
 
             facilities = []
-            for row in cur.fetchall():
+            for row in rows:
                 fac_id, name, address, distance_m = row
                 distance_m = int(distance_m)
                 facilities.append({
@@ -576,11 +512,7 @@ async def get_nearest_facilities_by_category(
                     'facilities': facilities
                 }
 
-        return {'latitude': lat, 'longitude': lng, 'categories': result}
-
-    finally:
-        cur.close()
-        conn.close()
+    return {'latitude': lat, 'longitude': lng, 'categories': result}
 
 
 # =============================================================================
@@ -593,35 +525,26 @@ async def get_zoning(
     lng: float = Query(..., description="経度", ge=-180, le=180)
 ):
     """指定座標の用途地域を判定"""
-    db = READatabase()
-    conn = db.get_connection()
-    cur = conn.cursor()
-
-    try:
-        cur.execute("""
-            SELECT
-                zone_code, zone_name, building_coverage_ratio,
-                floor_area_ratio, city_name,
-                ST_Area(geom::geography) as area_sq_m
-            FROM m_zoning
-            WHERE ST_Contains(geom, ST_SetSRID(ST_MakePoint(%s, %s), 4326))
-            ORDER BY area_sq_m DESC
-        """, (lng, lat))
-
-        zones = []
-        for i, row in enumerate(cur.fetchall()):
-            zone_code, zone_name, bcr, far, city_name, _ = row
-            zones.append(ZoningCandidate(
-                zone_code=zone_code, zone_name=zone_name,
-                building_coverage_ratio=bcr, floor_area_ratio=far,
-                city_name=city_name, is_primary=(i == 0)
-            ))
-
-        return ZoningResponse(zones=zones, latitude=lat, longitude=lng)
-
-    finally:
-        cur.close()
-        conn.close()
+    rows = await AsyncREADatabase.fetch("""
+        SELECT
+            zone_code, zone_name, building_coverage_ratio,
+            floor_area_ratio, city_name,
+            ST_Area(geom::geography) as area_sq_m
+        FROM m_zoning
+        WHERE ST_Contains(geom, ST_SetSRID(ST_MakePoint(%s, %s), 4326))
+        ORDER BY area_sq_m DESC
+    """, lng, lat)
+
+    zones = []
+    for i, row in enumerate(rows):
+        zone_code, zone_name, bcr, far, city_name, _ = row
+        zones.append(ZoningCandidate(
+            zone_code=zone_code, zone_name=zone_name,
+            building_coverage_ratio=bcr, floor_area_ratio=far,
+            city_name=city_name, is_primary=(i == 0)
+        ))
+
+    return ZoningResponse(zones=zones, latitude=lat, longitude=lng)
 
 
 @router.get("/zoning/geojson")
@@ -633,42 +556,33 @@ async def get_zoning_geojson(
     simplify: float = Query(0.0001, description="ポリゴン簡略化の許容誤差（度）")
 ):
     """指定範囲内の用途地域ポリゴンをGeoJSON形式で返す"""
-    db = READatabase()
-    conn = db.get_connection()
-    cur = conn.cursor()
-
-    try:
-        cur.execute("""
-            SELECT
-                id, zone_code, zone_name,
-                building_coverage_ratio, floor_area_ratio, city_name,
-                ST_AsGeoJSON(ST_Simplify(geom, %s)) as geojson
-            FROM m_zoning
-            WHERE geom && ST_MakeEnvelope(%s, %s, %s, %s, 4326)
-            LIMIT 5000
-        """, (simplify, min_lng, min_lat, max_lng, max_lat))
-
-        features = []
-        for row in cur.fetchall():
-            zoning_id, zone_code, zone_name, bcr, far, city_name, geojson_str = row
-            if geojson_str:
-                geometry = json.loads(geojson_str)
-                features.append({
-                    "type": "Feature",
-                    "properties": {
-                        "id": zoning_id, "zone_code": zone_code,
-                        "zone_name": zone_name,
-                        "building_coverage_ratio": bcr,
-                        "floor_area_ratio": far, "city_name": city_name
-                    },
-                    "geometry": geometry
-                })
-
-        return {"type": "FeatureCollection", "features": features}
-
-    finally:
-        cur.close()
-        conn.close()
+    rows = await AsyncREADatabase.fetch("""
+        SELECT
+            id, zone_code, zone_name,
+            building_coverage_ratio, floor_area_ratio, city_name,
+            ST_AsGeoJSON(ST_Simplify(geom, %s)) as geojson
+        FROM m_zoning
+        WHERE geom && ST_MakeEnvelope(%s, %s, %s, %s, 4326)
+        LIMIT 5000
+    """, simplify, min_lng, min_lat, max_lng, max_lat)
+
+    features = []
+    for row in rows:
+        zoning_id, zone_code, zone_name, bcr, far, city_name, geojson_str = row
+        if geojson_str:
+            geometry = json.loads(geojson_str)
+            features.append({
+                "type": "Feature",
+                "properties": {
+                    "id": zoning_id, "zone_code": zone_code,
+                    "zone_name": zone_name,
+                    "building_coverage_ratio": bcr,
+                    "floor_area_ratio": far, "city_name": city_name
+                },
+                "geometry": geometry
+            })
+
+    return {"type": "FeatureCollection", "features": features}
 
 
 @router.get("/zoning/legend")
@@ -702,32 +616,23 @@ async def get_urban_planning(
     lng: float = Query(..., description="経度", ge=-180, le=180)
 ):
     """指定座標の都市計画区域を判定"""
-    db = READatabase()
-    conn = db.get_connection()
-    cur = conn.cursor()
-
-    try:
-        cur.execute("""
-            SELECT
-                layer_no, area_type,
-                ST_Area(geom::geography) as area_sq_m
-            FROM m_urban_planning
-            WHERE ST_Contains(geom, ST_SetSRID(ST_MakePoint(%s, %s), 4326))
-            ORDER BY layer_no ASC, area_sq_m ASC
-        """, (lng, lat))
+    rows = await AsyncREADatabase.fetch("""
+        SELECT
+            layer_no, area_type,
+            ST_Area(geom::geography) as area_sq_m
+        FROM m_urban_planning
+        WHERE ST_Contains(geom, ST_SetSRID(ST_MakePoint(%s, %s), 4326))
+        ORDER BY layer_no ASC, area_sq_m ASC
+    """, lng, lat)
 
-        areas = []
-        for i, row in enumerate(cur.fetchall()):
-            layer_no, area_type, _ = row
-            areas.append(UrbanPlanningCandidate(
-                layer_no=layer_no, area_type=area_type, is_primary=(i == 0)
-            ))
+    areas = []
+    for i, row in enumerate(rows):
+        layer_no, area_type, _ = row
+        areas.append(UrbanPlanningCandidate(
+            layer_no=layer_no, area_type=area_type, is_primary=(i == 0)
+        ))
 
-        return UrbanPlanningResponse(areas=areas, latitude=lat, longitude=lng)
-
-    finally:
-        cur.close()
-        conn.close()
+    return UrbanPlanningResponse(areas=areas, latitude=lat, longitude=lng)
 
 
 @router.get("/urban-planning/geojson")
@@ -739,36 +644,27 @@ async def get_urban_planning_geojson(
     simplify: float = Query(0.0001, description="ポリゴン簡略化の許容誤差（度）")
 ):
     """指定範囲内の都市計画区域ポリゴンをGeoJSON形式で返す"""
-    db = READatabase()
-    conn = db.get_connection()
-    cur = conn.cursor()
-
-    try:
-        cur.execute("""
-            SELECT
-                id, layer_no, area_type,
-                ST_AsGeoJSON(ST_Simplify(geom, %s)) as geojson
-            FROM m_urban_planning
-            WHERE geom && ST_MakeEnvelope(%s, %s, %s, %s, 4326)
-            LIMIT 3000
-        """, (simplify, min_lng, min_lat, max_lng, max_lat))
-
-        features = []
-        for row in cur.fetchall():
-            plan_id, layer_no, area_type, geojson_str = row
-            if geojson_str:
-                geometry = json.loads(geojson_str)
-                features.append({
-                    "type": "Feature",
-                    "properties": {
-                        "id": plan_id, "layer_no": layer_no,
-                        "area_type": area_type
-                    },
-                    "geometry": geometry
-                })
-
-        return {"type": "FeatureCollection", "features": features}
-
-    finally:
-        cur.close()
-        conn.close()
+    rows = await AsyncREADatabase.fetch("""
+        SELECT
+            id, layer_no, area_type,
+            ST_AsGeoJSON(ST_Simplify(geom, %s)) as geojson
+        FROM m_urban_planning
+        WHERE geom && ST_MakeEnvelope(%s, %s, %s, %s, 4326)
+        LIMIT 3000
+    """, simplify, min_lng, min_lat, max_lng, max_lat)
+
+    features = []
+    for row in rows:
+        plan_id, layer_no, area_type, geojson_str = row
+        if geojson_str:
+            geometry = json.loads(geojson_str)
+            features.append({
+                "type": "Feature",
+                "properties": {
+                    "id": plan_id, "layer_no": layer_no,
+                    "area_type": area_type
+                },
+                "geometry": geometry
+            })
+
+    return {"type": "FeatureCollection", "features": features}
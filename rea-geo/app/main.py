@@ -6,20 +6,36 @@ PostGISを使用した空間検索を提供。
 """
 
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
 from .endpoints import geo
+from shared.async_database import AsyncREADatabase
+from shared.constants import get_config
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """DBコネクションプールの作成・破棄"""
+    await AsyncREADatabase.init_pool()
+    # 定数設定（system_config）は同期ドライバで遅延ロードされるため起動時に読み込む
+    await run_in_threadpool(get_config, "school_type_codes")
+    yield
+    await AsyncREADatabase.close_pool()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version="1.0.0",
     description="REA Geo API - 地理情報サービス（読み取り専用）",
     openapi_url="/api/v1/geo/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS設定（Core APIと同一）
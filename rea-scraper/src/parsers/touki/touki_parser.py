@@ -2,362 +2,29 @@
 登記事項証明書 パーサーモジュール
 抽出したテキストを構造化データに変換
 
+パース処理は shared/touki_parser.py（rea-api と共通）。
+ここでは propertiesテーブル形式への変換を追加する。
+
 対応フォーマット:
 - 登記情報提供サービスからのPDF（罫線テーブル形式）
 - 土地全部事項証明書
 - 建物全部事項証明書
-
-注意事項:
-- PDFテキスト抽出では下線情報が失われるため、抹消事項の判別は不可
-- 履歴がある場合は最新の情報を抽出
 """
-import re
-from typing import Optional, Dict, Any, List
+import sys
 from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any
 
-try:
-    from loguru import logger
-except ImportError:
-    import logging
-    logger = logging.getLogger(__name__)
-
-
-class ToukiParser:
-    """登記事項証明書テキストをパースして構造化データに変換"""
-
-    def __init__(self):
-        # 全角→半角変換テーブル
-        self.zenkaku_to_hankaku = str.maketrans(
-            '０１２３４５６７８９：．，',
-            '0123456789:.,'
-        )
-
-    def normalize(self, text: str) -> str:
-        """全角数字を半角に変換"""
-        return text.translate(self.zenkaku_to_hankaku)
-
-    def parse(self, raw_text: str) -> Dict[str, Any]:
-        """
-        生テキストをパースして構造化データに変換
-
-        Args:
-            raw_text: PDFから抽出した生テキスト
-
-        Returns:
-            構造化されたデータ（JSON形式）
-        """
-        if not raw_text:
-            return {'error': 'Empty text', 'parsed_at': datetime.now().isoformat()}
-
-        result = {
-            'document_type': self._detect_document_type(raw_text),
-            'real_estate_number': self._extract_real_estate_number(raw_text),
-            'land_info': {},
-            'building_info': {},
-            'owner_info': {},
-            'mortgage_info': [],
-            'parsed_at': datetime.now().isoformat(),
-            'confidence': 0.0,
-        }
-
-        try:
-            # 土地情報の抽出
-            if result['document_type'] in ['land', 'both']:
-                result['land_info'] = self._extract_land_info(raw_text)
-
-            # 建物情報の抽出
-            if result['document_type'] in ['building', 'both']:
-                result['building_info'] = self._extract_building_info(raw_text)
-
-            # 所有者情報の抽出（甲区から）
-            result['owner_info'] = self._extract_owner_info(raw_text)
-
-            # 抵当権情報の抽出（乙区から）
-            result['mortgage_info'] = self._extract_mortgage_info(raw_text)
-
-            # 信頼度の計算
-            result['confidence'] = self._calculate_confidence(result)
-
-            logger.info(f"Parsed: type={result['document_type']}, confidence={result['confidence']:.2f}")
-
-        except Exception as e:
-            logger.error(f"Error parsing text: {e}")
-            result['error'] = str(e)
-
-        return result
-
-    def _detect_document_type(self, text: str) -> str:
-        """登記の種類を判定（土地/建物/両方）"""
-        has_land = '土地の表示' in text
-        has_building = '建物の表示' in text or '主である建物の表示' in text
-
-        if has_land and has_building:
-            return 'both'
-        elif has_building:
-            return 'building'
-        elif has_land:
-            return 'land'
-        else:
-            return 'unknown'
-
-    def _extract_real_estate_number(self, text: str) -> Optional[str]:
-        """不動産番号を抽出"""
-        match = re.search(r'不動産番号[│\|]?\s*([０-９\d]+)', text)
-        return self.normalize(match.group(1)) if match else None
-
-    def _extract_land_info(self, text: str) -> Dict[str, Any]:
-        """土地情報を抽出"""
-        info = {}
-
-        # 所在（最新）- 日付情報を除外
-        matches = re.findall(r'所\s*在[│\|]([^│┃\n]+)', text)
-        if matches:
-            for loc in reversed(matches):
-                loc = loc.strip()
-                if loc and not re.search(r'年|月|日|変更|登記', loc):
-                    info['location'] = loc
-                    break
-
-        # 地番 - 最初にマッチしたもの
-        match = re.search(r'([０-９\d]+番[０-９\d]*)\s*│', text)
-        if match:
-            info['lot_number'] = self.normalize(match.group(1))
-
-        # 地目（最新）- 最後にマッチしたものを使用
-        land_categories = ['宅地', '畑', '田', '山林', '原野', '雑種地', '公衆用道路', '墓地', '池沼']
-        for cat in land_categories:
-            # │宅地│ または │ 宅地 │ のパターン
-            if f'│{cat}' in text or f'│ {cat}' in text:
-                # 最後に出現したものを採用
-                last_pos = max(text.rfind(f'│{cat}'), text.rfind(f'│ {cat}'))
-                if last_pos > info.get('_cat_pos', -1):
-                    info['land_category'] = cat
-                    info['_cat_pos'] = last_pos
-        # 一時的なキーを削除
-        info.pop('_cat_pos', None)
-
-        # 地積: │ 数字：数字 │ パターン
-        area_matches = re.findall(r'│\s*([０-９\d]+)[：:]([０-９\d]+)\s*│', text)
-        if area_matches:
-            # 最後のマッチを使用（最新の地積）
-            whole, decimal = area_matches[-1]
-            area = float(self.normalize(whole)) + float(self.normalize(decimal)) / 100
-            info['land_area_m2'] = round(area, 2)
-        else:
-            # │ 数字： │ のパターン（小数点以下なし）
-            area_match = re.search(r'│\s*([０-９\d]+)[：:]\s*│', text)
-            if area_match:
-                info['land_area_m2'] = float(self.normalize(area_match.group(1)))
-
-        return info
-
-    def _extract_building_info(self, text: str) -> Dict[str, Any]:
-        """建物情報を抽出"""
-        info = {}
+# パス設定（shared を import するため）
+project_root = Path(__file__).resolve().parents[4]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-        # 所在
-        matches = re.findall(r'所\s*在[│\|]([^│┃\n]+)', text)
-        if matches:
-            for loc in reversed(matches):
-                loc = loc.strip()
-                if loc and not re.search(r'年|月|日|変更|登記', loc):
-                    info['location'] = loc
-                    break
+from shared.touki_parser import ToukiParser as BaseToukiParser
 
-        # 家屋番号
-        match = re.search(r'家屋番号[│\|]\s*([^│┃\n]+)', text)
-        if match:
-            info['building_number'] = self.normalize(match.group(1).strip())
 
-        # 種類
-        building_types = ['居宅', '共同住宅', '店舗', '事務所', '倉庫', '工場', '車庫']
-        for bt in building_types:
-            if bt in text:
-                info['building_type'] = bt
-                break
-
-        # 構造: │木造...階│ + 「建」
-        match = re.search(r'│(木造[^│\n]+階)', text)
-        if match:
-            structure = match.group(1)
-            # 「建」が含まれていなければ追加
-            if not structure.endswith('建'):
-                structure += '建'
-            info['structure'] = structure
-        else:
-            # 鉄骨造、鉄筋コンクリート造なども対応
-            match = re.search(r'│((?:鉄骨|鉄筋コンクリート|鉄骨鉄筋コンクリート)[^│\n]+階)', text)
-            if match:
-                structure = match.group(1)
-                if not structure.endswith('建'):
-                    structure += '建'
-                info['structure'] = structure
-
-        # 床面積: X階 数字：数字
-        floor_matches = re.findall(r'([１２３４５６７８９\d]+)階\s*([０-９\d]+)[：:]([０-９\d]+)', text)
-        if floor_matches:
-            floor_areas = {}
-            total = 0.0
-            for floor, whole, decimal in floor_matches:
-                floor_num = int(self.normalize(floor))
-                area = float(self.normalize(whole)) + float(self.normalize(decimal)) / 100
-                floor_areas[f'floor_{floor_num}'] = round(area, 2)
-                total += area
-            info['floor_areas'] = floor_areas
-            info['total_floor_area_m2'] = round(total, 2)
-
-        # 新築年月日
-        match = re.search(r'(明治|大正|昭和|平成|令和)([０-９\d]+)年([０-９\d]+)月([０-９\d]+)日新築', text)
-        if match:
-            era, year, month, day = match.groups()
-            info['construction_date'] = self._convert_japanese_date(era, year, month, day)
-
-        return info
-
-    def _extract_owner_info(self, text: str) -> Dict[str, Any]:
-        """所有者情報を抽出（甲区から最新の所有者）"""
-        info = {}
-
-        # 行ごとに処理して所有者情報を抽出
-        # パターン1: 所有者 住所 ┃ → 次行に名前
-        # パターン2: 所有者 住所 ┃ → 住所続き → 名前（複数行にまたがる場合）
-        owner_blocks = []
-        lines = text.split('\n')
-
-        for i, line in enumerate(lines):
-            # 「登記名義人」は除外（注釈文）
-            if '所有者' in line and '登記名義人' not in line:
-                # 住所を抽出
-                addr_match = re.search(r'所有者\s+([^┃\n]+)', line)
-                if addr_match:
-                    address = addr_match.group(1).strip().rstrip('│')
-                    # 次の数行から名前を探す（住所が複数行にまたがる場合対応）
-                    for offset in range(1, 4):
-                        if i + offset >= len(lines):
-                            break
-                        check_line = lines[i + offset]
-                        # 名前パターン: │...┃ または行全体が名前┃
-                        name_match = re.search(r'[│┃]\s*([^│┃\d０-９\n]{2,})\s*┃', check_line)
-                        if not name_match:
-                            # 行末が┃で、漢字名前がある場合
-                            name_match = re.search(r'^\s*([^\d０-９│┃\n]{2,})\s*┃$', check_line)
-                        if name_match:
-                            name = re.sub(r'\s+', '', name_match.group(1).strip())
-                            # 名前らしいか判定（2文字以上の非数字で、登記関連用語でない）
-                            skip_words = ['移記', '登記', '原因', '売買', '相続', '平成', '昭和', '令和', '順位']
-                            if name and len(name) >= 2 and not any(w in name for w in skip_words):
-                                owner_blocks.append({
-                                    'address': address,
-                                    'name': name
-                                })
-                                break
-
-        # 最後（最新）の所有者を使用
-        if owner_blocks:
-            latest = owner_blocks[-1]
-            info['owner_address'] = latest['address']
-            info['owner_name'] = latest['name']
-
-        return info
-
-    def _extract_mortgage_info(self, text: str) -> List[Dict[str, Any]]:
-        """抵当権情報を抽出（乙区）"""
-        mortgages = []
-
-        # 抵当権設定のパターン
-        if '抵当権設定' not in text:
-            return mortgages
-
-        # 債権額を抽出
-        amount_matches = re.findall(r'債権額\s*金([０-９\d,，]+)万?円', text)
-        holder_matches = re.findall(r'抵当権者\s+([^\n│┃]+)', text)
-
-        for i, amount_str in enumerate(amount_matches):
-            amount_str = self.normalize(amount_str).replace(',', '')
-            amount = int(amount_str)
-            # 万円の場合は10000倍
-            # （テキスト内で「万円」が金額の後にあるかで判断）
-
-            mortgage = {
-                'type': '抵当権',
-                'amount': amount,
-            }
-
-            if i < len(holder_matches):
-                mortgage['holder'] = holder_matches[i].strip()
-
-            mortgages.append(mortgage)
-
-        return mortgages
-
-    def _convert_japanese_date(self, era: str, year: str, month: str, day: str) -> str:
-        """和暦を西暦に変換"""
-        era_start = {
-            '明治': 1868,
-            '大正': 1912,
-            '昭和': 1926,
-            '平成': 1989,
-            '令和': 2019,
-        }
-
-        year_num = int(self.normalize(year))
-        month_num = int(self.normalize(month))
-        day_num = int(self.normalize(day))
-
-        western_year = era_start.get(era, 1900) + year_num - 1
-
-        return f"{western_year}-{month_num:02d}-{day_num:02d}"
-
-    def _calculate_confidence(self, result: Dict) -> float:
-        """パース結果の信頼度を計算（0.0-1.0）"""
-        score = 0.0
-        max_score = 0.0
-
-        # 不動産番号
-        max_score += 1
-        if result.get('real_estate_number'):
-            score += 1
-
-        # 土地情報のスコア
-        if result['document_type'] in ['land', 'both']:
-            max_score += 4
-            land = result.get('land_info', {})
-            if land.get('location'):
-                score += 1
-            if land.get('lot_number'):
-                score += 1
-            if land.get('land_category'):
-                score += 1
-            if land.get('land_area_m2'):
-                score += 1
-
-        # 建物情報のスコア
-        if result['document_type'] in ['building', 'both']:
-            max_score += 5
-            building = result.get('building_info', {})
-            if building.get('location'):
-                score += 1
-            if building.get('building_number'):
-                score += 1
-            if building.get('building_type'):
-                score += 1
-            if building.get('structure'):
-                score += 1
-            if building.get('total_floor_area_m2'):
-                score += 1
-
-        # 所有者情報
-        max_score += 2
-        owner = result.get('owner_info', {})
-        if owner.get('owner_name'):
-            score += 1
-        if owner.get('owner_address'):
-            score += 1
-
-        if max_score == 0:
-            return 0.0
-
-        return round(score / max_score, 2)
+class ToukiParser(BaseToukiParser):
+    """登記事項証明書テキストをパースして構造化データに変換"""
 
     def to_property_data(self, parsed_data: Dict) -> Dict[str, Any]:
         """
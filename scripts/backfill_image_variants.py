@@ -0,0 +1,88 @@
+"""
+物件画像の派生画像（サムネイル・中・大 + WebP）の一括生成
+
+マイグレーション 2026-10-18_property_images_variants.sql 適用後に実行する。
+variants が未生成の画像のみ対象（--force で全件の variants を作り直し）。
+派生画像のファイル名にはサイズ・画質が入るため、--force でも既存のファイルは上書きしない
+（内容アドレスの画像は immutable で長期キャッシュされる）。サイズ・画質を変えた場合は新しい名前で作成される。
+
+使用方法:
+PYTHONPATH=. python3 scripts/backfill_image_variants.py [--batch-size 100] [--workers 4] [--force]
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "rea-api"))
+
+from sqlalchemy import text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="物件画像の派生画像の一括生成")
+    parser.add_argument("--batch-size", type=int, default=100, help="1トランザクションあたりの件数")
+    parser.add_argument("--workers", type=int, help="画像処理のプロセス数（既定: IMAGE_PROCESS_WORKERS）")
+    parser.add_argument("--force", action="store_true", help="生成済みの画像も variants を作り直す（既存ファイルは上書きしない）")
+    args = parser.parse_args()
+
+    if args.workers:
+        os.environ["IMAGE_PROCESS_WORKERS"] = str(args.workers)
+
+    from app.api.api_v1.endpoints.images import UPLOAD_ROOT
+    from app.core.database import SessionLocal
+    from app.utils.image_processor import image_processor
+
+    db = SessionLocal()
+    try:
+        rows = db.execute(text(f"""
+            SELECT id, file_path
+            FROM property_images
+            WHERE deleted_at IS NULL
+              AND file_path IS NOT NULL
+              {"" if args.force else "AND variants IS NULL"}
+            ORDER BY id
+        """)).fetchall()
+        print(f"対象: {len(rows)}件")
+
+        generated = 0
+        failed = []
+        for start in range(0, len(rows), args.batch_size):
+            batch = rows[start:start + args.batch_size]
+            ids_by_path = {}
+            for row in batch:
+                ids_by_path.setdefault(row.file_path, []).append(row.id)
+
+            updates = []
+            for path, variants, error in image_processor.process_many(UPLOAD_ROOT, ids_by_path):
+                if error is not None:
+                    failed.extend((image_id, error) for image_id in ids_by_path[path])
+                    continue
+                updates.extend({"id": image_id, "variants": json.dumps(variants)} for image_id in ids_by_path[path])
+
+            if updates:
+                db.execute(
+                    text("UPDATE property_images SET variants = CAST(:variants AS jsonb) WHERE id = :id"),
+                    updates,
+                )
+                db.commit()
+            generated += len(updates)
+            print(f"  {start + len(batch)}/{len(rows)} 件処理（生成 {generated}件, 失敗 {len(failed)}件）")
+
+        for image_id, error in failed:
+            print(f"  失敗 id={image_id}: {error}")
+        print(f"完了: {generated}件生成, {len(failed)}件失敗")
+        return 1 if failed else 0
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+        image_processor.shutdown()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+物件検索ドキュメント（properties.search_text）の一括作成
+
+マイグレーション 2026-10-18_properties_search_text.sql 適用後に実行する。
+正規化ルールを変更した場合も再実行すれば差分のみ更新される。
+
+使用方法:
+PYTHONPATH=. python3 scripts/backfill_property_search_text.py [--batch-size 1000]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "rea-api"))
+
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+from app.services.property_search import refresh_search_documents
+
+
+def main():
+    parser = argparse.ArgumentParser(description="物件検索ドキュメントの一括作成")
+    parser.add_argument("--batch-size", type=int, default=1000, help="1トランザクションあたりの件数")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        ids = [row.id for row in db.execute(text("SELECT id FROM properties ORDER BY id"))]
+        print(f"対象: {len(ids)}件")
+
+        updated = 0
+        for start in range(0, len(ids), args.batch_size):
+            batch = ids[start:start + args.batch_size]
+            updated += refresh_search_documents(db, batch)
+            db.commit()
+            print(f"  {start + len(batch)}/{len(ids)} 件処理（更新 {updated}件）")
+
+        print(f"完了: {updated}件更新")
+        return 0
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+登記レコード検索キー（touki_records.lot_number_key / location_key / owner_names）の一括作成
+
+マイグレーション 2026-10-18_touki_records_search.sql 適用後に実行する。
+正規化ルールを変更した場合も再実行すれば差分のみ更新される。
+
+使用方法:
+PYTHONPATH=. python3 scripts/backfill_touki_search_keys.py [--batch-size 1000]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "rea-api"))
+
+from app.services.touki_search import refresh_search_keys
+from shared.database import READatabase
+
+
+def main():
+    parser = argparse.ArgumentParser(description="登記レコード検索キーの一括作成")
+    parser.add_argument("--batch-size", type=int, default=1000, help="1トランザクションあたりの件数")
+    args = parser.parse_args()
+
+    with READatabase.cursor() as (cur, conn):
+        cur.execute("SELECT id FROM touki_records ORDER BY id")
+        ids = [row[0] for row in cur.fetchall()]
+    print(f"対象: {len(ids)}件")
+
+    updated = 0
+    for start in range(0, len(ids), args.batch_size):
+        batch = ids[start:start + args.batch_size]
+        with READatabase.cursor(commit=True) as (cur, conn):
+            updated += refresh_search_keys(cur, batch)
+        print(f"  {start + len(batch)}/{len(ids)} 件処理（更新 {updated}件）")
+
+    print(f"完了: {updated}件更新")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+GenericCRUD.get_full ベンチマーク
+
+複合クエリ（composite=True）と従来の個別クエリ（composite=False）を比較する。
+- 1回あたりの平均時間・p95
+- 1回あたりのSQL実行回数（ラウンドトリップ数）
+- 両モードの結果が一致するか
+
+使用方法:
+PYTHONPATH=. python3 scripts/benchmark_get_full.py [--ids 1,2,3] [--sample 50] [--repeat 5]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "rea-api"))
+
+from sqlalchemy import event, text
+
+from app.core.database import SessionLocal, engine
+from app.crud.generic import GenericCRUD
+from shared.schema_registry import schema_registry
+
+
+class StatementCounter:
+    """SQLAlchemyエンジンで実行されたSQL文を数える"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def pick_ids(db, sample: int):
+    """ベンチマーク対象の物件IDを取得（関連テーブルありを優先）"""
+    result = db.execute(text("""
+        SELECT p.id
+        FROM properties p
+        WHERE p.deleted_at IS NULL
+        ORDER BY
+            (EXISTS (SELECT 1 FROM property_images pi WHERE pi.property_id = p.id)) DESC,
+            p.id DESC
+        LIMIT :limit
+    """), {"limit": sample})
+    return [row.id for row in result]
+
+
+def run_mode(crud, ids, composite: bool, repeat: int, counter: StatementCounter):
+    """指定モードで全IDをrepeat回取得し、計測値を返す"""
+    timings = []
+    counter.count = 0
+    for _ in range(repeat):
+        for property_id in ids:
+            start = time.perf_counter()
+            crud.get_full(property_id, composite=composite)
+            timings.append((time.perf_counter() - start) * 1000)
+    calls = repeat * len(ids)
+    return {
+        "mean_ms": statistics.mean(timings),
+        "p95_ms": sorted(timings)[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0],
+        "statements_per_call": counter.count / calls,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="get_full ベンチマーク")
+    parser.add_argument("--ids", help="対象物件ID（カンマ区切り）")
+    parser.add_argument("--sample", type=int, default=50, help="自動選択する物件数")
+    parser.add_argument("--repeat", type=int, default=5, help="繰り返し回数")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    counter = StatementCounter()
+    try:
+        ids = [int(x) for x in args.ids.split(",")] if args.ids else pick_ids(db, args.sample)
+        if not ids:
+            print("対象物件がありません")
+            return 1
+
+        crud = GenericCRUD(db)
+        # スキーマレジストリのロードは計測から除外
+        schema_registry.refresh(db)
+
+        # 結果一致チェック
+        mismatched = [
+            pid for pid in ids
+            if crud.get_full(pid, composite=True) != crud.get_full(pid, composite=False)
+        ]
+
+        event.listen(engine, "before_cursor_execute", counter)
+        legacy = run_mode(crud, ids, composite=False, repeat=args.repeat, counter=counter)
+        composite = run_mode(crud, ids, composite=True, repeat=args.repeat, counter=counter)
+        event.remove(engine, "before_cursor_execute", counter)
+
+        print(f"対象: {len(ids)}件 × {args.repeat}回")
+        print(f"{'mode':<12}{'mean(ms)':>10}{'p95(ms)':>10}{'SQL/call':>10}")
+        for name, r in (("legacy", legacy), ("composite", composite)):
+            print(f"{name:<12}{r['mean_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['statements_per_call']:>10.1f}")
+        print(f"速度比: {legacy['mean_ms'] / composite['mean_ms']:.2f}x")
+
+        if mismatched:
+            print(f"結果不一致: {mismatched}")
+            return 1
+        print("結果一致: OK")
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
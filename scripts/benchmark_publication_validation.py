@@ -0,0 +1,130 @@
+"""
+公開時バリデーション ベンチマーク
+
+validate_for_publication を以下の2モードで比較する。
+- uncached: 毎回ルールキャッシュを無効化（master_options読み込み + ルールのコンパイル込み）
+- cached:   コンパイル済みルールを使用（DBアクセスなし）
+
+- 1回あたりの平均時間・p95
+- 1回あたりのSQL実行回数（cached で SQL が発生したら回帰として終了コード1）
+- 両モードの結果が一致するか
+
+使用方法:
+PYTHONPATH=. python3 scripts/benchmark_publication_validation.py [--ids 1,2,3] [--sample 50] [--repeat 5] [--status 公開]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "rea-api"))
+
+from sqlalchemy import event, text
+
+from app.core.database import SessionLocal, engine
+from app.crud.generic import GenericCRUD
+from app.services.publication_validator import publication_rules, validate_for_publication
+from shared.schema_registry import schema_registry
+
+
+class StatementCounter:
+    """SQLAlchemyエンジンで実行されたSQL文を数える"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def pick_ids(db, sample: int):
+    """ベンチマーク対象の物件IDを取得（物件種別が異なるものを混ぜる）"""
+    result = db.execute(text("""
+        SELECT id
+        FROM (
+            SELECT p.id, ROW_NUMBER() OVER (PARTITION BY p.property_type ORDER BY p.id DESC) AS rn
+            FROM properties p
+            WHERE p.deleted_at IS NULL AND p.property_type IS NOT NULL
+        ) t
+        ORDER BY rn, id DESC
+        LIMIT :limit
+    """), {"limit": sample})
+    return [row.id for row in result]
+
+
+def run_mode(db, dataset, status: str, cached: bool, repeat: int, counter: StatementCounter):
+    """指定モードで全物件をrepeat回検証し、計測値と結果を返す"""
+    timings = []
+    results = {}
+    counter.count = 0
+    for _ in range(repeat):
+        for property_id, data in dataset:
+            if not cached:
+                publication_rules.invalidate()
+            start = time.perf_counter()
+            results[property_id] = validate_for_publication(db, data, status)
+            timings.append((time.perf_counter() - start) * 1000)
+    calls = repeat * len(dataset)
+    return {
+        "mean_ms": statistics.mean(timings),
+        "p95_ms": sorted(timings)[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0],
+        "statements_per_call": counter.count / calls,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="公開時バリデーション ベンチマーク")
+    parser.add_argument("--ids", help="対象物件ID（カンマ区切り）")
+    parser.add_argument("--sample", type=int, default=50, help="自動選択する物件数")
+    parser.add_argument("--repeat", type=int, default=5, help="繰り返し回数")
+    parser.add_argument("--status", default="公開", help="検証する公開ステータス")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    counter = StatementCounter()
+    try:
+        ids = [int(x) for x in args.ids.split(",")] if args.ids else pick_ids(db, args.sample)
+        if not ids:
+            print("対象物件がありません")
+            return 1
+
+        # 物件データの取得・スキーマレジストリのロードは計測から除外
+        schema_registry.refresh(db)
+        crud = GenericCRUD(db)
+        dataset = [(pid, data) for pid in ids if (data := crud.get_full(pid)) is not None]
+
+        event.listen(engine, "before_cursor_execute", counter)
+        uncached = run_mode(db, dataset, args.status, cached=False, repeat=args.repeat, counter=counter)
+        publication_rules.invalidate()
+        validate_for_publication(db, dataset[0][1], args.status)  # ルールのロード（計測外）
+        cached = run_mode(db, dataset, args.status, cached=True, repeat=args.repeat, counter=counter)
+        event.remove(engine, "before_cursor_execute", counter)
+
+        print(f"対象: {len(dataset)}件 × {args.repeat}回（ステータス: {args.status}）")
+        print(f"{'mode':<12}{'mean(ms)':>10}{'p95(ms)':>10}{'SQL/call':>10}")
+        for name, r in (("uncached", uncached), ("cached", cached)):
+            print(f"{name:<12}{r['mean_ms']:>10.3f}{r['p95_ms']:>10.3f}{r['statements_per_call']:>10.1f}")
+        print(f"速度比: {uncached['mean_ms'] / cached['mean_ms']:.1f}x")
+        print(f"コンパイル済み物件種別: {publication_rules.stats()['property_types']}")
+
+        exit_code = 0
+        mismatched = [pid for pid in uncached["results"] if uncached["results"][pid] != cached["results"][pid]]
+        if mismatched:
+            print(f"結果不一致: {mismatched}")
+            exit_code = 1
+        else:
+            print("結果一致: OK")
+        if cached["statements_per_call"] > 0:
+            print("回帰: キャッシュ済みルールでSQLが実行されています")
+            exit_code = 1
+        return exit_code
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+登記事項証明書パーサー ベンチマーク
+
+shared/touki_parser.py のスループット（ページ/秒）を計測する。
+
+- 入力: tests/fixtures/touki/*.txt（デフォルト）または touki_imports.raw_text（--from-db）
+- ページ数: raw_text の「--- Page n ---」の数（区切りが無いものは1ページ）
+- 1文書あたりの平均時間・p95、ページ/秒
+- --min-pages-per-sec を下回ったら回帰として終了コード1
+
+使用方法:
+PYTHONPATH=. python3 scripts/benchmark_touki_parser.py [--dir tests/fixtures/touki] [--from-db 200] [--repeat 200] [--min-pages-per-sec 0]
+"""
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "rea-api"))
+
+from shared.touki_parser import parse_touki
+
+PAGE_MARKER = re.compile(r'^--- Page \d+ ---$', re.MULTILINE)
+
+
+def count_pages(raw_text: str) -> int:
+    return max(1, len(PAGE_MARKER.findall(raw_text)))
+
+
+def load_fixtures(directory: Path):
+    return [path.read_text(encoding="utf-8") for path in sorted(directory.glob("*.txt"))]
+
+
+def load_from_db(limit: int):
+    """抽出済みのインポートから raw_text を取得（新しい順）"""
+    from shared.database import READatabase
+
+    with READatabase.cursor() as (cur, conn):
+        cur.execute("""
+            SELECT raw_text
+            FROM touki_imports
+            WHERE deleted_at IS NULL AND raw_text IS NOT NULL
+            ORDER BY id DESC
+            LIMIT %s
+        """, (limit,))
+        return [row[0] for row in cur.fetchall()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="登記事項証明書パーサー ベンチマーク")
+    parser.add_argument("--dir", default=str(project_root / "tests" / "fixtures" / "touki"),
+                        help="証明書テキスト（*.txt）のディレクトリ")
+    parser.add_argument("--from-db", type=int, metavar="N", help="touki_imports の raw_text を最大N件使用")
+    parser.add_argument("--repeat", type=int, default=200, help="繰り返し回数")
+    parser.add_argument("--min-pages-per-sec", type=float, default=0, help="下回ったら終了コード1")
+    args = parser.parse_args()
+
+    documents = load_from_db(args.from_db) if args.from_db else load_fixtures(Path(args.dir))
+    if not documents:
+        print("対象の証明書テキストがありません")
+        return 1
+
+    pages = sum(count_pages(text) for text in documents)
+    parse_touki(documents[0])  # ウォームアップ（計測外）
+
+    timings = []
+    for _ in range(args.repeat):
+        for raw_text in documents:
+            start = time.perf_counter()
+            parse_touki(raw_text)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    total_seconds = sum(timings) / 1000
+    pages_per_sec = pages * args.repeat / total_seconds
+
+    print(f"対象: {len(documents)}件（{pages}ページ）× {args.repeat}回")
+    print(f"{'mean(ms)':>10}{'p95(ms)':>10}{'pages/sec':>12}")
+    p95 = sorted(timings)[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0]
+    print(f"{statistics.mean(timings):>10.3f}{p95:>10.3f}{pages_per_sec:>12.0f}")
+
+    if pages_per_sec < args.min_pages_per_sec:
+        print(f"回帰: {pages_per_sec:.0f} pages/sec < {args.min_pages_per_sec:.0f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+非同期DB層 負荷テスト
+
+DBを使うエンドポイントに同時リクエストを送り、スループットと
+同じワーカー上の軽量エンドポイント（/health）の応答時間を計測する。
+
+async def のエンドポイントが同期ドライバでDBを呼ぶと、クエリ中はイベントループ全体が止まり、
+/health のような無関係なリクエストも待たされる。移行前後のコミットで同じ条件で実行して比較する。
+
+使用方法:
+# Geo API（uvicorn 1ワーカーで起動しておく）
+python3 scripts/loadtest_async_db.py --base-url http://127.0.0.1:8007 \
+    --path "/api/v1/geo/zoning/geojson?min_lat=35.6&min_lng=139.6&max_lat=35.8&max_lng=139.8" \
+    --concurrency 20 --duration 30
+
+# 比較例
+git checkout <移行前>  && (サーバー再起動) && python3 scripts/loadtest_async_db.py ... > before.txt
+git checkout <移行後>  && (サーバー再起動) && python3 scripts/loadtest_async_db.py ... > after.txt
+
+計測結果:
+asyncpg 移行（user-010）の前後とも未計測。スクリプトを追加した環境にはDB・asyncpg が無く、
+実行できなかった。移行前後の数値（スループット・/health のp50/p95）は上記の比較手順で
+計測し、この欄に追記すること。
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+
+def percentile(values: List[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(len(ordered) * p)) - 1))
+    return ordered[index]
+
+
+async def worker(client: httpx.AsyncClient, url: str, deadline: float, latencies: List[float], errors: Dict[str, int]):
+    """deadlineまで同じURLを繰り返しリクエスト"""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.get(url)
+            if response.status_code >= 400:
+                errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+                continue
+        except httpx.HTTPError as e:
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def probe(client: httpx.AsyncClient, url: str, deadline: float, interval: float, latencies: List[float]):
+    """軽量エンドポイントを一定間隔で叩き、イベントループの詰まりを計測"""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            await client.get(url)
+            latencies.append((time.perf_counter() - start) * 1000)
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(interval)
+
+
+def summarize(name: str, latencies: List[float], duration: float) -> str:
+    if not latencies:
+        return f"{name:<10}{'-':>10}{'-':>10}{'-':>10}{'-':>10}"
+    return (
+        f"{name:<10}{len(latencies) / duration:>10.1f}"
+        f"{statistics.mean(latencies):>10.1f}"
+        f"{percentile(latencies, 0.50):>10.1f}"
+        f"{percentile(latencies, 0.95):>10.1f}"
+    )
+
+
+async def run(args) -> int:
+    target_url = args.base_url.rstrip("/") + args.path
+    probe_url = args.base_url.rstrip("/") + args.probe_path
+
+    limits = httpx.Limits(max_connections=args.concurrency + 2)
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        # ウォームアップ（プール作成・設定キャッシュ読み込み）
+        await client.get(target_url)
+
+        target_latencies: List[float] = []
+        probe_latencies: List[float] = []
+        errors: Dict[str, int] = {}
+
+        deadline = time.perf_counter() + args.duration
+        await asyncio.gather(
+            *(worker(client, target_url, deadline, target_latencies, errors) for _ in range(args.concurrency)),
+            probe(client, probe_url, deadline, args.probe_interval, probe_latencies),
+        )
+
+    print(f"対象: {target_url}")
+    print(f"同時接続: {args.concurrency} / 計測時間: {args.duration}秒")
+    print(f"{'':<10}{'req/s':>10}{'mean(ms)':>10}{'p50(ms)':>10}{'p95(ms)':>10}")
+    print(summarize("target", target_latencies, args.duration))
+    print(summarize("probe", probe_latencies, args.duration))
+    if errors:
+        print(f"エラー: {errors}")
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="非同期DB層 負荷テスト")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8007", help="サーバーURL")
+    parser.add_argument("--path", required=True, help="負荷をかけるパス（クエリ文字列含む）")
+    parser.add_argument("--probe-path", default="/health", help="応答時間を計測する軽量エンドポイント")
+    parser.add_argument("--concurrency", type=int, default=20, help="同時リクエスト数")
+    parser.add_argument("--duration", type=float, default=30, help="計測時間（秒）")
+    parser.add_argument("--probe-interval", type=float, default=0.1, help="probeの間隔（秒）")
+    parser.add_argument("--timeout", type=float, default=60, help="リクエストタイムアウト（秒）")
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+-- カラムプリセット（fields= 射影）
+-- 日付: 2026-10-18
+-- 用途: GET /properties?fields=list 等で取得カラムを絞り込むためのプリセットを
+--       column_labels に定義する（プリセット名の配列、NULL=どのプリセットにも含めない）
+--       API: GenericCRUD.resolve_fields / GET /metadata/field-presets/{table_name}
+-- 実行: ssh rea-conoha "sudo -u postgres psql real_estate_db" < 2026-10-18_column_labels_field_presets.sql
+-- 反映: API側はスキーマレジストリのTTL（5分）経過後、または
+--       POST /admin/schema-registry/refresh で即時反映
+
+-- =============================================================================
+-- 1. カラム追加
+-- =============================================================================
+
+ALTER TABLE column_labels ADD COLUMN IF NOT EXISTS field_presets TEXT[];
+
+COMMENT ON COLUMN column_labels.field_presets IS 'このカラムを含むカラムプリセット名（list/map/export 等）';
+
+-- =============================================================================
+-- 2. list: 管理画面 物件一覧（rea-admin PropertiesPage の表示列）
+-- =============================================================================
+
+UPDATE column_labels
+SET field_presets = array_append(COALESCE(field_presets, '{}'), 'list')
+WHERE table_name = 'properties'
+  AND column_name IN (
+      'id', 'company_property_number', 'property_name', 'sale_price',
+      'property_type', 'sales_status', 'publication_status',
+      'prefecture', 'city', 'address_detail', 'created_at'
+  )
+  AND NOT ('list' = ANY(COALESCE(field_presets, '{}')));
+
+-- =============================================================================
+-- 3. map: 地図表示（ピン + ポップアップ）
+-- =============================================================================
+
+UPDATE column_labels
+SET field_presets = array_append(COALESCE(field_presets, '{}'), 'map')
+WHERE table_name = 'properties'
+  AND column_name IN (
+      'id', 'property_name', 'sale_price', 'property_type',
+      'sales_status', 'latitude', 'longitude', 'prefecture', 'city'
+  )
+  AND NOT ('map' = ANY(COALESCE(field_presets, '{}')));
+
+-- =============================================================================
+-- 4. export: CSV等の出力（column_labelsに登録された物件カラム全て、内部カラムは除く）
+-- =============================================================================
+
+UPDATE column_labels
+SET field_presets = array_append(COALESCE(field_presets, '{}'), 'export')
+WHERE table_name = 'properties'
+  AND NOT ('export' = ANY(COALESCE(field_presets, '{}')));
+
+-- =============================================================================
+-- 確認クエリ
+-- =============================================================================
+
+SELECT preset, COUNT(*) AS columns
+FROM column_labels, unnest(field_presets) AS preset
+WHERE table_name = 'properties'
+GROUP BY preset
+ORDER BY preset;
+
+-- ロールバック手順:
+-- ALTER TABLE column_labels DROP COLUMN field_presets;
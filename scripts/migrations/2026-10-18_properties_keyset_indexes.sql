@@ -0,0 +1,42 @@
+-- 物件一覧キーセットページネーション用インデックス
+-- 日付: 2026-10-18
+-- 用途: GET /properties の cursor 指定時、(sort_by, id) の複合インデックスで
+--       深いページでも先頭ページと同じコストで取得する
+-- 実行: ssh rea-conoha "sudo -u postgres psql real_estate_db" < 2026-10-18_properties_keyset_indexes.sql
+
+-- =============================================================================
+-- 1. id ソート（デフォルト）
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_properties_active_id
+    ON properties (id)
+    WHERE deleted_at IS NULL;
+
+-- =============================================================================
+-- 2. 一覧画面でソート可能なカラム（rea-admin PropertiesPage の sortable 列）
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_properties_company_property_number_id
+    ON properties (company_property_number, id)
+    WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_properties_property_name_id
+    ON properties (property_name, id)
+    WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_properties_sale_price_id
+    ON properties (sale_price, id)
+    WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_properties_created_at_id
+    ON properties (created_at, id)
+    WHERE deleted_at IS NULL;
+
+-- =============================================================================
+-- 確認クエリ
+-- =============================================================================
+
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'properties'
+  AND indexname LIKE 'idx_properties_%_id';
@@ -0,0 +1,37 @@
+-- properties.property_url 部分ユニークインデックス
+-- 日付: 2026-10-18
+-- 用途: POST /properties/bulk-upsert（スクレイパー同期）の
+--       INSERT ... ON CONFLICT (property_url) WHERE deleted_at IS NULL に必要
+--       取り込み処理は rea-api/app/services/scraper_ingest.py
+-- 実行: ssh rea-conoha "sudo -u postgres psql real_estate_db" < 2026-10-18_properties_property_url_unique.sql
+--
+-- 注意: 未削除の物件で property_url が重複しているとインデックス作成に失敗する
+--       1. の確認クエリで重複が無いことを確認してから実行すること
+
+-- =============================================================================
+-- 1. 重複確認（0件であること）
+-- =============================================================================
+
+SELECT property_url, array_agg(id ORDER BY id) AS ids
+FROM properties
+WHERE deleted_at IS NULL
+  AND property_url IS NOT NULL
+GROUP BY property_url
+HAVING COUNT(*) > 1;
+
+-- =============================================================================
+-- 2. 部分ユニークインデックス（論理削除済みは対象外）
+-- =============================================================================
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_properties_property_url_unique
+    ON properties (property_url)
+    WHERE deleted_at IS NULL;
+
+-- =============================================================================
+-- 確認クエリ
+-- =============================================================================
+
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'properties'
+  AND indexname = 'idx_properties_property_url_unique';
@@ -0,0 +1,24 @@
+-- properties.scraper_content_hash（スクレイパー同期の変更検知）
+-- 日付: 2026-10-18
+-- 用途: POST /properties/bulk-upsert で前回取り込み時と同じ内容の物件を
+--       書き込まずにスキップする（updated_at・WAL・インデックス更新の削減）
+--       ハッシュの計算は rea-api/app/services/scraper_ingest.py
+-- 実行: ssh rea-conoha "sudo -u postgres psql real_estate_db" < 2026-10-18_properties_scraper_content_hash.sql
+-- 既存データ: NULL のまま（次回の同期で各物件1回だけ更新され、以降は変更時のみ更新）
+
+-- =============================================================================
+-- 1. ハッシュカラム
+-- =============================================================================
+
+ALTER TABLE properties ADD COLUMN IF NOT EXISTS scraper_content_hash TEXT;
+
+COMMENT ON COLUMN properties.scraper_content_hash IS 'スクレイパー同期で最後に取り込んだ送信データの正規化ハッシュ（SHA-256）';
+
+-- =============================================================================
+-- 確認クエリ
+-- =============================================================================
+
+SELECT column_name, data_type
+FROM information_schema.columns
+WHERE table_name = 'properties'
+  AND column_name = 'scraper_content_hash';
@@ -0,0 +1,42 @@
+-- 物件検索ドキュメント（pg_trgm）
+-- 日付: 2026-10-18
+-- 用途: GET /properties?search= を複数カラムILIKE（全件スキャン）から
+--       正規化済み検索ドキュメント + トライグラムGINインデックスへ置き換える
+--       ドキュメントの生成は rea-api/app/services/property_search.py
+-- 実行: ssh rea-conoha "sudo -u postgres psql real_estate_db" < 2026-10-18_properties_search_text.sql
+-- 既存データ: 実行後に scripts/backfill_property_search_text.py を実行すること
+--
+-- 注意: pg_trgm が日本語をトライグラムに分割するには、DBの LC_CTYPE が
+--       C 以外（ja_JP.UTF-8 / C.UTF-8 等）である必要がある
+--       確認: SELECT datctype FROM pg_database WHERE datname = current_database();
+
+-- =============================================================================
+-- 1. 拡張
+-- =============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- =============================================================================
+-- 2. 検索ドキュメントカラム
+-- =============================================================================
+
+ALTER TABLE properties ADD COLUMN IF NOT EXISTS search_text TEXT;
+
+COMMENT ON COLUMN properties.search_text IS '検索ドキュメント（物件名・カナ・物件番号・住所を正規化して連結、アプリ側で更新）';
+
+-- =============================================================================
+-- 3. トライグラムインデックス
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_properties_search_text_trgm
+    ON properties USING gin (search_text gin_trgm_ops)
+    WHERE deleted_at IS NULL;
+
+-- =============================================================================
+-- 確認クエリ
+-- =============================================================================
+
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'properties'
+  AND indexname = 'idx_properties_search_text_trgm';
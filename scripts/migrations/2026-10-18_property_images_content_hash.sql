@@ -0,0 +1,33 @@
+-- property_images 内容ハッシュ（内容アドレス保存・重複排除）
+-- 日付: 2026-10-18
+-- 用途: アップロード画像を SHA-256 で uploads/properties/objects/ に1ファイルだけ保存し、
+--       同じ画像を複数の property_images 行から参照する（派生画像も再利用）
+--       保存処理は rea-api/app/api/api_v1/endpoints/images.py
+-- 実行: ssh rea-conoha "sudo -u postgres psql real_estate_db" < 2026-10-18_property_images_content_hash.sql
+
+-- =============================================================================
+-- 1. content_hash カラム追加
+-- =============================================================================
+
+ALTER TABLE property_images ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+
+-- コメント追加
+COMMENT ON COLUMN property_images.content_hash IS '画像ファイルのSHA-256（NULLは内容アドレス化以前のアップロード）';
+
+-- =============================================================================
+-- 2. 同じ内容の画像の検索用インデックス
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_property_images_content_hash
+    ON property_images (content_hash)
+    WHERE content_hash IS NOT NULL;
+
+-- =============================================================================
+-- 確認クエリ
+-- =============================================================================
+
+SELECT COUNT(*) AS total,
+       COUNT(content_hash) AS content_addressed,
+       COUNT(DISTINCT content_hash) AS distinct_files
+FROM property_images
+WHERE deleted_at IS NULL;
@@ -0,0 +1,25 @@
+-- property_images 派生画像（サムネイル・中・大 + WebP）
+-- 日付: 2026-10-18
+-- 用途: アップロード時に生成した表示サイズごとの画像URLを記録する
+--       生成処理は rea-api/app/utils/image_processor.py
+--       既存画像は scripts/backfill_image_variants.py で生成する
+-- 実行: ssh rea-conoha "sudo -u postgres psql real_estate_db" < 2026-10-18_property_images_variants.sql
+
+-- =============================================================================
+-- 1. variants カラム追加
+-- =============================================================================
+
+ALTER TABLE property_images ADD COLUMN IF NOT EXISTS variants JSONB;
+
+-- コメント追加
+COMMENT ON COLUMN property_images.variants IS
+    '派生画像 {"width", "height", "sizes": {"thumbnail"|"medium"|"large": {"file_url", "webp_url", "width", "height"}}}（NULLは未生成）';
+
+-- =============================================================================
+-- 確認クエリ
+-- =============================================================================
+
+SELECT COUNT(*) AS total,
+       COUNT(variants) AS with_variants
+FROM property_images
+WHERE deleted_at IS NULL;
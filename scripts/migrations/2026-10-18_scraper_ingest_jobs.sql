@@ -0,0 +1,59 @@
+-- スクレイパー同期 取り込みジョブ
+-- 日付: 2026-10-18
+-- 用途: POST /properties/bulk-upsert/jobs（大量データの非同期取り込み）の
+--       ジョブ状態・進捗・itemごとのエラーを保持する
+--       ワーカーは rea-api/app/services/ingest_jobs.py
+-- 実行: ssh rea-conoha "sudo -u postgres psql real_estate_db" < 2026-10-18_scraper_ingest_jobs.sql
+
+-- =============================================================================
+-- 1. scraper_ingest_jobs テーブル作成
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS scraper_ingest_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    organization_id INTEGER NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    payload_path TEXT NOT NULL,
+    payload_format VARCHAR(10) NOT NULL DEFAULT 'json',
+    is_gzip BOOLEAN NOT NULL DEFAULT FALSE,
+    payload_size BIGINT,
+    total_items INTEGER,
+    processed_items INTEGER NOT NULL DEFAULT 0,
+    created_count INTEGER NOT NULL DEFAULT 0,
+    updated_count INTEGER NOT NULL DEFAULT 0,
+    unchanged_count INTEGER NOT NULL DEFAULT 0,
+    error_count INTEGER NOT NULL DEFAULT 0,
+    errors JSONB NOT NULL DEFAULT '[]'::jsonb,
+    error_message TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_by VARCHAR(255),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMPTZ,
+    heartbeat_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+-- コメント追加
+COMMENT ON TABLE scraper_ingest_jobs IS 'スクレイパー同期の非同期取り込みジョブ';
+COMMENT ON COLUMN scraper_ingest_jobs.status IS 'queued / running / completed / failed';
+COMMENT ON COLUMN scraper_ingest_jobs.payload_path IS '受信データのファイル名（rea-api/data/ingest_jobs/）';
+COMMENT ON COLUMN scraper_ingest_jobs.processed_items IS '処理済み件数（チャンク単位で更新、再開時はこの続きから）';
+COMMENT ON COLUMN scraper_ingest_jobs.errors IS 'itemごとのエラー [{index, detail}]（先頭1000件程度まで）';
+COMMENT ON COLUMN scraper_ingest_jobs.heartbeat_at IS 'ワーカーの最終更新時刻（一定時間更新がなければ再取得）';
+
+-- =============================================================================
+-- 2. ワーカーの取得用インデックス
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_scraper_ingest_jobs_pending
+    ON scraper_ingest_jobs (id)
+    WHERE status IN ('queued', 'running');
+
+-- =============================================================================
+-- 確認クエリ
+-- =============================================================================
+
+SELECT column_name, data_type
+FROM information_schema.columns
+WHERE table_name = 'scraper_ingest_jobs'
+ORDER BY ordinal_position;
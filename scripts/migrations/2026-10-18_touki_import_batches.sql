@@ -0,0 +1,59 @@
+-- 登記PDF 一括インポート（バッチ・内容ハッシュによる重複排除）
+-- 日付: 2026-10-18
+-- 用途: POST /touki/upload/batch（複数PDF または ZIP）のバッチ単位の進捗集計と、
+--       取り込み済みの証明書（同じ内容のPDF）を再抽出しないためのハッシュ検索
+--       抽出・パースは rea-api/app/services/touki_extraction.py のワーカーで実行
+-- 前提: 2026-10-18_touki_imports_extraction.sql
+-- 実行: ssh rea-conoha "sudo -u postgres psql real_estate_db" < 2026-10-18_touki_import_batches.sql
+
+-- =============================================================================
+-- 1. touki_import_batches テーブル作成
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS touki_import_batches (
+    id BIGSERIAL PRIMARY KEY,
+    file_count INTEGER NOT NULL DEFAULT 0,
+    auto_parse BOOLEAN NOT NULL DEFAULT TRUE,
+    duplicates JSONB NOT NULL DEFAULT '[]'::jsonb,
+    skipped JSONB NOT NULL DEFAULT '[]'::jsonb,
+    created_by VARCHAR(100),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- コメント追加
+COMMENT ON TABLE touki_import_batches IS '登記PDFの一括アップロード';
+COMMENT ON COLUMN touki_import_batches.file_count IS '受け付けたPDF数（重複を含む）';
+COMMENT ON COLUMN touki_import_batches.duplicates IS '取り込み済みと同じ内容のPDF [{file_name, import_id}]';
+COMMENT ON COLUMN touki_import_batches.skipped IS '受け付けなかったファイル [{file_name, reason}]';
+
+-- =============================================================================
+-- 2. touki_imports にハッシュ・バッチIDを追加
+-- =============================================================================
+
+ALTER TABLE touki_imports ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+ALTER TABLE touki_imports ADD COLUMN IF NOT EXISTS batch_id BIGINT REFERENCES touki_import_batches(id);
+
+COMMENT ON COLUMN touki_imports.content_hash IS 'PDFのSHA-256（重複アップロードの検出用）';
+COMMENT ON COLUMN touki_imports.batch_id IS '一括アップロードのバッチ（単体アップロードはNULL）';
+
+CREATE INDEX IF NOT EXISTS idx_touki_imports_content_hash
+    ON touki_imports (content_hash)
+    WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_touki_imports_batch_id
+    ON touki_imports (batch_id)
+    WHERE batch_id IS NOT NULL;
+
+-- バッチの登記レコード数の集計用
+CREATE INDEX IF NOT EXISTS idx_touki_records_touki_import_id
+    ON touki_records (touki_import_id);
+
+-- =============================================================================
+-- 確認クエリ
+-- =============================================================================
+
+SELECT column_name, data_type
+FROM information_schema.columns
+WHERE table_name = 'touki_imports'
+  AND column_name IN ('content_hash', 'batch_id')
+ORDER BY column_name;
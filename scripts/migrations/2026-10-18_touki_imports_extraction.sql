@@ -0,0 +1,37 @@
+-- touki_imports バックグラウンドPDF抽出
+-- 日付: 2026-10-18
+-- 用途: POST /touki/upload はPDFを保存して status=queued で登録し、
+--       ワーカー（rea-api/app/services/touki_extraction.py）がページ並列で抽出する
+--       status: queued → extracting → uploaded（auto_parse なら parsed） / error
+-- 実行: ssh rea-conoha "sudo -u postgres psql real_estate_db" < 2026-10-18_touki_imports_extraction.sql
+
+-- =============================================================================
+-- 1. 進捗・自動パース用カラム追加
+-- =============================================================================
+
+ALTER TABLE touki_imports ADD COLUMN IF NOT EXISTS page_count INTEGER;
+ALTER TABLE touki_imports ADD COLUMN IF NOT EXISTS pages_extracted INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE touki_imports ADD COLUMN IF NOT EXISTS auto_parse BOOLEAN NOT NULL DEFAULT FALSE;
+
+-- コメント追加
+COMMENT ON COLUMN touki_imports.page_count IS 'PDFのページ数（抽出開始時に設定）';
+COMMENT ON COLUMN touki_imports.pages_extracted IS '抽出済みページ数（進捗表示用）';
+COMMENT ON COLUMN touki_imports.auto_parse IS 'TRUE: 抽出完了後にパースして touki_records を作成';
+
+-- =============================================================================
+-- 2. ワーカーの取得用インデックス
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_touki_imports_pending
+    ON touki_imports (id)
+    WHERE status IN ('queued', 'extracting') AND deleted_at IS NULL;
+
+-- =============================================================================
+-- 確認クエリ
+-- =============================================================================
+
+SELECT status, COUNT(*)
+FROM touki_imports
+WHERE deleted_at IS NULL
+GROUP BY status
+ORDER BY status;
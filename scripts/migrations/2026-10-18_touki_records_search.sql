@@ -0,0 +1,67 @@
+-- 登記レコード検索キー（不動産番号・地番・所在・所有者）
+-- 日付: 2026-10-18
+-- 用途: GET /touki/records/search・GET /touki/records/suggest 用に
+--       touki_records に正規化済みの検索キーを追加し、インデックスを作成する
+--       キーの生成は rea-api/app/services/touki_search.py
+-- 実行: ssh rea-conoha "sudo -u postgres psql real_estate_db" < 2026-10-18_touki_records_search.sql
+-- 既存データ: 実行後に scripts/backfill_touki_search_keys.py を実行すること
+--
+-- 注意: pg_trgm が日本語をトライグラムに分割するには、DBの LC_CTYPE が
+--       C 以外（ja_JP.UTF-8 / C.UTF-8 等）である必要がある
+--       確認: SELECT datctype FROM pg_database WHERE datname = current_database();
+
+-- =============================================================================
+-- 1. 拡張
+-- =============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- =============================================================================
+-- 2. 検索キーカラム
+-- =============================================================================
+
+ALTER TABLE touki_records ADD COLUMN IF NOT EXISTS lot_number_key VARCHAR(100);
+ALTER TABLE touki_records ADD COLUMN IF NOT EXISTS location_key TEXT;
+ALTER TABLE touki_records ADD COLUMN IF NOT EXISTS owner_names TEXT;
+
+COMMENT ON COLUMN touki_records.lot_number_key IS '地番の検索キー（「91番44」→「91-44」、建物は所在の番地から、アプリ側で更新）';
+COMMENT ON COLUMN touki_records.location_key IS '所在の検索キー（番地を除いた町域を正規化、アプリ側で更新）';
+COMMENT ON COLUMN touki_records.owner_names IS '所有者名の検索キー（正規化して空白区切り、アプリ側で更新）';
+
+-- =============================================================================
+-- 3. インデックス
+-- =============================================================================
+
+-- 不動産番号（完全一致）
+CREATE INDEX IF NOT EXISTS idx_touki_records_real_estate_number
+    ON touki_records (real_estate_number)
+    WHERE deleted_at IS NULL;
+
+-- 地番（完全一致、候補提案の地番一致）
+CREATE INDEX IF NOT EXISTS idx_touki_records_lot_number_key
+    ON touki_records (lot_number_key)
+    WHERE deleted_at IS NULL;
+
+-- 所在（部分一致・類似度）
+CREATE INDEX IF NOT EXISTS idx_touki_records_location_key_trgm
+    ON touki_records USING gin (location_key gin_trgm_ops)
+    WHERE deleted_at IS NULL;
+
+-- 所有者名（部分一致・類似度）
+CREATE INDEX IF NOT EXISTS idx_touki_records_owner_names_trgm
+    ON touki_records USING gin (owner_names gin_trgm_ops)
+    WHERE deleted_at IS NULL;
+
+-- =============================================================================
+-- 確認クエリ
+-- =============================================================================
+
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE tablename = 'touki_records'
+  AND indexname IN (
+      'idx_touki_records_real_estate_number',
+      'idx_touki_records_lot_number_key',
+      'idx_touki_records_location_key_trgm',
+      'idx_touki_records_owner_names_trgm'
+  );
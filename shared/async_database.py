@@ -0,0 +1,233 @@
+"""REA 非同期データベース接続
+
+async def のエンドポイントから使うための asyncpg コネクションプール。
+READatabase（psycopg2・同期）と同じ .env 設定で接続する。
+
+【使い分け】
+========================
+- async def のエンドポイント: AsyncREADatabase（イベントループをブロックしない）
+- def のエンドポイント・スクリプト: READatabase / SQLAlchemyセッション
+  （FastAPIが def をスレッドプールで実行するため、同期ドライバで問題ない）
+
+async def の中で READatabase を呼ぶと、クエリ完了までワーカー全体が停止する。
+
+【仕様】
+========================
+- プロセスごとに1つのプールを共有（初回アクセス時に作成）
+- アプリ起動・終了時に init_pool() / close_pool() を呼ぶ
+- SQLは READatabase と同じ %s プレースホルダで書ける（$1, $2... に変換）
+- json / jsonb は取得時に dict/list へ変換（psycopg2と同じ）、
+  書き込み時は json.dumps 済みの文字列と dict/list のどちらも受け付ける
+- execute / executemany / fetch / fetchrow / fetchval の実行時間を shared.query_stats に記録
+  （connection() / transaction() で借りた接続から直接呼んだ場合も含む。cursor() / prepare() は対象外）
+
+使い方:
+    from shared.async_database import AsyncREADatabase
+
+    rows = await AsyncREADatabase.fetch(
+        "SELECT id, station_name FROM m_stations WHERE id = %s", station_id
+    )
+    for row in rows:
+        print(row["station_name"])   # row[1] でも可
+
+    async with AsyncREADatabase.transaction() as conn:
+        await conn.execute("UPDATE ... WHERE id = $1", property_id)
+"""
+
+import asyncio
+import functools
+import json
+import os
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import asyncpg
+
+from shared.database import READatabase
+from shared.query_stats import record_query
+
+# %s → $n 変換（%% はリテラルの %）
+_PLACEHOLDER = re.compile(r"%%|%s")
+
+
+def to_asyncpg_query(query: str) -> str:
+    """psycopg2形式（%s）のSQLを asyncpg形式（$1, $2...）に変換"""
+    counter = 0
+
+    def replace(match: "re.Match[str]") -> str:
+        nonlocal counter
+        if match.group(0) == "%%":
+            return "%"
+        counter += 1
+        return f"${counter}"
+
+    return _PLACEHOLDER.sub(replace, query)
+
+
+def _encode_json(value: Any) -> str:
+    """json/jsonb パラメータ（json.dumps済みの文字列はそのまま）"""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """接続ごとの初期化（json/jsonbの変換設定）"""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=_encode_json,
+            decoder=json.loads,
+            schema="pg_catalog",
+        )
+
+
+def _timed(method):
+    """クエリの実行時間を shared.query_stats に記録"""
+
+    @functools.wraps(method)
+    async def wrapper(self, query, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await method(self, query, *args, **kwargs)
+        finally:
+            record_query(query, (time.perf_counter() - start) * 1000)
+
+    return wrapper
+
+
+class _InstrumentedConnection(asyncpg.Connection):
+    """クエリの実行時間を記録する接続（プールの connection_class）"""
+
+    execute = _timed(asyncpg.Connection.execute)
+    executemany = _timed(asyncpg.Connection.executemany)
+    fetch = _timed(asyncpg.Connection.fetch)
+    fetchrow = _timed(asyncpg.Connection.fetchrow)
+    fetchval = _timed(asyncpg.Connection.fetchval)
+
+
+class AsyncREADatabase:
+    """asyncpg コネクションプール（プロセス共有）"""
+
+    _pool: Optional[asyncpg.Pool] = None
+    _lock: Optional[asyncio.Lock] = None
+
+    MIN_SIZE = 2
+    MAX_SIZE = 10
+
+    @classmethod
+    async def init_pool(cls, min_size: Optional[int] = None, max_size: Optional[int] = None) -> asyncpg.Pool:
+        """プールを作成（作成済みの場合はそのまま返す）
+
+        Args:
+            min_size: 最小接続数（未指定時は DB_POOL_MIN_SIZE または MIN_SIZE）
+            max_size: 最大接続数（未指定時は DB_POOL_MAX_SIZE または MAX_SIZE）
+        """
+        if cls._pool is not None:
+            return cls._pool
+
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+
+        async with cls._lock:
+            if cls._pool is None:
+                READatabase._load_env()
+                cls._pool = await asyncpg.create_pool(
+                    host=os.getenv("DB_HOST", "localhost"),
+                    port=int(os.getenv("DB_PORT", "5432")),
+                    database=os.getenv("DB_NAME", "real_estate_db"),
+                    user=os.getenv("DB_USER", "rea_user"),
+                    password=os.getenv("DB_PASSWORD", "rea_password"),
+                    min_size=min_size or int(os.getenv("DB_POOL_MIN_SIZE", cls.MIN_SIZE)),
+                    max_size=max_size or int(os.getenv("DB_POOL_MAX_SIZE", cls.MAX_SIZE)),
+                    init=_init_connection,
+                    connection_class=_InstrumentedConnection,
+                )
+        return cls._pool
+
+    @classmethod
+    async def close_pool(cls) -> None:
+        """プールを閉じる（アプリ終了時）"""
+        if cls._pool is not None:
+            await cls._pool.close()
+            cls._pool = None
+
+    @classmethod
+    @asynccontextmanager
+    async def connection(cls) -> AsyncIterator[asyncpg.Connection]:
+        """プールから接続を借りる（自動コミット）
+
+        Example:
+            async with AsyncREADatabase.connection() as conn:
+                row = await conn.fetchrow("SELECT ... WHERE id = $1", 1)
+        """
+        pool = await cls.init_pool()
+        async with pool.acquire() as conn:
+            yield conn
+
+    @classmethod
+    @asynccontextmanager
+    async def transaction(cls) -> AsyncIterator[asyncpg.Connection]:
+        """トランザクション付きで接続を借りる（正常終了でコミット、例外でロールバック）
+
+        接続を直接使う場合のプレースホルダは asyncpg形式（$1, $2...）。
+        """
+        async with cls.connection() as conn:
+            async with conn.transaction():
+                yield conn
+
+    @classmethod
+    async def fetch(cls, query: str, *args: Any) -> List[asyncpg.Record]:
+        """複数行取得（Recordは row[0] / row["column"] の両方で参照可能）"""
+        async with cls.connection() as conn:
+            return await conn.fetch(to_asyncpg_query(query), *args)
+
+    @classmethod
+    async def fetch_dict(cls, query: str, *args: Any) -> List[Dict[str, Any]]:
+        """複数行取得（辞書形式、READatabase.execute_query_dict 相当）"""
+        return [dict(row) for row in await cls.fetch(query, *args)]
+
+    @classmethod
+    async def fetchrow(cls, query: str, *args: Any) -> Optional[asyncpg.Record]:
+        """1行取得（該当なしはNone）"""
+        async with cls.connection() as conn:
+            return await conn.fetchrow(to_asyncpg_query(query), *args)
+
+    @classmethod
+    async def fetchval(cls, query: str, *args: Any) -> Any:
+        """先頭行の先頭カラムを取得"""
+        async with cls.connection() as conn:
+            return await conn.fetchval(to_asyncpg_query(query), *args)
+
+    @classmethod
+    async def execute(cls, query: str, *args: Any) -> str:
+        """更新系SQLを実行（自動コミット）
+
+        Returns:
+            コマンドステータス（例: "UPDATE 3"）、件数は affected_rows() で取得
+        """
+        async with cls.connection() as conn:
+            return await conn.execute(to_asyncpg_query(query), *args)
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """プールの状態（監視用）"""
+        if cls._pool is None:
+            return {"initialized": False}
+        return {
+            "initialized": True,
+            "size": cls._pool.get_size(),
+            "idle": cls._pool.get_idle_size(),
+            "min_size": cls._pool.get_min_size(),
+            "max_size": cls._pool.get_max_size(),
+        }
+
+
+def affected_rows(status: str) -> int:
+    """コマンドステータス（"UPDATE 3" / "INSERT 0 1"）から件数を取得"""
+    try:
+        return int(status.rsplit(" ", 1)[-1])
+    except (ValueError, AttributeError):
+        return 0
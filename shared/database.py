@@ -20,21 +20,332 @@ DB_PASSWORD=rea_password # データベースパスワード
 - 実行場所に依存しない安定した接続
 - 全てのモジュールはこのライブラリを経由してDB接続する
 
+【コネクションプール】
+========================
+get_connection() はプロセス内で共有するプールから接続を貸し出す。
+返された接続の close() はプールへの返却になるため、呼び出し側のコードは変更不要。
+
+DB_POOL_ENABLED=false    # プールを使わず毎回接続する（従来動作）
+DB_POOL_MIN_SIZE=1       # 常に保持する接続数
+DB_POOL_MAX_SIZE=10      # 同時に貸し出せる最大接続数
+DB_POOL_TIMEOUT=30       # 空きを待つ最大秒数（超えるとPoolTimeoutError）
+DB_POOL_CHECK_IDLE=30    # この秒数以上使われていない接続は貸し出し前に SELECT 1 で確認
+
+統計は READatabase.pool_stats() で取得できる（管理API: GET /admin/db-pool）。
+
 【変更履歴】
 ========================
 2025-07-23: プロジェクトルート固定化（技術的負債解消）
            - 実行場所による.env読み込みの差異を解消
            - DB接続の完全統一化を実現
+2026-10-18: コネクションプール導入
+           - .envの読み込みをプロセスで1回に変更
+           - get_connection() をプール経由に変更（close()で返却）
 """
 
 import os
+import threading
+import time
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional, Tuple
 
 import psycopg2
+from psycopg2 import extensions
 from psycopg2.extras import RealDictCursor
 
+from shared.query_stats import record_query
+
+
+class _TimedCursorMixin:
+    """execute / executemany の実行時間を shared.query_stats に記録"""
+
+    def execute(self, query, vars=None):
+        start = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            record_query(query, (time.perf_counter() - start) * 1000)
+
+    def executemany(self, query, vars_list):
+        start = time.perf_counter()
+        try:
+            return super().executemany(query, vars_list)
+        finally:
+            record_query(query, (time.perf_counter() - start) * 1000)
+
+
+_timed_cursor_classes: Dict[type, type] = {}
+
+
+def _timed_cursor_class(factory: type) -> type:
+    """カーソルクラスに計測用Mixinを付けたサブクラス（クラスごとにキャッシュ）"""
+    timed = _timed_cursor_classes.get(factory)
+    if timed is None:
+        timed = type(f"Timed{factory.__name__}", (_TimedCursorMixin, factory), {})
+        _timed_cursor_classes[factory] = timed
+    return timed
+
+
+class _InstrumentedConnection(extensions.connection):
+    """cursor() が計測付きカーソルを返す接続（RealDictCursor等の指定も維持）"""
+
+    def cursor(self, *args, **kwargs):
+        factory = kwargs.get("cursor_factory") or self.cursor_factory or extensions.cursor
+        if not issubclass(factory, _TimedCursorMixin):
+            kwargs["cursor_factory"] = _timed_cursor_class(factory)
+        return super().cursor(*args, **kwargs)
+
+
+class PoolTimeoutError(psycopg2.OperationalError):
+    """プールの空き待ちがタイムアウトした"""
+
+
+class _PooledConnection:
+    """プールから貸し出した接続のラッパー
+
+    psycopg2の接続と同じように使える（属性の参照・設定は実接続に委譲）。
+    close() で実接続を閉じずにプールへ返却する。
+    """
+
+    def __init__(self, pool: "_ConnectionPool", conn):
+        self._pool = pool
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name, value):
+        # autocommit / isolation_level 等は実接続に設定（_pool / _conn はラッパー自身）
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._conn, name, value)
+
+    def __enter__(self):
+        self._conn.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._conn.__exit__(exc_type, exc_value, traceback)
+
+    @property
+    def closed(self) -> int:
+        return 1 if self._conn is None else self._conn.closed
+
+    def close(self) -> None:
+        """プールへ返却（二重呼び出しは無視）"""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool.release(conn)
+
+    def __del__(self):
+        # close()されずに破棄された場合もプールへ戻す
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class _ConnectionPool:
+    """スレッドセーフなpsycopg2コネクションプール
+
+    - 接続数は max_size まで、空きがなければ timeout 秒まで待つ
+    - 長時間使われていない接続は貸し出し前に SELECT 1 で確認し、切れていれば作り直す
+    - 返却時に未完了のトランザクションはロールバックする
+    - fork後の子プロセスでは親の接続を使わない
+    """
+
+    def __init__(self, connect, min_size: int, max_size: int, timeout: float, check_idle: float):
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max(max_size, 1)
+        self.timeout = timeout
+        self.check_idle = check_idle
+
+        self._cond = threading.Condition()
+        self._idle: List[Tuple[Any, float]] = []  # (接続, 返却時刻)
+        self._in_use = 0
+        self._waiting = 0
+        self._pid = os.getpid()
+
+        # 統計
+        self._created = 0
+        self._discarded = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds = 0.0
+
+    def _reset_after_fork(self) -> None:
+        if self._pid != os.getpid():
+            self._idle = []
+            self._in_use = 0
+            self._waiting = 0
+            self._pid = os.getpid()
+
+    def _is_alive(self, conn, idle_since: float) -> bool:
+        """貸し出し前の確認（SELECT 1 はネットワーク待ちになるのでロック外で呼ぶ）"""
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self.check_idle:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    @staticmethod
+    def _close(conn) -> None:
+        """実接続を閉じる（ロック外で呼ぶ）"""
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+
+    def acquire(self) -> _PooledConnection:
+        """接続を借りる（空きがなければ待つ）
+
+        ロック中は空き接続の取り出しと枠の確保だけを行い、
+        接続の確認（SELECT 1）・作成・破棄はロック外で行う。
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        waited = False
+
+        while True:
+            conn = None
+            with self._cond:
+                self._reset_after_fork()
+                while True:
+                    # 空き接続（新しく返却されたものから使う）。確認中も枠は確保しておく
+                    if self._idle:
+                        conn, idle_since = self._idle.pop()
+                        self._in_use += 1
+                        break
+
+                    # 上限未満なら新規作成
+                    if self._in_use < self.max_size:
+                        self._in_use += 1
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            f"DB接続プールの空き待ちがタイムアウトしました（max_size={self.max_size}）"
+                        )
+                    self._waiting += 1
+                    waited = True
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+
+            if conn is None:
+                break
+
+            if self._is_alive(conn, idle_since):
+                return self._checkout(conn, start if waited else None)
+
+            # 切れていた接続は閉じて枠を返し、次の空き接続を探す
+            self._close(conn)
+            with self._cond:
+                self._discarded += 1
+                self._in_use -= 1
+                self._cond.notify()
+
+        # 接続はロック外で作成（他スレッドを待たせない）
+        try:
+            conn = self._connect()
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._created += 1
+        return self._checkout(conn, start if waited else None)
+
+    def _checkout(self, conn, wait_start: Optional[float]) -> _PooledConnection:
+        """貸し出しの記録（枠は acquire で確保済み）"""
+        with self._cond:
+            self._checkouts += 1
+            if wait_start is not None:
+                self._wait_seconds += time.monotonic() - wait_start
+        return _PooledConnection(self, conn)
+
+    def release(self, conn) -> None:
+        """接続を返却（壊れた接続・超過分は閉じる）"""
+        reusable = not conn.closed
+        if reusable:
+            try:
+                status = conn.info.transaction_status
+                if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                    reusable = False
+                elif status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+                if reusable and conn.autocommit:
+                    conn.autocommit = False
+            except psycopg2.Error:
+                reusable = False
+
+        with self._cond:
+            if self._pid != os.getpid():
+                # fork前に借りた接続は子プロセスでは返却しない
+                return
+            self._in_use -= 1
+            keep = reusable and len(self._idle) < self.max_size
+            if keep:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                self._discarded += 1
+            self._cond.notify()
+
+        if not keep:
+            self._close(conn)
+
+    def close_all(self) -> None:
+        """空き接続を全て閉じる（貸し出し中の接続は返却時に閉じる）"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._discarded += len(idle)
+        for conn, _ in idle:
+            self._close(conn)
+
+    def warm_up(self) -> None:
+        """min_size まで接続を作成"""
+        with self._cond:
+            missing = self.min_size - len(self._idle) - self._in_use
+        for _ in range(max(missing, 0)):
+            self._add_idle()
+
+    def _add_idle(self) -> None:
+        conn = self._connect()
+        with self._cond:
+            self._created += 1
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "enabled": True,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "created": self._created,
+                "discarded": self._discarded,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "wait_seconds_total": round(self._wait_seconds, 3),
+            }
+
 
 class READatabase:
     """シンプルなDB接続クラス
@@ -43,6 +354,10 @@ class READatabase:
     どのモジュールから使用しても同じ設定で接続できることを保証する。
     """
 
+    _env_loaded = False
+    _pool: Optional[_ConnectionPool] = None
+    _pool_lock = threading.Lock()
+
     @classmethod
     def _load_env(cls):
         """プロジェクトルートの.envファイルを必ず読み込む
@@ -60,6 +375,9 @@ class READatabase:
         - プロジェクトルートを固定パスで指定
         - どこから実行しても必ず同じ.envファイルを読む
         """
+        if cls._env_loaded:
+            return
+
         # プロジェクトルートを検出（このファイルの親の親ディレクトリ）
         # shared/database.py → shared → REA
         project_root = Path(__file__).resolve().parent.parent
@@ -76,12 +394,56 @@ class READatabase:
             print(f"警告: .envファイルが見つかりません: {env_path}")
             print("デフォルト値を使用します。")
 
+        cls._env_loaded = True
+
+    @classmethod
+    def _connect(cls):
+        """新しいpsycopg2接続を作成（プールを通さない）"""
+        cls._load_env()
+
+        # 接続情報（.envから読み込み、なければデフォルト値）
+        return psycopg2.connect(
+            host=os.getenv("DB_HOST", "localhost"),
+            port=os.getenv("DB_PORT", "5432"),
+            database=os.getenv("DB_NAME", "real_estate_db"),
+            user=os.getenv("DB_USER", "rea_user"),
+            password=os.getenv("DB_PASSWORD", "rea_password"),
+            connection_factory=_InstrumentedConnection,
+        )
+
+    @classmethod
+    def _pool_enabled(cls) -> bool:
+        """プールを使う設定か（DB_POOL_ENABLED）"""
+        cls._load_env()
+        return os.getenv("DB_POOL_ENABLED", "true").lower() not in ("false", "0", "no")
+
+    @classmethod
+    def _get_pool(cls) -> Optional[_ConnectionPool]:
+        """プールを取得（初回に作成、DB_POOL_ENABLED=false の場合はNone）"""
+        if cls._pool is not None:
+            return cls._pool
+
+        if not cls._pool_enabled():
+            return None
+
+        with cls._pool_lock:
+            if cls._pool is None:
+                cls._pool = _ConnectionPool(
+                    cls._connect,
+                    min_size=int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+                    max_size=int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+                    timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+                    check_idle=float(os.getenv("DB_POOL_CHECK_IDLE", "30")),
+                )
+        return cls._pool
+
     @classmethod
     def get_connection(cls):
         """DB接続を取得
 
         環境変数から接続情報を取得します。
         必ずプロジェクトルートの.envファイルを読み込みます。
+        プール有効時はプールから貸し出し、close() で返却されます。
 
         デフォルト値：
         - host: localhost
@@ -91,21 +453,36 @@ class READatabase:
         - password: rea_password
 
         Returns:
-            psycopg2.connection: PostgreSQL接続オブジェクト
+            psycopg2.connection: PostgreSQL接続オブジェクト（プール有効時はそのラッパー）
 
         Raises:
             psycopg2.OperationalError: 接続失敗時
+            PoolTimeoutError: プールの空き待ちタイムアウト時
         """
-        cls._load_env()
+        pool = cls._get_pool()
+        if pool is None:
+            return cls._connect()
+        return pool.acquire()
 
-        # 接続情報（.envから読み込み、なければデフォルト値）
-        return psycopg2.connect(
-            host=os.getenv("DB_HOST", "localhost"),
-            port=os.getenv("DB_PORT", "5432"),
-            database=os.getenv("DB_NAME", "real_estate_db"),
-            user=os.getenv("DB_USER", "rea_user"),
-            password=os.getenv("DB_PASSWORD", "rea_password"),
-        )
+    @classmethod
+    def init_pool(cls) -> None:
+        """プールを作成し min_size まで接続しておく（アプリ起動時、任意）"""
+        pool = cls._get_pool()
+        if pool is not None:
+            pool.warm_up()
+
+    @classmethod
+    def close_pool(cls) -> None:
+        """プールの空き接続を閉じる（アプリ終了時）"""
+        if cls._pool is not None:
+            cls._pool.close_all()
+
+    @classmethod
+    def pool_stats(cls) -> Dict[str, Any]:
+        """プールの統計（貸し出し中・待機中・作成数など、未作成の場合は作成しない）"""
+        if cls._pool is None:
+            return {"enabled": cls._pool_enabled(), "initialized": False}
+        return cls._pool.stats()
 
     @classmethod
     def test_connection(cls) -> bool:
@@ -371,6 +748,7 @@ class READatabase:
                 print(f"DBエラー: {health['error']}")
         """
         try:
+            start = time.perf_counter()
             conn = cls.get_connection()
             cur = conn.cursor()
 
@@ -382,6 +760,7 @@ class READatabase:
             cur.execute("SELECT current_database()")
             database = cur.fetchone()[0]
 
+            cur.close()
             conn.close()
 
             return {
@@ -389,7 +768,8 @@ class READatabase:
                 "database": database,
                 "version": version,
                 "config_source": "プロジェクトルート/.env",
-                "response_time_ms": 10,  # 簡易的な値
+                "response_time_ms": round((time.perf_counter() - start) * 1000, 1),
+                "pool": cls.pool_stats(),
             }
         except Exception as e:
             return {
@@ -4,7 +4,14 @@ REAフォーマット処理統一システム
 """
 
 import re
-from typing import Optional
+import unicodedata
+from typing import List, Optional
+
+# ひらがな → カタカナ（ぁ〜ゖ）
+_HIRAGANA_TO_KATAKANA = {code: code + 0x60 for code in range(0x3041, 0x3097)}
+
+# 長音・ハイフン類 → 半角ハイフン（normalize_addressと同じ扱い）
+_HYPHENS_TO_ASCII = str.maketrans({c: "-" for c in "ー‐‑–—―−"})
 
 
 def normalize_address(address: str) -> str:
@@ -56,6 +63,80 @@ def normalize_address(address: str) -> str:
     return address.strip()
 
 
+def normalize_search_text(text: str) -> str:
+    """
+    検索用にテキストを正規化（検索ドキュメント・検索語の両方に適用）
+
+    Args:
+        text: 対象文字列
+
+    Returns:
+        str: 正規化された文字列
+
+    Examples:
+        >>> normalize_search_text("ｻｯﾎﾟﾛ　ＭＡＮＳＩＯＮ１０１")
+        "サッポロmansion101"
+        >>> normalize_search_text("さっぽろ")
+        "サッポロ"
+    """
+    if not text:
+        return ""
+
+    # 全角英数字・記号 → 半角、半角カナ → 全角
+    text = unicodedata.normalize("NFKC", text)
+
+    # ひらがな → カタカナ
+    text = text.translate(_HIRAGANA_TO_KATAKANA)
+
+    # 長音・ハイフン類を統一
+    text = text.translate(_HYPHENS_TO_ASCII)
+
+    # 空白を削除
+    text = re.sub(r"\s+", "", text)
+
+    return text.lower()
+
+
+def normalize_lot_number(lot_number: str) -> str:
+    """
+    地番・家屋番号を比較用に正規化（番・番地・の・ハイフン類を「-」に統一）
+
+    Args:
+        lot_number: 地番（登記の「９１番４４」、物件データの「91-44」等）
+
+    Returns:
+        str: 正規化された地番
+
+    Examples:
+        >>> normalize_lot_number("９１番４４")
+        "91-44"
+        >>> normalize_lot_number("地番 91番地の44")
+        "91-44"
+    """
+    if not lot_number:
+        return ""
+
+    text = unicodedata.normalize("NFKC", lot_number).translate(_HYPHENS_TO_ASCII)
+    text = re.sub(r"\s+", "", text)
+    text = text.removeprefix("地番")
+    text = re.sub(r"番地|番|の", "-", text)
+    return re.sub(r"-+", "-", text).strip("-")
+
+
+def split_search_keywords(term: str) -> List[str]:
+    """
+    検索語を空白（全角含む）で分割して正規化
+
+    Examples:
+        >>> split_search_keywords("札幌　まんしょん")
+        ["札幌", "マンション"]
+    """
+    if not term:
+        return []
+    keywords = [normalize_search_text(word) for word in unicodedata.normalize("NFKC", term).split()]
+    return [kw for kw in keywords if kw]
+
+
 def clean_phone_number(phone_text: str) -> Optional[str]:
     """
     電話番号をクリーニング
@@ -0,0 +1,213 @@
+"""
+REA SQL計測
+
+リクエスト単位でSQLの実行回数・合計時間・最も遅いSQLを記録する。
+SQLAlchemyエンジン（instrument_engine）、READatabase のカーソル、
+AsyncREADatabase（asyncpg）の接続から記録される。
+
+- 計測はリクエスト開始時に begin_request() を呼んだコンテキストでのみ行う
+  （スクリプト等、計測中でない場合は record_query() は何もしない）
+- def エンドポイントはスレッドプールで実行されるが、contextvars はコピーされるため
+  同じ RequestQueryStats に記録される
+- エンドポイントごとの直近 WINDOW 件の集計を endpoint_query_stats に保持する
+  （プロセス単位、複数ワーカーでは各ワーカーの値）
+
+使い方:
+    from shared.query_stats import begin_request, end_request, endpoint_query_stats
+
+    stats = begin_request()
+    try:
+        ...  # リクエスト処理
+    finally:
+        end_request()
+    print(stats.count, stats.total_ms, stats.slowest_sql)
+"""
+import contextvars
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# 記録するSQLの最大長
+MAX_SQL_LENGTH = 500
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize_sql(statement: Any) -> str:
+    """SQLを1行に整形（bytes・psycopg2.sql.Composed も受け付ける）"""
+    if isinstance(statement, bytes):
+        statement = statement.decode("utf-8", errors="replace")
+    elif not isinstance(statement, str):
+        statement = str(statement)
+    sql = _WHITESPACE.sub(" ", statement).strip()
+    if len(sql) > MAX_SQL_LENGTH:
+        sql = sql[:MAX_SQL_LENGTH] + "..."
+    return sql
+
+
+class RequestQueryStats:
+    """1リクエスト分のSQL統計"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.finished_at: Optional[float] = None
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self._slowest_statement: Any = None
+        self._lock = threading.Lock()
+
+    def finish(self) -> None:
+        """計測終了時刻を記録（elapsed_ms を確定する）"""
+        if self.finished_at is None:
+            self.finished_at = time.perf_counter()
+
+    def record(self, statement: Any, elapsed_ms: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            if elapsed_ms >= self.slowest_ms:
+                self.slowest_ms = elapsed_ms
+                # 整形は最も遅いSQLだけ、参照時に行う
+                self._slowest_statement = statement
+
+    @property
+    def slowest_sql(self) -> Optional[str]:
+        if self._slowest_statement is None:
+            return None
+        return _normalize_sql(self._slowest_statement)
+
+    @property
+    def elapsed_ms(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return (end - self.started_at) * 1000
+
+    def server_timing(self) -> str:
+        """Server-Timing ヘッダー値（db: SQL合計 / app: リクエスト全体）"""
+        return (
+            f'db;dur={self.total_ms:.1f};desc="{self.count} queries", '
+            f"app;dur={self.elapsed_ms:.1f}"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.total_ms, 1),
+            "total_ms": round(self.elapsed_ms, 1),
+            "slowest_ms": round(self.slowest_ms, 1),
+            "slowest_sql": self.slowest_sql,
+        }
+
+
+_current: contextvars.ContextVar[Optional[RequestQueryStats]] = contextvars.ContextVar(
+    "rea_request_query_stats", default=None
+)
+
+
+def begin_request() -> RequestQueryStats:
+    """現在のコンテキストで計測を開始"""
+    stats = RequestQueryStats()
+    _current.set(stats)
+    return stats
+
+
+def end_request(finish: bool = True) -> None:
+    """計測を終了（このコンテキストの以降のSQLは記録しない）
+
+    Args:
+        finish: False の場合はコンテキストから外すだけで終了時刻を確定しない
+                （ストリーミングレスポンスは本文の送信後に stats.finish() を呼ぶ）
+    """
+    stats = _current.get()
+    if stats is not None and finish:
+        stats.finish()
+    _current.set(None)
+
+
+def current_request_stats() -> Optional[RequestQueryStats]:
+    return _current.get()
+
+
+def record_query(statement: Any, elapsed_ms: float) -> None:
+    """SQL実行を記録（計測中でなければ何もしない）"""
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed_ms)
+
+
+def instrument_engine(engine) -> None:
+    """SQLAlchemyエンジンのSQL実行を計測対象にする"""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("rea_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("rea_query_start")
+        if starts:
+            record_query(statement, (time.perf_counter() - starts.pop()) * 1000)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None:
+            starts = conn.info.get("rea_query_start")
+            if starts:
+                starts.pop()
+
+
+class EndpointQueryStats:
+    """エンドポイントごとの直近リクエストのSQL統計（ローリング）"""
+
+    WINDOW = 200
+
+    def __init__(self):
+        # (method, path) -> deque[(queries, db_ms, total_ms, slowest_ms, slowest_sql)]
+        self._samples: Dict[Tuple[str, str], Deque[Tuple[int, float, float, float, Optional[str]]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, method: str, path: str, stats: RequestQueryStats) -> None:
+        sample = (stats.count, stats.total_ms, stats.elapsed_ms, stats.slowest_ms, stats._slowest_statement)
+        with self._lock:
+            samples = self._samples.get((method, path))
+            if samples is None:
+                samples = self._samples[(method, path)] = deque(maxlen=self.WINDOW)
+            samples.append(sample)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """エンドポイント別の集計（SQL合計時間の多い順）"""
+        with self._lock:
+            snapshot = {key: list(samples) for key, samples in self._samples.items()}
+
+        result = []
+        for (method, path), samples in snapshot.items():
+            n = len(samples)
+            totals = sorted(s[2] for s in samples)
+            slowest = max(samples, key=lambda s: s[3])
+            result.append({
+                "method": method,
+                "path": path,
+                "requests": n,
+                "avg_queries": round(sum(s[0] for s in samples) / n, 1),
+                "max_queries": max(s[0] for s in samples),
+                "avg_db_ms": round(sum(s[1] for s in samples) / n, 1),
+                "avg_total_ms": round(sum(totals) / n, 1),
+                "p95_total_ms": round(totals[min(n - 1, int(n * 0.95))], 1),
+                "db_ms_sum": round(sum(s[1] for s in samples), 1),
+                "slowest_ms": round(slowest[3], 1),
+                "slowest_sql": _normalize_sql(slowest[4]) if slowest[4] is not None else None,
+            })
+        result.sort(key=lambda item: item["db_ms_sum"], reverse=True)
+        return result
+
+
+# シングルトンインスタンス
+endpoint_query_stats = EndpointQueryStats()
@@ -0,0 +1,224 @@
+"""
+REAスキーマレジストリ
+
+information_schema.columns と column_labels をプロセス内で共有するレジストリ。
+GenericCRUD・MetadataValidator・メタデータAPIはここから読み込む。
+
+- 初回アクセス時に2クエリで全テーブル分を一括ロード
+- refresh() で即時再ロード、invalidate() で次回アクセス時に再ロード
+- 管理画面でcolumn_labelsを更新した場合は invalidate() を呼ぶこと
+- 複数ワーカープロセス間の整合はTTL（MAX_AGE）で担保する
+
+使い方:
+    from shared.schema_registry import schema_registry
+
+    columns = schema_registry.get_db_columns("properties", db)
+    labels = schema_registry.get_column_labels("properties", db)
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from shared.database import READatabase
+
+# テキスト検索対象となるデータ型
+TEXT_DATA_TYPES: Set[str] = {"character varying", "text", "character"}
+
+# 標準のカラムプリセット名（2026-10-18_column_labels_field_presets.sql で登録）
+STANDARD_FIELD_PRESETS: Set[str] = {"list", "map", "export"}
+
+_DB_COLUMNS_QUERY = """
+    SELECT
+        c.table_name,
+        c.column_name,
+        c.data_type,
+        c.udt_name,
+        c.character_maximum_length,
+        c.numeric_precision,
+        c.is_nullable,
+        c.column_default,
+        c.ordinal_position,
+        (pk.column_name IS NOT NULL) AS is_primary_key
+    FROM information_schema.columns c
+    LEFT JOIN (
+        SELECT kcu.table_name, kcu.column_name
+        FROM information_schema.table_constraints tc
+        JOIN information_schema.key_column_usage kcu
+            ON tc.constraint_name = kcu.constraint_name
+            AND tc.table_schema = kcu.table_schema
+        WHERE tc.table_schema = 'public'
+        AND tc.constraint_type = 'PRIMARY KEY'
+    ) pk ON pk.table_name = c.table_name AND pk.column_name = c.column_name
+    WHERE c.table_schema = 'public'
+    ORDER BY c.table_name, c.ordinal_position
+"""
+
+_COLUMN_LABELS_QUERY = """
+    SELECT *
+    FROM column_labels
+    ORDER BY table_name, display_order, column_name
+"""
+
+
+def _fetch_all(db, query: str) -> List[Dict[str, Any]]:
+    """SQLAlchemyセッション または READatabase でクエリを実行し辞書リストを返す"""
+    if db is not None:
+        from sqlalchemy import text
+        return [dict(row._mapping) for row in db.execute(text(query))]
+
+    with READatabase.dict_cursor() as (cur, conn):
+        cur.execute(query)
+        return [dict(row) for row in cur.fetchall()]
+
+
+class SchemaRegistry:
+    """プロセス共有のスキーマ・column_labelsレジストリ"""
+
+    _instance: Optional['SchemaRegistry'] = None
+
+    MAX_AGE = 300  # 5分（他プロセスでの変更を取り込む上限）
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._lock = threading.RLock()
+            cls._instance._columns = {}
+            cls._instance._labels = {}
+            cls._instance._loaded_at = None
+            cls._instance._version = 0
+        return cls._instance
+
+    # ------------------------------------------------------------------
+    # ロード・無効化
+    # ------------------------------------------------------------------
+
+    def _is_stale(self) -> bool:
+        return self._loaded_at is None or time.time() - self._loaded_at > self.MAX_AGE
+
+    def _ensure_loaded(self, db=None) -> None:
+        if not self._is_stale():
+            return
+        with self._lock:
+            if self._is_stale():
+                self.refresh(db)
+
+    def refresh(self, db=None) -> None:
+        """
+        DBから再ロード
+
+        Args:
+            db: SQLAlchemyセッション（Noneの場合はREADatabaseで直接接続）
+        """
+        column_rows = _fetch_all(db, _DB_COLUMNS_QUERY)
+        label_rows = _fetch_all(db, _COLUMN_LABELS_QUERY)
+
+        columns: Dict[str, List[Dict[str, Any]]] = {}
+        for row in column_rows:
+            columns.setdefault(row["table_name"], []).append(row)
+
+        labels: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for row in label_rows:
+            labels.setdefault(row["table_name"], {})[row["column_name"]] = row
+
+        with self._lock:
+            self._columns = columns
+            self._labels = labels
+            self._loaded_at = time.time()
+            self._version += 1
+
+    def invalidate(self) -> None:
+        """次回アクセス時に再ロードさせる"""
+        with self._lock:
+            self._loaded_at = None
+
+    @property
+    def version(self) -> int:
+        """再ロードのたびに増える番号（派生キャッシュの更新判定用）"""
+        return self._version
+
+    def stats(self) -> Dict[str, Any]:
+        """レジストリの状態（管理画面用）"""
+        return {
+            "loaded": self._loaded_at is not None,
+            "loaded_at": self._loaded_at,
+            "version": self._version,
+            "table_count": len(self._columns),
+            "labeled_table_count": len(self._labels),
+            "max_age_seconds": self.MAX_AGE,
+        }
+
+    # ------------------------------------------------------------------
+    # 実DBカラム（information_schema）
+    # ------------------------------------------------------------------
+
+    def get_column_info(self, table_name: str, db=None) -> List[Dict[str, Any]]:
+        """
+        実DBカラムの詳細（ordinal_position順）
+
+        Returns:
+            [{column_name, data_type, udt_name, is_nullable, ordinal_position, is_primary_key, ...}]
+            ※ 読み取り専用として扱うこと
+        """
+        self._ensure_loaded(db)
+        return self._columns.get(table_name, [])
+
+    def get_db_columns(self, table_name: str, db=None) -> List[str]:
+        """実DBカラム名一覧（ordinal_position順）"""
+        return [c["column_name"] for c in self.get_column_info(table_name, db)]
+
+    def get_text_columns(self, table_name: str, db=None) -> List[str]:
+        """テキスト型カラム名一覧（検索対象の自動検出用）"""
+        return [
+            c["column_name"]
+            for c in self.get_column_info(table_name, db)
+            if c["data_type"] in TEXT_DATA_TYPES
+        ]
+
+    # ------------------------------------------------------------------
+    # column_labels
+    # ------------------------------------------------------------------
+
+    def get_column_labels(self, table_name: str, db=None) -> Dict[str, Dict[str, Any]]:
+        """
+        column_labelsの行（display_order, column_name順）
+
+        Returns:
+            {column_name: column_labelsの全カラム}
+            ※ 読み取り専用として扱うこと
+        """
+        self._ensure_loaded(db)
+        return self._labels.get(table_name, {})
+
+    def get_all_column_labels(self, db=None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """全テーブルのcolumn_labels {table_name: {column_name: row}}"""
+        self._ensure_loaded(db)
+        return self._labels
+
+    def get_label_columns(self, table_name: str, db=None) -> List[str]:
+        """column_labelsに登録されたカラム名一覧（display_order, column_name順）"""
+        return list(self.get_column_labels(table_name, db).keys())
+
+    def get_updatable_columns(self, table_name: str, db=None) -> Set[str]:
+        """column_labelsで is_updatable = true のカラム名"""
+        return {
+            column_name
+            for column_name, label in self.get_column_labels(table_name, db).items()
+            if label.get("is_updatable") is True
+        }
+
+    def get_field_presets(self, table_name: str, db=None) -> Dict[str, List[str]]:
+        """
+        column_labels.field_presets から組み立てたカラムプリセット
+
+        Returns:
+            {preset_name: [column_name, ...]}（display_order, column_name順）
+        """
+        presets: Dict[str, List[str]] = {}
+        for column_name, label in self.get_column_labels(table_name, db).items():
+            for preset in label.get("field_presets") or []:
+                presets.setdefault(preset, []).append(column_name)
+        return presets
+
+
+# シングルトンインスタンス
+schema_registry = SchemaRegistry()
@@ -0,0 +1,336 @@
+"""
+登記事項証明書 パーサー（rea-api / rea-scraper 共通）
+
+PDFから抽出したテキスト（登記情報提供サービスの罫線テーブル形式）を構造化データに変換する。
+
+1. テキストを1回走査して区画に分割
+   表題部（土地の表示）/ 表題部（建物の表示）/ 権利部（甲区）/ 権利部（乙区）/ 共同担保目録
+2. 各区画のテキストに対して、その区画にある項目の正規表現だけを実行（モジュール読み込み時にコンパイル済み）
+   - 表題部（土地）: 所在・地番・地目・地積
+   - 表題部（建物）: 所在・家屋番号・種類・構造・床面積・新築年月日
+   - 甲区: 所有者（最新）
+   - 乙区: 抵当権
+
+注意事項:
+- PDFテキスト抽出では下線情報が失われるため、抹消事項の判別は不可
+- 履歴がある場合は最新（後に出現したもの）の情報を抽出
+"""
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+# 区画
+SECTION_PREAMBLE = "preamble"
+SECTION_LAND = "land"
+SECTION_BUILDING = "building"
+SECTION_KOU = "kou"
+SECTION_OTSU = "otsu"
+SECTION_COLLATERAL = "collateral"
+
+_ZENKAKU_TO_HANKAKU = str.maketrans('０１２３４５６７８９：．，', '0123456789:.,')
+
+_ERA_START = {'明治': 1868, '大正': 1912, '昭和': 1926, '平成': 1989, '令和': 2019}
+
+LAND_CATEGORIES = ('宅地', '畑', '田', '山林', '原野', '雑種地', '公衆用道路', '墓地', '池沼')
+BUILDING_TYPES = ('居宅', '共同住宅', '店舗', '事務所', '倉庫', '工場', '車庫')
+
+# 区画の見出し（表題部 / 権利部 / 共同担保目録 を含む行が区画の始まり）
+# 候補の行は「部」「録」の1文字で探す（sre は選択・文字クラスより単一リテラルの検索がはるかに速い）
+_HEADER_CANDIDATES = (re.compile('部'), re.compile('録'))
+_HEADER_KEYWORDS = ('表題部', '権利部', '共同担保目録')
+_PAGE_MARKER = re.compile(r'--- Page \d+ ---\n?')
+
+# 区画のテキスト全体に対して検索するため、改行をまたがない空白（[^\S\n]）を使う
+_REAL_ESTATE_NUMBER = re.compile(r'不動産番号[│\|]?[^\S\n]*([０-９\d]+)')
+_LOCATION = re.compile(r'所[^\S\n]*在[│\|]([^│┃\n]+)')
+_LOCATION_HISTORY = re.compile(r'年|月|日|変更|登記')
+_LOT_NUMBER = re.compile(r'([０-９\d]+番[０-９\d]*)[^\S\n]*│')
+_LAND_CATEGORY = re.compile(
+    r'│[^\S\n]?(' + '|'.join(sorted(LAND_CATEGORIES, key=len, reverse=True)) + ')'
+)
+# 地積: │ 181：80 │ / │ 4521 │（小数点以下なし）
+_LAND_AREA = re.compile(r'│[^\S\n]*([０-９\d]+)(?:[：:]([０-９\d]*))?[^\S\n]*│')
+_BUILDING_NUMBER = re.compile(r'家屋番号[│\|][^\S\n]*([^│┃\n]+)')
+_BUILDING_TYPE = re.compile('|'.join(BUILDING_TYPES))
+_STRUCTURE = re.compile(r'│((?:木造|軽量鉄骨|鉄骨鉄筋コンクリート|鉄筋コンクリート|鉄骨)[^│\n]*(?:階|平家))')
+_FLOOR_AREA = re.compile(r'([１２３４５６７８９\d]+)階[^\S\n]*([０-９\d]+)[：:]([０-９\d]+)')
+_CONSTRUCTION_DATE = re.compile(r'(明治|大正|昭和|平成|令和)([０-９\d]+)年([０-９\d]+)月([０-９\d]+)日新築')
+_OWNER_ADDRESS = re.compile(r'所有者[^\S\n]+([^┃\n]+)')
+_OWNER_NAME = re.compile(r'[│┃]\s*([^│┃\d０-９\n]{2,})\s*┃')
+_OWNER_NAME_LINE = re.compile(r'^\s*([^\d０-９│┃\n]{2,})\s*┃$')
+_OWNER_SKIP_WORDS = ('移記', '登記', '原因', '売買', '相続', '平成', '昭和', '令和', '順位')
+_MORTGAGE_AMOUNT = re.compile(r'債権額[^\S\n]*金([０-９\d,，]+)万?円')
+_MORTGAGE_HOLDER = re.compile(r'抵当権者[^\S\n]+([^\n│┃]+)')
+
+
+def normalize(text: str) -> str:
+    """全角数字を半角に変換"""
+    return text.translate(_ZENKAKU_TO_HANKAKU)
+
+
+def _section_of(header_line: str) -> Optional[str]:
+    """見出し行の区画（見出しでない・判定できない場合は None）"""
+    squashed = ''.join(header_line.split())
+    if not any(keyword in squashed for keyword in _HEADER_KEYWORDS):
+        return None
+    if '共同担保目録' in squashed:
+        return SECTION_COLLATERAL
+    if '甲区' in squashed:
+        return SECTION_KOU
+    if '乙区' in squashed:
+        return SECTION_OTSU
+    if '土地の表示' in squashed:
+        return SECTION_LAND
+    if '建物の表示' in squashed:
+        return SECTION_BUILDING
+    return None
+
+
+def split_sections(raw_text: str) -> Dict[str, str]:
+    """
+    テキストを1回走査して区画ごとのテキストに分割
+
+    見出し行はその区画に含める（表題部の見出し行に不動産番号がある）。
+    ページ区切り（--- Page n ---）では区画は変わらない（次ページの同じ区画に続く）。
+    """
+    text = _PAGE_MARKER.sub('', raw_text) if '--- Page' in raw_text else raw_text
+    chunks: Dict[str, List[str]] = {}
+    section, start = SECTION_PREAMBLE, 0
+    line_starts = sorted({
+        text.rfind('\n', 0, match.start()) + 1
+        for pattern in _HEADER_CANDIDATES
+        for match in pattern.finditer(text)
+    })
+    for line_start in line_starts:
+        line_end = text.find('\n', line_start)
+        next_section = _section_of(text[line_start:line_end if line_end != -1 else len(text)])
+        if next_section is None:
+            continue
+        chunks.setdefault(section, []).append(text[start:line_start])
+        section, start = next_section, line_start
+    chunks.setdefault(section, []).append(text[start:])
+    return {name: ''.join(parts) for name, parts in chunks.items()}
+
+
+def _extract_location(text: str) -> Optional[str]:
+    """所在（最新）- 日付・変更履歴の行を除外"""
+    for loc in reversed(_LOCATION.findall(text)):
+        loc = loc.strip()
+        if loc and not _LOCATION_HISTORY.search(loc):
+            return loc
+    return None
+
+
+def _extract_land_info(text: str) -> Dict[str, Any]:
+    """表題部（土地）"""
+    info: Dict[str, Any] = {}
+    location = _extract_location(text)
+    if location:
+        info['location'] = location
+
+    # 地番 - 最初に出現したもの
+    match = _LOT_NUMBER.search(text)
+    if match:
+        info['lot_number'] = normalize(match.group(1))
+
+    # 地目・地積 - 最後に出現したもの（最新）
+    categories = _LAND_CATEGORY.findall(text)
+    if categories:
+        info['land_category'] = categories[-1]
+
+    areas = _LAND_AREA.findall(text)
+    if areas:
+        whole, decimal = areas[-1]
+        land_area = float(normalize(whole))
+        if decimal:
+            land_area += float(normalize(decimal)) / 100
+        info['land_area_m2'] = round(land_area, 2)
+    return info
+
+
+def _convert_japanese_date(era: str, year: str, month: str, day: str) -> str:
+    """和暦を西暦（YYYY-MM-DD）に変換"""
+    western_year = _ERA_START.get(era, 1900) + int(normalize(year)) - 1
+    return f"{western_year}-{int(normalize(month)):02d}-{int(normalize(day)):02d}"
+
+
+def _extract_building_info(text: str) -> Dict[str, Any]:
+    """表題部（建物）"""
+    info: Dict[str, Any] = {}
+    location = _extract_location(text)
+    if location:
+        info['location'] = location
+
+    match = _BUILDING_NUMBER.search(text)
+    if match:
+        info['building_number'] = normalize(match.group(1).strip())
+
+    # 種類は出現位置ではなく BUILDING_TYPES の順で優先
+    building_types = set(_BUILDING_TYPE.findall(text))
+    for building_type in BUILDING_TYPES:
+        if building_type in building_types:
+            info['building_type'] = building_type
+            break
+
+    match = _STRUCTURE.search(text)
+    if match:
+        structure = match.group(1)
+        info['structure'] = structure if structure.endswith('建') else structure + '建'
+
+    # 床面積 - 同じ階が複数回ある場合（増築・変更）は後のものを採用
+    floor_areas: Dict[str, float] = {}
+    for floor, whole, decimal in _FLOOR_AREA.findall(text):
+        area = float(normalize(whole)) + float(normalize(decimal)) / 100
+        floor_areas[f'floor_{int(normalize(floor))}'] = round(area, 2)
+    if floor_areas:
+        info['floor_areas'] = floor_areas
+        info['total_floor_area_m2'] = round(sum(floor_areas.values()), 2)
+
+    match = _CONSTRUCTION_DATE.search(text)
+    if match:
+        info['construction_date'] = _convert_japanese_date(*match.groups())
+    return info
+
+
+def _extract_owner_info(text: str) -> Dict[str, Any]:
+    """
+    所有者（最新）
+
+    「所有者 住所」の行の後、数行以内にある名前を探す（住所が複数行にまたがる場合に対応）。
+    """
+    latest = None
+    for addr_match in _OWNER_ADDRESS.finditer(text):
+        line_start = text.rfind('\n', 0, addr_match.start()) + 1
+        pos = text.find('\n', addr_match.end())
+        if pos == -1:
+            pos = len(text)
+        # 「登記名義人」は除外（注釈文）
+        if '登記名義人' in text[line_start:pos]:
+            continue
+        address = addr_match.group(1).strip().rstrip('│')
+
+        # 続く3行
+        for _ in range(3):
+            if pos >= len(text):
+                break
+            next_line_end = text.find('\n', pos + 1)
+            if next_line_end == -1:
+                next_line_end = len(text)
+            check_line = text[pos + 1:next_line_end]
+            pos = next_line_end
+
+            name_match = _OWNER_NAME.search(check_line) or _OWNER_NAME_LINE.search(check_line)
+            if not name_match:
+                continue
+            name = ''.join(name_match.group(1).split())
+            # 名前らしいか判定（2文字以上の非数字で、登記関連用語でない）
+            if len(name) >= 2 and not any(w in name for w in _OWNER_SKIP_WORDS):
+                latest = {'owner_address': address, 'owner_name': name}
+                break
+    return latest or {}
+
+
+def _extract_mortgage_info(text: str) -> List[Dict[str, Any]]:
+    """抵当権（乙区）"""
+    if '抵当権設定' not in text:
+        return []
+
+    holders = _MORTGAGE_HOLDER.findall(text)
+    mortgages = []
+    for i, amount_str in enumerate(_MORTGAGE_AMOUNT.findall(text)):
+        mortgage = {
+            'type': '抵当権',
+            'amount': int(normalize(amount_str).replace(',', '')),
+        }
+        if i < len(holders):
+            mortgage['holder'] = holders[i].strip()
+        mortgages.append(mortgage)
+    return mortgages
+
+
+def calculate_confidence(result: Dict[str, Any]) -> float:
+    """パース結果の信頼度（0.0-1.0、抽出できた主要項目の割合）"""
+    checks = [bool(result.get('real_estate_number'))]
+
+    if result['document_type'] in ('land', 'both'):
+        land = result.get('land_info', {})
+        checks += [bool(land.get(k)) for k in ('location', 'lot_number', 'land_category', 'land_area_m2')]
+
+    if result['document_type'] in ('building', 'both'):
+        building = result.get('building_info', {})
+        checks += [bool(building.get(k)) for k in (
+            'location', 'building_number', 'building_type', 'structure', 'total_floor_area_m2'
+        )]
+
+    owner = result.get('owner_info', {})
+    checks += [bool(owner.get('owner_name')), bool(owner.get('owner_address'))]
+
+    return round(sum(checks) / len(checks), 2)
+
+
+class ToukiParser:
+    """登記事項証明書テキストをパースして構造化データに変換"""
+
+    def normalize(self, text: str) -> str:
+        """全角数字を半角に変換"""
+        return normalize(text)
+
+    def parse(self, raw_text: str) -> Dict[str, Any]:
+        """
+        生テキストをパースして構造化データに変換
+
+        Args:
+            raw_text: PDFから抽出した生テキスト
+
+        Returns:
+            {document_type, real_estate_number, land_info, building_info,
+             owner_info, mortgage_info, parsed_at, confidence}
+        """
+        parsed_at = datetime.now(timezone.utc).isoformat()
+        if not raw_text:
+            return {'error': 'Empty text', 'parsed_at': parsed_at}
+
+        sections = split_sections(raw_text)
+        land_text = sections.get(SECTION_LAND)
+        building_text = sections.get(SECTION_BUILDING)
+
+        if land_text and building_text:
+            document_type = 'both'
+        elif building_text:
+            document_type = 'building'
+        elif land_text:
+            document_type = 'land'
+        else:
+            document_type = 'unknown'
+
+        real_estate_number = None
+        for section in (SECTION_PREAMBLE, SECTION_LAND, SECTION_BUILDING):
+            match = _REAL_ESTATE_NUMBER.search(sections.get(section, ''))
+            if match:
+                real_estate_number = normalize(match.group(1))
+                break
+
+        # 所有者は甲区から。甲区が無い（表題部に所有者が記載される）場合は全体から探す
+        owner_info = _extract_owner_info(sections.get(SECTION_KOU, ''))
+        if not owner_info:
+            owner_info = _extract_owner_info(raw_text)
+
+        result = {
+            'document_type': document_type,
+            'real_estate_number': real_estate_number,
+            'land_info': _extract_land_info(land_text) if land_text else {},
+            'building_info': _extract_building_info(building_text) if building_text else {},
+            'owner_info': owner_info,
+            'mortgage_info': _extract_mortgage_info(sections.get(SECTION_OTSU, '')),
+            'parsed_at': parsed_at,
+        }
+        result['confidence'] = calculate_confidence(result)
+        return result
+
+
+_default_parser = ToukiParser()
+
+
+def parse_touki(raw_text: str) -> Dict[str, Any]:
+    """登記事項証明書テキストをパース（ToukiParser().parse と同じ）"""
+    return _default_parser.parse(raw_text)
@@ -17,7 +17,8 @@ column_labelsテーブルのis_updatable, is_required, data_type等を使用し
 """
 
 from typing import Dict, Any, List, Set, Optional, Tuple
-from functools import lru_cache
+
+from shared.schema_registry import schema_registry
 
 
 class MetadataValidator:
@@ -29,66 +30,25 @@ class MetadataValidator:
             db_session: SQLAlchemyセッション（Noneの場合は直接接続）
         """
         self.db = db_session
-        self._cache: Dict[str, Dict[str, Any]] = {}
 
     def _get_column_metadata(self, table_name: str) -> Dict[str, Dict[str, Any]]:
         """
-        テーブルのカラムメタデータを取得（キャッシュ付き）
+        テーブルのカラムメタデータを取得（スキーマレジストリ経由）
 
         Returns:
             {column_name: {is_updatable, is_required, data_type, ...}}
         """
-        if table_name in self._cache:
-            return self._cache[table_name]
-
-        if self.db is None:
-            from shared.database import READatabase
-            db = READatabase()
-            conn = db.get_connection()
-            cur = conn.cursor()
-        else:
-            from sqlalchemy import text
-            result = self.db.execute(text("""
-                SELECT column_name, is_updatable, is_required, data_type,
-                       input_type, japanese_label
-                FROM column_labels
-                WHERE table_name = :table_name
-            """), {"table_name": table_name})
-
-            metadata = {}
-            for row in result:
-                metadata[row.column_name] = {
-                    'is_updatable': row.is_updatable,
-                    'is_required': row.is_required,
-                    'data_type': row.data_type,
-                    'input_type': row.input_type,
-                    'label': row.japanese_label,
-                }
-            self._cache[table_name] = metadata
-            return metadata
-
-        try:
-            cur.execute("""
-                SELECT column_name, is_updatable, is_required, data_type,
-                       input_type, japanese_label
-                FROM column_labels
-                WHERE table_name = %s
-            """, (table_name,))
-
-            metadata = {}
-            for row in cur.fetchall():
-                metadata[row[0]] = {
-                    'is_updatable': row[1],
-                    'is_required': row[2],
-                    'data_type': row[3],
-                    'input_type': row[4],
-                    'label': row[5],
-                }
-            self._cache[table_name] = metadata
-            return metadata
-        finally:
-            cur.close()
-            conn.close()
+        labels = schema_registry.get_column_labels(table_name, self.db)
+        return {
+            column_name: {
+                'is_updatable': row.get('is_updatable'),
+                'is_required': row.get('is_required'),
+                'data_type': row.get('data_type'),
+                'input_type': row.get('input_type'),
+                'label': row.get('japanese_label'),
+            }
+            for column_name, row in labels.items()
+        }
 
     def get_updatable_columns(self, table_name: str) -> Set[str]:
         """更新可能なカラム名のセットを取得"""
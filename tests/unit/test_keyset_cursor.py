@@ -0,0 +1,145 @@
+"""
+キーセットページネーション（rea-api/app/crud/generic.py）のカーソルテスト
+
+encode_cursor / decode_cursor と GenericCRUD._keyset_condition を確認する。
+生成したWHERE条件は sqlite（行値比較・NULLS FIRST/LAST をPostgreSQLの既定に合わせて指定）で
+実行し、カーソルで全ページを辿った結果が ORDER BY で一括取得した結果と一致することを確認する。
+
+実行: python -m pytest tests/unit/test_keyset_cursor.py
+"""
+import base64
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "rea-api"))
+
+from app.crud.generic import GenericCRUD, decode_cursor, encode_cursor  # noqa: E402
+
+# price に NULL と同値を含む
+ROWS = [
+    (1, 300), (2, None), (3, 100), (4, 300), (5, None),
+    (6, 200), (7, 100), (8, None), (9, 300), (10, 200),
+]
+
+
+@pytest.fixture
+def crud():
+    return GenericCRUD(db=None)
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, price INTEGER)")
+    conn.executemany("INSERT INTO items (id, price) VALUES (?, ?)", ROWS)
+    yield conn
+    conn.close()
+
+
+def _order_by(sort_by, sort_order):
+    # PostgreSQLの既定: ASC は NULLS LAST、DESC は NULLS FIRST
+    nulls = "NULLS FIRST" if sort_order == "desc" else "NULLS LAST"
+    return f"{sort_by} {sort_order} {nulls}, id {sort_order}"
+
+
+def _paginate(crud, conn, sort_by, sort_order, page_size):
+    ids = []
+    cursor = None
+    while True:
+        where, params = ("1 = 1", {})
+        if cursor:
+            where, params = crud._keyset_condition(cursor, sort_by, sort_order)
+        rows = conn.execute(
+            f"SELECT id, price FROM items WHERE {where} ORDER BY {_order_by(sort_by, sort_order)} LIMIT {page_size}",
+            params,
+        ).fetchall()
+        if not rows:
+            return ids
+        ids.extend(row[0] for row in rows)
+        last_id, last_price = rows[-1]
+        cursor = encode_cursor(sort_by, sort_order, {"id": last_id, "price": last_price})
+
+
+class TestCursorToken:
+    def test_round_trip(self):
+        cursor = encode_cursor("price", "desc", {"id": 7, "price": 100, "name": "物件"})
+        assert decode_cursor(cursor) == {"s": "price", "o": "desc", "v": 100, "id": 7}
+
+    def test_url_safe_without_padding(self):
+        cursor = encode_cursor("property_name", "asc", {"id": 1, "property_name": "札幌?&/マンション"})
+        assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+        assert decode_cursor(cursor)["v"] == "札幌?&/マンション"
+
+    def test_missing_sort_column_falls_back_to_id(self):
+        assert decode_cursor(encode_cursor("price", "asc", {"id": 3}))["s"] == "id"
+
+    @pytest.mark.parametrize("cursor", [
+        "!!!not-base64!!!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+        base64.urlsafe_b64encode(json.dumps([1, 2]).encode()).decode(),
+        base64.urlsafe_b64encode(json.dumps({"s": "id", "o": "asc", "v": 1}).encode()).decode(),
+        encode_cursor("price", "asc", {"id": 3, "price": 100})[:-4],
+    ])
+    def test_invalid_tokens(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestKeysetCondition:
+    @pytest.mark.parametrize("sort_by, sort_order", [
+        ("price", "asc"),
+        ("price", "desc"),
+        ("id", "asc"),
+        ("id", "desc"),
+    ])
+    @pytest.mark.parametrize("page_size", [1, 2, 3, 4, 10])
+    def test_pages_match_full_order(self, crud, conn, sort_by, sort_order, page_size):
+        expected = [row[0] for row in conn.execute(
+            f"SELECT id FROM items ORDER BY {_order_by(sort_by, sort_order)}"
+        )]
+        assert _paginate(crud, conn, sort_by, sort_order, page_size) == expected
+
+    def test_null_cursor_asc_continues_within_trailing_nulls(self, crud):
+        cursor = encode_cursor("price", "asc", {"id": 2, "price": None})
+        condition, params = crud._keyset_condition(cursor, "price", "asc")
+        assert condition == "(price IS NULL AND id > :cursor_id)"
+        assert params == {"cursor_id": 2}
+
+    def test_null_cursor_desc_continues_into_non_null(self, crud):
+        cursor = encode_cursor("price", "desc", {"id": 8, "price": None})
+        condition, params = crud._keyset_condition(cursor, "price", "desc")
+        assert condition == "((price IS NULL AND id < :cursor_id) OR price IS NOT NULL)"
+        assert params == {"cursor_id": 8}
+
+    def test_value_cursor_asc_includes_trailing_nulls(self, crud):
+        cursor = encode_cursor("price", "asc", {"id": 6, "price": 200})
+        condition, params = crud._keyset_condition(cursor, "price", "asc")
+        assert condition == "((price, id) > (:cursor_value, :cursor_id) OR price IS NULL)"
+        assert params == {"cursor_id": 6, "cursor_value": 200}
+
+    def test_sort_expr_replaces_column(self, crud):
+        cursor = encode_cursor("search_rank", "desc", {"id": 5, "search_rank": 0.5})
+        condition, _ = crud._keyset_condition(cursor, "search_rank", "desc", sort_expr="similarity(x, :q)")
+        assert condition == "(similarity(x, :q), id) < (:cursor_value, :cursor_id)"
+
+    @pytest.mark.parametrize("sort_by, sort_order", [
+        ("price", "desc"),   # 並び順の変更
+        ("id", "asc"),       # ソートカラムの変更
+        ("created_at", "asc"),
+    ])
+    def test_rejects_mismatched_cursor(self, crud, sort_by, sort_order):
+        cursor = encode_cursor("price", "asc", {"id": 6, "price": 200})
+        with pytest.raises(ValueError, match="does not match"):
+            crud._keyset_condition(cursor, sort_by, sort_order)
+
+    def test_rejects_tampered_cursor(self, crud):
+        cursor = encode_cursor("price", "asc", {"id": 6, "price": 200})
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            crud._keyset_condition(cursor[:5] + "$" + cursor[6:], "price", "asc")
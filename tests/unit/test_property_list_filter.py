@@ -0,0 +1,127 @@
+"""
+一括処理の対象条件（rea-api/app/api/api_v1/endpoints/properties.py の PropertyListFilter）のテスト
+
+resolve_target_ids（一括更新・公開可否一括チェック）が filter から決める物件IDが、
+同じ条件で GET /properties（read_properties）が返す物件と一致することを確認する。
+GenericCRUD は受け取った条件（filters / range_filters / search_term）をメモリ上で
+評価するフェイクに差し替える。
+
+実行: python -m pytest tests/unit/test_property_list_filter.py
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "rea-api"))
+
+pytest.importorskip("fastapi")
+
+from app.api.api_v1.endpoints import properties  # noqa: E402
+from app.api.api_v1.endpoints.properties import (  # noqa: E402
+    PropertyListFilter,
+    read_properties,
+    resolve_target_ids,
+)
+
+ROWS = [
+    {"id": 1, "property_name": "北見マンション", "company_property_number": "A-001",
+     "property_type": "mansion", "sales_status": "販売中", "publication_status": "公開", "sale_price": 12000000},
+    {"id": 2, "property_name": "北見戸建", "company_property_number": "A-002",
+     "property_type": "detached", "sales_status": "販売中", "publication_status": "非公開", "sale_price": 8000000},
+    {"id": 3, "property_name": "網走マンション", "company_property_number": "B-001",
+     "property_type": "mansion", "sales_status": "成約済", "publication_status": "公開", "sale_price": 15000000},
+    {"id": 4, "property_name": "北見土地", "company_property_number": "B-002",
+     "property_type": "land", "sales_status": "販売中", "publication_status": "公開", "sale_price": None},
+    {"id": 5, "property_name": "札幌マンション", "company_property_number": "C-北見",
+     "property_type": "mansion", "sales_status": "販売中", "publication_status": "公開", "sale_price": 30000000},
+]
+
+
+class FakeCRUD:
+    """一覧系メソッドの条件をメモリ上の ROWS に適用する GenericCRUD の代わり"""
+
+    def __init__(self, db):
+        pass
+
+    def resolve_fields(self, table_name, fields):
+        return None
+
+    @staticmethod
+    def _matches(row, filters, range_filters, search_term, search_columns):
+        for key, value in (filters or {}).items():
+            if isinstance(value, str) and "%" in value:
+                if value.strip("%") not in (row[key] or ""):
+                    return False
+            elif row[key] != value:
+                return False
+        for key, value in (range_filters or {}).items():
+            column, op = key.rsplit("__", 1)
+            if row[column] is None or (op == "gte" and row[column] < value) or (op == "lte" and row[column] > value):
+                return False
+        if search_term:
+            assert search_columns, "検索語を渡す場合は search_columns も指定する"
+            if not any(search_term in (row[column] or "") for column in search_columns):
+                return False
+        return True
+
+    def _select(self, filters=None, range_filters=None, search_term=None, search_columns=None):
+        return [
+            dict(row) for row in ROWS
+            if self._matches(row, filters, range_filters, search_term, search_columns)
+        ]
+
+    def get_list_with_total(self, table_name, skip=0, limit=100, filters=None, range_filters=None,
+                            sort_by="id", sort_order="desc", cursor=None, search_term=None,
+                            search_columns=None, fields=None):
+        items = self._select(filters, range_filters, search_term, search_columns)
+        return items[skip:skip + limit], len(items)
+
+    def iter_list(self, table_name, filters=None, range_filters=None, sort_by="id", sort_order="desc",
+                  search_term=None, search_columns=None, fields=None, batch_size=1000):
+        yield from self._select(filters, range_filters, search_term, search_columns)
+
+
+@pytest.fixture(autouse=True)
+def fake_crud(monkeypatch):
+    monkeypatch.setattr(properties, "GenericCRUD", FakeCRUD)
+    monkeypatch.setattr(properties, "require_auth", lambda request: None)
+
+
+def _list_ids(list_filter: PropertyListFilter):
+    response = read_properties(
+        request=None,
+        skip=0,
+        limit=1000,
+        sort_by="id",
+        sort_order="desc",
+        cursor=None,
+        count="exact",
+        fields=None,
+        db=None,
+        **list_filter.model_dump(),
+    )
+    return {item["id"] for item in response["items"]}
+
+
+@pytest.mark.parametrize("conditions", [
+    {"search": "北見"},
+    {"search": "マンション", "sale_price_max": 20000000},
+    {"search": "北見", "property_type": "mansion"},  # 検索時は完全一致フィルタを使わない
+    {"property_type": "mansion"},
+    {"sales_status": "販売中", "publication_status": "公開"},
+    {"sale_price_min": 10000000},
+    {"search": "該当なし"},
+])
+def test_filter_ids_match_list(conditions):
+    list_filter = PropertyListFilter(**conditions)
+    ids = resolve_target_ids(FakeCRUD(None), None, list_filter, 1000, "一括更新")
+    assert set(ids) == _list_ids(list_filter)
+    assert ids == sorted(ids)
+
+
+def test_search_narrows_targets():
+    ids = resolve_target_ids(FakeCRUD(None), None, PropertyListFilter(search="北見"), 1000, "一括更新")
+    assert ids == [1, 2, 4, 5]
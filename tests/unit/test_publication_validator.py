@@ -0,0 +1,258 @@
+"""
+公開時バリデーション（rea-api/app/services/publication_validator.py）のルールテスト
+
+compile_publication_rules / evaluate_publication_rules を固定の column_labels・master_options で実行し、
+コンパイル前の実装（should_exclude_field・validate_for_publication が都度DBを参照していた版）と
+同じ判定になることを確認する。
+
+実行: python -m pytest tests/unit/test_publication_validator.py
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "rea-api"))
+
+from app.services.publication_validator import (  # noqa: E402
+    compile_publication_rules,
+    evaluate_publication_rules,
+)
+
+PROPERTY_TYPE = "land"
+
+# use_district の選択肢（option_code → option_value）
+MASTER_OPTIONS = {
+    "use_district": {
+        "1": "第一種低層住居専用地域",
+        "8": "商業地域",
+        "99": "無指定",
+    },
+}
+
+
+def _label(column_name, **extra):
+    label = {
+        "column_name": column_name,
+        "japanese_label": column_name,
+        "group_name": "基本情報",
+        "required_for_publication": [PROPERTY_TYPE],
+    }
+    label.update(extra)
+    return label
+
+
+def _compile(*labels, master_options=MASTER_OPTIONS, property_type=PROPERTY_TYPE):
+    all_labels = {"properties": {label["column_name"]: label for label in labels}}
+    return compile_publication_rules(property_type, all_labels, master_options)
+
+
+def _missing(rules, property_data):
+    return [field["label"] for field in evaluate_publication_rules(rules, property_data)]
+
+
+# =============================================================================
+# exclude_when_flag
+# =============================================================================
+
+class TestExcludeWhenFlag:
+    RULES = _compile(
+        _label("road_info", required_for_publication=None, special_flag_key="no_road_access"),
+        _label("setback", conditional_exclusion={"depends_on": "road_info", "exclude_when_flag": "no_road_access"}),
+    )
+
+    @pytest.mark.parametrize("road_info, excluded", [
+        ({"no_road_access": True}, True),
+        ({"no_road_access": False}, False),
+        ({"no_road_access": "true"}, False),  # True（bool）のみフラグとみなす
+        ({}, False),
+        ("no_road_access", False),
+        (None, False),
+    ])
+    def test_flag(self, road_info, excluded):
+        missing = _missing(self.RULES, {"road_info": road_info})
+        assert missing == ([] if excluded else ["setback"])
+
+
+# =============================================================================
+# exclude_when_option_value
+# =============================================================================
+
+class TestExcludeWhenOptionValue:
+    RULES = _compile(
+        _label("use_district", required_for_publication=None, master_category_code="use_district"),
+        _label(
+            "building_coverage_ratio",
+            conditional_exclusion={"depends_on": "use_district", "exclude_when_option_value": ["無指定"]},
+        ),
+    )
+
+    @pytest.mark.parametrize("use_district, excluded", [
+        # JSONB配列（いずれかのコードが除外対象なら除外）
+        (["99"], True),
+        (["1", "99"], True),
+        ([99], True),
+        (["1"], False),
+        (["8", "1"], False),
+        ([], False),
+        # 後方互換: 整数・文字列のコード
+        (99, True),
+        ("99", True),
+        (1, False),
+        ("8", False),
+        # マスタに無いコード・表示名そのもの（コードでないので一致しない）
+        ("5", False),
+        ("無指定", False),
+        (None, False),
+    ])
+    def test_option_value(self, use_district, excluded):
+        missing = _missing(self.RULES, {"use_district": use_district})
+        assert missing == ([] if excluded else ["building_coverage_ratio"])
+
+    def test_without_master_category_code_never_excludes(self):
+        rules = _compile(
+            _label("use_district", required_for_publication=None),
+            _label(
+                "building_coverage_ratio",
+                conditional_exclusion={"depends_on": "use_district", "exclude_when_option_value": ["無指定"]},
+            ),
+        )
+        assert _missing(rules, {"use_district": "99"}) == ["building_coverage_ratio"]
+
+    def test_inactive_option_is_not_matched(self):
+        # master_options は is_active = TRUE のみ（無指定が無効化されている場合）
+        rules = _compile(
+            _label("use_district", required_for_publication=None, master_category_code="use_district"),
+            _label(
+                "building_coverage_ratio",
+                conditional_exclusion={"depends_on": "use_district", "exclude_when_option_value": ["無指定"]},
+            ),
+            master_options={"use_district": {"1": "第一種低層住居専用地域"}},
+        )
+        assert _missing(rules, {"use_district": "99"}) == ["building_coverage_ratio"]
+
+
+# =============================================================================
+# exclude_when
+# =============================================================================
+
+class TestExcludeWhen:
+    @pytest.mark.parametrize("exclude_when, depends_value, excluded", [
+        # 文字列で一致
+        (["detached"], "detached", True),
+        (["detached"], "mansion", False),
+        # コードで一致（型が違っても文字列として一致すれば除外）
+        ([3], 3, True),
+        ([3], "3", True),
+        (["3"], 3, True),
+        (["3"], 4, False),
+        # 配列・None は要素単位では比較しない
+        (["detached"], ["detached"], False),
+        (["detached"], None, False),
+        ([], "detached", False),
+    ])
+    def test_value(self, exclude_when, depends_value, excluded):
+        rules = _compile(
+            _label("building_kind", required_for_publication=None),
+            _label("room_floor", conditional_exclusion={"depends_on": "building_kind", "exclude_when": exclude_when}),
+        )
+        missing = _missing(rules, {"building_kind": depends_value})
+        assert missing == ([] if excluded else ["room_floor"])
+
+    def test_default_exclusions_when_no_rules_configured(self):
+        # conditional_exclusion が1件も無い場合は既定のルール（room_floor は detached で除外）
+        label = _label("room_floor", required_for_publication=["detached", "mansion"])
+        detached = _compile(label, property_type="detached")
+        mansion = _compile(label, property_type="mansion")
+        assert _missing(detached, {"property_type": "detached"}) == []
+        assert _missing(mansion, {"property_type": "mansion"}) == ["room_floor"]
+
+
+# =============================================================================
+# min_selections・有効値
+# =============================================================================
+
+class TestRequiredValues:
+    @pytest.mark.parametrize("min_selections, value, valid", [
+        (None, [], False),
+        (None, ["a"], True),
+        (2, ["a"], False),
+        (2, ["a", "b"], True),
+        (2, ["a", "b", "c"], True),
+        (0, [], True),
+    ])
+    def test_min_selections(self, min_selections, value, valid):
+        rules = _compile(_label("features", min_selections=min_selections))
+        assert _missing(rules, {"features": value}) == ([] if valid else ["features"])
+
+    @pytest.mark.parametrize("value, valid", [
+        (None, False),
+        ("", False),
+        ("   ", False),
+        ("なし", True),
+        (0, True),
+        ({}, False),
+        ({"no_station": True}, True),
+        ({"no_station": False}, True),  # 空でないdictは有効
+    ])
+    def test_values(self, value, valid):
+        rules = _compile(_label("transportation", special_flag_key="no_station"))
+        assert _missing(rules, {"transportation": value}) == ([] if valid else ["transportation"])
+
+    def test_order_label_and_group_fallbacks(self):
+        rules = _compile(
+            _label("b", japanese_label="B項目", group_order=2, display_order=1),
+            _label("a", japanese_label=None, group_name=None, group_order=1, display_order=5),
+            _label("c", japanese_label="C項目", group_order=None, display_order=None),
+        )
+        assert evaluate_publication_rules(rules, {}) == [
+            {"label": "a", "group": "その他"},
+            {"label": "B項目", "group": "基本情報"},
+            {"label": "C項目", "group": "基本情報"},
+        ]
+
+    def test_hidden_columns_are_not_required(self):
+        rules = _compile(_label("room_floor", visible_for=["mansion"]), _label("land_area"))
+        assert _missing(rules, {}) == ["land_area"]
+
+
+# =============================================================================
+# validation_group
+# =============================================================================
+
+class TestValidationGroups:
+    def _rules(self):
+        return _compile(
+            _label("property_name"),
+            _label("is_residential", japanese_label="居住用", required_for_publication=None,
+                   validation_group="property_purpose", group_name="物件用途", display_order=1),
+            _label("is_commercial", japanese_label="事業用", required_for_publication=None,
+                   validation_group="property_purpose", group_name="物件用途", display_order=2),
+            _label("is_investment", japanese_label="投資用", required_for_publication=None,
+                   validation_group="property_purpose", group_name="物件用途", display_order=3,
+                   visible_for=["mansion"]),
+        )
+
+    def test_none_true(self):
+        data = {"property_name": "テスト", "is_residential": False, "is_commercial": None}
+        assert evaluate_publication_rules(self._rules(), data) == [
+            {"label": "「居住用」「事業用」のいずれか", "group": "物件用途"},
+        ]
+
+    def test_one_true(self):
+        data = {"property_name": "テスト", "is_residential": False, "is_commercial": True}
+        assert evaluate_publication_rules(self._rules(), data) == []
+
+    def test_truthy_non_bool_is_not_true(self):
+        data = {"property_name": "テスト", "is_residential": 1, "is_commercial": "true"}
+        assert _missing(self._rules(), data) == ["「居住用」「事業用」のいずれか"]
+
+    def test_hidden_member_does_not_satisfy_group(self):
+        data = {"property_name": "テスト", "is_investment": True}
+        assert _missing(self._rules(), data) == ["「居住用」「事業用」のいずれか"]
+
+    def test_groups_checked_only_after_required_fields(self):
+        # 必須項目が欠けている場合は validation_group の結果を含めない
+        assert _missing(self._rules(), {}) == ["property_name"]
@@ -0,0 +1,72 @@
+"""
+登記事項証明書パーサー（shared/touki_parser.py）の正解データテスト
+
+tests/fixtures/touki/ の *.txt（匿名化した証明書テキスト）をパースし、
+同名の *.json（期待値、parsed_at を除く）と一致することを確認する。
+
+実行: python -m pytest tests/unit/test_touki_parser.py
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+
+from shared.touki_parser import (  # noqa: E402
+    SECTION_BUILDING,
+    SECTION_KOU,
+    SECTION_LAND,
+    SECTION_OTSU,
+    ToukiParser,
+    parse_touki,
+    split_sections,
+)
+
+FIXTURE_DIR = project_root / "tests" / "fixtures" / "touki"
+FIXTURES = sorted(FIXTURE_DIR.glob("*.txt"))
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=[f.stem for f in FIXTURES])
+def test_fixture_corpus(fixture):
+    result = parse_touki(fixture.read_text(encoding="utf-8"))
+    assert result.pop("parsed_at")
+    expected = json.loads(fixture.with_suffix(".json").read_text(encoding="utf-8"))
+    assert result == expected
+
+
+def test_split_sections_keeps_section_across_pages():
+    text = (FIXTURE_DIR / "land_history.txt").read_text(encoding="utf-8")
+    sections = split_sections(text)
+
+    assert SECTION_BUILDING not in sections
+    assert "不動産番号" in sections[SECTION_LAND]
+    # 2ページ目の甲区（見出しの繰り返し）も同じ区画にまとめる
+    assert sections[SECTION_KOU].count("所有者") == 2
+    assert "抵当権設定" in sections[SECTION_OTSU]
+    assert "--- Page" not in "".join(sections.values())
+
+
+def test_fields_are_taken_from_their_own_section():
+    text = (FIXTURE_DIR / "land_and_building.txt").read_text(encoding="utf-8")
+    result = parse_touki(text)
+
+    # 建物の所在（地番付き）が土地の所在に混ざらない
+    assert result["land_info"]["location"] == "北見市春光町三丁目"
+    assert result["building_info"]["location"] == "北見市春光町三丁目 ３３番地２"
+
+
+def test_floor_area_history_uses_latest_value():
+    text = (FIXTURE_DIR / "building_rc_extension.txt").read_text(encoding="utf-8")
+    building = parse_touki(text)["building_info"]
+
+    assert building["floor_areas"]["floor_1"] == 135.25
+    assert building["total_floor_area_m2"] == round(sum(building["floor_areas"].values()), 2)
+
+
+def test_empty_text():
+    result = ToukiParser().parse("")
+    assert result["error"] == "Empty text"
+    assert "parsed_at" in result
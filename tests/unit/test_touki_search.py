@@ -0,0 +1,110 @@
+"""
+登記レコード検索キー（shared/formatters.normalize_lot_number、
+rea-api/app/services/touki_search.py）の正規化テスト
+
+実行: python -m pytest tests/unit/test_touki_search.py
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "rea-api"))
+
+from app.services.touki_search import (  # noqa: E402
+    _kanji_to_int,
+    build_search_keys,
+    normalize_location,
+    split_location,
+)
+from shared.formatters import normalize_lot_number  # noqa: E402
+
+
+@pytest.mark.parametrize("lot_number, expected", [
+    ("９１番４４", "91-44"),
+    ("地番 91番地の44", "91-44"),
+    ("91-44", "91-44"),
+    ("91ー44", "91-44"),
+    ("９１－４４", "91-44"),
+    ("91番地", "91"),
+    ("１２３番", "123"),
+    ("", ""),
+    (None, ""),
+])
+def test_normalize_lot_number(lot_number, expected):
+    assert normalize_lot_number(lot_number) == expected
+
+
+@pytest.mark.parametrize("kanji, expected", [
+    ("一", 1),
+    ("九", 9),
+    ("十", 10),
+    ("十一", 11),
+    ("二十", 20),
+    ("二十三", 23),
+    ("九十九", 99),
+])
+def test_kanji_to_int(kanji, expected):
+    assert _kanji_to_int(kanji) == expected
+
+
+@pytest.mark.parametrize("location, expected", [
+    ("北見市春光町三丁目 ３３番地２", ("北見市春光町3丁目", "33-2")),
+    ("北見市春光町3丁目33-2", ("北見市春光町3丁目", "33-2")),
+    ("札幌市中央区北一条西十丁目", ("札幌市中央区北一条西10丁目", "")),
+    ("札幌市中央区南二十三丁目", ("札幌市中央区南23丁目", "")),
+    ("北見市春光町3丁目", ("北見市春光町3丁目", "")),
+    ("", ("", "")),
+])
+def test_split_location(location, expected):
+    assert split_location(location) == expected
+
+
+def test_normalize_location_unifies_ke():
+    assert normalize_location("旭川市緑ヶ丘") == normalize_location("旭川市緑ケ丘") == "旭川市緑ケ丘"
+
+
+def test_registry_and_property_address_share_location_key():
+    # 登記（漢数字・全角）と物件住所（算用数字）が同じキーになる
+    registry_key, registry_lot = split_location("北見市春光町三丁目 ３３番地２")
+    property_key, property_lot = split_location("北見市春光町3丁目33-2")
+    assert (registry_key, registry_lot) == (property_key, property_lot)
+
+
+class TestBuildSearchKeys:
+    def test_building_lot_from_location(self):
+        keys = build_search_keys({
+            "location": "北見市春光町三丁目 ３３番地２",
+            "lot_number": None,
+            "owners": [{"name": "山田　太郎"}, {"name": "ｻﾄｳ ﾊﾅｺ"}, {"name": ""}, {}],
+            "real_estate_number": "４６０１－０００１２３４５６",
+        })
+        assert keys == {
+            "real_estate_number": "4601000123456",
+            "lot_number_key": "33-2",
+            "location_key": "北見市春光町3丁目",
+            "owner_names": "山田太郎 サトウハナコ",
+        }
+
+    def test_land_lot_number_takes_precedence(self):
+        keys = build_search_keys({"location": "北見市春光町三丁目 ３３番地２", "lot_number": "９１番４４"})
+        assert keys["lot_number_key"] == "91-44"
+
+    def test_empty_lot(self):
+        keys = build_search_keys({"location": "北見市春光町三丁目", "lot_number": "", "owners": None})
+        assert keys == {
+            "real_estate_number": None,
+            "lot_number_key": None,
+            "location_key": "北見市春光町3丁目",
+            "owner_names": None,
+        }
+
+    def test_empty_record(self):
+        assert build_search_keys({}) == {
+            "real_estate_number": None,
+            "lot_number_key": None,
+            "location_key": None,
+            "owner_names": None,
+        }